@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Reference implementations of omnibase_spi protocols.
+
+``omnibase_spi`` itself is protocol-only: production adapters live in
+``omnibase_infra`` and product repos. The modules in this package are
+single-process, dependency-free implementations of selected protocols that
+serve as executable specifications, test doubles and benchmark baselines
+for those adapters. They are not part of the published wheel.
+
+Modules:
+    batching_producer: Adaptive micro-batching ``ProtocolEventBusProducerHandler``
+        wrapper.
+    bloom_idempotency_store: Time-partitioned Bloom filter tier in front of any
+        ``ProtocolIdempotencyStore``.
+    caching_projection_reader: Read-through LRU/TTL cache for any
+        ``ProtocolProjectionReader``, invalidated by applied writes.
+    coalescing_projector: Write-coalescing ``ProtocolProjector`` over a
+        ``ProtocolProjectionDatabase``.
+    compiled_schema_registry: Compiled, LRU-cached validators in front of any
+        ``ProtocolSchemaRegistry``.
+    dependency_work_queue: Dependency-aware priority ``ProtocolWorkQueue``
+        with incremental readiness tracking.
+    dlq_replayer: Rate-limited parallel ``ProtocolDLQHandler`` replay with
+        resumable checkpoints.
+    envelope_chunker: Zero-copy ``ProtocolEnvelopeChunker`` and streaming
+        chunk reassembler.
+    in_memory_event_bus: Partitioned in-memory ``ProtocolEventBusBase``.
+    indexed_node_registry: ``ProtocolWorkflowNodeRegistry`` with capability
+        indexes and incrementally scored node heaps.
+    partitioned_dispatcher: Key-ordered parallel dispatch from a
+        ``ProtocolEventBusConsumer`` with watermark commits.
+    persistent_state: HAMT-backed persistent map states and batch
+        ``ProtocolWorkflowReducer`` dispatch.
+    segmented_event_store: Append-only segment-file ``ProtocolEventStore`` with
+        sparse stream indexes and group commit.
+    snapshot_rehydrator: Workflow state rehydration from the latest
+        ``ProtocolSnapshotStore`` snapshot plus an event tail replay.
+    sharded_idempotency_store: Lock-striped ``ProtocolIdempotencyStore`` with
+        timing-wheel expiry.
+"""
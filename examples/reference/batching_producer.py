@@ -0,0 +1,384 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Adaptive micro-batching wrapper for ``ProtocolEventBusProducerHandler``.
+
+``BatchingProducer`` wraps any conforming producer and turns ``send`` calls
+into ``send_batch`` calls:
+
+- A batch is sent as soon as its payload reaches ``batch_size_bytes``, or
+  when the linger window opened by its first message closes.
+- Batches are sent one at a time in ``send`` order, so messages with the
+  same key (and any two messages, in fact) reach the wrapped producer in
+  the order they were sent.
+- ``on_success`` / ``on_error`` passed to ``send`` are still invoked for
+  their own message only.
+- The linger window adapts to load: it halves (down to ``min_linger_ms``)
+  while linger-triggered batches hold a single message, so a lightly loaded
+  producer adds next to no latency, and it doubles (up to ``linger_ms``)
+  while batches coalesce several messages or fill up.
+
+``send`` returns once the message is buffered, like the producers it wraps;
+it only waits when the buffer is full and a batch must go out first.
+Failures of batches sent from the linger timer are reported to the
+messages' ``on_error`` callbacks and re-raised by the next ``flush``.
+
+Example:
+    ```python
+    producer = BatchingProducer.from_config(kafka_producer, redpanda_config)
+    for payload in payloads:
+        await producer.send("onex.evt.demo.v1", payload, key=b"user:123")
+    await producer.flush()
+    ```
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Sequence
+
+from omnibase_core.models.event_bus import (
+    ModelProducerHealthStatus,
+    ModelProducerMessage,
+)
+from omnibase_spi.exceptions import InvalidProtocolStateError, ProtocolHandlerError
+from omnibase_spi.protocols.event_bus.protocol_event_bus_producer_handler import (
+    DeliveryCallback,
+    ProtocolEventBusProducerHandler,
+)
+from omnibase_spi.protocols.event_bus.protocol_redpanda_adapter import (
+    ProtocolRedpandaConfig,
+)
+
+DEFAULT_BATCH_SIZE_BYTES = 1_048_576
+DEFAULT_LINGER_MS = 5.0
+
+# Linger windows shorter than this fraction of the maximum snap to the minimum.
+_LINGER_FLOOR_FRACTION = 1 / 64
+
+_Callbacks = tuple[DeliveryCallback | None, DeliveryCallback | None]
+_MessageId = tuple[str, bytes | None, bytes]
+
+
+class _CallbackRouter:
+    """Route a batch's delivery reports to the callbacks of each message."""
+
+    __slots__ = ("_waiting",)
+
+    def __init__(
+        self, messages: Sequence[ModelProducerMessage], callbacks: list[_Callbacks]
+    ) -> None:
+        # Reports carry (topic, key, value) only; identical messages are
+        # matched first-in, first-out, which per-key ordering guarantees.
+        self._waiting: dict[_MessageId, deque[_Callbacks]] = {}
+        for message, pair in zip(messages, callbacks, strict=True):
+            if pair != (None, None):
+                message_id = (message.topic, message.key, message.value)
+                self._waiting.setdefault(message_id, deque()).append(pair)
+
+    def __bool__(self) -> bool:
+        return bool(self._waiting)
+
+    def _pop(self, topic: str, key: bytes | None, value: bytes) -> _Callbacks | None:
+        waiting = self._waiting.get((topic, key, value))
+        if not waiting:
+            return None
+        pair = waiting.popleft()
+        if not waiting:
+            del self._waiting[topic, key, value]
+        return pair
+
+    def on_success(
+        self, topic: str, key: bytes | None, value: bytes, error: Exception | None
+    ) -> None:
+        pair = self._pop(topic, key, value)
+        if pair is not None and pair[0] is not None:
+            pair[0](topic, key, value, error)
+
+    def on_error(
+        self, topic: str, key: bytes | None, value: bytes, error: Exception | None
+    ) -> None:
+        pair = self._pop(topic, key, value)
+        if pair is not None and pair[1] is not None:
+            pair[1](topic, key, value, error)
+
+    def fail_remaining(self, error: Exception) -> None:
+        """Report ``error`` to every message not reported on yet."""
+        waiting, self._waiting = self._waiting, {}
+        for (topic, key, value), pairs in waiting.items():
+            for _, on_error in pairs:
+                if on_error is None:
+                    continue
+                try:
+                    on_error(topic, key, value, error)
+                # Callback failures must not mask the batch error.
+                except Exception:  # noqa: BLE001, S112
+                    continue
+
+
+class BatchingProducer:
+    """
+    ``ProtocolEventBusProducerHandler`` that coalesces ``send`` into batches.
+
+    Attributes:
+        batches_sent: ``send_batch`` calls made on the wrapped producer.
+        messages_sent: Messages the wrapped producer accepted.
+        messages_failed: Messages in batches that raised.
+        last_error: ``"ExceptionType: message"`` of the latest batch failure.
+    """
+
+    def __init__(
+        self,
+        producer: ProtocolEventBusProducerHandler,
+        *,
+        batch_size_bytes: int = DEFAULT_BATCH_SIZE_BYTES,
+        linger_ms: float = DEFAULT_LINGER_MS,
+        min_linger_ms: float = 0.0,
+        adaptive: bool = True,
+    ) -> None:
+        """
+        Wrap ``producer``.
+
+        Args:
+            producer: Producer that receives the batches.
+            batch_size_bytes: Buffered key and value bytes that trigger an
+                immediate batch.
+            linger_ms: Longest time the first message of a batch waits for
+                company; the adaptive window never exceeds it.
+            min_linger_ms: Shortest adaptive linger window.
+            adaptive: Adapt the linger window to load. When ``False`` every
+                batch lingers ``linger_ms``.
+
+        Raises:
+            ValueError: If ``batch_size_bytes`` is not positive or the linger
+                bounds are negative or inverted.
+        """
+        if batch_size_bytes < 1:
+            raise ValueError("batch_size_bytes must be positive")
+        if not 0 <= min_linger_ms <= linger_ms:
+            raise ValueError("expected 0 <= min_linger_ms <= linger_ms")
+        self._producer = producer
+        self._batch_size_bytes = batch_size_bytes
+        self._max_linger = linger_ms / 1000
+        self._min_linger = min_linger_ms / 1000
+        self._linger = self._max_linger
+        self._adaptive = adaptive
+        self._messages: list[ModelProducerMessage] = []
+        self._callbacks: list[_Callbacks] = []
+        self._pending_bytes = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_tasks: set[asyncio.Task[None]] = set()
+        self._lock = asyncio.Lock()
+        self._background_error: Exception | None = None
+        self._closed = False
+        self.batches_sent = 0
+        self.messages_sent = 0
+        self.messages_failed = 0
+        self.last_error: str | None = None
+
+    @classmethod
+    def from_config(
+        cls,
+        producer: ProtocolEventBusProducerHandler,
+        config: ProtocolRedpandaConfig,
+        *,
+        adaptive: bool = True,
+    ) -> "BatchingProducer":
+        """Wrap ``producer`` using ``config.batch_size_bytes`` and ``linger_ms``."""
+        return cls(
+            producer,
+            batch_size_bytes=config.batch_size_bytes,
+            linger_ms=config.linger_ms,
+            adaptive=adaptive,
+        )
+
+    # -- introspection ------------------------------------------------------
+
+    @property
+    def linger_ms(self) -> float:
+        """Current linger window in milliseconds."""
+        return self._linger * 1000
+
+    @property
+    def pending_messages(self) -> int:
+        """Messages buffered and not yet handed to the wrapped producer."""
+        return len(self._messages)
+
+    @property
+    def handler_type(self) -> str:
+        """The wrapped producer's handler type."""
+        return self._producer.handler_type
+
+    @property
+    def supports_transactions(self) -> bool:
+        """Whether the wrapped producer supports transactions."""
+        return self._producer.supports_transactions
+
+    @property
+    def supports_exactly_once(self) -> bool:
+        """Whether the wrapped producer supports exactly-once delivery."""
+        return self._producer.supports_exactly_once
+
+    # -- sending ------------------------------------------------------------
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None = None,
+        headers: dict[str, bytes] | None = None,
+        partition: int | None = None,
+        on_success: DeliveryCallback | None = None,
+        on_error: DeliveryCallback | None = None,
+    ) -> None:
+        """
+        Buffer one message for the next batch.
+
+        Waits only when the message completes a batch, which is then sent
+        before returning.
+
+        Raises:
+            InvalidProtocolStateError: If the producer is closed.
+            ProtocolHandlerError: Whatever the wrapped ``send_batch`` raises
+                for a batch sent from this call.
+        """
+        if self._closed:
+            raise InvalidProtocolStateError("producer is closed")
+        # Arguments are already typed; skip per-message pydantic validation.
+        self._messages.append(
+            ModelProducerMessage.model_construct(
+                topic=topic, value=value, key=key, headers=headers, partition=partition
+            )
+        )
+        self._callbacks.append((on_success, on_error))
+        self._pending_bytes += len(value) + (len(key) if key else 0)
+        if self._pending_bytes >= self._batch_size_bytes:
+            await self._send_pending(full=True)
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._linger, self._on_linger
+            )
+
+    async def send_batch(
+        self,
+        messages: Sequence[ModelProducerMessage],
+        on_success: DeliveryCallback | None = None,
+        on_error: DeliveryCallback | None = None,
+    ) -> int:
+        """Send buffered messages, then pass ``messages`` straight through."""
+        if self._closed:
+            raise InvalidProtocolStateError("producer is closed")
+        await self._send_pending(full=False)
+        async with self._lock:
+            sent = await self._producer.send_batch(messages, on_success, on_error)
+        self.batches_sent += 1
+        self.messages_sent += sent
+        return sent
+
+    def _on_linger(self) -> None:
+        self._timer = None
+        task = asyncio.create_task(self._send_from_timer())
+        self._timer_tasks.add(task)
+        task.add_done_callback(self._timer_tasks.discard)
+
+    async def _send_from_timer(self) -> None:
+        try:
+            await self._send_pending(full=False)
+        # No caller to raise to: keep the error for the next flush().
+        except Exception as e:  # noqa: BLE001
+            self._background_error = e
+
+    async def _send_pending(self, *, full: bool) -> None:
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            messages, callbacks = self._messages, self._callbacks
+            if not messages:
+                return
+            self._messages, self._callbacks, self._pending_bytes = [], [], 0
+            if self._adaptive:
+                self._adapt(len(messages), full=full)
+
+            router = _CallbackRouter(messages, callbacks)
+            try:
+                if router:
+                    sent = await self._producer.send_batch(
+                        messages, router.on_success, router.on_error
+                    )
+                else:
+                    sent = await self._producer.send_batch(messages)
+            except Exception as e:
+                self.messages_failed += len(messages)
+                self.last_error = f"{type(e).__name__}: {e}"
+                router.fail_remaining(e)
+                raise
+            self.batches_sent += 1
+            self.messages_sent += sent
+
+    def _adapt(self, batch_len: int, *, full: bool) -> None:
+        floor = self._max_linger * _LINGER_FLOOR_FRACTION
+        if full or batch_len > 1:
+            self._linger = min(self._max_linger, max(self._linger * 2, floor))
+        else:
+            halved = self._linger / 2
+            self._linger = halved if halved >= floor else self._min_linger
+            self._linger = max(self._linger, self._min_linger)
+
+    # -- lifecycle ----------------------------------------------------------
+
+    async def flush(self, timeout_seconds: float = 30.0) -> None:
+        """
+        Send buffered messages and flush the wrapped producer.
+
+        Raises:
+            TimeoutError: If flushing takes longer than ``timeout_seconds``.
+            ProtocolHandlerError: If a batch sent from the linger timer
+                failed since the last flush.
+        """
+        async with asyncio.timeout(timeout_seconds):
+            await self._send_pending(full=False)
+            if self._timer_tasks:
+                await asyncio.gather(*self._timer_tasks)
+            await self._producer.flush(timeout_seconds)
+        error, self._background_error = self._background_error, None
+        if error is not None:
+            raise ProtocolHandlerError(
+                f"batch send failed: {error}", context={"error": type(error).__name__}
+            ) from error
+
+    async def close(self, timeout_seconds: float = 30.0) -> None:
+        """Flush, then close the wrapped producer."""
+        if self._closed:
+            return
+        try:
+            await self.flush(timeout_seconds)
+        finally:
+            self._closed = True
+            await self._producer.close(timeout_seconds)
+
+    async def health_check(self) -> ModelProducerHealthStatus:
+        """Wrapped producer's health, counting buffered messages as pending."""
+        status = await self._producer.health_check()
+        if not self._messages:
+            return status
+        return status.model_copy(
+            update={"pending_messages": status.pending_messages + len(self._messages)}
+        )
+
+    # -- transactions -------------------------------------------------------
+
+    async def begin_transaction(self) -> None:
+        """Send buffered messages outside the transaction, then begin it."""
+        await self._send_pending(full=False)
+        await self._producer.begin_transaction()
+
+    async def commit_transaction(self) -> None:
+        """Send buffered messages into the transaction, then commit it."""
+        await self._send_pending(full=False)
+        await self._producer.commit_transaction()
+
+    async def abort_transaction(self) -> None:
+        """Send buffered messages into the transaction, then abort it."""
+        await self._send_pending(full=False)
+        await self._producer.abort_transaction()
@@ -0,0 +1,369 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Bloom filter tier in front of any ``ProtocolIdempotencyStore``.
+
+``BloomFilteredIdempotencyStore`` wraps a conforming store and remembers,
+in a time-partitioned Bloom filter, every ``(domain, message_id)`` written
+through it:
+
+- ``is_processed`` answers "no" from the filter for keys it has never
+  seen, without a backing-store round trip; "maybe" answers go to the
+  store. Most messages are new, so most lookups never leave the process.
+- ``check_and_record`` must still be decided by the store, which is the
+  only place the check and the write are atomic. When the store offers
+  ``check_and_record_many`` (like ``ShardedIdempotencyStore``), calls made
+  in the same event loop iteration with the same domain and correlation id
+  are sent as one batch.
+- The filter is split into ``generations`` generations that each cover
+  ``retention_seconds / (generations - 1)`` of writes. Lookups consult all
+  of them; once the newest has covered its span, a new one starts and the
+  oldest is dropped. A key is therefore remembered for at least the
+  retention window and then forgotten, in step with
+  ``cleanup_expired(retention_seconds)`` on the store.
+- Filters are sized from ``expected_records`` per retention window so that
+  a lookup of an unseen key is a false positive with probability at most
+  ``false_positive_rate``. A generation that receives more writes than
+  planned grows another filter instead of losing accuracy.
+
+The filter only knows what was written through this wrapper. Unless
+``warm`` says the filter already covers the store (the store started empty,
+or its keys were passed to ``remember``), negative answers are trusted only
+once a full retention window has passed. Writers that bypass the wrapper
+make negative answers wrong; give each wrapper exclusive ownership of its
+keys, as a consumer of a partition has.
+
+Example:
+    ```python
+    store = BloomFilteredIdempotencyStore(
+        postgres_store,
+        retention_seconds=7 * 24 * 3600,
+        expected_records=50_000_000,
+    )
+    if await store.check_and_record(event.message_id, domain="billing"):
+        await handle_event(event)
+    print(f"filter answered {store.hit_ratio:.0%} of lookups")
+    ```
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from uuid import UUID
+
+from omnibase_spi.protocols.storage.protocol_idempotency_store import (
+    ProtocolIdempotencyStore,
+)
+
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+DEFAULT_GENERATIONS = 8
+DEFAULT_MAX_BATCH_SIZE = 256
+
+_RecordMany = Callable[[list[UUID], str | None, UUID | None], Awaitable[list[bool]]]
+_BatchKey = tuple[str | None, UUID | None]
+_Pending = list[tuple[UUID, "asyncio.Future[bool]"]]
+
+_LN2 = math.log(2)
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over pairs of 64-bit hashes."""
+
+    __slots__ = ("bits", "capacity", "count", "hashes", "size")
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        self.size = max(
+            8, math.ceil(-capacity * math.log(false_positive_rate) / _LN2**2)
+        )
+        self.hashes = max(1, round(self.size / capacity * _LN2))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.capacity = capacity
+        self.count = 0
+
+    def add(self, h1: int, h2: int) -> None:
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % size
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, h1: int, h2: int) -> bool:
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+
+class _Generation:
+    """Filters for the writes of one time span, allocated on first write."""
+
+    __slots__ = ("filters", "started")
+
+    def __init__(self, started: float) -> None:
+        self.started = started
+        self.filters: list[_BloomFilter] = []
+
+    def add(self, h1: int, h2: int, capacity: int, false_positive_rate: float) -> None:
+        if not self.filters or self.filters[-1].count >= capacity:
+            self.filters.append(_BloomFilter(capacity, false_positive_rate))
+        self.filters[-1].add(h1, h2)
+
+    def might_contain(self, h1: int, h2: int) -> bool:
+        return any(f.might_contain(h1, h2) for f in self.filters)
+
+
+class _Batcher:
+    """Coalesce ``check_and_record`` calls into ``check_and_record_many``."""
+
+    def __init__(self, record_many: _RecordMany, max_batch_size: int) -> None:
+        self._record_many = record_many
+        self._max_batch_size = max_batch_size
+        self._pending: dict[_BatchKey, _Pending] = {}
+        self._flush_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.batches = 0
+
+    async def submit(
+        self, message_id: UUID, domain: str | None, correlation_id: UUID | None
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        key = (domain, correlation_id)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = []
+        pending.append((message_id, future))
+        if len(pending) >= self._max_batch_size:
+            self._send(key, self._pending.pop(key))
+        elif not self._flush_scheduled:
+            # Everything submitted before the loop gets back to this
+            # callback joins the batch.
+            self._flush_scheduled = True
+            loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        for key, batch in pending.items():
+            self._send(key, batch)
+
+    def _send(self, key: _BatchKey, batch: _Pending) -> None:
+        task = asyncio.create_task(self._write(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, key: _BatchKey, batch: _Pending) -> None:
+        domain, correlation_id = key
+        try:
+            results = await self._record_many(
+                [message_id for message_id, _ in batch], domain, correlation_id
+            )
+        # Hand the error to every caller in the batch.
+        except Exception as e:  # noqa: BLE001
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            self.batches += 1
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            # Never leave a caller waiting, even if this task is cancelled.
+            for _, future in batch:
+                future.cancel()
+
+
+def _hashes(message_id: UUID, domain: str | None) -> tuple[int, int]:
+    # Two independent hashes for double hashing; tuple hashing mixes all
+    # bits of the id, so time-based UUIDs spread as well as random ones.
+    id_int = message_id.int
+    return hash((domain, id_int)), hash((id_int, domain)) | 1
+
+
+class BloomFilteredIdempotencyStore:
+    """
+    ``ProtocolIdempotencyStore`` that skips lookups of unseen keys.
+
+    Attributes:
+        lookups: ``is_processed`` calls.
+        filter_negatives: Lookups the filter answered without the store.
+        false_positives: Trusted lookups the filter passed on that the
+            store answered with False.
+    """
+
+    def __init__(
+        self,
+        store: ProtocolIdempotencyStore,
+        *,
+        retention_seconds: float,
+        expected_records: int,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        generations: int = DEFAULT_GENERATIONS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        warm: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Wrap ``store``.
+
+        Args:
+            store: Store that decides and keeps the records.
+            retention_seconds: How long the store keeps records; keys are
+                remembered at least this long.
+            expected_records: Records written per retention window.
+            false_positive_rate: Chance that a lookup of an unseen key goes
+                to the store anyway.
+            generations: Number of filter generations; more generations
+                forget keys closer to the end of the retention window.
+            max_batch_size: Largest ``check_and_record_many`` batch.
+            warm: The filter already covers every record in ``store``, so
+                negative answers are trusted from the start.
+            clock: Wall clock in epoch seconds.
+
+        Raises:
+            ValueError: If a size or duration is not positive, fewer than
+                two generations are asked for, or ``false_positive_rate`` is
+                not between 0 and 1.
+        """
+        if retention_seconds <= 0:
+            raise ValueError("retention_seconds must be positive")
+        if expected_records < 1 or max_batch_size < 1:
+            raise ValueError("expected_records and max_batch_size must be positive")
+        if generations < 2:
+            raise ValueError("generations must be at least 2")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self._store = store
+        record_many: _RecordMany | None = getattr(store, "check_and_record_many", None)
+        self._batcher = (
+            None if record_many is None else _Batcher(record_many, max_batch_size)
+        )
+        self._span = retention_seconds / (generations - 1)
+        # Every lookup may hit a filter in each generation; split the budget.
+        self._capacity = math.ceil(expected_records / (generations - 1))
+        self._filter_rate = false_positive_rate / generations
+        self._generation_count = generations
+        self._clock = clock
+        now = clock()
+        self._generations = deque([_Generation(now)], maxlen=generations)
+        self._trusted_from = now if warm else now + retention_seconds
+        self.lookups = 0
+        self.filter_negatives = 0
+        self.false_positives = 0
+
+    # -- metrics --------------------------------------------------------------
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered by the filter alone."""
+        return self.filter_negatives / self.lookups if self.lookups else 0.0
+
+    @property
+    def false_positive_ratio(self) -> float:
+        """Share of trusted lookups of absent keys the filter passed on."""
+        absent = self.filter_negatives + self.false_positives
+        return self.false_positives / absent if absent else 0.0
+
+    @property
+    def store_batches(self) -> int:
+        """``check_and_record_many`` calls made on the store."""
+        return 0 if self._batcher is None else self._batcher.batches
+
+    @property
+    def filter_bytes(self) -> int:
+        """Memory held by the filter bits."""
+        return sum(len(f.bits) for g in self._generations for f in g.filters)
+
+    # -- filter ---------------------------------------------------------------
+
+    def _rotate(self, now: float) -> None:
+        current = self._generations[-1]
+        elapsed = int((now - current.started) // self._span)
+        # Spans without writes still age the filter; after a full turn only
+        # the newest generations matter.
+        first = max(1, elapsed - self._generation_count + 1)
+        for step in range(first, elapsed + 1):
+            self._generations.append(_Generation(current.started + step * self._span))
+
+    def _remember(self, message_id: UUID, domain: str | None) -> None:
+        self._rotate(self._clock())
+        h1, h2 = _hashes(message_id, domain)
+        self._generations[-1].add(h1, h2, self._capacity, self._filter_rate)
+
+    def remember(self, message_ids: Iterable[UUID], domain: str | None = None) -> None:
+        """Add keys already in the backing store to the filter."""
+        for message_id in message_ids:
+            self._remember(message_id, domain)
+
+    # -- ProtocolIdempotencyStore ---------------------------------------------
+
+    async def check_and_record(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> bool:
+        """
+        Remember the key, then let the store decide.
+
+        Raises:
+            IdempotencyStoreError: Whatever the store raises for the call
+                or for the batch it was sent in.
+        """
+        # Remember first: a lookup racing the write may then see a false
+        # positive, never a false negative.
+        self._remember(message_id, domain)
+        if self._batcher is None:
+            return await self._store.check_and_record(
+                message_id, domain, correlation_id
+            )
+
+        return await self._batcher.submit(message_id, domain, correlation_id)
+
+    async def is_processed(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+    ) -> bool:
+        """Answer False for keys the filter has never seen, else ask the store."""
+        now = self._clock()
+        self._rotate(now)
+        self.lookups += 1
+        trusted = now >= self._trusted_from
+        if trusted:
+            h1, h2 = _hashes(message_id, domain)
+            if not any(g.might_contain(h1, h2) for g in self._generations):
+                self.filter_negatives += 1
+                return False
+        processed = await self._store.is_processed(message_id, domain)
+        if trusted and not processed:
+            self.false_positives += 1
+        return processed
+
+    async def mark_processed(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+        processed_at: datetime | None = None,
+    ) -> None:
+        """Remember the key, then record it in the store."""
+        self._remember(message_id, domain)
+        await self._store.mark_processed(
+            message_id, domain, correlation_id, processed_at
+        )
+
+    async def cleanup_expired(
+        self,
+        ttl_seconds: int,
+    ) -> int:
+        """Clean up the store; the filter forgets keys as it rotates."""
+        return await self._store.cleanup_expired(ttl_seconds)
@@ -0,0 +1,361 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Read-through cache in front of any ``ProtocolProjectionReader``.
+
+``CachingProjectionReader`` wraps a conforming reader and caches the
+answers of its per-entity queries, ``get_entity_state``, ``exists``,
+``get_registration_status`` and ``get_node_capabilities``:
+
+- Entries are kept in LRU order, at most ``max_entries`` of them, and
+  expire ``ttl_seconds`` after they were loaded. ``None`` answers are
+  cached too, so lookups of unknown entities are also absorbed.
+- Concurrent misses for the same query share one call to the wrapped
+  reader (singleflight); a caller that is cancelled does not cancel the
+  load for the others.
+- ``InvalidatingProjector`` wraps the ``ProtocolProjector`` that writes the
+  projections. Whenever it reports an ``applied`` result, the cached
+  entries of that entity are dropped, and a load already in flight for
+  them is not cached. Entries of other entities are untouched.
+- ``exists`` is answered from a cached ``get_entity_state`` when there is
+  one.
+
+``get_by_criteria`` and ``get_registered_nodes`` span many entities, so a
+write cannot invalidate them precisely; they always go to the wrapped
+reader. ``get_registration_status`` and ``get_node_capabilities`` are keyed
+by node, whose projections the reader may store under any domain, so they
+are dropped on an applied write of that entity id in any domain. Without
+an ``InvalidatingProjector`` in front of every writer, entries are only
+refreshed when the TTL runs out.
+
+Cached values are shared between callers and must be treated as
+read-only. The cache belongs to one event loop.
+
+Example:
+    ```python
+    reader = CachingProjectionReader(postgres_reader, ttl_seconds=30.0)
+    projector = InvalidatingProjector(postgres_projector, reader)
+
+    await projector.persist(state, node_id, "registration", sequence_info)
+    status = await reader.get_registration_status(node_id)
+    print(f"cache answered {reader.hit_ratio:.0%} of lookups")
+    ```
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar, cast
+
+from omnibase_core.types import JsonType
+from omnibase_spi.protocols.projections.protocol_projection_reader import (
+    ProtocolProjectionReader,
+)
+from omnibase_spi.protocols.projections.protocol_projector import (
+    ProtocolBatchPersistResult,
+    ProtocolPersistResult,
+    ProtocolProjector,
+    ProtocolSequenceInfo,
+)
+
+_T = TypeVar("_T")
+# (query, domain, entity id); node-keyed queries have no domain part.
+_Key = tuple[str, str | None, str]
+
+_STATE = "get_entity_state"
+_EXISTS = "exists"
+_NODE_QUERIES = frozenset({"get_registration_status", "get_node_capabilities"})
+
+
+class CachingProjectionReader:
+    """
+    ``ProtocolProjectionReader`` caching per-entity answers of another one.
+
+    Attributes:
+        lookups: Cacheable queries answered.
+        hits: Queries answered from the cache.
+        coalesced: Misses that joined a load already in flight.
+        invalidations: Cache entries and in-flight loads dropped by writes.
+        evictions: Entries dropped to stay within ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        reader: ProtocolProjectionReader,
+        *,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Wrap ``reader``.
+
+        Args:
+            reader: Reader to load misses from.
+            max_entries: Most entries kept; the least recently used go
+                first.
+            ttl_seconds: Time after loading at which an entry expires.
+            clock: Monotonic time source, in seconds.
+
+        Raises:
+            ValueError: If ``max_entries`` or ``ttl_seconds`` is not
+                positive.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        self._reader = reader
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[_Key, tuple[float, object]] = OrderedDict()
+        self._by_entity: dict[str, set[_Key]] = {}
+        self._inflight: dict[_Key, asyncio.Future[Any]] = {}
+        self.lookups = 0
+        self.hits = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of cacheable queries answered from the cache."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- cache ----------------------------------------------------------------
+
+    def _get(self, key: _Key) -> tuple[bool, object]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= self._clock():
+            self._drop(key)
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[1]
+
+    async def _cached(self, key: _Key, load: Callable[[], Awaitable[_T]]) -> _T:
+        self.lookups += 1
+        found, value = self._get(key)
+        if found:
+            self.hits += 1
+            return cast("_T", value)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(load())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._loaded(key, done))
+        else:
+            self.coalesced += 1
+        # Shielded so that one cancelled caller leaves the load running for
+        # the others.
+        return cast("_T", await asyncio.shield(future))
+
+    def _loaded(self, key: _Key, future: "asyncio.Future[Any]") -> None:
+        # Not current if invalidated while loading: the answer may predate
+        # the write.
+        current = self._inflight.get(key) is future
+        if current:
+            del self._inflight[key]
+        if future.cancelled() or future.exception() is not None or not current:
+            return
+        self._entries[key] = (self._clock() + self._ttl, future.result())
+        self._entries.move_to_end(key)
+        self._by_entity.setdefault(key[2], set()).add(key)
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
+
+    def _drop(self, key: _Key) -> None:
+        del self._entries[key]
+        keys = self._by_entity[key[2]]
+        keys.discard(key)
+        if not keys:
+            del self._by_entity[key[2]]
+
+    def invalidate(self, entity_id: str, domain: str | None = None) -> int:
+        """
+        Drop what is cached or loading for an entity.
+
+        Args:
+            entity_id: Entity (or node) id that was written.
+            domain: Domain of the write. Entries of other domains are kept,
+                except node-keyed ones; ``None`` drops all of the entity's
+                entries.
+
+        Returns:
+            Number of entries and in-flight loads dropped.
+        """
+
+        def affected(key: _Key) -> bool:
+            return domain is None or key[1] == domain or key[0] in _NODE_QUERIES
+
+        keys = [k for k in self._by_entity.get(entity_id, ()) if affected(k)]
+        for key in keys:
+            self._drop(key)
+        loading = [k for k in self._inflight if k[2] == entity_id and affected(k)]
+        for key in loading:
+            del self._inflight[key]
+        self.invalidations += len(keys) + len(loading)
+        return len(keys) + len(loading)
+
+    def clear(self) -> None:
+        """Drop every entry and in-flight load."""
+        self.invalidations += len(self._entries) + len(self._inflight)
+        self._entries.clear()
+        self._by_entity.clear()
+        self._inflight.clear()
+
+    # -- ProtocolProjectionReader ---------------------------------------------
+
+    async def get_entity_state(self, entity_id: str, domain: str) -> JsonType | None:
+        """Cached ``get_entity_state`` of the wrapped reader."""
+        return await self._cached(
+            (_STATE, domain, entity_id),
+            lambda: self._reader.get_entity_state(entity_id, domain),
+        )
+
+    async def exists(self, entity_id: str, domain: str) -> bool:
+        """Cached ``exists``, answered from a cached state when there is one."""
+        found, state = self._get((_STATE, domain, entity_id))
+        if found:
+            self.lookups += 1
+            self.hits += 1
+            return state is not None
+        return await self._cached(
+            (_EXISTS, domain, entity_id),
+            lambda: self._reader.exists(entity_id, domain),
+        )
+
+    async def get_by_criteria(
+        self,
+        criteria: JsonType,
+        domain: str,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[JsonType]:
+        """Uncached: passed to the wrapped reader."""
+        return await self._reader.get_by_criteria(criteria, domain, limit, offset)
+
+    async def get_registration_status(
+        self,
+        node_id: str,
+        domain: str | None = None,
+    ) -> JsonType | None:
+        """Cached ``get_registration_status`` of the wrapped reader."""
+        return await self._cached(
+            ("get_registration_status", domain, node_id),
+            lambda: self._reader.get_registration_status(node_id, domain),
+        )
+
+    async def get_registered_nodes(
+        self,
+        domain: str | None = None,
+        state: str | None = None,
+        capabilities: list[str] | None = None,
+        limit: int | None = None,
+    ) -> list[JsonType]:
+        """Uncached: passed to the wrapped reader."""
+        return await self._reader.get_registered_nodes(
+            domain, state, capabilities, limit
+        )
+
+    async def get_node_capabilities(self, node_id: str) -> list[str] | None:
+        """Cached ``get_node_capabilities`` of the wrapped reader."""
+        return await self._cached(
+            ("get_node_capabilities", None, node_id),
+            lambda: self._reader.get_node_capabilities(node_id),
+        )
+
+
+class InvalidatingProjector:
+    """``ProtocolProjector`` that invalidates a cache on applied writes."""
+
+    def __init__(
+        self, projector: ProtocolProjector, cache: CachingProjectionReader
+    ) -> None:
+        """
+        Wrap ``projector``.
+
+        Args:
+            projector: Projector that writes the projections.
+            cache: Cache whose entries the writes make stale.
+        """
+        self._projector = projector
+        self._cache = cache
+
+    async def persist(
+        self,
+        projection: object,
+        entity_id: str,
+        domain: str,
+        sequence_info: ProtocolSequenceInfo,
+        *,
+        correlation_id: str | None = None,
+    ) -> ProtocolPersistResult:
+        """Persist, then invalidate the entity if the projection was applied."""
+        result = await self._projector.persist(
+            projection,
+            entity_id,
+            domain,
+            sequence_info,
+            correlation_id=correlation_id,
+        )
+        if result.status == "applied":
+            self._cache.invalidate(entity_id, domain)
+        return result
+
+    async def batch_persist(
+        self,
+        projections: Sequence[tuple[object, str, str, ProtocolSequenceInfo]],
+        *,
+        correlation_id: str | None = None,
+    ) -> ProtocolBatchPersistResult:
+        """Persist, then invalidate every entity with an applied projection."""
+        result = await self._projector.batch_persist(
+            projections, correlation_id=correlation_id
+        )
+        # Results carry no domain, so every domain the batch wrote the
+        # entity under is invalidated.
+        applied = {r.entity_id for r in result.results if r.status == "applied"}
+        for entity_id, domain in {(p[1], p[2]) for p in projections}:
+            if entity_id in applied:
+                self._cache.invalidate(entity_id, domain)
+        return result
+
+    async def get_last_sequence(
+        self,
+        entity_id: str,
+        domain: str,
+    ) -> ProtocolSequenceInfo | None:
+        """Passed to the wrapped projector."""
+        return await self._projector.get_last_sequence(entity_id, domain)
+
+    async def is_stale(
+        self,
+        entity_id: str,
+        domain: str,
+        sequence_info: ProtocolSequenceInfo,
+    ) -> bool:
+        """Passed to the wrapped projector."""
+        return await self._projector.is_stale(entity_id, domain, sequence_info)
+
+    async def cleanup_before_sequence(
+        self,
+        domain: str,
+        sequence: int,
+        *,
+        batch_size: int = 1000,
+        confirmed: bool = False,
+    ) -> int:
+        """Passed to the wrapped projector."""
+        return await self._projector.cleanup_before_sequence(
+            domain, sequence, batch_size=batch_size, confirmed=confirmed
+        )
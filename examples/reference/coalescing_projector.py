@@ -0,0 +1,440 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Write-coalescing reference ``ProtocolProjector`` over a projection database.
+
+``CoalescingProjector`` keeps one row per ``(domain, entity_id, partition)``
+in a table of a ``ProtocolProjectionDatabase`` and applies projections as
+batches:
+
+- The last applied sequence of every key it has seen is cached in memory,
+  so stale projections are rejected without a database round trip. Keys
+  not cached yet are loaded with one ``SELECT`` per batch.
+- Within a batch, only the highest fresh sequence of each key is written;
+  the other projections for that key are rejected as stale, superseded by
+  the one written.
+- A batch is written with a single ``execute_many`` of one multi-row
+  upsert, whose ``WHERE`` clause keeps the row's sequence monotonic even if
+  the cache is behind the table.
+- Concurrent ``persist`` calls made in the same event loop iteration are
+  coalesced into one batch; ``batch_persist`` writes its projections as one
+  batch.
+
+Batches are applied one at a time. The cache assumes this projector is the
+only writer of its keys, as the consumer of a partition is; a write by
+another process is not seen until the key is evicted by
+``cleanup_before_sequence``. The SQL is portable between PostgreSQL
+(``paramstyle="numeric"``, the default) and SQLite (``paramstyle="qmark"``).
+
+Example:
+    ```python
+    projector = CoalescingProjector(database, table="order_projections")
+    await projector.create_table()
+    result = await projector.batch_persist(
+        [
+            (order, order.order_id, "orders", SequenceInfo(offset, "orders-0"))
+            for order, offset in reduced
+        ]
+    )
+    print(f"applied {result.applied_count}/{result.total_count}")
+    ```
+"""
+
+import asyncio
+import json
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from omnibase_spi.exceptions import ProjectorError
+from omnibase_spi.protocols.projections.protocol_projection_database import (
+    ProtocolProjectionDatabase,
+)
+from omnibase_spi.protocols.projections.protocol_projector import (
+    ProtocolSequenceInfo,
+)
+
+DEFAULT_TABLE = "projections"
+
+# Entity ids per key-loading SELECT; well below SQLite's parameter limit.
+_LOAD_CHUNK = 500
+# Cached sequence of a key that has no row yet.
+_ABSENT = -1
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?")
+
+_Status = Literal["applied", "rejected_stale", "rejected_conflict"]
+_Key = tuple[str, str, str]
+_Item = tuple[object, str, str, ProtocolSequenceInfo]
+
+
+@dataclass(frozen=True, slots=True)
+class SequenceInfo:
+    """``ProtocolSequenceInfo`` value."""
+
+    sequence: int
+    partition: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PersistResult:
+    """``ProtocolPersistResult`` value."""
+
+    status: _Status
+    entity_id: str
+    applied_sequence: int | None = None
+    rejected_reason: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class BatchPersistResult:
+    """``ProtocolBatchPersistResult`` value."""
+
+    results: tuple[PersistResult, ...]
+
+    @property
+    def total_count(self) -> int:
+        """Number of projections in the batch."""
+        return len(self.results)
+
+    @property
+    def applied_count(self) -> int:
+        """Number of projections applied."""
+        return sum(r.status == "applied" for r in self.results)
+
+    @property
+    def rejected_count(self) -> int:
+        """Number of projections rejected."""
+        return self.total_count - self.applied_count
+
+
+def _encode_json(projection: object) -> str:
+    dump = getattr(projection, "model_dump_json", None)
+    if callable(dump):
+        return str(dump())
+    return json.dumps(projection, separators=(",", ":"), default=str)
+
+
+def _validate(item: _Item) -> _Key:
+    _, entity_id, domain, sequence_info = item
+    if not isinstance(entity_id, str) or not entity_id:
+        raise ValueError("entity_id must be a non-empty string")
+    if not isinstance(domain, str) or not domain:
+        raise ValueError("domain must be a non-empty string")
+    if sequence_info.sequence < 0:
+        raise ValueError("sequence must not be negative")
+    return domain, entity_id, sequence_info.partition or ""
+
+
+class CoalescingProjector:
+    """
+    ``ProtocolProjector`` that coalesces writes per entity and batch.
+
+    Attributes:
+        flushes: Batches written to the database.
+        rows_written: Rows in those batches.
+        key_loads: ``SELECT`` round trips made to fill the sequence cache.
+    """
+
+    def __init__(
+        self,
+        database: ProtocolProjectionDatabase,
+        *,
+        table: str = DEFAULT_TABLE,
+        paramstyle: Literal["numeric", "qmark"] = "numeric",
+        encode: Callable[[object], str] = _encode_json,
+    ) -> None:
+        """
+        Create a projector writing to ``table``.
+
+        Args:
+            database: Database holding the projection table.
+            table: Table name, optionally schema-qualified.
+            paramstyle: ``"numeric"`` for ``$1`` placeholders (asyncpg),
+                ``"qmark"`` for ``?`` placeholders (sqlite3).
+            encode: Serializes a projection into the ``projection`` column.
+                Defaults to pydantic JSON for models and ``json.dumps``
+                otherwise.
+
+        Raises:
+            ValueError: If ``table`` is not a plain SQL identifier.
+        """
+        if not _IDENTIFIER.fullmatch(table):
+            raise ValueError(f"invalid table name: {table!r}")
+        self._database = database
+        self._table = table
+        self._numeric = paramstyle == "numeric"
+        self._encode = encode
+        self._upsert = (
+            f"INSERT INTO {table} "  # noqa: S608 - validated identifier
+            "(domain, entity_id, partition_key, sequence, projection) "
+            f"VALUES ({self._placeholders(1, 5)}) "
+            "ON CONFLICT (domain, entity_id, partition_key) DO UPDATE SET "
+            "sequence = excluded.sequence, projection = excluded.projection "
+            f"WHERE {table}.sequence < excluded.sequence"
+        )
+        self._sequences: dict[_Key, int] = {}
+        self._lock = asyncio.Lock()
+        self._pending: list[tuple[_Item, _Key, asyncio.Future[PersistResult]]] = []
+        self._flush_scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.flushes = 0
+        self.rows_written = 0
+        self.key_loads = 0
+
+    def _placeholders(self, first: int, count: int) -> str:
+        if self._numeric:
+            return ", ".join(f"${i}" for i in range(first, first + count))
+        return ", ".join("?" * count)
+
+    async def create_table(self) -> None:
+        """Create the projection table if it does not exist."""
+        await self._database.execute(
+            f"CREATE TABLE IF NOT EXISTS {self._table} ("
+            "domain TEXT NOT NULL, "
+            "entity_id TEXT NOT NULL, "
+            "partition_key TEXT NOT NULL, "
+            "sequence BIGINT NOT NULL, "
+            "projection TEXT NOT NULL, "
+            "PRIMARY KEY (domain, entity_id, partition_key))"
+        )
+
+    # -- ProtocolProjector ----------------------------------------------------
+
+    async def persist(
+        self,
+        projection: object,
+        entity_id: str,
+        domain: str,
+        sequence_info: ProtocolSequenceInfo,
+        *,
+        correlation_id: str | None = None,
+    ) -> PersistResult:
+        """
+        Persist one projection, batched with concurrent ``persist`` calls.
+
+        Raises:
+            ProjectorError: If writing the batch fails.
+            ValueError: If ``entity_id``, ``domain`` or the sequence is
+                invalid.
+        """
+        item = (projection, entity_id, domain, sequence_info)
+        key = _validate(item)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[PersistResult] = loop.create_future()
+        self._pending.append((item, key, future))
+        if not self._flush_scheduled:
+            # Everything persisted before the loop gets back to this
+            # callback joins the batch.
+            self._flush_scheduled = True
+            loop.call_soon(self._flush_pending)
+        return await future
+
+    def _flush_pending(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        task = asyncio.create_task(self._write_pending(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write_pending(
+        self, pending: list[tuple[_Item, _Key, "asyncio.Future[PersistResult]"]]
+    ) -> None:
+        try:
+            results = await self._apply(
+                [item for item, _, _ in pending], [key for _, key, _ in pending]
+            )
+        # Hand the error to every caller in the batch.
+        except Exception as e:  # noqa: BLE001
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, _, future), result in zip(pending, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            # Never leave a caller waiting, even if this task is cancelled.
+            for _, _, future in pending:
+                future.cancel()
+
+    async def batch_persist(
+        self,
+        projections: Sequence[tuple[object, str, str, ProtocolSequenceInfo]],
+        *,
+        correlation_id: str | None = None,
+    ) -> BatchPersistResult:
+        """
+        Persist projections as one coalesced batch.
+
+        Raises:
+            ProjectorError: If writing the batch fails.
+            ValueError: If any projection tuple is invalid; nothing is
+                written then.
+        """
+        keys = [_validate(item) for item in projections]
+        return BatchPersistResult(tuple(await self._apply(projections, keys)))
+
+    async def _apply(
+        self, items: Sequence[_Item], keys: Sequence[_Key]
+    ) -> list[PersistResult]:
+        async with self._lock:
+            await self._load({key for key in keys if key not in self._sequences})
+            last = self._sequences
+            winners: dict[_Key, int] = {}
+            for position, (item, key) in enumerate(zip(items, keys, strict=True)):
+                sequence = item[3].sequence
+                if sequence <= last[key]:
+                    continue
+                best = winners.get(key)
+                if best is None or sequence > items[best][3].sequence:
+                    winners[key] = position
+
+            if winners:
+                await self._write(items, winners)
+            results = [
+                self._result(position, item, key, items, winners)
+                for position, (item, key) in enumerate(zip(items, keys, strict=True))
+            ]
+            for key, position in winners.items():
+                last[key] = items[position][3].sequence
+            return results
+
+    def _result(
+        self,
+        position: int,
+        item: _Item,
+        key: _Key,
+        items: Sequence[_Item],
+        winners: dict[_Key, int],
+    ) -> PersistResult:
+        sequence = item[3].sequence
+        winner = winners.get(key)
+        if winner == position:
+            return PersistResult("applied", item[1], applied_sequence=sequence)
+        if winner is None or sequence <= self._sequences[key]:
+            reason = f"sequence {sequence} <= last applied {self._sequences[key]}"
+        else:
+            reason = (
+                f"sequence {sequence} superseded by {items[winner][3].sequence} "
+                "in the same batch"
+            )
+        return PersistResult("rejected_stale", item[1], rejected_reason=reason)
+
+    async def _write(self, items: Sequence[_Item], winners: dict[_Key, int]) -> None:
+        rows = [
+            (*key, items[position][3].sequence, self._encode(items[position][0]))
+            for key, position in winners.items()
+        ]
+        try:
+            await self._database.execute_many(self._upsert, rows)
+        except Exception as e:
+            # Part of the batch may have been written: reload these keys.
+            for key in winners:
+                self._sequences.pop(key, None)
+            raise ProjectorError(
+                f"failed to write {len(rows)} projections: {e}",
+                context={"operation": "batch_persist", "table": self._table},
+            ) from e
+        self.flushes += 1
+        self.rows_written += len(rows)
+
+    async def _load(self, keys: set[_Key]) -> None:
+        """Fill the sequence cache for ``keys`` from the table."""
+        if not keys:
+            return
+        entity_ids = sorted({entity_id for _, entity_id, _ in keys})
+        for start in range(0, len(entity_ids), _LOAD_CHUNK):
+            chunk = entity_ids[start : start + _LOAD_CHUNK]
+            rows = await self._query(
+                f"SELECT domain, entity_id, partition_key, sequence "  # noqa: S608
+                f"FROM {self._table} "
+                f"WHERE entity_id IN ({self._placeholders(1, len(chunk))})",
+                *chunk,
+            )
+            self.key_loads += 1
+            for row in rows:
+                key = (row["domain"], row["entity_id"], row["partition_key"])
+                if key in keys:
+                    self._sequences[key] = int(row["sequence"])
+        for key in keys:
+            self._sequences.setdefault(key, _ABSENT)
+
+    async def _query(self, query: str, *params: object) -> list[dict[str, Any]]:
+        try:
+            return await self._database.execute(query, *params)
+        except Exception as e:
+            raise ProjectorError(
+                f"projection query failed: {e}",
+                context={"operation": "query", "table": self._table},
+            ) from e
+
+    async def get_last_sequence(
+        self,
+        entity_id: str,
+        domain: str,
+    ) -> SequenceInfo | None:
+        """
+        Read the entity's sequence from the table.
+
+        With several partitions, the one with the highest sequence is
+        returned.
+        """
+        rows = await self._query(
+            f"SELECT partition_key, sequence FROM {self._table} "  # noqa: S608
+            f"WHERE domain = {self._placeholders(1, 1)} "
+            f"AND entity_id = {self._placeholders(2, 1)} "
+            "ORDER BY sequence DESC LIMIT 1",
+            domain,
+            entity_id,
+        )
+        if not rows:
+            return None
+        return SequenceInfo(int(rows[0]["sequence"]), rows[0]["partition_key"] or None)
+
+    async def is_stale(
+        self,
+        entity_id: str,
+        domain: str,
+        sequence_info: ProtocolSequenceInfo,
+    ) -> bool:
+        """Compare against the cached sequence, loading it if needed."""
+        key = _validate((None, entity_id, domain, sequence_info))
+        async with self._lock:
+            if key not in self._sequences:
+                await self._load({key})
+            return sequence_info.sequence <= self._sequences[key]
+
+    async def cleanup_before_sequence(
+        self,
+        domain: str,
+        sequence: int,
+        *,
+        batch_size: int = 1000,
+        confirmed: bool = False,
+    ) -> int:
+        """
+        Evict cached sequences of ``domain`` below ``sequence``.
+
+        Sequences live in the projection rows, which are kept, so evicted
+        keys are still checked against the table when next written; this
+        only bounds the cache.
+
+        Returns:
+            Number of cache entries evicted.
+
+        Raises:
+            ValueError: If ``confirmed`` is not True.
+        """
+        if not confirmed:
+            raise ValueError("cleanup_before_sequence requires confirmed=True")
+        async with self._lock:
+            evict = [
+                key
+                for key, last in self._sequences.items()
+                if key[0] == domain and last < sequence
+            ]
+            for key in evict:
+                del self._sequences[key]
+        return len(evict)
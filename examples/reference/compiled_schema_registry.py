@@ -0,0 +1,697 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Compiled, cached event validation in front of any ``ProtocolSchemaRegistry``.
+
+``CompilingSchemaRegistry`` wraps a conforming registry. The first time a
+``(subject, version)`` schema is needed it is fetched once and compiled by
+``compile_schema`` into a tree of closures specialised to that schema: the
+keywords present are looked up once, required names and property
+validators are bound up front, and ``$ref`` targets are compiled once and
+shared. Validating an event afterwards is a call into that tree, with no
+registry round trip and no walk over the schema dict.
+
+- Compiled schemas are kept in LRU order, at most ``max_schemas`` of them.
+  Pinned versions never change and do not expire; ``latest`` entries
+  expire after ``latest_ttl_seconds`` so that versions registered
+  elsewhere are picked up.
+- Subjects without a schema are kept in a negative cache for
+  ``negative_ttl_seconds``, so events for them do not reach the registry
+  each time either.
+- Concurrent misses for the same schema share one fetch.
+- ``validate_events`` validates a batch of one subject with a single
+  lookup and returns one ``(is_valid, error_message)`` per event.
+- ``register_schema`` through this layer drops the subject's ``latest``
+  and negative entries.
+
+``compile_schema`` covers the JSON Schema (draft-07) validation keywords
+for types, ``enum``/``const``, objects, arrays, strings, numbers, local
+``$ref`` and the ``allOf``/``anyOf``/``oneOf``/``not`` combinators;
+``format`` and other annotations are ignored, as draft-07 allows. Schemas
+using anything else, and non-JSON schema types such as Avro, are not
+compiled: their events are validated by the wrapped registry.
+
+Error messages give the JSON path of the first violation, for example
+``$.payload.commits[2].sha: does not match '^[0-9a-f]{40}$'``.
+
+Example:
+    ```python
+    registry = CompilingSchemaRegistry(redpanda_registry, max_schemas=512)
+
+    is_valid, error = await registry.validate_event(subject, event_dict)
+    results = await registry.validate_events(subject, batch)
+    print(f"{registry.hits} of {registry.lookups} lookups were cached")
+    ```
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, TypeGuard
+
+from omnibase_core.types import JsonType
+from omnibase_spi.protocols.event_bus.protocol_schema_registry import (
+    ProtocolSchemaRegistry,
+)
+
+LATEST = "latest"
+
+# Validators return None when the value is valid, else the path to the
+# violation (innermost last) and a message; the path is only built on failure.
+_Error = tuple[tuple[str | int, ...], str]
+Validator = Callable[[object], _Error | None]
+
+_ANNOTATIONS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "format",
+        "definitions",
+        "$defs",
+        "readOnly",
+        "writeOnly",
+        "contentMediaType",
+        "contentEncoding",
+    }
+)
+
+_OBJECT = frozenset(
+    {
+        "properties",
+        "required",
+        "additionalProperties",
+        "minProperties",
+        "maxProperties",
+    }
+)
+_ARRAY = frozenset(
+    {"items", "additionalItems", "minItems", "maxItems", "uniqueItems", "contains"}
+)
+_STRING = frozenset({"minLength", "maxLength", "pattern"})
+_NUMBER = frozenset(
+    {"minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf"}
+)
+_COMBINATORS = frozenset({"allOf", "anyOf", "oneOf", "not"})
+
+
+class UnsupportedSchemaError(ValueError):
+    """Raised when a schema uses keywords ``compile_schema`` does not cover."""
+
+
+def _is_integer(value: object) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value: object) -> TypeGuard[float]:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _exact(number: float) -> Fraction:
+    """The decimal a JSON number was written as, as an exact fraction."""
+    return Fraction(repr(number)) if isinstance(number, float) else Fraction(number)
+
+
+def _is_multiple(value: float, step: Fraction) -> bool:
+    """Exact ``multipleOf``; float division misjudges large or decimal values."""
+    if isinstance(value, int) and step.denominator == 1:
+        return value % step.numerator == 0
+    try:
+        return (_exact(value) / step).denominator == 1
+    except (OverflowError, ValueError):
+        # Non-standard inf and nan are not multiples of anything.
+        return False
+
+
+_TYPE_CHECKS: dict[str, Callable[[object], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+    "integer": _is_integer,
+    "number": _is_number,
+}
+
+
+def _equal(a: object, b: object) -> bool:
+    """JSON equality: ``1 == 1.0`` but ``True != 1``."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(_equal, a, b))
+    return a == b
+
+
+def _valid(_value: object) -> _Error | None:
+    return None
+
+
+def _invalid(_value: object) -> _Error | None:
+    return (), "no value is allowed"
+
+
+def _all(checks: list[Validator]) -> Validator:
+    if not checks:
+        return _valid
+    if len(checks) == 1:
+        return checks[0]
+    ordered = tuple(checks)
+
+    def validate(value: object) -> _Error | None:
+        for check in ordered:
+            error = check(value)
+            if error is not None:
+                return error
+        return None
+
+    return validate
+
+
+class _Compiler:
+    """Compiles one root schema, sharing ``$ref`` targets."""
+
+    def __init__(self, root: object) -> None:
+        self._root = root
+        self._refs: dict[str, Validator] = {}
+
+    def ref(self, pointer: str) -> Validator:
+        compiled = self._refs.get(pointer)
+        if compiled is not None:
+            return compiled
+        if not pointer.startswith("#"):
+            raise UnsupportedSchemaError(f"non-local $ref {pointer!r}")
+        target = self._root
+        for token in filter(None, pointer[1:].split("/")):
+            name = token.replace("~1", "/").replace("~0", "~")
+            if not isinstance(target, dict) or name not in target:
+                raise UnsupportedSchemaError(f"unresolvable $ref {pointer!r}")
+            target = target[name]
+        # Recursive schemas reach this pointer again while it compiles; they
+        # call through the slot, which is filled once compiling is done.
+        slot: list[Validator] = []
+
+        def forward(value: object) -> _Error | None:
+            return slot[0](value)
+
+        self._refs[pointer] = forward
+        slot.append(self.compile(target))
+        self._refs[pointer] = slot[0]
+        return slot[0]
+
+    def compile(self, schema: object) -> Validator:
+        if schema is True or schema == {}:
+            return _valid
+        if schema is False:
+            return _invalid
+        if not isinstance(schema, dict):
+            raise UnsupportedSchemaError(f"schema must be an object, not {schema!r}")
+        if "$ref" in schema:
+            # Draft-07 ignores the siblings of $ref.
+            return self.ref(schema["$ref"])
+        keywords = set(schema) - _ANNOTATIONS
+        checks: list[Validator] = []
+        if "type" in keywords:
+            checks.append(self._type(schema["type"]))
+        if "enum" in keywords:
+            checks.append(self._enum(schema["enum"]))
+        if "const" in keywords:
+            checks.append(self._const(schema["const"]))
+        for build in (self._object, self._array, self._string, self._number):
+            check = build(schema, keywords)
+            if check is not None:
+                checks.append(check)
+        checks.extend(self._combinators(schema, keywords))
+        handled = {"type", "enum", "const"} | _OBJECT | _ARRAY | _STRING | _NUMBER
+        unsupported = keywords - handled - _COMBINATORS
+        if unsupported:
+            raise UnsupportedSchemaError(
+                f"unsupported keywords: {', '.join(sorted(unsupported))}"
+            )
+        return _all(checks)
+
+    def _type(self, spec: object) -> Validator:
+        names = [spec] if isinstance(spec, str) else spec
+        if not isinstance(names, list) or not all(n in _TYPE_CHECKS for n in names):
+            raise UnsupportedSchemaError(f"unknown type {spec!r}")
+        message = f"expected {' or '.join(names)}"
+        if len(names) == 1:
+            test = _TYPE_CHECKS[names[0]]
+        else:
+            tests = tuple(_TYPE_CHECKS[name] for name in names)
+
+            def test(value: object) -> bool:
+                return any(t(value) for t in tests)
+
+        def validate(value: object) -> _Error | None:
+            return None if test(value) else ((), message)
+
+        return validate
+
+    def _enum(self, options: object) -> Validator:
+        if not isinstance(options, list) or not options:
+            raise UnsupportedSchemaError("enum must be a non-empty array")
+        message = f"not one of {options!r}"
+        if all(isinstance(o, str) for o in options):
+            allowed = frozenset(options)
+
+            def validate(value: object) -> _Error | None:
+                if isinstance(value, str) and value in allowed:
+                    return None
+                return (), message
+
+            return validate
+
+        def validate_any(value: object) -> _Error | None:
+            return None if any(_equal(value, o) for o in options) else ((), message)
+
+        return validate_any
+
+    def _const(self, expected: object) -> Validator:
+        message = f"expected {expected!r}"
+
+        def validate(value: object) -> _Error | None:
+            return None if _equal(value, expected) else ((), message)
+
+        return validate
+
+    def _object(self, schema: dict[str, Any], keywords: set[str]) -> Validator | None:
+        if not keywords & _OBJECT:
+            return None
+        properties = schema.get("properties", {})
+        if not isinstance(properties, dict):
+            raise UnsupportedSchemaError("properties must be an object")
+        fields = tuple(
+            (name, check)
+            for name, sub in properties.items()
+            if (check := self.compile(sub)) is not _valid
+        )
+        required = schema.get("required", [])
+        if not isinstance(required, list) or not all(
+            isinstance(name, str) for name in required
+        ):
+            raise UnsupportedSchemaError("required must be an array of strings")
+        names = tuple(required)
+        extra = schema.get("additionalProperties", True)
+        known = frozenset(properties)
+        extra_check = None if extra is True else self.compile(extra)
+        bounds = (schema.get("minProperties", 0), schema.get("maxProperties"))
+
+        def validate(value: object) -> _Error | None:  # noqa: PLR0911
+            if not isinstance(value, dict):
+                return None
+            for name in names:
+                if name not in value:
+                    return (), f"missing required property {name!r}"
+            for name, check in fields:
+                if name in value:
+                    error = check(value[name])
+                    if error is not None:
+                        return (name, *error[0]), error[1]
+            if extra_check is not None:
+                for name in value.keys() - known:
+                    error = extra_check(value[name])
+                    if error is not None:
+                        if extra_check is _invalid:
+                            return (), f"unexpected property {name!r}"
+                        return (name, *error[0]), error[1]
+            if len(value) < bounds[0]:
+                return (), f"fewer than {bounds[0]} properties"
+            if bounds[1] is not None and len(value) > bounds[1]:
+                return (), f"more than {bounds[1]} properties"
+            return None
+
+        return validate
+
+    def _array(self, schema: dict[str, Any], keywords: set[str]) -> Validator | None:
+        if not keywords & _ARRAY:
+            return None
+        items = schema.get("items", True)
+        if isinstance(items, list):
+            positional = tuple(self.compile(sub) for sub in items)
+            rest = self.compile(schema.get("additionalItems", True))
+            each = None
+        else:
+            positional = ()
+            rest = _valid
+            each = self.compile(items)
+        if each is _valid:
+            each = None
+        minimum = schema.get("minItems", 0)
+        maximum = schema.get("maxItems")
+        unique = schema.get("uniqueItems", False)
+        contains = self.compile(schema["contains"]) if "contains" in schema else None
+
+        def validate(value: object) -> _Error | None:  # noqa: PLR0911, PLR0912
+            if not isinstance(value, list):
+                return None
+            if len(value) < minimum:
+                return (), f"fewer than {minimum} items"
+            if maximum is not None and len(value) > maximum:
+                return (), f"more than {maximum} items"
+            if each is not None:
+                for i, item in enumerate(value):
+                    error = each(item)
+                    if error is not None:
+                        return (i, *error[0]), error[1]
+            elif positional or rest is not _valid:
+                for i, item in enumerate(value):
+                    check = positional[i] if i < len(positional) else rest
+                    error = check(item)
+                    if error is not None:
+                        return (i, *error[0]), error[1]
+            if unique:
+                for i, item in enumerate(value):
+                    if any(_equal(item, other) for other in value[:i]):
+                        return (i,), "duplicate item"
+            if contains is not None and all(contains(i) is not None for i in value):
+                return (), "no item matches contains"
+            return None
+
+        return validate
+
+    def _string(self, schema: dict[str, Any], keywords: set[str]) -> Validator | None:
+        if not keywords & _STRING:
+            return None
+        minimum = schema.get("minLength", 0)
+        maximum = schema.get("maxLength")
+        pattern = schema.get("pattern")
+        search = re.compile(pattern).search if pattern is not None else None
+        mismatch = f"does not match {pattern!r}"
+
+        def validate(value: object) -> _Error | None:
+            if not isinstance(value, str):
+                return None
+            if len(value) < minimum:
+                return (), f"shorter than {minimum} characters"
+            if maximum is not None and len(value) > maximum:
+                return (), f"longer than {maximum} characters"
+            if search is not None and search(value) is None:
+                return (), mismatch
+            return None
+
+        return validate
+
+    def _number(self, schema: dict[str, Any], keywords: set[str]) -> Validator | None:
+        if not keywords & _NUMBER:
+            return None
+        low = schema.get("minimum", -math.inf)
+        high = schema.get("maximum", math.inf)
+        low_open = schema.get("exclusiveMinimum", -math.inf)
+        high_open = schema.get("exclusiveMaximum", math.inf)
+        step = schema.get("multipleOf")
+        if step is not None and not (_is_number(step) and 0 < step < math.inf):
+            raise UnsupportedSchemaError("multipleOf must be a positive number")
+        exact_step = None if step is None else _exact(step)
+
+        def validate(value: object) -> _Error | None:  # noqa: PLR0911
+            if not _is_number(value):
+                return None
+            if value < low:
+                return (), f"less than {low}"
+            if value > high:
+                return (), f"greater than {high}"
+            if value <= low_open:
+                return (), f"not greater than {low_open}"
+            if value >= high_open:
+                return (), f"not less than {high_open}"
+            if exact_step is not None and not _is_multiple(value, exact_step):
+                return (), f"not a multiple of {step}"
+            return None
+
+        return validate
+
+    def _combinators(
+        self, schema: dict[str, Any], keywords: set[str]
+    ) -> list[Validator]:
+        checks = []
+        if "allOf" in keywords:
+            checks.append(_all([self.compile(sub) for sub in schema["allOf"]]))
+        if "anyOf" in keywords:
+            options = tuple(self.compile(sub) for sub in schema["anyOf"])
+
+            def any_of(value: object) -> _Error | None:
+                if any(option(value) is None for option in options):
+                    return None
+                return (), "matches none of anyOf"
+
+            checks.append(any_of)
+        if "oneOf" in keywords:
+            choices = tuple(self.compile(sub) for sub in schema["oneOf"])
+
+            def one_of(value: object) -> _Error | None:
+                matched = sum(choice(value) is None for choice in choices)
+                if matched == 1:
+                    return None
+                return (), f"matches {matched} of oneOf, not exactly one"
+
+            checks.append(one_of)
+        if "not" in keywords:
+            negated = self.compile(schema["not"])
+
+            def not_(value: object) -> _Error | None:
+                return None if negated(value) is not None else ((), "matches not")
+
+            checks.append(not_)
+        return checks
+
+
+def _format(error: _Error) -> str:
+    path = "".join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in error[0])
+    return f"${path}: {error[1]}"
+
+
+def compile_schema(schema: JsonType) -> Callable[[JsonType], str | None]:
+    """
+    Compile a JSON Schema into a validator function.
+
+    Args:
+        schema: Draft-07 JSON Schema.
+
+    Returns:
+        Function returning None for a valid value, else a message naming the
+        path of the first violation.
+
+    Raises:
+        UnsupportedSchemaError: If the schema uses a keyword that is not
+            covered, or a ``$ref`` outside the schema.
+    """
+    try:
+        check = _Compiler(schema).compile(schema)
+    except (TypeError, re.error) as e:
+        raise UnsupportedSchemaError(f"malformed schema: {e}") from e
+
+    def validate(value: JsonType) -> str | None:
+        error = check(value)
+        return None if error is None else _format(error)
+
+    return validate
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    """Fetched schema, its validator, and when it expires."""
+
+    schema: JsonType | None
+    # None when the schema is missing or is validated by the wrapped registry.
+    validate: Callable[[JsonType], str | None] | None
+    expires: float
+
+
+class CompilingSchemaRegistry:
+    """
+    ``ProtocolSchemaRegistry`` validating events with compiled schemas.
+
+    Attributes:
+        lookups: Schema lookups made by ``get_schema`` and validation.
+        hits: Lookups answered from the cache, including missing schemas.
+        compiles: Schemas compiled.
+        fallbacks: Events validated by the wrapped registry because their
+            schema could not be compiled.
+        evictions: Schemas dropped to stay within ``max_schemas``.
+    """
+
+    def __init__(
+        self,
+        registry: ProtocolSchemaRegistry,
+        *,
+        version: str = LATEST,
+        max_schemas: int = 1_024,
+        latest_ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Wrap ``registry``.
+
+        Args:
+            registry: Registry to fetch schemas from and to delegate to.
+            version: Schema version events are validated against.
+            max_schemas: Most schemas kept, missing ones included; the least
+                recently used go first.
+            latest_ttl_seconds: Time after fetching at which a ``latest``
+                schema is fetched again.
+            negative_ttl_seconds: Time after which a missing schema is
+                looked up again.
+            clock: Monotonic time source, in seconds.
+
+        Raises:
+            ValueError: If ``max_schemas`` or a TTL is not positive.
+        """
+        if max_schemas < 1:
+            raise ValueError("max_schemas must be positive")
+        if latest_ttl_seconds <= 0:
+            raise ValueError("latest_ttl_seconds must be positive")
+        if negative_ttl_seconds <= 0:
+            raise ValueError("negative_ttl_seconds must be positive")
+        self._registry = registry
+        self._version = version
+        self._max_schemas = max_schemas
+        self._latest_ttl = latest_ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Future[_Entry]] = {}
+        self.lookups = 0
+        self.hits = 0
+        self.compiles = 0
+        self.fallbacks = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- cache ----------------------------------------------------------------
+
+    async def _entry(self, subject: str, version: str) -> _Entry:
+        key = (subject, version)
+        self.lookups += 1
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            del self._entries[key]
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(subject, version))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._loaded(key, done))
+        # Shielded so that one cancelled caller leaves the fetch running for
+        # the others.
+        return await asyncio.shield(future)
+
+    async def _load(self, subject: str, version: str) -> _Entry:
+        schema = await self._registry.get_schema(subject, version)
+        now = self._clock()
+        if schema is None:
+            return _Entry(None, None, now + self._negative_ttl)
+        expires = now + self._latest_ttl if version == LATEST else math.inf
+        try:
+            validate = compile_schema(schema)
+        except UnsupportedSchemaError:
+            return _Entry(schema, None, expires)
+        self.compiles += 1
+        return _Entry(schema, validate, expires)
+
+    def _loaded(self, key: tuple[str, str], future: "asyncio.Future[_Entry]") -> None:
+        # Not current if invalidated while loading: the schema may predate a
+        # registration.
+        current = self._inflight.get(key) is future
+        if current:
+            del self._inflight[key]
+        if future.cancelled() or future.exception() is not None or not current:
+            return
+        self._entries[key] = future.result()
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_schemas:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, subject: str) -> int:
+        """
+        Drop what is cached or loading for a subject, in every version.
+
+        Returns:
+            Number of entries and in-flight fetches dropped.
+        """
+        keys = [key for key in self._entries if key[0] == subject]
+        for key in keys:
+            del self._entries[key]
+        loading = [key for key in self._inflight if key[0] == subject]
+        for key in loading:
+            del self._inflight[key]
+        return len(keys) + len(loading)
+
+    # -- ProtocolSchemaRegistry -----------------------------------------------
+
+    async def register_schema(
+        self, subject: str, schema: JsonType, schema_type: str
+    ) -> int:
+        """Register with the wrapped registry, then drop the subject's entries."""
+        schema_id = await self._registry.register_schema(subject, schema, schema_type)
+        self.invalidate(subject)
+        return schema_id
+
+    async def get_schema(self, subject: str, version: str) -> JsonType | None:
+        """Cached ``get_schema`` of the wrapped registry."""
+        return (await self._entry(subject, version)).schema
+
+    async def validate_event(
+        self, subject: str, event_data: JsonType
+    ) -> tuple[bool, str | None]:
+        """Validate ``event_data`` against the subject's compiled schema."""
+        entry = await self._entry(subject, self._version)
+        if entry.validate is not None:
+            error = entry.validate(event_data)
+            return error is None, error
+        if entry.schema is None:
+            return False, f"no schema for {subject} version {self._version}"
+        self.fallbacks += 1
+        return await self._registry.validate_event(subject, event_data)
+
+    async def validate_events(
+        self, subject: str, events: Sequence[JsonType]
+    ) -> list[tuple[bool, str | None]]:
+        """
+        Validate a batch of events of one subject.
+
+        The schema is looked up once for the whole batch.
+
+        Returns:
+            ``(is_valid, error_message)`` for each event, in order.
+        """
+        entry = await self._entry(subject, self._version)
+        validate = entry.validate
+        if validate is not None:
+            results: list[tuple[bool, str | None]] = []
+            for event in events:
+                error = validate(event)
+                results.append((error is None, error))
+            return results
+        if entry.schema is None:
+            missing = f"no schema for {subject} version {self._version}"
+            return [(False, missing)] * len(events)
+        self.fallbacks += len(events)
+        return [await self._registry.validate_event(subject, event) for event in events]
+
+    async def close(self, timeout_seconds: float = 30.0) -> None:
+        """Drop the cache and close the wrapped registry."""
+        self._entries.clear()
+        self._inflight.clear()
+        await self._registry.close(timeout_seconds)
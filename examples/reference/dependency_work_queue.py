@@ -0,0 +1,769 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Dependency-aware priority ``ProtocolWorkQueue``.
+
+``DependencyWorkQueue`` keeps work tickets in memory and answers readiness
+queries from incrementally maintained indexes, not by scanning every
+ticket:
+
+- Dependencies form a DAG. Each ticket counts its dependencies that have
+  not completed; ``complete_ticket`` decrements the counters of the
+  ticket's dependents only, so readiness updates cost O(out-degree).
+  ``add_ticket_dependency`` refuses edges that would close a cycle,
+  searching the new dependency's own dependencies, and only once
+  something depends on the ticket.
+- A ticket is ready while it is pending, has no open dependencies and is
+  not reserved. Ready tickets are kept in one heap per ordering that an
+  assignment strategy has asked for: ``round_robin`` serves tickets in
+  the order they became ready; ``priority_weighted``, ``least_loaded``
+  and ``capability_based`` by priority, then age; and
+  ``dependency_optimized`` first serves tickets that unblock the most
+  others. Choosing agents is left to the caller. Heap entries of tickets
+  that stop being ready are skipped when read and purged once they
+  outnumber the ready tickets.
+- ``reserve_ticket`` takes a lease on a ready ticket for
+  ``duration_minutes``; until it is released or expires, the ticket is
+  not ready for others. Leases are kept in a heap by expiry and checked
+  on every call.
+
+``get_ready_tickets`` and ``fetch_pending_tickets`` accept a ``limit`` and
+then only walk the top of the heap; without one, the ready entries are
+sorted once. Tickets are added with
+``add_ticket``; required agent capabilities are read from the
+``required_capabilities`` list in a ticket's metadata. Returned tickets are
+the queue's own objects and must be treated as read-only. The queue
+belongs to one event loop.
+
+Example:
+    ```python
+    queue = DependencyWorkQueue()
+    queue.add_ticket("build", "compile", priority="high")
+    queue.add_ticket("test", "pytest")
+    await queue.add_ticket_dependency("test", "build")
+
+    for ticket in await queue.get_ready_tickets(limit=10):
+        await queue.assign_ticket_to_agent(ticket.ticket_id, "agent-1")
+    await queue.complete_ticket("build", {"artifact": "wheel"})
+    print([t.ticket_id for t in await queue.get_ready_tickets()])  # ["test"]
+    ```
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from omnibase_spi.exceptions import InvalidProtocolStateError
+from omnibase_spi.protocols.types.protocol_core_types import ContextValue
+from omnibase_spi.protocols.workflow_orchestration.protocol_work_queue import (
+    LiteralAssignmentStrategy,
+    LiteralWorkQueuePriority,
+)
+
+LiteralTicketStatus = Literal[
+    "pending", "assigned", "in_progress", "completed", "failed"
+]
+
+# Ticket priorities of both LiteralTaskPriority and LiteralWorkQueuePriority,
+# most urgent first.
+_RANKS = {
+    "urgent": 0,
+    "critical": 1,
+    "high": 2,
+    "normal": 3,
+    "low": 4,
+    "deferred": 5,
+}
+_ORDERS: dict[str, str] = {
+    "round_robin": "fifo",
+    "priority_weighted": "priority",
+    "least_loaded": "priority",
+    "capability_based": "priority",
+    "dependency_optimized": "unblocking",
+}
+_TERMINAL = frozenset({"completed", "failed"})
+_PURGE_FLOOR = 1_024
+
+# Heap entry: the ordering key, then the ready stamp and the ticket id.
+_Entry = tuple[Any, ...]
+
+
+@dataclass(slots=True)
+class WorkTicket:
+    """``ProtocolWorkTicket`` held by ``DependencyWorkQueue``."""
+
+    ticket_id: str
+    work_type: str
+    priority: str = "normal"
+    status: LiteralTicketStatus = "pending"
+    assigned_to: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    due_at: datetime | None = None
+    completed_at: datetime | None = None
+    payload: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    async def validate_work_ticket(self) -> bool:
+        """Return whether the ticket has an id, a work type and a priority."""
+        return bool(self.ticket_id and self.work_type) and self.priority in _RANKS
+
+    def is_overdue(self) -> bool:
+        """Return whether an open ticket is past its due time."""
+        return (
+            self.due_at is not None
+            and self.status not in _TERMINAL
+            and datetime.now(UTC) > self.due_at
+        )
+
+
+@dataclass(slots=True)
+class _Lease:
+    agent_id: str
+    expires: float
+    stamp: int
+
+
+class DependencyWorkQueue:
+    """
+    In-memory ``ProtocolWorkQueue`` with incremental readiness tracking.
+
+    Attributes:
+        cycles_rejected: Dependencies refused because they closed a cycle.
+        leases_expired: Reservations that ran out before being released.
+        purges: Rebuilds of the ready heaps to drop skipped entries.
+    """
+
+    def __init__(
+        self,
+        *,
+        strategy: LiteralAssignmentStrategy = "priority_weighted",
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create an empty queue.
+
+        Args:
+            strategy: Initial assignment strategy, which orders ready
+                tickets.
+            clock: Monotonic time source for leases and durations, in
+                seconds.
+            wall_clock: Epoch time source for ticket timestamps.
+
+        Raises:
+            ValueError: If ``strategy`` is not an assignment strategy.
+        """
+        if strategy not in _ORDERS:
+            raise ValueError(f"unknown assignment strategy {strategy!r}")
+        self._strategy: LiteralAssignmentStrategy = strategy
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._tickets: dict[str, WorkTicket] = {}
+        self._created: dict[str, int] = {}
+        self._dependencies: dict[str, dict[str, None]] = {}
+        self._dependents: dict[str, dict[str, None]] = {}
+        self._waiting: dict[str, int] = {}
+        self._blocked: dict[str, None] = {}
+        # Ready ticket id -> stamp of its current heap entries, and the
+        # stamp at which it became ready.
+        self._ready: dict[str, int] = {}
+        self._since: dict[str, int] = {}
+        self._heaps: dict[str, list[_Entry]] = {_ORDERS[strategy]: []}
+        self._skipped = 0
+        self._stamps = itertools.count()
+        self._leases: dict[str, _Lease] = {}
+        self._expiries: list[tuple[float, int, str]] = []
+        self._by_priority: dict[str, dict[str, None]] = {}
+        self._by_agent: dict[str, dict[str, None]] = {}
+        self._statuses: Counter[str] = Counter()
+        self._times: dict[str, dict[str, float]] = {}
+        self._durations: dict[str, tuple[float, int]] = {}
+        self._checkpoints: dict[str, dict[str, dict[str, ContextValue]]] = {}
+        self._subscribers: list[asyncio.Queue[WorkTicket]] = []
+        self.cycles_rejected = 0
+        self.leases_expired = 0
+        self.purges = 0
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    # -- tickets --------------------------------------------------------------
+
+    def add_ticket(
+        self,
+        ticket_id: str,
+        work_type: str,
+        *,
+        priority: str = "normal",
+        payload: dict[str, Any] | None = None,
+        metadata: dict[str, Any] | None = None,
+        due_at: datetime | None = None,
+    ) -> WorkTicket:
+        """
+        Add a pending ticket.
+
+        Raises:
+            ValueError: If the id is taken or the priority is unknown.
+        """
+        if ticket_id in self._tickets:
+            raise ValueError(f"ticket {ticket_id!r} already exists")
+        if priority not in _RANKS:
+            raise ValueError(f"unknown priority {priority!r}")
+        ticket = WorkTicket(
+            ticket_id,
+            work_type,
+            priority,
+            created_at=self._now(),
+            due_at=due_at,
+            payload=payload or {},
+            metadata=metadata or {},
+        )
+        self._tickets[ticket_id] = ticket
+        self._created[ticket_id] = len(self._created)
+        self._waiting[ticket_id] = 0
+        self._times[ticket_id] = {"created": self._clock()}
+        self._by_priority.setdefault(priority, {})[ticket_id] = None
+        self._statuses["pending"] += 1
+        self._refresh(ticket_id)
+        self._notify(ticket)
+        return ticket
+
+    def _now(self) -> datetime:
+        return datetime.fromtimestamp(self._wall_clock(), UTC)
+
+    def _notify(self, ticket: WorkTicket) -> None:
+        for subscriber in self._subscribers:
+            subscriber.put_nowait(ticket)
+
+    def _set_status(self, ticket: WorkTicket, status: LiteralTicketStatus) -> None:
+        self._statuses[ticket.status] -= 1
+        self._statuses[status] += 1
+        ticket.status = status
+        self._times[ticket.ticket_id][status] = self._clock()
+
+    def _assign(self, ticket: WorkTicket, agent_id: str | None) -> None:
+        if ticket.assigned_to is not None:
+            del self._by_agent[ticket.assigned_to][ticket.ticket_id]
+        ticket.assigned_to = agent_id
+        if agent_id is not None:
+            self._by_agent.setdefault(agent_id, {})[ticket.ticket_id] = None
+
+    # -- readiness ------------------------------------------------------------
+
+    def _key(self, order: str, ticket_id: str, stamp: int) -> _Entry:
+        rank = _RANKS[self._tickets[ticket_id].priority]
+        created = self._created[ticket_id]
+        if order == "fifo":
+            return (self._since[ticket_id], stamp, ticket_id)
+        if order == "priority":
+            return (rank, created, stamp, ticket_id)
+        unblocks = len(self._dependents.get(ticket_id, ()))
+        return (-unblocks, rank, created, stamp, ticket_id)
+
+    def _refresh(self, ticket_id: str, *, reorder: bool = False) -> None:
+        """Update the blocked and ready indexes of one ticket."""
+        pending = self._tickets[ticket_id].status == "pending"
+        waiting = self._waiting[ticket_id]
+        if pending and waiting:
+            self._blocked[ticket_id] = None
+        else:
+            self._blocked.pop(ticket_id, None)
+        ready = pending and not waiting and ticket_id not in self._leases
+        # Only the unblocking order depends on the dependents of a ticket.
+        reorder = reorder and "unblocking" in self._heaps
+        if ready and (reorder or ticket_id not in self._ready):
+            stamp = next(self._stamps)
+            if ticket_id in self._ready:
+                self._skipped += 1
+            else:
+                self._since[ticket_id] = stamp
+            self._ready[ticket_id] = stamp
+            for order, heap in self._heaps.items():
+                heapq.heappush(heap, self._key(order, ticket_id, stamp))
+        elif not ready and ticket_id in self._ready:
+            del self._ready[ticket_id]
+            del self._since[ticket_id]
+            self._skipped += 1
+        if self._skipped > max(_PURGE_FLOOR, len(self._ready)):
+            self._purge()
+
+    def _purge(self) -> None:
+        for order in self._heaps:
+            self._heaps[order] = self._build(order)
+        self._skipped = 0
+        self.purges += 1
+
+    def _build(self, order: str) -> list[_Entry]:
+        heap = [self._key(order, i, stamp) for i, stamp in self._ready.items()]
+        heapq.heapify(heap)
+        return heap
+
+    def _ordered(self, limit: int | None = None) -> Iterator[WorkTicket]:
+        """Yield ready tickets in the order of the current strategy."""
+        self._expire()
+        order = _ORDERS[self._strategy]
+        heap = self._heaps.get(order)
+        if heap is None:
+            heap = self._heaps[order] = self._build(order)
+        # Stale entries on top would be walked by every read; drop them.
+        # _skipped keeps counting them, which only brings a purge forward.
+        while heap and self._ready.get(heap[0][-1]) != heap[0][-2]:
+            heapq.heappop(heap)
+        if limit is None:
+            # A full listing is cheaper sorted in one go than walked.
+            ready = self._ready
+            for entry in sorted(e for e in heap if ready.get(e[-1]) == e[-2]):
+                yield self._tickets[entry[-1]]
+            return
+        # Walks the heap as a tree, smallest frontier entry first, so
+        # reading the top k entries costs O(k log k) plus skipped entries.
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            entry, i = heapq.heappop(frontier)
+            if self._ready.get(entry[-1]) == entry[-2]:
+                yield self._tickets[entry[-1]]
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+    def _expire(self) -> None:
+        now = self._clock()
+        while self._expiries and self._expiries[0][0] <= now:
+            _, stamp, ticket_id = heapq.heappop(self._expiries)
+            lease = self._leases.get(ticket_id)
+            if lease is not None and lease.stamp == stamp:
+                del self._leases[ticket_id]
+                self.leases_expired += 1
+                self._refresh(ticket_id)
+
+    # -- ProtocolWorkQueue ----------------------------------------------------
+
+    async def connect_to_work_system(self) -> bool:
+        """The queue is its own work system."""
+        return True
+
+    async def fetch_pending_tickets(self, limit: int | None = None) -> list[WorkTicket]:
+        """Return pending tickets that are ready, as ``get_ready_tickets``."""
+        return await self.get_ready_tickets(limit)
+
+    async def subscribe_to_ticket_updates(self) -> AsyncIterator[WorkTicket]:
+        """
+        Return an iterator over tickets as they change.
+
+        Changes are recorded from this call on. Closing the iterator ends
+        the subscription.
+        """
+        updates: asyncio.Queue[WorkTicket] = asyncio.Queue()
+        self._subscribers.append(updates)
+        return self._updates(updates)
+
+    async def _updates(
+        self, updates: "asyncio.Queue[WorkTicket]"
+    ) -> AsyncIterator[WorkTicket]:
+        try:
+            while True:
+                yield await updates.get()
+        finally:
+            self._subscribers.remove(updates)
+
+    async def assign_ticket_to_agent(self, ticket_id: str, agent_id: str) -> WorkTicket:
+        """
+        Assign a ready ticket, or one reserved by ``agent_id``.
+
+        Raises:
+            KeyError: If the ticket does not exist.
+            InvalidProtocolStateError: If the ticket is not pending, is
+                blocked, or is reserved by another agent.
+        """
+        self._expire()
+        ticket = self._tickets[ticket_id]
+        lease = self._leases.get(ticket_id)
+        if ticket.status != "pending" or self._waiting[ticket_id]:
+            raise InvalidProtocolStateError(
+                f"ticket {ticket_id} is {ticket.status}"
+                + (" and blocked" if self._waiting[ticket_id] else "")
+            )
+        if lease is not None and lease.agent_id != agent_id:
+            raise InvalidProtocolStateError(
+                f"ticket {ticket_id} is reserved by {lease.agent_id}"
+            )
+        self._leases.pop(ticket_id, None)
+        self._assign(ticket, agent_id)
+        self._set_status(ticket, "assigned")
+        self._refresh(ticket_id)
+        self._notify(ticket)
+        return ticket
+
+    async def update_ticket_status(
+        self, ticket_id: str, status: str, message: str | None = None
+    ) -> bool:
+        """
+        Move a ticket to ``status``.
+
+        ``completed``, ``failed`` and ``pending`` go through
+        ``complete_ticket``, ``fail_ticket`` and ``requeue_ticket``;
+        ``assigned`` and ``in_progress`` apply to assigned tickets.
+        """
+        if status == "completed":
+            return await self.complete_ticket(
+                ticket_id, {} if message is None else {"message": message}
+            )
+        if status == "failed":
+            return await self.fail_ticket(ticket_id, message or "")
+        if status == "pending":
+            return await self.requeue_ticket(ticket_id, message or "")
+        ticket = self._tickets.get(ticket_id)
+        if (
+            ticket is None
+            or status not in {"assigned", "in_progress"}
+            or ticket.status not in {"assigned", "in_progress"}
+        ):
+            return False
+        self._set_status(ticket, status)  # type: ignore[arg-type]
+        if message is not None:
+            ticket.metadata["status_message"] = message
+        self._notify(ticket)
+        return True
+
+    async def update_ticket_progress(
+        self, ticket_id: str, progress_percent: float
+    ) -> bool:
+        """
+        Record progress of an assigned ticket, which is then in progress.
+
+        Raises:
+            ValueError: If ``progress_percent`` is not between 0 and 100.
+        """
+        if not 0 <= progress_percent <= 100:
+            raise ValueError("progress_percent must be between 0 and 100")
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None or ticket.status not in {"assigned", "in_progress"}:
+            return False
+        ticket.metadata["progress_percent"] = progress_percent
+        if ticket.status == "assigned":
+            self._set_status(ticket, "in_progress")
+        self._notify(ticket)
+        return True
+
+    async def complete_ticket(
+        self, ticket_id: str, result_data: dict[str, ContextValue]
+    ) -> bool:
+        """
+        Complete an open, unblocked ticket and unblock its dependents.
+
+        Returns:
+            False if the ticket does not exist, is finished or is blocked.
+        """
+        self._expire()
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None or ticket.status in _TERMINAL or self._waiting[ticket_id]:
+            return False
+        self._leases.pop(ticket_id, None)
+        self._set_status(ticket, "completed")
+        ticket.completed_at = self._now()
+        ticket.metadata["result"] = result_data
+        self._refresh(ticket_id)
+        times = self._times[ticket_id]
+        started = times.get("assigned", times["created"])
+        total, count = self._durations.get(ticket.work_type, (0.0, 0))
+        self._durations[ticket.work_type] = (
+            total + times["completed"] - started,
+            count + 1,
+        )
+        for dependent in self._dependents.get(ticket_id, ()):
+            self._waiting[dependent] -= 1
+            if not self._waiting[dependent]:
+                self._refresh(dependent)
+        self._notify(ticket)
+        return True
+
+    async def fail_ticket(self, ticket_id: str, error_message: str) -> bool:
+        """Fail an open ticket; its dependents stay blocked."""
+        self._expire()
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None or ticket.status in _TERMINAL:
+            return False
+        self._leases.pop(ticket_id, None)
+        self._set_status(ticket, "failed")
+        ticket.metadata["error"] = error_message
+        self._refresh(ticket_id)
+        self._notify(ticket)
+        return True
+
+    async def get_ticket_by_id(self, ticket_id: str) -> WorkTicket | None:
+        """Return the ticket, if it exists."""
+        return self._tickets.get(ticket_id)
+
+    async def get_tickets_by_priority(
+        self, priority: LiteralWorkQueuePriority
+    ) -> list[WorkTicket]:
+        """Return the tickets of ``priority``, oldest first."""
+        return [self._tickets[i] for i in self._by_priority.get(priority, ())]
+
+    async def get_tickets_by_agent(self, agent_id: str) -> list[WorkTicket]:
+        """Return the tickets assigned to ``agent_id``."""
+        return [self._tickets[i] for i in self._by_agent.get(agent_id, ())]
+
+    async def get_available_tickets(
+        self,
+        agent_capabilities: list[str] | None = None,
+        max_priority: LiteralWorkQueuePriority | None = None,
+    ) -> list[WorkTicket]:
+        """
+        Return ready tickets an agent can take, in strategy order.
+
+        Args:
+            agent_capabilities: Capabilities of the agent; tickets requiring
+                others are left out. ``None`` skips the check.
+            max_priority: Least urgent priority to include; ``None``
+                includes all.
+        """
+        rank = _RANKS[max_priority] if max_priority is not None else len(_RANKS)
+        capabilities = None if agent_capabilities is None else set(agent_capabilities)
+        return [
+            t
+            for t in self._ordered()
+            if _RANKS[t.priority] <= rank
+            and (
+                capabilities is None
+                or capabilities.issuperset(t.metadata.get("required_capabilities", ()))
+            )
+        ]
+
+    async def reserve_ticket(
+        self, ticket_id: str, agent_id: str, duration_minutes: int
+    ) -> bool:
+        """
+        Lease a ready ticket to ``agent_id``, or extend the agent's lease.
+
+        Raises:
+            ValueError: If ``duration_minutes`` is not positive.
+        """
+        if duration_minutes <= 0:
+            raise ValueError("duration_minutes must be positive")
+        self._expire()
+        lease = self._leases.get(ticket_id)
+        if lease is None and ticket_id not in self._ready:
+            return False
+        if lease is not None and lease.agent_id != agent_id:
+            return False
+        stamp = next(self._stamps)
+        expires = self._clock() + duration_minutes * 60
+        self._leases[ticket_id] = _Lease(agent_id, expires, stamp)
+        heapq.heappush(self._expiries, (expires, stamp, ticket_id))
+        self._refresh(ticket_id)
+        return True
+
+    async def release_ticket_reservation(self, ticket_id: str, agent_id: str) -> bool:
+        """Release the lease ``agent_id`` holds on a ticket."""
+        self._expire()
+        lease = self._leases.get(ticket_id)
+        if lease is None or lease.agent_id != agent_id:
+            return False
+        del self._leases[ticket_id]
+        self._refresh(ticket_id)
+        return True
+
+    async def get_queue_statistics(self) -> dict[str, int]:
+        """Count tickets by status, plus ready, blocked and reserved ones."""
+        self._expire()
+        return {
+            "total": len(self._tickets),
+            "pending": self._statuses["pending"],
+            "ready": len(self._ready),
+            "blocked": len(self._blocked),
+            "reserved": len(self._leases),
+            "assigned": self._statuses["assigned"],
+            "in_progress": self._statuses["in_progress"],
+            "completed": self._statuses["completed"],
+            "failed": self._statuses["failed"],
+        }
+
+    async def get_ticket_dependencies(self, ticket_id: str) -> list[str]:
+        """Return the tickets ``ticket_id`` depends on, finished or not."""
+        return list(self._dependencies.get(ticket_id, ()))
+
+    async def add_ticket_dependency(
+        self, ticket_id: str, dependency_ticket_id: str
+    ) -> bool:
+        """
+        Make a pending ticket depend on another ticket.
+
+        Returns:
+            False if either ticket does not exist, ``ticket_id`` is not
+            pending, or the dependency would close a cycle.
+        """
+        ticket = self._tickets.get(ticket_id)
+        if (
+            ticket is None
+            or dependency_ticket_id not in self._tickets
+            or ticket.status != "pending"
+        ):
+            return False
+        if dependency_ticket_id in self._dependencies.get(ticket_id, ()):
+            return True
+        if self._reaches(dependency_ticket_id, ticket_id):
+            self.cycles_rejected += 1
+            return False
+        self._dependencies.setdefault(ticket_id, {})[dependency_ticket_id] = None
+        self._dependents.setdefault(dependency_ticket_id, {})[ticket_id] = None
+        if self._tickets[dependency_ticket_id].status != "completed":
+            self._waiting[ticket_id] += 1
+            self._leases.pop(ticket_id, None)
+        self._refresh(ticket_id)
+        self._refresh(dependency_ticket_id, reorder=True)
+        return True
+
+    def _reaches(self, start: str, target: str) -> bool:
+        """Return whether ``start`` depends on ``target``, transitively."""
+        if start == target:
+            return True
+        if not self._dependents.get(target):
+            # Nothing depends on target, as for tickets wired up when added.
+            return False
+        seen = {start}
+        stack = [start]
+        while stack:
+            for dependency in self._dependencies.get(stack.pop(), ()):
+                if dependency == target:
+                    return True
+                if dependency not in seen:
+                    seen.add(dependency)
+                    stack.append(dependency)
+        return False
+
+    async def remove_ticket_dependency(
+        self, ticket_id: str, dependency_ticket_id: str
+    ) -> bool:
+        """Drop a dependency; the ticket may become ready."""
+        dependencies = self._dependencies.get(ticket_id, {})
+        if dependency_ticket_id not in dependencies:
+            return False
+        del dependencies[dependency_ticket_id]
+        del self._dependents[dependency_ticket_id][ticket_id]
+        if self._tickets[dependency_ticket_id].status != "completed":
+            self._waiting[ticket_id] -= 1
+        self._refresh(ticket_id)
+        self._refresh(dependency_ticket_id, reorder=True)
+        return True
+
+    async def get_blocked_tickets(self) -> list[WorkTicket]:
+        """Return pending tickets with open dependencies."""
+        return [self._tickets[i] for i in self._blocked]
+
+    async def get_ready_tickets(self, limit: int | None = None) -> list[WorkTicket]:
+        """Return up to ``limit`` ready tickets, in strategy order."""
+        return list(itertools.islice(self._ordered(limit), limit))
+
+    async def set_assignment_strategy(
+        self, strategy: LiteralAssignmentStrategy
+    ) -> bool:
+        """Order ready tickets by ``strategy`` from now on."""
+        if strategy not in _ORDERS:
+            return False
+        self._strategy = strategy
+        return True
+
+    async def get_assignment_strategy(self) -> LiteralAssignmentStrategy:
+        """Return the current strategy."""
+        return self._strategy
+
+    async def requeue_ticket(self, ticket_id: str, reason: str) -> bool:
+        """Return an unfinished or failed ticket to pending, unassigned."""
+        self._expire()
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None or ticket.status in {"pending", "completed"}:
+            return False
+        self._assign(ticket, None)
+        # Timings restart with the new attempt; the ticket keeps its age.
+        self._times[ticket_id] = {"created": self._times[ticket_id]["created"]}
+        self._set_status(ticket, "pending")
+        ticket.metadata["requeue_reason"] = reason
+        ticket.metadata["attempts"] = ticket.metadata.get("attempts", 1) + 1
+        self._refresh(ticket_id)
+        self._notify(ticket)
+        return True
+
+    async def estimate_completion_time(self, ticket_id: str) -> dict[str, Any]:
+        """
+        Estimate the remaining seconds from completed tickets of its type.
+
+        ``estimated_seconds`` is ``None`` until a ticket of the work type has
+        completed, and 0 for finished tickets.
+        """
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return {"ticket_id": ticket_id, "estimated_seconds": None}
+        estimate: float | None = None
+        if ticket.status in _TERMINAL:
+            estimate = 0.0
+        elif ticket.work_type in self._durations:
+            total, count = self._durations[ticket.work_type]
+            estimate = total / count
+            progress = ticket.metadata.get("progress_percent", 0.0)
+            estimate *= 1 - progress / 100
+        return {
+            "ticket_id": ticket_id,
+            "status": ticket.status,
+            "estimated_seconds": estimate,
+            "open_dependencies": self._waiting[ticket_id],
+        }
+
+    async def get_ticket_metrics(self, ticket_id: str) -> dict[str, float]:
+        """Return timings and graph counts of a ticket."""
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            return {}
+        times = self._times[ticket_id]
+        now = self._clock()
+        done = times.get("completed", times.get("failed", now))
+        assigned = times.get("assigned", done)
+        return {
+            "age_seconds": now - times["created"],
+            "wait_seconds": assigned - times["created"],
+            "run_seconds": done - assigned,
+            "progress_percent": float(ticket.metadata.get("progress_percent", 0.0)),
+            "dependencies": float(len(self._dependencies.get(ticket_id, ()))),
+            "open_dependencies": float(self._waiting[ticket_id]),
+            "dependents": float(len(self._dependents.get(ticket_id, ()))),
+            "attempts": float(ticket.metadata.get("attempts", 1)),
+        }
+
+    async def create_ticket_checkpoint(
+        self, ticket_id: str, checkpoint_data: dict[str, ContextValue]
+    ) -> str:
+        """
+        Store a copy of ``checkpoint_data`` and return its id.
+
+        Raises:
+            KeyError: If the ticket does not exist.
+        """
+        ticket = self._tickets[ticket_id]
+        checkpoint_id = str(uuid.uuid4())
+        self._checkpoints.setdefault(ticket_id, {})[checkpoint_id] = {
+            **checkpoint_data,
+            "progress_percent": ticket.metadata.get("progress_percent", 0.0),
+        }
+        return checkpoint_id
+
+    async def restore_ticket_checkpoint(
+        self, ticket_id: str, checkpoint_id: str
+    ) -> bool:
+        """Put a checkpoint's data and progress back into the ticket metadata."""
+        checkpoint = self._checkpoints.get(ticket_id, {}).get(checkpoint_id)
+        if checkpoint is None:
+            return False
+        ticket = self._tickets[ticket_id]
+        data = dict(checkpoint)
+        ticket.metadata["progress_percent"] = data.pop("progress_percent")
+        ticket.metadata["checkpoint"] = data
+        self._notify(ticket)
+        return True
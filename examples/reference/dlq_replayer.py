@@ -0,0 +1,529 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Rate-controlled parallel DLQ replay behind ``ProtocolDLQHandler``.
+
+``ReplayingDLQHandler`` reads DLQ entries page by page from a ``DLQReader``
+and republishes each one's ``original_envelope`` to its ``original_topic``
+through a ``ProtocolEventBusProducerHandler``:
+
+- Entries are replayed by a ``PartitionedDispatcher`` whose lanes are keyed
+  by original topic and message key. Entries for one key are replayed in
+  DLQ order; other keys are replayed concurrently, at most ``concurrency``
+  at a time.
+- A token bucket limits replays to ``rate_per_second`` with bursts of up
+  to ``burst``, so draining a large DLQ does not flood the downstream
+  consumers.
+- After every page, the producer is flushed and the DLQ position up to
+  which every entry has been replayed is checkpointed, in memory and, with
+  ``checkpoint_path``, in a JSON file. ``reprocess_dlq`` resumes from the
+  checkpoint, so a replay that stopped or crashed carries on where it was.
+- ``get_metrics`` adds the throughput of the current (or last) replay,
+  the entries left to replay and an ETA to the protocol's metrics.
+
+A DLQ topic is read as one ordered log of entries in the JSON structure
+``ProtocolDLQHandler`` documents. Entries that cannot be decoded are
+counted as failed and skipped. A failed publish stops the replay at that
+entry: ``reprocess_dlq`` reports it in ``errors`` and the checkpoint stays
+before it. Breakdowns by topic and error type count the entries read so
+far; the oldest message age is that of entries read but not yet
+checkpointed. Metrics cover the ``dlq_topics`` given and every topic
+replayed or checkpointed.
+
+Example:
+    ```python
+    handler = ReplayingDLQHandler(
+        dlq_reader,
+        producer,
+        concurrency=64,
+        rate_per_second=5_000,
+        checkpoint_path=Path("/var/lib/onex/dlq-replay.json"),
+    )
+    results = await handler.reprocess_dlq("onex.evt.git.hook.v1.dlq")
+    metrics = await handler.get_metrics()
+    print(results["messages_reprocessed"], metrics["replay_eta_seconds"])
+    ```
+"""
+
+import asyncio
+import json
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+from examples.reference.partitioned_dispatcher import PartitionedDispatcher
+from omnibase_core.types import JsonType
+from omnibase_spi.exceptions import InvalidProtocolStateError, ProtocolHandlerError
+from omnibase_spi.protocols.event_bus.protocol_event_bus_extended import (
+    ProtocolEventBusMessage,
+)
+from omnibase_spi.protocols.event_bus.protocol_event_bus_producer_handler import (
+    ProtocolEventBusProducerHandler,
+)
+
+DEFAULT_CONCURRENCY = 64
+DEFAULT_PAGE_SIZE = 1_000
+
+# Errors returned by one reprocess_dlq call; the counts cover the rest.
+_MAX_ERRORS = 20
+_TOP = 5
+
+
+class DLQReader(Protocol):
+    """Reads a DLQ topic as one ordered log of entries."""
+
+    async def read(
+        self, dlq_topic: str, position: int, max_entries: int
+    ) -> Sequence[ProtocolEventBusMessage]:
+        """Return up to ``max_entries`` entries from ``position`` on."""
+        ...
+
+    async def end_position(self, dlq_topic: str) -> int:
+        """Return the position after the last entry."""
+        ...
+
+
+@dataclass(slots=True)
+class _Entry:
+    """DLQ message at its log position, with its DLQ fields decoded."""
+
+    key: bytes | None
+    value: bytes
+    topic: str
+    offset: int | None
+    original_topic: str = ""
+    envelope: bytes = b""
+    error_type: str = "unknown"
+    error_timestamp: float | None = None
+    problem: str | None = None
+    partition: int | None = 0
+    timestamp: int | None = None
+    headers: dict[str, bytes] = field(default_factory=dict)
+
+
+def _decode(message: ProtocolEventBusMessage, dlq_topic: str, offset: int) -> _Entry:
+    entry = _Entry(message.key, message.value, dlq_topic, offset)
+    try:
+        record = json.loads(message.value)
+        entry.original_topic = record["original_topic"]
+        envelope = record["original_envelope"]
+        entry.error_timestamp = record.get("error_timestamp")
+        error = str(record.get("error_type") or record.get("error_message") or "")
+    except (ValueError, TypeError, KeyError) as e:
+        entry.problem = f"undecodable DLQ entry at {dlq_topic}@{offset}: {e!r}"
+        return entry
+    if isinstance(envelope, str):
+        entry.envelope = envelope.encode()
+    else:
+        entry.envelope = json.dumps(envelope, separators=(",", ":")).encode()
+    entry.error_type = error.split(":", 1)[0].strip() or "unknown"
+    return entry
+
+
+def _entry(message: ProtocolEventBusMessage) -> _Entry:
+    if not isinstance(message, _Entry):
+        raise TypeError(f"expected a decoded DLQ entry, got {type(message)!r}")
+    return message
+
+
+def _replay_key(message: ProtocolEventBusMessage) -> Hashable:
+    entry = _entry(message)
+    return entry.original_topic, entry.key
+
+
+class _TokenBucket:
+    """Token bucket that lets callers borrow and sleep off the debt."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float]) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    async def take(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            # Later callers queue behind the debt already taken.
+            await asyncio.sleep(-self._tokens / self._rate)
+
+
+@dataclass(slots=True, eq=False)
+class _Run:
+    """Progress of one ``reprocess_dlq`` call."""
+
+    dlq_topic: str
+    position: int
+    limit: int | None
+    read: int = 0
+    replayed: int = 0
+    failed: int = 0
+    errors: list[str] = field(default_factory=list)
+    dispatcher: PartitionedDispatcher | None = None
+
+    def fail(self, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < _MAX_ERRORS:
+            self.errors.append(error)
+
+
+class _DLQStream:
+    """Consumer-shaped view of a DLQ topic for ``PartitionedDispatcher``."""
+
+    def __init__(self, handler: "ReplayingDLQHandler", run: _Run) -> None:
+        self._handler = handler
+        self._run = run
+
+    async def subscribe_to_topics(self, topics: list[str], group_id: str) -> None:
+        """Unused: the stream reads its run's DLQ topic."""
+
+    async def unsubscribe_from_topics(self, topics: list[str]) -> None:
+        """Unused: the stream reads its run's DLQ topic."""
+
+    async def consume_messages(
+        self, timeout_ms: int, max_messages: int
+    ) -> list[ProtocolEventBusMessage]:
+        return await self.consume_messages_stream(timeout_ms)
+
+    async def consume_messages_stream(
+        self, batch_timeout_ms: int
+    ) -> list[ProtocolEventBusMessage]:
+        run = self._run
+        room = self._handler.page_size
+        if run.limit is not None:
+            room = min(room, run.limit - run.read)
+        messages: Sequence[ProtocolEventBusMessage] = ()
+        if room > 0 and not self._handler.stopping:
+            messages = await self._handler.reader.read(
+                run.dlq_topic, run.position, room
+            )
+        if not messages:
+            assert run.dispatcher is not None
+            run.dispatcher.stop()
+            return []
+        entries = [
+            _decode(message, run.dlq_topic, run.position + i)
+            for i, message in enumerate(messages)
+        ]
+        run.position += len(entries)
+        run.read += len(entries)
+        self._handler.observe(entries)
+        return list(entries)
+
+    async def commit_offsets(self) -> None:
+        """Unused: ``commit`` is always available."""
+
+    async def commit(self, offsets: dict[str, dict[int, int]]) -> None:
+        await self._handler.checkpoint(
+            self._run.dlq_topic, offsets[self._run.dlq_topic][0]
+        )
+
+    async def seek_to_beginning(self, topic: str, partition: int) -> None:
+        await self.seek_to_offset(topic, partition, 0)
+
+    async def seek_to_end(self, topic: str, partition: int) -> None:
+        end = await self._handler.reader.end_position(self._run.dlq_topic)
+        await self.seek_to_offset(topic, partition, end)
+
+    async def seek_to_offset(self, topic: str, partition: int, offset: int) -> None:
+        self._run.position = offset
+
+    async def get_current_offsets(self) -> dict[str, dict[int, int]]:
+        return {self._run.dlq_topic: {0: self._run.position}}
+
+    async def close_consumer(self, timeout_seconds: float = 30.0) -> None:
+        """Unused: the reader belongs to the handler."""
+
+    async def validate_connection(self) -> bool:
+        return True
+
+
+class ReplayingDLQHandler:
+    """
+    ``ProtocolDLQHandler`` replaying DLQ entries in parallel under a rate limit.
+
+    Attributes:
+        reprocessing_success: Entries replayed since creation.
+        reprocessing_failed: Entries that failed to replay since creation.
+        alerts_triggered: Times the summary went from OK to ALERT.
+    """
+
+    def __init__(
+        self,
+        reader: DLQReader,
+        producer: ProtocolEventBusProducerHandler,
+        *,
+        dlq_topics: Sequence[str] = (),
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_per_second: float | None = None,
+        burst: int | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        checkpoint_path: Path | None = None,
+        alert_threshold: int = 100,
+        max_dlq_message_age_hours: float = 24.0,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create a replayer.
+
+        Args:
+            reader: Source of DLQ entries.
+            producer: Producer to republish original envelopes with.
+            dlq_topics: DLQ topics to report on before they are replayed;
+                topics replayed or checkpointed are reported on anyway.
+            concurrency: Most entries replayed at once.
+            rate_per_second: Most replays per second; None for no limit.
+            burst: Replays allowed at once above the rate; defaults to
+                ``concurrency``.
+            page_size: Entries read per ``DLQReader.read`` call, and
+                replayed between checkpoints.
+            checkpoint_path: JSON file to keep checkpoints in across
+                restarts; loaded if it exists.
+            alert_threshold: Unreplayed entries above which the summary
+                alerts.
+            max_dlq_message_age_hours: Age of the oldest unreplayed entry
+                above which the summary alerts.
+            clock: Monotonic time source for rate limiting and throughput.
+            wall_clock: Epoch time source for entry ages.
+
+        Raises:
+            ValueError: If ``concurrency``, ``rate_per_second``, ``burst``
+                or ``page_size`` is not positive.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        if rate_per_second is not None and rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be positive")
+        self.reader = reader
+        self.page_size = page_size
+        self._producer = producer
+        self._concurrency = concurrency
+        self._bucket = (
+            None
+            if rate_per_second is None
+            else _TokenBucket(rate_per_second, burst or concurrency, clock)
+        )
+        self._checkpoint_path = checkpoint_path
+        self._alert_threshold = alert_threshold
+        self._max_age_hours = max_dlq_message_age_hours
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._checkpoints: dict[str, int] = {}
+        if checkpoint_path is not None and checkpoint_path.exists():
+            self._checkpoints = json.loads(checkpoint_path.read_text())
+        self._ends: dict[str, int] = dict.fromkeys(dlq_topics, 0)
+        self._by_topic: Counter[str] = Counter()
+        self._by_error: Counter[str] = Counter()
+        # Per topic, (end position, oldest error timestamp) of each page
+        # read but not yet checkpointed.
+        self._pages: dict[str, deque[tuple[int, float | None]]] = {}
+        self._runs: set[_Run] = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._started_at: float | None = None
+        self._session_replayed = 0
+        self._rate = 0.0
+        self._alerting = False
+        self.stopping = False
+        self.reprocessing_success = 0
+        self.reprocessing_failed = 0
+        self.alerts_triggered = 0
+
+    @property
+    def checkpoints(self) -> dict[str, int]:
+        """Position up to which each DLQ topic has been replayed."""
+        return dict(self._checkpoints)
+
+    # -- lifecycle ------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Allow replays again after ``stop``."""
+        self.stopping = False
+
+    async def stop(self, timeout_seconds: float = 30.0) -> None:
+        """
+        Stop running replays after their current page and checkpoint.
+
+        Raises:
+            TimeoutError: If the replays do not stop within the timeout.
+        """
+        self.stopping = True
+        for run in self._runs:
+            if run.dispatcher is not None:
+                run.dispatcher.stop()
+        async with asyncio.timeout(timeout_seconds):
+            await self._idle.wait()
+
+    # -- replay ---------------------------------------------------------------
+
+    async def reprocess_dlq(self, dlq_topic: str, limit: int | None = None) -> JsonType:
+        """
+        Replay entries of ``dlq_topic`` from its checkpoint on.
+
+        Returns:
+            ``messages_reprocessed``, ``messages_failed`` and ``errors`` as
+            the protocol defines them, plus ``checkpoint``, the position
+            the next call starts from.
+
+        Raises:
+            InvalidProtocolStateError: If the handler is stopped.
+        """
+        if self.stopping:
+            raise InvalidProtocolStateError("DLQ handler is stopped")
+        run = _Run(dlq_topic, self._checkpoints.get(dlq_topic, 0), limit)
+        run.dispatcher = PartitionedDispatcher(
+            _DLQStream(self, run),
+            lambda message: self._replay(run, message),
+            lanes=self._concurrency,
+            max_in_flight=self.page_size,
+            batch_timeout_ms=0,
+            key=_replay_key,
+        )
+        self._ends[dlq_topic] = await self.reader.end_position(dlq_topic)
+        self._runs.add(run)
+        self._idle.clear()
+        if self._started_at is None:
+            self._started_at = self._clock()
+        try:
+            await run.dispatcher.run()
+        except ProtocolHandlerError as e:
+            # The failed entry is counted by _replay; the replay stops there.
+            run.errors.append(str(e.__cause__ or e))
+        finally:
+            self._runs.discard(run)
+            if not self._runs:
+                self._rate = self._throughput()
+                self._idle.set()
+                self._started_at = None
+                self._session_replayed = 0
+        return {
+            "messages_reprocessed": run.replayed,
+            "messages_failed": run.failed,
+            "errors": list(run.errors[:_MAX_ERRORS]),
+            "checkpoint": self._checkpoints.get(dlq_topic, 0),
+        }
+
+    async def _replay(self, run: _Run, message: ProtocolEventBusMessage) -> None:
+        entry = _entry(message)
+        if entry.problem is not None:
+            run.fail(entry.problem)
+            self.reprocessing_failed += 1
+            return
+        if self._bucket is not None:
+            await self._bucket.take()
+        try:
+            await self._producer.send(
+                topic=entry.original_topic, value=entry.envelope, key=entry.key
+            )
+        except Exception:
+            run.failed += 1
+            self.reprocessing_failed += 1
+            raise
+        run.replayed += 1
+        self._session_replayed += 1
+        self.reprocessing_success += 1
+
+    async def checkpoint(self, dlq_topic: str, position: int) -> None:
+        """Record that every entry of ``dlq_topic`` before ``position`` is replayed."""
+        # Buffered sends must be delivered before the checkpoint covers them.
+        await self._producer.flush()
+        self._checkpoints[dlq_topic] = position
+        pages = self._pages.get(dlq_topic)
+        while pages and pages[0][0] <= position:
+            pages.popleft()
+        if self._checkpoint_path is not None:
+            staged = self._checkpoint_path.with_name(
+                self._checkpoint_path.name + ".tmp"
+            )
+            staged.write_text(json.dumps(self._checkpoints))
+            staged.replace(self._checkpoint_path)
+
+    def observe(self, entries: Sequence[_Entry]) -> None:
+        """Count entries read into the topic and error breakdowns."""
+        stamps = []
+        for entry in entries:
+            self._by_topic[entry.original_topic or entry.topic] += 1
+            self._by_error[entry.error_type] += 1
+            if entry.error_timestamp is not None:
+                stamps.append(entry.error_timestamp)
+        # Decoded entries always carry their DLQ position.
+        if entries and (end := entries[-1].offset) is not None:
+            self._pages.setdefault(entries[-1].topic, deque()).append(
+                (end + 1, min(stamps, default=None))
+            )
+
+    # -- metrics --------------------------------------------------------------
+
+    def _oldest_age_hours(self) -> float:
+        stamps = [
+            stamp
+            for pages in self._pages.values()
+            for _, stamp in pages
+            if stamp is not None
+        ]
+        if not stamps:
+            return 0.0
+        return max(0.0, self._wall_clock() - min(stamps)) / 3600
+
+    def _throughput(self) -> float:
+        if self._started_at is None:
+            return self._rate
+        elapsed = self._clock() - self._started_at
+        return self._session_replayed / elapsed if elapsed > 0 else 0.0
+
+    async def get_metrics(self) -> JsonType:
+        """Protocol metrics plus replay throughput and ETA."""
+        for dlq_topic in self._checkpoints.keys() | self._ends.keys():
+            self._ends[dlq_topic] = await self.reader.end_position(dlq_topic)
+        remaining = sum(
+            max(0, end - self._checkpoints.get(topic, 0))
+            for topic, end in self._ends.items()
+        )
+        rate = self._throughput()
+        return {
+            "total_dlq_messages": sum(self._ends.values()),
+            "messages_by_topic": dict(self._by_topic),
+            "messages_by_error_type": dict(self._by_error),
+            "oldest_message_age_hours": self._oldest_age_hours(),
+            "reprocessing_success": self.reprocessing_success,
+            "reprocessing_failed": self.reprocessing_failed,
+            "alerts_triggered": self.alerts_triggered,
+            "replay_remaining": remaining,
+            "replay_rate_per_second": rate,
+            "replay_eta_seconds": remaining / rate if rate > 0 else None,
+        }
+
+    async def get_dlq_summary(self) -> JsonType:
+        """Protocol summary; alerts on unreplayed count or oldest age."""
+        metrics = await self.get_metrics()
+        assert isinstance(metrics, dict)
+        remaining = metrics["replay_remaining"]
+        age = self._oldest_age_hours()
+        alerting = (
+            isinstance(remaining, int) and remaining > self._alert_threshold
+        ) or age > self._max_age_hours
+        if alerting and not self._alerting:
+            self.alerts_triggered += 1
+        self._alerting = alerting
+        return {
+            "total_messages": metrics["total_dlq_messages"],
+            "oldest_message_age_hours": age,
+            "top_failing_topics": dict(self._by_topic.most_common(_TOP)),
+            "top_error_types": dict(self._by_error.most_common(_TOP)),
+            "alert_status": "ALERT" if alerting else "OK",
+            "alerts_triggered": self.alerts_triggered,
+        }
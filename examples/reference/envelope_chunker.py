@@ -0,0 +1,571 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Zero-copy reference implementation of ``ProtocolEnvelopeChunker``.
+
+``EnvelopeChunker.chunk`` serializes the envelope once and slices the result
+with ``memoryview``: chunk payloads are read-only views into that single
+buffer, and the per-chunk and whole-series checksums are computed in the
+same pass over the slices. Payloads are therefore ``memoryview`` objects
+rather than ``bytes``; they support the buffer protocol (sockets, files,
+hashing, ``bytes(...)``) but pydantic serializes them only with a
+warning. Pass ``copy_payloads=True`` where a transport needs real ``bytes``
+or serializes the model.
+
+``ChunkReassembler`` rebuilds envelopes from chunks as they arrive, in any
+order and interleaved across series:
+
+- each series gets a preallocated slot per chunk index, so nothing is
+  sorted, and the payloads are joined exactly once, on completion (a
+  preallocated ``bytearray`` would cost a second full copy, because
+  ``from_bytes`` takes immutable ``bytes``);
+- each chunk is verified on arrival, and the series checksum advances over
+  the contiguous prefix received so far, so in-order arrival leaves no
+  checksum work for the last chunk;
+- ``max_buffered_bytes`` bounds the memory held by incomplete series, and
+  ``expire`` abandons series older than the reassembly timeout;
+- failures drop the series and raise ``ChunkSeriesFailedError`` carrying
+  the ``ModelChunkSeriesFailed`` event to publish.
+
+``EnvelopeChunker.reassemble`` is the batch form of the same reassembler.
+
+Example:
+    ```python
+    chunker = EnvelopeChunker.from_policy(MyEnvelope, policy)
+    chunks = chunker.chunk(envelope, policy.chunk_target_size_bytes)
+
+    reassembler = ChunkReassembler.from_policy(MyEnvelope, policy)
+    for chunk in transport.receive():
+        envelope = reassembler.add(chunk)
+        if envelope is not None:
+            handle(envelope)
+    ```
+"""
+
+import hashlib
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from typing import NoReturn
+from uuid import UUID, uuid4
+
+from omnibase_core.enums.enum_chunk_failure_reason import EnumChunkFailureReason
+from omnibase_core.models.chunking.model_chunk_metadata import ModelChunkMetadata
+from omnibase_core.models.chunking.model_chunk_policy import ModelChunkPolicy
+from omnibase_core.models.chunking.model_chunk_series_failed import (
+    ModelChunkSeriesFailed,
+)
+from omnibase_core.models.chunking.model_chunked_envelope import (
+    ModelChunkedEnvelope,
+)
+from omnibase_spi.protocols.chunking.protocol_chunkable_envelope import (
+    ProtocolChunkableEnvelope,
+)
+
+_POLICY_DEFAULTS = ModelChunkPolicy()
+
+DEFAULT_CHECKSUM_ALGORITHM = "sha256"
+DEFAULT_MAX_CHUNK_COUNT = _POLICY_DEFAULTS.max_chunk_count
+DEFAULT_REASSEMBLY_TIMEOUT_SECONDS = _POLICY_DEFAULTS.reassembly_timeout_seconds
+DEFAULT_MAX_BUFFERED_BYTES = 512 * 1024 * 1024
+
+# Completed series remembered so redelivered chunks are ignored instead of
+# opening a series that can never complete.
+COMPLETED_SERIES_HISTORY = 1024
+
+EnvelopeType = type[ProtocolChunkableEnvelope]
+
+
+class ChunkSeriesFailedError(ValueError):
+    """
+    A chunk series was abandoned.
+
+    Attributes:
+        event: Diagnostic event describing the failure, ready to publish.
+    """
+
+    def __init__(self, event: ModelChunkSeriesFailed) -> None:
+        """Wrap ``event``."""
+        message = f"chunk series {event.chunk_series_id} failed: {event.reason.value}"
+        if event.detail:
+            message = f"{message} ({event.detail})"
+        super().__init__(message)
+        self.event = event
+
+
+def _new_hasher(checksum: str) -> "hashlib._Hash":
+    algorithm, _, digest = checksum.partition(":")
+    if not digest:
+        raise ValueError(f"checksum {checksum!r} is not in algorithm:hex format")
+    return hashlib.new(algorithm)
+
+
+def _format_checksum(hasher: "hashlib._Hash") -> str:
+    return f"{hasher.name}:{hasher.hexdigest()}"
+
+
+class EnvelopeChunker:
+    """
+    ``ProtocolEnvelopeChunker`` that slices with ``memoryview``.
+
+    Chunks use the ``any_order`` reassembly strategy and ``algorithm:hex``
+    checksums.
+    """
+
+    def __init__(
+        self,
+        envelope_type: EnvelopeType,
+        *,
+        max_chunk_count: int = DEFAULT_MAX_CHUNK_COUNT,
+        checksum_algorithm: str = DEFAULT_CHECKSUM_ALGORITHM,
+        copy_payloads: bool = False,
+    ) -> None:
+        """
+        Create a chunker for one envelope type.
+
+        Args:
+            envelope_type: Class whose ``from_bytes`` rebuilds envelopes.
+            max_chunk_count: Most chunks a single envelope may produce.
+            checksum_algorithm: ``hashlib`` algorithm for both checksums.
+            copy_payloads: Give chunks ``bytes`` payloads instead of views.
+
+        Raises:
+            ValueError: If ``max_chunk_count`` is not positive or the
+                algorithm is unknown to ``hashlib``.
+        """
+        if max_chunk_count < 1:
+            raise ValueError("max_chunk_count must be positive")
+        hashlib.new(checksum_algorithm)
+        self.envelope_type = envelope_type
+        self.max_chunk_count = max_chunk_count
+        self.checksum_algorithm = checksum_algorithm
+        self.copy_payloads = copy_payloads
+
+    @classmethod
+    def from_policy(
+        cls,
+        envelope_type: EnvelopeType,
+        policy: ModelChunkPolicy,
+        *,
+        checksum_algorithm: str = DEFAULT_CHECKSUM_ALGORITHM,
+        copy_payloads: bool = False,
+    ) -> "EnvelopeChunker":
+        """Create a chunker enforcing ``policy.max_chunk_count``."""
+        return cls(
+            envelope_type,
+            max_chunk_count=policy.max_chunk_count,
+            checksum_algorithm=checksum_algorithm,
+            copy_payloads=copy_payloads,
+        )
+
+    def chunk(
+        self,
+        envelope: ProtocolChunkableEnvelope,
+        max_chunk_size: int,
+        *,
+        headers: Mapping[str, str] | None = None,
+        series_id: UUID | None = None,
+    ) -> list[ModelChunkedEnvelope]:
+        """
+        Split ``envelope`` into chunks of at most ``max_chunk_size`` bytes.
+
+        Args:
+            envelope: Envelope to chunk.
+            max_chunk_size: Maximum payload bytes per chunk.
+            headers: Routing headers copied onto every chunk.
+            series_id: Series identifier; a random UUID by default.
+
+        Returns:
+            Chunks in index order. An empty envelope yields one empty chunk.
+
+        Raises:
+            ValueError: If ``max_chunk_size`` is not positive or the envelope
+                needs more than ``max_chunk_count`` chunks.
+        """
+        if max_chunk_size < 1:
+            raise ValueError("max_chunk_size must be positive")
+        data = envelope.to_bytes()
+        total_size = len(data)
+        chunk_count = max(1, -(-total_size // max_chunk_size))
+        if chunk_count > self.max_chunk_count:
+            raise ValueError(
+                f"envelope of {total_size} bytes needs {chunk_count} chunks of "
+                f"{max_chunk_size} bytes; max_chunk_count is {self.max_chunk_count}"
+            )
+
+        view = memoryview(data)
+        series_hasher = hashlib.new(self.checksum_algorithm)
+        pieces: list[tuple[memoryview, str]] = []
+        for start in range(0, chunk_count * max_chunk_size, max_chunk_size):
+            piece = view[start : start + max_chunk_size]
+            series_hasher.update(piece)
+            chunk_hasher = hashlib.new(self.checksum_algorithm, piece)
+            pieces.append((piece, _format_checksum(chunk_hasher)))
+        payload_checksum = _format_checksum(series_hasher)
+
+        series_id = series_id if series_id is not None else uuid4()
+        envelope_headers = dict(headers) if headers else {}
+        # Every field is computed here; skip pydantic validation per chunk.
+        return [
+            ModelChunkedEnvelope.model_construct(
+                envelope_headers=envelope_headers,
+                chunk_metadata=ModelChunkMetadata.model_construct(
+                    chunk_series_id=series_id,
+                    chunk_index=index,
+                    chunk_count=chunk_count,
+                    chunk_size=len(piece),
+                    total_size=total_size,
+                    payload_checksum=payload_checksum,
+                    chunk_checksum=chunk_checksum,
+                    reassembly_strategy="any_order",
+                ),
+                chunk_payload=piece.tobytes() if self.copy_payloads else piece,
+            )
+            for index, (piece, chunk_checksum) in enumerate(pieces)
+        ]
+
+    def reassemble(
+        self, chunks: list[ModelChunkedEnvelope]
+    ) -> ProtocolChunkableEnvelope:
+        """
+        Rebuild the envelope from every chunk of one series, in any order.
+
+        Raises:
+            ValueError: If chunks are missing, belong to several series or
+                fail verification (``ChunkSeriesFailedError``), or if
+                deserialization fails.
+        """
+        if not chunks:
+            raise ValueError("no chunks to reassemble")
+        series_ids = {chunk.chunk_metadata.chunk_series_id for chunk in chunks}
+        if len(series_ids) > 1:
+            raise ValueError(f"chunks belong to {len(series_ids)} series")
+        reassembler = ChunkReassembler(
+            self.envelope_type, max_chunk_count=self.max_chunk_count
+        )
+        for chunk in chunks:
+            envelope = reassembler.add(chunk)
+            if envelope is not None:
+                return envelope
+        metadata = chunks[0].chunk_metadata
+        raise ValueError(
+            f"chunk series {metadata.chunk_series_id} is incomplete: "
+            f"{reassembler.received(metadata.chunk_series_id)} of "
+            f"{metadata.chunk_count} chunks"
+        )
+
+
+class _Series:
+    """Reassembly state of one chunk series."""
+
+    __slots__ = (
+        "chunk_checksums",
+        "chunk_count",
+        "deadline",
+        "expiry",
+        "hashed",
+        "hasher",
+        "payload_checksum",
+        "payloads",
+        "received",
+        "received_bytes",
+        "strict_order",
+        "total_size",
+    )
+
+    def __init__(self, metadata: ModelChunkMetadata, deadline: float) -> None:
+        self.chunk_count = metadata.chunk_count
+        self.total_size = metadata.total_size
+        self.payload_checksum = metadata.payload_checksum
+        self.hasher = _new_hasher(metadata.payload_checksum)
+        self.strict_order = metadata.reassembly_strategy == "strict_order"
+        self.expiry = metadata.expiry_timestamp
+        self.deadline = deadline
+        self.payloads: list[bytes | None] = [None] * metadata.chunk_count
+        self.chunk_checksums: list[str | None] = [None] * metadata.chunk_count
+        self.received = 0
+        self.received_bytes = 0
+        self.hashed = 0
+
+
+class ChunkReassembler:
+    """
+    Streaming, bounded-memory reassembly of chunk series.
+
+    Not thread-safe; feed it from one task or thread.
+    """
+
+    def __init__(
+        self,
+        envelope_type: EnvelopeType,
+        *,
+        timeout_seconds: float = DEFAULT_REASSEMBLY_TIMEOUT_SECONDS,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+        max_chunk_count: int = DEFAULT_MAX_CHUNK_COUNT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create a reassembler for one envelope type.
+
+        Args:
+            envelope_type: Class whose ``from_bytes`` rebuilds envelopes.
+            timeout_seconds: Time a series may take, from its first chunk,
+                before ``expire`` abandons it.
+            max_buffered_bytes: Total size of incomplete series kept at once.
+            max_chunk_count: Largest accepted ``chunk_count``.
+            clock: Monotonic clock in seconds, for the timeout.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if timeout_seconds <= 0 or max_buffered_bytes < 1 or max_chunk_count < 1:
+            raise ValueError(
+                "timeout_seconds, max_buffered_bytes and max_chunk_count must be positive"
+            )
+        self.envelope_type = envelope_type
+        self.timeout_seconds = timeout_seconds
+        self.max_buffered_bytes = max_buffered_bytes
+        self.max_chunk_count = max_chunk_count
+        self._clock = clock
+        self._series: dict[UUID, _Series] = {}
+        self._completed: dict[UUID, None] = {}
+        self._buffered_bytes = 0
+
+    @classmethod
+    def from_policy(
+        cls,
+        envelope_type: EnvelopeType,
+        policy: ModelChunkPolicy,
+        *,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+    ) -> "ChunkReassembler":
+        """Create a reassembler using the policy's timeout and chunk limit."""
+        return cls(
+            envelope_type,
+            timeout_seconds=policy.reassembly_timeout_seconds,
+            max_buffered_bytes=max_buffered_bytes,
+            max_chunk_count=policy.max_chunk_count,
+        )
+
+    @property
+    def pending_series(self) -> int:
+        """Incomplete series currently buffered."""
+        return len(self._series)
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes preallocated for incomplete series."""
+        return self._buffered_bytes
+
+    def received(self, series_id: UUID) -> int:
+        """Chunks received so far for an incomplete series (0 if unknown)."""
+        series = self._series.get(series_id)
+        return series.received if series is not None else 0
+
+    def add(self, chunk: ModelChunkedEnvelope) -> ProtocolChunkableEnvelope | None:
+        """
+        Accept one chunk.
+
+        Redelivered chunks (same index and checksum) and chunks of series
+        completed recently are ignored.
+
+        Returns:
+            The reassembled envelope when ``chunk`` completes its series,
+            otherwise ``None``.
+
+        Raises:
+            ChunkSeriesFailedError: If the chunk is corrupt, conflicts with a
+                chunk already received, breaks ``strict_order`` or would
+                exceed ``max_buffered_bytes``. The series is dropped.
+            ValueError: If the reassembled bytes fail to deserialize.
+        """
+        metadata = chunk.chunk_metadata
+        series_id = metadata.chunk_series_id
+        if series_id in self._completed:
+            return None
+        series = self._series.get(series_id)
+        if series is None:
+            series = self._open(metadata)
+        self._check_chunk(series, metadata, chunk.chunk_payload)
+
+        index = metadata.chunk_index
+        if series.chunk_checksums[index] is not None:
+            if series.chunk_checksums[index] == metadata.chunk_checksum:
+                return None
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.DUPLICATE_CHUNK,
+                f"chunk {index} redelivered with a different checksum",
+            )
+        if series.strict_order and index != series.received:
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.CORRUPT_CHUNK,
+                f"chunk {index} arrived before chunk {series.received} in a "
+                "strict_order series",
+            )
+
+        series.payloads[index] = chunk.chunk_payload
+        series.chunk_checksums[index] = metadata.chunk_checksum
+        series.received += 1
+        series.received_bytes += metadata.chunk_size
+        self._advance_hash(series)
+        if series.received < series.chunk_count:
+            return None
+
+        del self._series[series_id]
+        self._buffered_bytes -= series.total_size
+        if _format_checksum(series.hasher) != series.payload_checksum:
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.CHECKSUM_MISMATCH,
+                f"expected {series.payload_checksum}",
+                chunk_count=series.chunk_count,
+                received=series.received,
+            )
+        self._remember(series_id)
+        return self.envelope_type.from_bytes(b"".join(series.payloads))  # type: ignore[arg-type]
+
+    def expire(self) -> list[ModelChunkSeriesFailed]:
+        """
+        Abandon series past the reassembly timeout or their expiry timestamp.
+
+        Returns:
+            One ``TIMEOUT`` failure event per abandoned series.
+        """
+        now = self._clock()
+        wall_now = datetime.now(UTC)
+        expired = [
+            series_id
+            for series_id, series in self._series.items()
+            if now >= series.deadline
+            or (series.expiry is not None and wall_now >= series.expiry)
+        ]
+        events = []
+        for series_id in expired:
+            series = self._series.pop(series_id)
+            self._buffered_bytes -= series.total_size
+            events.append(
+                ModelChunkSeriesFailed(
+                    chunk_series_id=series_id,
+                    reason=EnumChunkFailureReason.TIMEOUT,
+                    received_chunk_count=series.received,
+                    expected_chunk_count=series.chunk_count,
+                    failed_at=wall_now,
+                )
+            )
+        return events
+
+    def _open(self, metadata: ModelChunkMetadata) -> _Series:
+        series_id = metadata.chunk_series_id
+        if metadata.chunk_count > self.max_chunk_count:
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.CORRUPT_CHUNK,
+                f"chunk_count {metadata.chunk_count} exceeds {self.max_chunk_count}",
+                chunk_count=metadata.chunk_count,
+            )
+        if self._buffered_bytes + metadata.total_size > self.max_buffered_bytes:
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.PARTIAL_PROCESSING_PREVENTED,
+                f"{metadata.total_size} bytes would exceed the "
+                f"{self.max_buffered_bytes}-byte reassembly budget",
+                chunk_count=metadata.chunk_count,
+            )
+        try:
+            series = _Series(metadata, self._clock() + self.timeout_seconds)
+        except ValueError as e:
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.CORRUPT_CHUNK,
+                str(e),
+                chunk_count=metadata.chunk_count,
+            )
+        self._series[series_id] = series
+        self._buffered_bytes += series.total_size
+        return series
+
+    def _check_chunk(
+        self, series: _Series, metadata: ModelChunkMetadata, payload: bytes
+    ) -> None:
+        series_id = metadata.chunk_series_id
+        index = metadata.chunk_index
+        size = len(payload)
+        if (
+            metadata.chunk_count != series.chunk_count
+            or metadata.total_size != series.total_size
+            or metadata.payload_checksum != series.payload_checksum
+            or index >= series.chunk_count
+            or size != metadata.chunk_size
+        ):
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.CORRUPT_CHUNK,
+                f"chunk {index} metadata is inconsistent with its series",
+            )
+
+        # Redeliveries are compared by checksum in add().
+        remaining = series.total_size - series.received_bytes
+        completes = series.received == series.chunk_count - 1
+        if series.chunk_checksums[index] is None and (
+            size > remaining or (completes and size != remaining)
+        ):
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.CORRUPT_CHUNK,
+                f"chunk {index} has {size} bytes, which does not fit the series",
+            )
+
+        try:
+            hasher = _new_hasher(metadata.chunk_checksum)
+        except ValueError as e:
+            self._fail(series_id, EnumChunkFailureReason.CORRUPT_CHUNK, str(e))
+        hasher.update(payload)
+        if _format_checksum(hasher) != metadata.chunk_checksum:
+            self._fail(
+                series_id,
+                EnumChunkFailureReason.CHECKSUM_MISMATCH,
+                f"chunk {index} expected {metadata.chunk_checksum}",
+            )
+
+    @staticmethod
+    def _advance_hash(series: _Series) -> None:
+        payloads = series.payloads
+        while series.hashed < series.chunk_count:
+            payload = payloads[series.hashed]
+            if payload is None:
+                return
+            series.hasher.update(payload)
+            series.hashed += 1
+
+    def _remember(self, series_id: UUID) -> None:
+        self._completed[series_id] = None
+        if len(self._completed) > COMPLETED_SERIES_HISTORY:
+            del self._completed[next(iter(self._completed))]
+
+    def _fail(
+        self,
+        series_id: UUID,
+        reason: EnumChunkFailureReason,
+        detail: str,
+        *,
+        chunk_count: int | None = None,
+        received: int | None = None,
+    ) -> NoReturn:
+        series = self._series.pop(series_id, None)
+        if series is not None:
+            self._buffered_bytes -= series.total_size
+            chunk_count = series.chunk_count
+            received = series.received
+        raise ChunkSeriesFailedError(
+            ModelChunkSeriesFailed(
+                chunk_series_id=series_id,
+                reason=reason,
+                received_chunk_count=received or 0,
+                expected_chunk_count=chunk_count or 1,
+                failed_at=datetime.now(UTC),
+                detail=detail,
+            )
+        )
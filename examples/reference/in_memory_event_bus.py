@@ -0,0 +1,323 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Partitioned in-memory reference implementation of ``ProtocolEventBusBase``.
+
+``InMemoryEventBus`` is meant for tests and single-node deployments:
+
+- Every topic is split into a fixed number of partitions, each a bounded
+  ring buffer. Messages with the same key (``ProtocolEventMessage.key`` or
+  ``ModelEnvelope.entity_id``) land in the same partition and are delivered
+  in publish order; keyless messages are spread round-robin.
+- ``publish`` / ``publish_envelope`` wait while the target partition is
+  full, so memory stays bounded and producers are slowed to consumer speed.
+- Subscriptions that share a consumer ``group`` split the topic's
+  partitions between them; every group receives every message.
+- The published object itself is handed to every group: nothing is copied
+  or serialized on the way.
+
+One worker task per partition delivers each message to the partition's
+handlers in turn, so a partition advances at the pace of its slowest group.
+Messages published to a topic nobody subscribes to are dropped. The bus
+belongs to the event loop it is used on and is not thread-safe.
+
+Example:
+    ```python
+    bus = InMemoryEventBus(partitions=4)
+    await bus.subscribe("onex.evt.demo.v1", handle_envelope, group="workers")
+    consumer = asyncio.create_task(bus.start_consuming())
+    await bus.publish_envelope(envelope, "onex.evt.demo.v1")
+    await bus.stop_consuming()
+    await consumer
+    ```
+"""
+
+import asyncio
+import itertools
+import zlib
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from omnibase_core.models.common import ModelEnvelope
+from omnibase_core.types import JsonType
+from omnibase_spi.exceptions import SPIError
+from omnibase_spi.protocols.types.protocol_event_bus_types import ProtocolEventMessage
+
+EnvelopeHandler = Callable[[ModelEnvelope], Awaitable[None]]
+
+# Handlers receive whatever was published: envelopes from publish_envelope(),
+# event messages from publish().
+_Handler = Callable[[Any], Awaitable[None]]
+
+DEFAULT_PARTITIONS = 8
+DEFAULT_PARTITION_CAPACITY = 1024
+
+
+class _Partition:
+    """Bounded ring buffer plus the handlers it delivers to."""
+
+    __slots__ = (
+        "capacity",
+        "count",
+        "head",
+        "not_empty",
+        "not_full",
+        "routes",
+        "slots",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        self.slots: list[object] = [None] * capacity
+        self.capacity = capacity
+        self.head = 0
+        self.count = 0
+        self.not_empty = asyncio.Event()
+        self.not_full = asyncio.Event()
+        self.not_full.set()
+        # One handler per consumer group, chosen by rebalance().
+        self.routes: tuple[_Handler, ...] = ()
+
+
+class _Topic:
+    """Partitions and consumer groups of one topic."""
+
+    __slots__ = ("groups", "partitions", "round_robin")
+
+    def __init__(self, partitions: int, capacity: int) -> None:
+        self.partitions = tuple(_Partition(capacity) for _ in range(partitions))
+        self.groups: dict[str, list[_Handler]] = {}
+        self.round_robin = itertools.cycle(self.partitions)
+
+    def partition_for(self, key: bytes | str | None) -> _Partition:
+        if key is None:
+            return next(self.round_robin)
+        if isinstance(key, str):
+            key = key.encode()
+        return self.partitions[zlib.crc32(key) % len(self.partitions)]
+
+    def rebalance(self) -> None:
+        """Assign each partition to one member of every group."""
+        for index, partition in enumerate(self.partitions):
+            partition.routes = tuple(
+                members[index % len(members)] for members in self.groups.values()
+            )
+
+
+class InMemoryEventBus:
+    """
+    In-process event bus with partitioned, bounded, key-ordered delivery.
+
+    Implements ``ProtocolEventBusBase``. ``subscribe`` additionally accepts a
+    consumer ``group``; subscriptions without one each form their own group.
+
+    Attributes:
+        published: Messages accepted into a partition.
+        delivered: Successful handler invocations.
+        dropped: Messages published to topics without subscribers.
+        handler_errors: Handler invocations that raised.
+        last_error: ``"ExceptionType: message"`` of the latest handler error.
+    """
+
+    def __init__(
+        self,
+        partitions: int = DEFAULT_PARTITIONS,
+        partition_capacity: int = DEFAULT_PARTITION_CAPACITY,
+    ) -> None:
+        """
+        Create an idle bus.
+
+        Args:
+            partitions: Partitions per topic.
+            partition_capacity: Messages each partition buffers before
+                publishers wait.
+
+        Raises:
+            ValueError: If either argument is not positive.
+        """
+        if partitions < 1 or partition_capacity < 1:
+            raise ValueError("partitions and partition_capacity must be positive")
+        self._partitions = partitions
+        self._capacity = partition_capacity
+        self._topics: dict[str, _Topic] = {}
+        self._workers: dict[_Partition, asyncio.Task[None]] = {}
+        self._anonymous_groups = itertools.count()
+        self._consuming = False
+        self._stopping = False
+        self._stopped = asyncio.Event()
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.handler_errors = 0
+        self.last_error: str | None = None
+
+    # -- publishing ---------------------------------------------------------
+
+    async def publish(self, event: ProtocolEventMessage) -> None:
+        """
+        Publish an event message to ``event.topic``, partitioned by ``event.key``.
+
+        Waits while the target partition is full.
+        """
+        await self._enqueue(event.topic, event.key, event)
+
+    async def publish_envelope(self, envelope: ModelEnvelope, topic: str) -> None:
+        """
+        Publish an envelope to ``topic``, partitioned by ``envelope.entity_id``.
+
+        Waits while the target partition is full.
+        """
+        await self._enqueue(topic, envelope.entity_id, envelope)
+
+    async def _enqueue(
+        self, topic: str, key: bytes | str | None, message: object
+    ) -> None:
+        entry = self._topics.get(topic)
+        if entry is None or not entry.groups:
+            self.dropped += 1
+            return
+        partition = entry.partition_for(key)
+        while partition.count == partition.capacity:
+            partition.not_full.clear()
+            await partition.not_full.wait()
+        partition.slots[(partition.head + partition.count) % partition.capacity] = (
+            message
+        )
+        partition.count += 1
+        self.published += 1
+        if partition.count == 1:
+            partition.not_empty.set()
+
+    # -- subscribing --------------------------------------------------------
+
+    async def subscribe(
+        self,
+        topic: str,
+        handler: EnvelopeHandler,
+        group: str | None = None,
+    ) -> None:
+        """
+        Register ``handler`` for ``topic``.
+
+        Args:
+            topic: Topic to consume.
+            handler: Async callback; receives the published object itself.
+            group: Consumer group. Members of one group share the topic's
+                partitions (each partition goes to exactly one member, so
+                per-key order is kept); every group sees every message.
+
+        Raises:
+            SPIError: If ``topic`` is empty.
+        """
+        if not topic:
+            raise SPIError("topic must be a non-empty string")
+        entry = self._topics.get(topic)
+        if entry is None:
+            entry = self._topics[topic] = _Topic(self._partitions, self._capacity)
+        if group is None:
+            group = f"\0anonymous-{next(self._anonymous_groups)}"
+        entry.groups.setdefault(group, []).append(handler)
+        entry.rebalance()
+        if self._consuming:
+            self._start_workers(entry)
+
+    # -- consuming ----------------------------------------------------------
+
+    async def start_consuming(self, timeout_seconds: float | None = None) -> None:
+        """
+        Deliver messages until ``stop_consuming`` is called.
+
+        Args:
+            timeout_seconds: Stop consuming and return after this many
+                seconds. ``None`` runs until stopped.
+        """
+        if not self._consuming:
+            self._consuming = True
+            self._stopping = False
+            self._stopped = asyncio.Event()
+            for entry in self._topics.values():
+                self._start_workers(entry)
+        stopped = self._stopped
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                await stopped.wait()
+        except TimeoutError:
+            await self.stop_consuming()
+
+    async def stop_consuming(self, timeout_seconds: float = 30.0) -> None:
+        """
+        Drain buffered messages, then stop the partition workers.
+
+        Args:
+            timeout_seconds: Time allowed for draining. Workers still busy
+                afterwards are cancelled; their undelivered messages stay
+                buffered for the next ``start_consuming``.
+        """
+        if not self._consuming:
+            return
+        self._stopping = True
+        workers = list(self._workers.values())
+        for partition in self._workers:
+            partition.not_empty.set()
+        if workers:
+            _, pending = await asyncio.wait(workers, timeout=timeout_seconds)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._workers.clear()
+        self._consuming = False
+        self._stopped.set()
+
+    def _start_workers(self, entry: _Topic) -> None:
+        for partition in entry.partitions:
+            if partition not in self._workers:
+                self._workers[partition] = asyncio.create_task(self._drain(partition))
+
+    async def _drain(self, partition: _Partition) -> None:
+        slots = partition.slots
+        capacity = partition.capacity
+        while True:
+            if not partition.count:
+                if self._stopping:
+                    return
+                partition.not_empty.clear()
+                await partition.not_empty.wait()
+                continue
+
+            head = partition.head
+            message = slots[head]
+            slots[head] = None
+            partition.head = (head + 1) % capacity
+            partition.count -= 1
+            if partition.count == capacity - 1:
+                partition.not_full.set()
+
+            routes = partition.routes
+            for handler in routes:
+                try:
+                    await handler(message)
+                # A failing handler must not stop the partition.
+                except Exception as e:  # noqa: BLE001
+                    self.handler_errors += 1
+                    self.delivered -= 1
+                    self.last_error = f"{type(e).__name__}: {e}"
+            self.delivered += len(routes)
+
+    # -- health -------------------------------------------------------------
+
+    async def health_check(self) -> JsonType:
+        """Return counters and buffer occupancy; the bus itself is always healthy."""
+        partitions = [p for entry in self._topics.values() for p in entry.partitions]
+        return {
+            "healthy": True,
+            "consuming": self._consuming,
+            "topics": len(self._topics),
+            "partitions": len(partitions),
+            "buffered": sum(p.count for p in partitions),
+            "capacity": sum(p.capacity for p in partitions),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "handler_errors": self.handler_errors,
+            "last_error": self.last_error,
+        }
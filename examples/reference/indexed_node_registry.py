@@ -0,0 +1,869 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Indexed scheduling ``ProtocolWorkflowNodeRegistry``.
+
+``IndexedNodeRegistry`` keeps workflow nodes in memory and picks nodes for
+tasks without scoring every node for every task:
+
+- Each node has a base score: its free task slots as a fraction of
+  ``max_concurrent_tasks``, times its smoothed success rate, times a
+  health factor (1 for healthy, 0.5 for degraded), reduced by up to half
+  for reserved resources. The score is recomputed only when one of these
+  changes: ``update_node_workload``, ``record_task_execution_metrics``,
+  ``reserve_resources``, ``release_resources``, a capability change or a
+  health change.
+- Capability names map to the nodes that have them. For every node type,
+  each capability has a heap of its nodes by base score, and one more
+  heap holds all nodes of the type. A recomputed score is pushed onto the
+  node's heaps, and the entry it replaces is dropped once a walk reaches
+  it. A heap is rebuilt once such entries outnumber live ones. Nodes
+  without free slots or with an unschedulable health status are left out
+  of the heaps.
+- A node with every preferred capability of a task scores 1 more than
+  its base score, so it ranks above all nodes without them.
+  ``discover_nodes_for_task`` first walks the heap of the rarest required
+  or preferred capability, best base score first, and checks the other
+  constraints on each node it reaches. If that yields too few nodes, it
+  goes on with the heap of the rarest required capability. Either walk
+  stops as soon as it has enough nodes, and the result is the one
+  ``calculate_scheduling_score`` would give for every node.
+- ``reserve_resources`` holds numeric resource amounts against a node's
+  capacity. All amounts are reserved or none are, and the reservation is
+  released when its timeout passes.
+
+A node fits a task when it has the criteria's node type, a free task slot,
+every required capability, a capability supporting the task type, and
+free capacity for the numeric resource requirements of the task and the
+criteria. Affinity, anti-affinity and geographic rules are not evaluated.
+Nodes are added with ``add_node``; returned node infos are the registry's
+own objects and must be treated as read-only. The registry belongs to one
+event loop and does not call ``base_registry``.
+
+Example:
+    ```python
+    registry = IndexedNodeRegistry(base_registry)
+    registry.add_node(node, capacity={"cpu": 16, "memory_gb": 64})
+
+    result = await registry.discover_nodes_for_task(task, criteria)
+    chosen = result.selected_nodes[0]
+    if await registry.reserve_resources(
+        chosen.node_id, task.task_id, result.resource_allocation, 60
+    ):
+        await registry.update_node_workload(chosen.node_id, task.task_id, "assigned")
+    ```
+"""
+
+import heapq
+import itertools
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from omnibase_spi.protocols.types.protocol_core_types import (
+    ContextValue,
+    LiteralHealthStatus,
+    LiteralNodeType,
+)
+from omnibase_spi.protocols.types.protocol_workflow_orchestration_types import (
+    LiteralTaskPriority,
+    LiteralTaskType,
+    ProtocolTaskConfiguration,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry import (
+    ProtocolTaskSchedulingCriteria,
+    ProtocolWorkflowNodeCapability,
+    ProtocolWorkflowNodeInfo,
+)
+
+if TYPE_CHECKING:
+    from omnibase_spi.protocols.node.protocol_node_registry import ProtocolNodeRegistry
+
+# Health factor of the base score; other statuses are not schedulable.
+_HEALTH = {
+    "healthy": 1.0,
+    "available": 1.0,
+    "degraded": 0.5,
+    "warning": 0.5,
+}
+_STARTED = frozenset({"assigned", "started"})
+_FINISHED = frozenset({"completed", "failed", "cancelled", "released"})
+_PURGE_FLOOR = 1_024
+
+# Heap entry: negated base score, registration order, score stamp, node id.
+_Entry = tuple[float, int, int, str]
+# Heap key: node type and capability name, or None for all nodes of the type.
+_Key = tuple[str, str | None]
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowNodeCapability:
+    """``ProtocolWorkflowNodeCapability`` value object."""
+
+    capability_id: str
+    capability_name: str
+    capability_version: str = "1.0.0"
+    supported_task_types: list[LiteralTaskType] = field(
+        default_factory=lambda: ["compute", "effect", "orchestrator", "reducer"]
+    )
+    supported_node_types: list[LiteralNodeType] = field(default_factory=list)
+    resource_requirements: dict[str, ContextValue] = field(default_factory=dict)
+    configuration_schema: dict[str, ContextValue] = field(default_factory=dict)
+    performance_characteristics: dict[str, float] = field(default_factory=dict)
+    availability_constraints: dict[str, ContextValue] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class WorkflowNodeInfo:
+    """``ProtocolWorkflowNodeInfo`` kept up to date by the registry."""
+
+    node_id: str
+    node_type: LiteralNodeType
+    node_name: str = ""
+    environment: str = "default"
+    group: str = "default"
+    version: str = "1.0.0"
+    health_status: LiteralHealthStatus = "healthy"
+    endpoint: str = ""
+    metadata: dict[str, ContextValue] = field(default_factory=dict)
+    workflow_capabilities: list[ProtocolWorkflowNodeCapability] = field(
+        default_factory=list
+    )
+    current_workload: dict[str, ContextValue] = field(default_factory=dict)
+    max_concurrent_tasks: int = 1
+    current_task_count: int = 0
+    supported_workflow_types: list[str] = field(default_factory=list)
+    task_execution_history: dict[str, ContextValue] = field(default_factory=dict)
+    resource_utilization: dict[str, float] = field(default_factory=dict)
+    scheduling_preferences: dict[str, ContextValue] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class TaskSchedulingCriteria:
+    """``ProtocolTaskSchedulingCriteria`` value object."""
+
+    task_type: LiteralTaskType
+    node_type: LiteralNodeType
+    required_capabilities: list[str] = field(default_factory=list)
+    preferred_capabilities: list[str] = field(default_factory=list)
+    resource_requirements: dict[str, ContextValue] = field(default_factory=dict)
+    affinity_rules: dict[str, ContextValue] = field(default_factory=dict)
+    anti_affinity_rules: dict[str, ContextValue] = field(default_factory=dict)
+    geographic_constraints: dict[str, ContextValue] | None = None
+    priority: LiteralTaskPriority = "normal"
+    timeout_tolerance: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class NodeSchedulingResult:
+    """``ProtocolNodeSchedulingResult`` value object."""
+
+    selected_nodes: list[ProtocolWorkflowNodeInfo]
+    scheduling_score: float
+    scheduling_rationale: str
+    fallback_nodes: list[ProtocolWorkflowNodeInfo]
+    resource_allocation: dict[str, ContextValue]
+    estimated_completion_time: float | None
+    constraints_satisfied: dict[str, bool]
+
+
+@dataclass(slots=True)
+class _Reservation:
+    amounts: dict[str, float]
+    expires: float
+
+
+@dataclass(slots=True)
+class _Node:
+    info: ProtocolWorkflowNodeInfo
+    seq: int
+    capacity: dict[str, float]
+    reserved: dict[str, float] = field(default_factory=dict)
+    reservations: dict[UUID, _Reservation] = field(default_factory=dict)
+    tasks: set[UUID] = field(default_factory=set)
+    # Capability name -> number of the node's capabilities with that name.
+    names: Counter[str] = field(default_factory=Counter)
+    task_types: Counter[str] = field(default_factory=Counter)
+    executions: int = 0
+    successes: int = 0
+    duration: float = 0.0
+    history: deque[tuple[float, str | None, bool, float]] = field(default_factory=deque)
+    score: float = 0.0
+    stamp: int = -1
+    # Heaps holding an entry with the current stamp.
+    keys: tuple[_Key, ...] = ()
+
+
+def _amounts(requirements: Mapping[str, ContextValue]) -> dict[str, float]:
+    """Return the numeric resource amounts of ``requirements``."""
+    return {
+        name: float(value)
+        for name, value in requirements.items()
+        if isinstance(value, int | float) and not isinstance(value, bool)
+    }
+
+
+class IndexedNodeRegistry:
+    """
+    In-memory ``ProtocolWorkflowNodeRegistry`` with indexed task scheduling.
+
+    Attributes:
+        rescores: Base score recomputations.
+        nodes_examined: Nodes reached by ``discover_nodes_for_task`` walks.
+        purges: Rebuilds of a heap to drop skipped entries.
+        reservations_expired: Reservations released by their timeout.
+    """
+
+    def __init__(
+        self,
+        base_registry: "ProtocolNodeRegistry",
+        *,
+        fallback_count: int = 2,
+        history_size: int = 1_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create an empty registry.
+
+        Args:
+            base_registry: Node registry returned by ``base_registry``.
+            fallback_count: Fallback nodes returned with a selected node.
+            history_size: Execution records kept per node for
+                ``get_node_performance_history``.
+            clock: Monotonic time source for reservation timeouts and
+                performance history, in seconds.
+
+        Raises:
+            ValueError: If ``fallback_count`` is negative or
+                ``history_size`` is not positive.
+        """
+        if fallback_count < 0:
+            raise ValueError("fallback_count must not be negative")
+        if history_size <= 0:
+            raise ValueError("history_size must be positive")
+        self._base_registry = base_registry
+        self._fallback_count = fallback_count
+        self._history_size = history_size
+        self._clock = clock
+        self._nodes: dict[str, _Node] = {}
+        self._by_capability: dict[str, dict[str, None]] = {}
+        self._by_workflow_type: dict[str, dict[str, None]] = {}
+        self._members: dict[_Key, dict[str, None]] = {}
+        self._heaps: dict[_Key, list[_Entry]] = {}
+        self._skipped: Counter[_Key] = Counter()
+        self._stamps = itertools.count()
+        self._expiries: list[tuple[float, int, str, UUID]] = []
+        self.rescores = 0
+        self.nodes_examined = 0
+        self.purges = 0
+        self.reservations_expired = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def base_registry(self) -> "ProtocolNodeRegistry":
+        """The node registry this workflow registry extends."""
+        return self._base_registry
+
+    def add_node(
+        self,
+        node: ProtocolWorkflowNodeInfo,
+        *,
+        capacity: Mapping[str, float] | None = None,
+    ) -> None:
+        """
+        Register ``node`` with its workflow capabilities.
+
+        Args:
+            node: Node to schedule tasks on. Its workload, utilization and
+                execution history fields are maintained by the registry.
+            capacity: Amount of each resource ``reserve_resources`` may
+                reserve on the node.
+
+        Raises:
+            ValueError: If the node id is registered or the node's
+                ``max_concurrent_tasks`` is not positive.
+        """
+        if node.node_id in self._nodes:
+            raise ValueError(f"node {node.node_id!r} is already registered")
+        if node.max_concurrent_tasks <= 0:
+            raise ValueError("max_concurrent_tasks must be positive")
+        state = _Node(
+            node,
+            len(self._nodes),
+            dict(capacity or {}),
+            history=deque(maxlen=self._history_size),
+        )
+        self._nodes[node.node_id] = state
+        self._members.setdefault((node.node_type, None), {})[node.node_id] = None
+        for capability in node.workflow_capabilities:
+            self._index(state, capability)
+        for workflow_type in node.supported_workflow_types:
+            self._by_workflow_type.setdefault(workflow_type, {})[node.node_id] = None
+        self._sync(state)
+        self._rescore(state)
+
+    # -- scores ---------------------------------------------------------------
+
+    def _index(self, node: _Node, capability: ProtocolWorkflowNodeCapability) -> None:
+        name = capability.capability_name
+        node.names[name] += 1
+        node.task_types.update(set(capability.supported_task_types))
+        node_id = node.info.node_id
+        self._by_capability.setdefault(name, {})[node_id] = None
+        self._members.setdefault((node.info.node_type, name), {})[node_id] = None
+
+    def _unindex(self, node: _Node, capability: ProtocolWorkflowNodeCapability) -> None:
+        name = capability.capability_name
+        node.names[name] -= 1
+        node.task_types.subtract(set(capability.supported_task_types))
+        if not node.names[name]:
+            del node.names[name]
+            del self._by_capability[name][node.info.node_id]
+            del self._members[node.info.node_type, name][node.info.node_id]
+        node.task_types = +node.task_types
+
+    def _sync(self, node: _Node) -> None:
+        """Mirror the registry's state into the node info."""
+        info = node.info
+        info.current_task_count = len(node.tasks)
+        info.current_workload = {
+            "active_tasks": len(node.tasks),
+            "reserved_tasks": len(node.reservations),
+            "free_slots": info.max_concurrent_tasks - len(node.tasks),
+        }
+        info.resource_utilization = {
+            name: node.reserved.get(name, 0.0) / amount
+            for name, amount in node.capacity.items()
+            if amount > 0
+        }
+        info.task_execution_history = {
+            "executions": node.executions,
+            "successes": node.successes,
+            "failures": node.executions - node.successes,
+            "total_duration_seconds": node.duration,
+        }
+
+    def _base_score(self, node: _Node) -> float:
+        info = node.info
+        health = _HEALTH.get(info.health_status, 0.0)
+        free = info.max_concurrent_tasks - len(node.tasks)
+        if not health or free <= 0:
+            return 0.0
+        reliability = (node.successes + 1) / (node.executions + 2)
+        utilization = info.resource_utilization
+        used = sum(utilization.values()) / len(utilization) if utilization else 0.0
+        return (
+            health
+            * free
+            / info.max_concurrent_tasks
+            * reliability
+            * (1 - min(used, 1.0) / 2)
+        )
+
+    def _rescore(self, node: _Node) -> None:
+        """Recompute the base score and push it onto the node's heaps."""
+        self.rescores += 1
+        replaced = node.keys
+        for key in replaced:
+            self._skipped[key] += 1
+        node.score = self._base_score(node)
+        node.stamp = next(self._stamps)
+        node_id, node_type = node.info.node_id, node.info.node_type
+        node.keys = (
+            ((node_type, None), *((node_type, name) for name in node.names))
+            if node.score > 0
+            else ()
+        )
+        entry = (-node.score, node.seq, node.stamp, node_id)
+        for key in node.keys:
+            heapq.heappush(self._heaps.setdefault(key, []), entry)
+        for key in replaced:
+            # Skipped entries outnumber the live ones.
+            if self._skipped[key] > max(_PURGE_FLOOR, len(self._heaps[key]) // 2):
+                self._purge(key)
+
+    def _purge(self, key: _Key) -> None:
+        heap = []
+        for node_id in self._members.get(key, {}):
+            node = self._nodes[node_id]
+            if key in node.keys:
+                heap.append((-node.score, node.seq, node.stamp, node_id))
+        heapq.heapify(heap)
+        self._heaps[key] = heap
+        self._skipped[key] = 0
+        self.purges += 1
+
+    def _fits(
+        self,
+        node: _Node,
+        task_type: str,
+        criteria: ProtocolTaskSchedulingCriteria,
+        amounts: dict[str, float],
+    ) -> bool:
+        info = node.info
+        if (
+            info.node_type != criteria.node_type
+            or not _HEALTH.get(info.health_status)
+            or len(node.tasks) >= info.max_concurrent_tasks
+            or task_type not in node.task_types
+        ):
+            return False
+        names = node.names
+        if any(name not in names for name in criteria.required_capabilities):
+            return False
+        return self._free(node, amounts, None)
+
+    def _free(
+        self, node: _Node, amounts: dict[str, float], task_id: UUID | None
+    ) -> bool:
+        """Return whether ``amounts`` fit next to other tasks' reservations."""
+        held = node.reservations.get(task_id) if task_id is not None else None
+        for name, amount in amounts.items():
+            reserved = node.reserved.get(name, 0.0)
+            if held is not None:
+                reserved -= held.amounts.get(name, 0.0)
+            if reserved + amount > node.capacity.get(name, 0.0):
+                return False
+        return True
+
+    def _prefers(self, node: _Node, preferred: list[str]) -> bool:
+        names = node.names
+        return bool(preferred) and all(name in names for name in preferred)
+
+    def _score(self, node: _Node, preferred: list[str]) -> float:
+        return node.score + 1.0 if self._prefers(node, preferred) else node.score
+
+    def _take(
+        self,
+        node_type: str,
+        names: list[str],
+        count: int,
+        accept: Callable[[_Node], bool],
+        *,
+        bonus: float,
+    ) -> list[_Node]:
+        """Return the best ``count`` accepted nodes with all of ``names``.
+
+        ``bonus`` is added to the base score of every node in the group.
+        """
+        key = min(
+            ((node_type, name) for name in names),
+            key=lambda k: len(self._members.get(k, ())),
+            default=(node_type, None),
+        )
+        heap = self._heaps.get(key, [])
+        taken: list[_Node] = []
+        examined: list[_Entry] = []
+        # Pops entries best first: replaced ones are dropped for good, and
+        # the examined ones are pushed back once enough nodes are taken.
+        while heap and count > 0:
+            entry = heapq.heappop(heap)
+            node = self._nodes[entry[3]]
+            if node.stamp != entry[2]:
+                self._skipped[key] -= 1
+                continue
+            examined.append(entry)
+            # Adding the preferred bonus can round distinct base scores to
+            # the same score; those ties are read in full and then ordered
+            # by registration, as ranking every node would order them.
+            if len(taken) >= count and node.score + bonus != taken[-1].score + bonus:
+                break
+            if all(name in node.names for name in names) and accept(node):
+                taken.append(node)
+        for entry in examined:
+            heapq.heappush(heap, entry)
+        self.nodes_examined += len(examined)
+        taken.sort(key=lambda n: (-(n.score + bonus), n.seq))
+        return taken[:count]
+
+    def _expire(self) -> None:
+        now = self._clock()
+        while self._expiries and self._expiries[0][0] <= now:
+            expires, _, node_id, task_id = heapq.heappop(self._expiries)
+            node = self._nodes[node_id]
+            held = node.reservations.get(task_id)
+            if held is not None and held.expires == expires:
+                self._release(node, task_id)
+                self.reservations_expired += 1
+
+    def _release(self, node: _Node, task_id: UUID) -> None:
+        held = node.reservations.pop(task_id)
+        for name, amount in held.amounts.items():
+            node.reserved[name] -= amount
+        self._sync(node)
+        self._rescore(node)
+
+    # -- ProtocolWorkflowNodeRegistry -----------------------------------------
+
+    async def discover_nodes_for_task(
+        self,
+        task_config: ProtocolTaskConfiguration,
+        scheduling_criteria: ProtocolTaskSchedulingCriteria,
+    ) -> NodeSchedulingResult:
+        """Pick the best fitting node for a task, with fallbacks."""
+        self._expire()
+        criteria = scheduling_criteria
+        requirements = {
+            **task_config.resource_requirements,
+            **criteria.resource_requirements,
+        }
+        amounts = _amounts(requirements)
+        node_type, task_type = criteria.node_type, task_config.task_type
+        required = list(criteria.required_capabilities)
+        preferred = list(criteria.preferred_capabilities)
+        wanted = 1 + self._fallback_count
+
+        def fits(node: _Node) -> bool:
+            # Heap members have the node type, a free slot and good health,
+            # and _take checks the capabilities.
+            return task_type in node.task_types and self._free(node, amounts, None)
+
+        # Nodes with every preferred capability come first; each group is
+        # read in base score order, which is its score order.
+        picked: list[_Node] = []
+        if preferred:
+            picked = self._take(
+                node_type, required + preferred, wanted, fits, bonus=1.0
+            )
+        picked += self._take(
+            node_type,
+            required,
+            wanted - len(picked),
+            lambda node: fits(node) and not self._prefers(node, preferred),
+            bonus=0.0,
+        )
+        if not picked:
+            return NodeSchedulingResult(
+                selected_nodes=[],
+                scheduling_score=0.0,
+                scheduling_rationale="no node fits the task",
+                fallback_nodes=[],
+                resource_allocation={},
+                estimated_completion_time=None,
+                constraints_satisfied=dict.fromkeys(
+                    ("node_type", "capabilities", "resources"), False
+                ),
+            )
+        best = picked[0]
+        score = self._score(best, preferred)
+        return NodeSchedulingResult(
+            selected_nodes=[best.info],
+            scheduling_score=score,
+            scheduling_rationale=(
+                "best base score of the nodes with every preferred capability"
+                if self._prefers(best, preferred)
+                else "best base score of the fitting nodes"
+            ),
+            fallback_nodes=[node.info for node in picked[1:]],
+            resource_allocation=requirements,
+            estimated_completion_time=(
+                best.duration / best.executions if best.executions else None
+            ),
+            constraints_satisfied=dict.fromkeys(
+                ("node_type", "capabilities", "resources"), True
+            ),
+        )
+
+    async def discover_nodes_by_capability(
+        self,
+        capability_name: str,
+        capability_version: str | None,
+        min_availability: float | None,
+    ) -> list[ProtocolWorkflowNodeInfo]:
+        """
+        Return nodes with a capability, best base score first.
+
+        Availability is the fraction of a node's task slots that are free.
+        """
+        found = []
+        for node_id in self._by_capability.get(capability_name, ()):
+            node = self._nodes[node_id]
+            info = node.info
+            if capability_version is not None and not any(
+                c.capability_name == capability_name
+                and c.capability_version == capability_version
+                for c in info.workflow_capabilities
+            ):
+                continue
+            free = 1 - len(node.tasks) / info.max_concurrent_tasks
+            if min_availability is None or free >= min_availability:
+                found.append(node)
+        found.sort(key=lambda n: (-n.score, n.seq))
+        return [node.info for node in found]
+
+    async def discover_nodes_for_workflow_type(
+        self,
+        workflow_type: str,
+        required_node_types: list[LiteralNodeType] | None,
+    ) -> list[ProtocolWorkflowNodeInfo]:
+        """Return nodes supporting a workflow type, in registration order."""
+        return [
+            self._nodes[node_id].info
+            for node_id in self._by_workflow_type.get(workflow_type, ())
+            if required_node_types is None
+            or self._nodes[node_id].info.node_type in required_node_types
+        ]
+
+    async def get_workflow_node_info(
+        self, node_id: str
+    ) -> ProtocolWorkflowNodeInfo | None:
+        """Return a node, or ``None`` if it is not registered."""
+        node = self._nodes.get(node_id)
+        return node.info if node is not None else None
+
+    async def register_workflow_capability(
+        self, node_id: str, capability: ProtocolWorkflowNodeCapability
+    ) -> bool:
+        """Add or replace a capability of a node, by capability id."""
+        node = self._nodes.get(node_id)
+        if node is None:
+            return False
+        capabilities = node.info.workflow_capabilities
+        for i, existing in enumerate(capabilities):
+            if existing.capability_id == capability.capability_id:
+                self._unindex(node, existing)
+                capabilities[i] = capability
+                break
+        else:
+            capabilities.append(capability)
+        self._index(node, capability)
+        self._rescore(node)
+        return True
+
+    async def unregister_workflow_capability(
+        self, node_id: str, capability_id: str
+    ) -> bool:
+        """Remove a capability of a node."""
+        node = self._nodes.get(node_id)
+        if node is None:
+            return False
+        capabilities = node.info.workflow_capabilities
+        for i, existing in enumerate(capabilities):
+            if existing.capability_id == capability_id:
+                del capabilities[i]
+                self._unindex(node, existing)
+                self._rescore(node)
+                return True
+        return False
+
+    async def get_node_capabilities(
+        self, node_id: str
+    ) -> list[ProtocolWorkflowNodeCapability]:
+        """Return the workflow capabilities of a node."""
+        node = self._nodes.get(node_id)
+        return list(node.info.workflow_capabilities) if node is not None else []
+
+    async def update_node_workload(
+        self, node_id: str, task_id: UUID, workload_change: str
+    ) -> None:
+        """
+        Start or finish a task on a node.
+
+        ``assigned`` and ``started`` add the task to the node's workload;
+        ``completed``, ``failed``, ``cancelled`` and ``released`` remove it.
+        Repeating a change for the same task has no further effect.
+
+        Raises:
+            KeyError: If the node is not registered.
+            ValueError: If ``workload_change`` is none of the above.
+        """
+        node = self._nodes[node_id]
+        if workload_change in _STARTED:
+            if task_id in node.tasks:
+                return
+            node.tasks.add(task_id)
+        elif workload_change in _FINISHED:
+            if task_id not in node.tasks:
+                return
+            node.tasks.remove(task_id)
+        else:
+            raise ValueError(f"unknown workload change {workload_change!r}")
+        self._sync(node)
+        self._rescore(node)
+
+    async def get_node_workload(self, node_id: str) -> dict[str, ContextValue]:
+        """Return the task counts of a node."""
+        node = self._nodes.get(node_id)
+        return dict(node.info.current_workload) if node is not None else {}
+
+    async def get_resource_utilization(self, node_id: str) -> dict[str, float]:
+        """Return the reserved fraction of each resource of a node."""
+        self._expire()
+        node = self._nodes.get(node_id)
+        return dict(node.info.resource_utilization) if node is not None else {}
+
+    async def calculate_scheduling_score(
+        self,
+        node_info: ProtocolWorkflowNodeInfo,
+        task_config: ProtocolTaskConfiguration,
+        criteria: ProtocolTaskSchedulingCriteria,
+    ) -> float:
+        """
+        Score a node for a task; 0 if it does not fit.
+
+        Nodes not registered here score 0.
+        """
+        self._expire()
+        node = self._nodes.get(node_info.node_id)
+        requirements = {
+            **task_config.resource_requirements,
+            **criteria.resource_requirements,
+        }
+        amounts = _amounts(requirements)
+        if node is None or not self._fits(
+            node, task_config.task_type, criteria, amounts
+        ):
+            return 0.0
+        return self._score(node, criteria.preferred_capabilities)
+
+    async def reserve_resources(
+        self,
+        node_id: str,
+        task_id: UUID,
+        resource_requirements: dict[str, ContextValue],
+        timeout_seconds: int,
+    ) -> bool:
+        """
+        Reserve the numeric resource amounts of ``resource_requirements``.
+
+        Either every amount fits the node's free capacity and all are
+        reserved, or nothing changes. Reserving again for the same task
+        replaces its reservation. Non-numeric requirements are ignored.
+
+        Raises:
+            ValueError: If ``timeout_seconds`` is not positive.
+        """
+        if timeout_seconds <= 0:
+            raise ValueError("timeout_seconds must be positive")
+        self._expire()
+        node = self._nodes.get(node_id)
+        amounts = _amounts(resource_requirements)
+        if node is None or not self._free(node, amounts, task_id):
+            return False
+        if task_id in node.reservations:
+            held = node.reservations.pop(task_id)
+            for name, amount in held.amounts.items():
+                node.reserved[name] -= amount
+        for name, amount in amounts.items():
+            node.reserved[name] = node.reserved.get(name, 0.0) + amount
+        expires = self._clock() + timeout_seconds
+        node.reservations[task_id] = _Reservation(amounts, expires)
+        heapq.heappush(self._expiries, (expires, node.seq, node_id, task_id))
+        self._sync(node)
+        self._rescore(node)
+        return True
+
+    async def release_resources(self, node_id: str, task_id: UUID) -> bool:
+        """Release a task's reservation on a node."""
+        self._expire()
+        node = self._nodes.get(node_id)
+        if node is None or task_id not in node.reservations:
+            return False
+        self._release(node, task_id)
+        return True
+
+    async def record_task_execution_metrics(
+        self, node_id: str, task_id: UUID, execution_metrics: dict[str, ContextValue]
+    ) -> None:
+        """
+        Record one execution of a task on a node.
+
+        Reads ``success`` (default true), ``duration_seconds`` (default 0)
+        and ``task_type`` from ``execution_metrics``.
+
+        Raises:
+            KeyError: If the node is not registered.
+        """
+        node = self._nodes[node_id]
+        success = bool(execution_metrics.get("success", True))
+        duration = execution_metrics.get("duration_seconds", 0.0)
+        seconds = float(duration) if isinstance(duration, int | float) else 0.0
+        task_type = execution_metrics.get("task_type")
+        node.executions += 1
+        node.successes += success
+        node.duration += seconds
+        node.history.append(
+            (
+                self._clock(),
+                task_type if isinstance(task_type, str) else None,
+                success,
+                seconds,
+            )
+        )
+        self._sync(node)
+        self._rescore(node)
+
+    async def get_node_performance_history(
+        self,
+        node_id: str,
+        task_type: LiteralTaskType | None,
+        time_window_seconds: int,
+    ) -> dict[str, ContextValue]:
+        """Summarize recent executions on a node, optionally of one task type."""
+        node = self._nodes.get(node_id)
+        if node is None:
+            return {}
+        since = self._clock() - time_window_seconds
+        records = [
+            (success, seconds)
+            for at, kind, success, seconds in node.history
+            if at >= since and (task_type is None or kind == task_type)
+        ]
+        successes = sum(success for success, _ in records)
+        return {
+            "executions": len(records),
+            "successes": successes,
+            "success_rate": successes / len(records) if records else 0.0,
+            "mean_duration_seconds": (
+                sum(seconds for _, seconds in records) / len(records)
+                if records
+                else 0.0
+            ),
+        }
+
+    async def update_node_availability(
+        self,
+        node_id: str,
+        availability_status: str,
+        metadata: dict[str, ContextValue] | None,
+    ) -> bool:
+        """Set a node's health status and merge ``metadata`` into its own."""
+        node = self._nodes.get(node_id)
+        if node is None:
+            return False
+        node.info.health_status = availability_status  # type: ignore[assignment]
+        if metadata:
+            node.info.metadata.update(metadata)
+        self._rescore(node)
+        return True
+
+    async def get_cluster_health_summary(
+        self, workflow_type: str | None, node_group: str | None
+    ) -> dict[str, ContextValue]:
+        """Count nodes by health status, with task slot totals."""
+        members: Iterable[str] = (
+            self._nodes
+            if workflow_type is None
+            else self._by_workflow_type.get(workflow_type, {})
+        )
+        nodes = [
+            self._nodes[node_id]
+            for node_id in members
+            if node_group is None or self._nodes[node_id].info.group == node_group
+        ]
+        statuses = Counter(node.info.health_status for node in nodes)
+        summary: dict[str, ContextValue] = {
+            "total_nodes": len(nodes),
+            "schedulable_nodes": sum(node.score > 0 for node in nodes),
+            "active_tasks": sum(len(node.tasks) for node in nodes),
+            "task_slots": sum(node.info.max_concurrent_tasks for node in nodes),
+        }
+        for status, count in sorted(statuses.items()):
+            summary[f"{status}_nodes"] = count
+        return summary
@@ -0,0 +1,376 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Consumer-side parallel dispatch honouring partition-key ordering.
+
+``PartitionedDispatcher`` reads batches from a ``ProtocolEventBusConsumer``
+and runs a handler on every message:
+
+- Each message is hashed by its partition key into one of ``lanes`` worker
+  lanes. Integer keys are used as they are and string, bytes and tuple
+  keys are hashed with CRC-32, so a key maps to the same lane in every
+  process whatever ``PYTHONHASHSEED`` is. A lane handles its messages one
+  at a time, in consumption order, so messages with the same key are
+  handled in order while messages with other keys are handled by other
+  lanes in parallel.
+- At most ``max_in_flight`` messages are queued or being handled; fetching
+  waits for room beyond that.
+- Offsets are committed per topic partition only up to the last message
+  before which every fetched message has been handled, the contiguous
+  completed watermark. A message that is still being handled, or whose
+  handler failed, is never skipped over by a commit.
+- ``lane_depths`` and ``lag`` report how much work each lane holds and how
+  many messages of each partition are fetched but not yet committable.
+
+``commit_offsets`` in ``ProtocolEventBusConsumer`` commits everything
+consumed. When the consumer also has ``commit(offsets)``, taking the next
+offset to consume per topic and partition like ``get_current_offsets``
+returns, the watermarks are committed after every fetched batch and
+fetching continues while lanes are busy. Otherwise the dispatcher lets each
+batch finish before it commits and fetches the next one.
+
+A handler error stops the dispatcher unless ``on_error`` handles it: lanes
+finish the message they are on, progress up to the failed message is
+committed, and ``run`` raises ``ProtocolHandlerError``. Delivery is at
+least once; after a restart, messages past the watermark are handled again.
+
+The default key is the message key, or its topic partition for messages
+without one. ``registry_key`` derives keys from the event registry's
+``partition_key_fields`` instead.
+
+Example:
+    ```python
+    dispatcher = PartitionedDispatcher(consumer, handle_event, lanes=32)
+    runner = asyncio.create_task(dispatcher.run())
+    ...
+    dispatcher.stop()
+    await runner
+    print(f"handled {dispatcher.completed}, lanes {dispatcher.lane_depths}")
+    ```
+"""
+
+import asyncio
+import json
+import zlib
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+
+from omnibase_spi.exceptions import InvalidProtocolStateError, ProtocolHandlerError
+from omnibase_spi.protocols.event_bus.protocol_event_bus_extended import (
+    ProtocolEventBusConsumer,
+    ProtocolEventBusMessage,
+)
+from omnibase_spi.registry.compiled_event_registry import CompiledEventRegistry
+
+DEFAULT_LANES = 16
+DEFAULT_MAX_IN_FLIGHT = 1024
+DEFAULT_BATCH_TIMEOUT_MS = 100
+
+MessageHandler = Callable[[ProtocolEventBusMessage], Awaitable[None]]
+ErrorHandler = Callable[[ProtocolEventBusMessage, Exception], Awaitable[None]]
+KeyFunction = Callable[[ProtocolEventBusMessage], Hashable]
+
+_TopicPartition = tuple[str, int]
+
+
+def message_key(message: ProtocolEventBusMessage) -> Hashable:
+    """Return the message key, or the topic partition of unkeyed messages."""
+    if message.key is not None:
+        return message.key
+    return message.topic, message.partition
+
+
+def registry_key(
+    registry: CompiledEventRegistry,
+    decode: Callable[[bytes], object] = json.loads,
+) -> KeyFunction:
+    """
+    Build a key function from the registry's ``partition_key_fields``.
+
+    Messages of registered topics are keyed by the partition key of their
+    decoded value; other messages fall back to ``message_key``.
+
+    Args:
+        registry: Compiled event registry.
+        decode: Decodes a message value into the event payload.
+    """
+
+    def key(message: ProtocolEventBusMessage) -> Hashable:
+        extractor = registry.extractors.get(message.topic)
+        if extractor is None:
+            return message_key(message)
+        return extractor(decode(message.value))
+
+    return key
+
+
+def _lane_hash(key: Hashable) -> int:
+    """Hash ``key`` the same way in every process; ``hash`` of str is salted."""
+    if isinstance(key, bytes):
+        return zlib.crc32(key)
+    if isinstance(key, str):
+        return zlib.crc32(key.encode())
+    if isinstance(key, int):
+        return key
+    if isinstance(key, tuple):
+        value = 0
+        for item in key:
+            value = zlib.crc32(b"%d," % _lane_hash(item), value)
+        return value
+    return hash(key)
+
+
+class _Watermark:
+    """Fetched offsets of one partition, in order, and how far all are done."""
+
+    __slots__ = ("committed", "done", "handled", "pending")
+
+    def __init__(self) -> None:
+        self.pending: deque[int] = deque()
+        self.done: set[int] = set()
+        self.handled: int | None = None
+        self.committed: int | None = None
+
+    def complete(self, offset: int) -> None:
+        self.done.add(offset)
+        pending = self.pending
+        while pending and pending[0] in self.done:
+            self.handled = pending.popleft()
+            self.done.discard(self.handled)
+
+
+class PartitionedDispatcher:
+    """
+    Dispatches consumed messages to key-ordered parallel lanes.
+
+    Attributes:
+        dispatched: Messages queued to a lane.
+        completed: Messages handled, including those passed to ``on_error``.
+        failed: Messages whose handler raised.
+        commits: Offset commits made.
+    """
+
+    def __init__(
+        self,
+        consumer: ProtocolEventBusConsumer,
+        handler: MessageHandler,
+        *,
+        lanes: int = DEFAULT_LANES,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        batch_timeout_ms: int = DEFAULT_BATCH_TIMEOUT_MS,
+        key: KeyFunction = message_key,
+        on_error: ErrorHandler | None = None,
+    ) -> None:
+        """
+        Create a dispatcher for a subscribed consumer.
+
+        Args:
+            consumer: Consumer to read batches from and commit offsets to.
+            handler: Coroutine function run on every message.
+            lanes: Number of worker lanes, the most messages handled at once.
+            max_in_flight: Most messages queued or being handled.
+            batch_timeout_ms: Passed to ``consume_messages_stream``.
+            key: Returns the hashable partition key of a message.
+            on_error: Called with a message and the error its handler raised;
+                the message then counts as handled. When it is not given, or
+                raises itself, the dispatcher stops.
+
+        Raises:
+            ValueError: If ``lanes`` or ``max_in_flight`` is not positive.
+        """
+        if lanes < 1:
+            raise ValueError("lanes must be positive")
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be positive")
+        self._consumer = consumer
+        self._handler = handler
+        self._on_error = on_error
+        self._key = key
+        self._batch_timeout_ms = batch_timeout_ms
+        commit = getattr(consumer, "commit", None)
+        self._commit: Callable[[dict[str, dict[int, int]]], Awaitable[None]] | None = (
+            commit if callable(commit) else None
+        )
+        self._queues: list[asyncio.Queue[ProtocolEventBusMessage | None]] = [
+            asyncio.Queue() for _ in range(lanes)
+        ]
+        self._active = [0] * lanes
+        self._capacity = asyncio.Semaphore(max_in_flight)
+        self._watermarks: dict[_TopicPartition, _Watermark] = {}
+        self._in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._failure = asyncio.Event()
+        self._error: tuple[ProtocolEventBusMessage, Exception] | None = None
+        self._uncommitted = False
+        self._running = False
+        self._stopping = False
+        self.dispatched = 0
+        self.completed = 0
+        self.failed = 0
+        self.commits = 0
+
+    # -- metrics --------------------------------------------------------------
+
+    @property
+    def lane_depths(self) -> list[int]:
+        """Messages queued or being handled, per lane."""
+        return [q.qsize() + a for q, a in zip(self._queues, self._active, strict=True)]
+
+    @property
+    def lag(self) -> dict[_TopicPartition, int]:
+        """Fetched messages past the completed watermark, per partition."""
+        return {tp: len(w.pending) for tp, w in self._watermarks.items()}
+
+    @property
+    def in_flight(self) -> int:
+        """Messages queued or being handled."""
+        return self._in_flight
+
+    # -- lifecycle ------------------------------------------------------------
+
+    def stop(self) -> None:
+        """Stop fetching; ``run`` returns once fetched messages are handled."""
+        self._stopping = True
+
+    async def run(self) -> None:
+        """
+        Fetch and dispatch until ``stop`` is called.
+
+        Raises:
+            InvalidProtocolStateError: If the dispatcher is already running.
+            ProtocolHandlerError: If a handler failed and ``on_error`` did not
+                handle it.
+        """
+        if self._running:
+            raise InvalidProtocolStateError("dispatcher is already running")
+        self._running = True
+        workers = [asyncio.create_task(self._lane(i)) for i in range(len(self._queues))]
+        fetcher = asyncio.create_task(self._fetch())
+        failure = asyncio.create_task(self._failure.wait())
+        try:
+            await asyncio.wait({fetcher, failure}, return_when=asyncio.FIRST_COMPLETED)
+            if self._error is None:
+                fetcher.result()
+            else:
+                fetcher.cancel()
+                await asyncio.gather(fetcher, return_exceptions=True)
+            # Idle lanes wait on their queue; the sentinel lets them exit.
+            for queue in self._queues:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+            await self._commit_progress()
+        finally:
+            failure.cancel()
+            for task in (fetcher, *workers):
+                task.cancel()
+            self._running = False
+        if self._error is not None:
+            message, error = self._error
+            raise ProtocolHandlerError(
+                f"handler failed on {message.topic}[{message.partition}] "
+                f"offset {message.offset}: {error}",
+                context={
+                    "topic": message.topic,
+                    "partition": message.partition,
+                    "offset": message.offset,
+                },
+            ) from error
+
+    # -- fetching -------------------------------------------------------------
+
+    async def _fetch(self) -> None:
+        while not self._stopping:
+            messages = await self._consumer.consume_messages_stream(
+                self._batch_timeout_ms
+            )
+            for message in messages:
+                await self._capacity.acquire()
+                self._dispatch(message)
+            if self._commit is None:
+                # commit_offsets() covers everything consumed: let it finish.
+                await self._idle.wait()
+            await self._commit_progress()
+        await self._idle.wait()
+
+    def _dispatch(self, message: ProtocolEventBusMessage) -> None:
+        if message.partition is not None and message.offset is not None:
+            tp = (message.topic, message.partition)
+            watermark = self._watermarks.get(tp)
+            if watermark is None:
+                watermark = self._watermarks[tp] = _Watermark()
+            watermark.pending.append(message.offset)
+        self._in_flight += 1
+        self._idle.clear()
+        lane = _lane_hash(self._key(message)) % len(self._queues)
+        self._queues[lane].put_nowait(message)
+        self.dispatched += 1
+
+    async def _commit_progress(self) -> None:
+        if self._commit is None:
+            if self._uncommitted and self._in_flight == 0:
+                await self._consumer.commit_offsets()
+                self._uncommitted = False
+                self.commits += 1
+            return
+        offsets: dict[str, dict[int, int]] = {}
+        for (topic, partition), watermark in self._watermarks.items():
+            if (
+                watermark.handled is not None
+                and watermark.handled != watermark.committed
+            ):
+                offsets.setdefault(topic, {})[partition] = watermark.handled + 1
+        if not offsets:
+            return
+        await self._commit(offsets)
+        for topic, partitions in offsets.items():
+            for partition, offset in partitions.items():
+                self._watermarks[topic, partition].committed = offset - 1
+        self.commits += 1
+
+    # -- lanes ----------------------------------------------------------------
+
+    async def _lane(self, lane: int) -> None:
+        queue = self._queues[lane]
+        while self._error is None:
+            message = await queue.get()
+            if message is None:
+                return
+            self._active[lane] = 1
+            try:
+                await self._handler(message)
+            # Handler errors go to on_error or stop the dispatcher.
+            except Exception as e:  # noqa: BLE001
+                if not await self._handle_error(message, e):
+                    return
+            finally:
+                self._active[lane] = 0
+            self._complete(message)
+
+    async def _handle_error(
+        self, message: ProtocolEventBusMessage, error: Exception
+    ) -> bool:
+        self.failed += 1
+        if self._on_error is not None:
+            try:
+                await self._on_error(message, error)
+            # Any on_error failure stops the dispatcher like the original.
+            except Exception as e:  # noqa: BLE001
+                error = e
+            else:
+                return True
+        if self._error is None:
+            self._error = (message, error)
+            self._failure.set()
+        return False
+
+    def _complete(self, message: ProtocolEventBusMessage) -> None:
+        if message.partition is not None and message.offset is not None:
+            self._watermarks[message.topic, message.partition].complete(message.offset)
+        self._uncommitted = True
+        self.completed += 1
+        self._in_flight -= 1
+        self._capacity.release()
+        if self._in_flight == 0:
+            self._idle.set()
@@ -0,0 +1,582 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Structurally shared reducer states and batch dispatch.
+
+A ``ProtocolWorkflowReducer`` must return a new immutable state from every
+``dispatch``. Holding the state payload in a ``dict`` means copying all of
+it for each action. This module keeps payloads in a persistent map
+instead:
+
+- ``PersistentMap`` is an immutable mapping stored as a hash array mapped
+  trie (HAMT) of 32-way nodes. ``set`` and ``delete`` copy only the nodes
+  on the path to the key, a handful for any realistic size, and share
+  every other node with the original map.
+- ``MapEditor``, from ``PersistentMap.mutate()``, applies many changes
+  without copying a node more than once: nodes it has copied belong to it
+  and are changed in place until ``finish()`` returns the new map. Maps
+  returned earlier are never changed.
+- ``MapStateReducer`` is a ``ProtocolWorkflowReducer`` over ``MapState``
+  values, built from an ``apply(editor, action)`` function. ``dispatch``
+  applies one action; ``dispatch_many`` applies a whole batch through one
+  editor and returns only the final state, equal to dispatching the
+  actions one by one.
+- ``dispatch_many(reducer, state, actions)`` uses the reducer's own
+  ``dispatch_many`` when it has one and folds ``dispatch`` otherwise.
+
+If ``apply`` raises, the state passed in is left as it was and nothing of
+the failed batch is kept.
+
+Example:
+    ```python
+    def apply(tasks: MapEditor, action: ProtocolAction) -> None:
+        tasks[action.payload["task"]] = action.type
+
+    reducer = MapStateReducer(apply)
+    state = dispatch_many(reducer, reducer.initial_state(), actions)
+    print(state.version, state.data["build"])
+    ```
+"""
+
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from omnibase_spi.protocols.types.protocol_core_types import (
+    ProtocolAction,
+    ProtocolState,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_reducer import (
+    ProtocolWorkflowReducer,
+)
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+# Key slot of an array entry whose value slot holds a child node.
+_NODE: Any = object()
+_MISSING: Any = object()
+
+# Owner token of the editor that may change a node in place; None for
+# nodes of finished maps.
+_Edit = object | None
+# (hash, key, value)
+_Entry = tuple[int, Any, Any]
+
+
+def _hash(key: Hashable) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _pair(edit: _Edit, shift: int, a: _Entry, b: _Entry) -> "_Node":
+    """Return a node holding two entries whose hashes agree below ``shift``."""
+    (h1, k1, v1), (h2, k2, v2) = a, b
+    if h1 == h2:
+        return _Collision(h1, [k1, v1, k2, v2], edit)
+    i1 = (h1 >> shift) & _MASK
+    i2 = (h2 >> shift) & _MASK
+    if i1 == i2:
+        return _Bitmap(1 << i1, [_NODE, _pair(edit, shift + _BITS, a, b)], edit)
+    array = [k1, v1, k2, v2] if i1 < i2 else [k2, v2, k1, v1]
+    return _Bitmap((1 << i1) | (1 << i2), array, edit)
+
+
+class _Bitmap:
+    """Trie node: one key/value or child slot pair per set bitmap bit."""
+
+    __slots__ = ("array", "bitmap", "edit")
+
+    def __init__(self, bitmap: int, array: list[Any], edit: _Edit) -> None:
+        self.bitmap = bitmap
+        self.array = array
+        self.edit = edit
+
+    def _editable(self, edit: _Edit) -> "_Bitmap":
+        if edit is not None and self.edit is edit:
+            return self
+        return _Bitmap(self.bitmap, self.array.copy(), edit)
+
+    def _insert(self, edit: _Edit, bit: int, i: int, key: Any, value: Any) -> "_Bitmap":
+        if edit is not None and self.edit is edit:
+            self.array[i:i] = [key, value]
+            self.bitmap |= bit
+            return self
+        array = [*self.array[:i], key, value, *self.array[i:]]
+        return _Bitmap(self.bitmap | bit, array, edit)
+
+    def single(self) -> tuple[Any, Any] | None:
+        if len(self.array) == 2 and self.array[0] is not _NODE:
+            return self.array[0], self.array[1]
+        return None
+
+    def find(self, shift: int, h: int, key: Any) -> Any:
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return _MISSING
+        i = 2 * (self.bitmap & (bit - 1)).bit_count()
+        k, v = self.array[i], self.array[i + 1]
+        if k is _NODE:
+            return v.find(shift + _BITS, h, key)
+        return v if k is key or k == key else _MISSING
+
+    def assoc(
+        self, edit: _Edit, shift: int, h: int, key: Any, value: Any
+    ) -> tuple["_Node", bool]:
+        bit = 1 << ((h >> shift) & _MASK)
+        i = 2 * (self.bitmap & (bit - 1)).bit_count()
+        if not self.bitmap & bit:
+            return self._insert(edit, bit, i, key, value), True
+        k, v = self.array[i], self.array[i + 1]
+        if k is _NODE:
+            child, added = v.assoc(edit, shift + _BITS, h, key, value)
+            if child is v:
+                return self, added
+            node = self._editable(edit)
+            node.array[i + 1] = child
+            return node, added
+        if k is key or k == key:
+            if v is value:
+                return self, False
+            node = self._editable(edit)
+            node.array[i + 1] = value
+            return node, False
+        node = self._editable(edit)
+        node.array[i] = _NODE
+        node.array[i + 1] = _pair(
+            edit, shift + _BITS, (_hash(k), k, v), (h, key, value)
+        )
+        return node, True
+
+    def without(
+        self, edit: _Edit, shift: int, h: int, key: Any
+    ) -> tuple["_Node | None", bool]:
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self, False
+        i = 2 * (self.bitmap & (bit - 1)).bit_count()
+        k, v = self.array[i], self.array[i + 1]
+        if k is _NODE:
+            child, removed = v.without(edit, shift + _BITS, h, key)
+            if not removed:
+                return self, False
+            if child is not None:
+                node = self._editable(edit)
+                # A child left with one entry is folded back into this node.
+                single = child.single()
+                node.array[i : i + 2] = [_NODE, child] if single is None else single
+                return node, True
+        elif not (k is key or k == key):
+            return self, False
+        if self.bitmap == bit:
+            return None, True
+        node = self._editable(edit)
+        del node.array[i : i + 2]
+        node.bitmap ^= bit
+        return node, True
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] is _NODE:
+                yield from array[i + 1].items()
+            else:
+                yield array[i], array[i + 1]
+
+
+class _Collision:
+    """Node for keys whose 64-bit hashes are all equal."""
+
+    __slots__ = ("array", "edit", "hash")
+
+    def __init__(self, h: int, array: list[Any], edit: _Edit) -> None:
+        self.hash = h
+        self.array = array
+        self.edit = edit
+
+    def _editable(self, edit: _Edit) -> "_Collision":
+        if edit is not None and self.edit is edit:
+            return self
+        return _Collision(self.hash, self.array.copy(), edit)
+
+    def _index(self, key: Any) -> int:
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] is key or array[i] == key:
+                return i
+        return -1
+
+    def single(self) -> tuple[Any, Any] | None:
+        return (self.array[0], self.array[1]) if len(self.array) == 2 else None
+
+    def find(self, shift: int, h: int, key: Any) -> Any:
+        if h != self.hash:
+            return _MISSING
+        i = self._index(key)
+        return _MISSING if i < 0 else self.array[i + 1]
+
+    def assoc(
+        self, edit: _Edit, shift: int, h: int, key: Any, value: Any
+    ) -> tuple["_Node", bool]:
+        if h != self.hash:
+            parent = _Bitmap(1 << ((self.hash >> shift) & _MASK), [_NODE, self], edit)
+            return parent.assoc(edit, shift, h, key, value)
+        i = self._index(key)
+        if i >= 0 and self.array[i + 1] is value:
+            return self, False
+        node = self._editable(edit)
+        if i >= 0:
+            node.array[i + 1] = value
+            return node, False
+        node.array += [key, value]
+        return node, True
+
+    def without(
+        self, edit: _Edit, shift: int, h: int, key: Any
+    ) -> tuple["_Node | None", bool]:
+        i = self._index(key) if h == self.hash else -1
+        if i < 0:
+            return self, False
+        if len(self.array) == 2:
+            return None, True
+        node = self._editable(edit)
+        del node.array[i : i + 2]
+        return node, True
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        array = self.array
+        for i in range(0, len(array), 2):
+            yield array[i], array[i + 1]
+
+
+_Node = _Bitmap | _Collision
+_EMPTY = _Bitmap(0, [], None)
+
+
+class PersistentMap(Mapping[Any, Any]):
+    """
+    Immutable mapping whose changed copies share unchanged structure.
+
+    Equality is that of ``Mapping``: two maps are equal when they hold equal
+    items, however they were built. Keys must be hashable; values are not
+    copied and should be immutable too.
+    """
+
+    __slots__ = ("_count", "_root")
+
+    def __init__(
+        self, items: Mapping[Any, Any] | Iterable[tuple[Any, Any]] = ()
+    ) -> None:
+        """Hold ``items``, given as a mapping or as key/value pairs."""
+        root, count, edit = _EMPTY, 0, object()
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            root, added = root.assoc(edit, 0, _hash(key), key, value)  # type: ignore[assignment]
+            count += added
+        self._root: _Bitmap = root
+        self._count = count
+
+    @classmethod
+    def _of(cls, root: _Bitmap, count: int) -> "PersistentMap":
+        new = cls.__new__(cls)
+        new._root = root  # noqa: SLF001
+        new._count = count  # noqa: SLF001
+        return new
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._root.find(0, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self._root.find(0, _hash(key), key) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        for key, _ in self._root.items():
+            yield key
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self._root.items())!r})"
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """Return a map with ``key`` set to ``value``."""
+        root, added = self._root.assoc(None, 0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return PersistentMap._of(root, self._count + added)  # type: ignore[arg-type]
+
+    def delete(self, key: Any) -> "PersistentMap":
+        """
+        Return a map without ``key``.
+
+        Raises:
+            KeyError: If ``key`` is not in the map.
+        """
+        root, removed = self._root.without(None, 0, _hash(key), key)
+        if not removed:
+            raise KeyError(key)
+        return PersistentMap._of(root or _EMPTY, self._count - 1)  # type: ignore[arg-type]
+
+    def update(
+        self, items: Mapping[Any, Any] | Iterable[tuple[Any, Any]]
+    ) -> "PersistentMap":
+        """Return a map with all of ``items`` set."""
+        editor = self.mutate()
+        editor.update(items)
+        return editor.finish()
+
+    def mutate(self) -> "MapEditor":
+        """Return an editor starting from this map."""
+        return MapEditor(self._root, self._count)
+
+
+class MapEditor:
+    """
+    Mutable view used to build a ``PersistentMap`` from another.
+
+    Only nodes the editor copied are changed in place, so the map it
+    started from, and every map it returned, stay as they were.
+
+    Attributes:
+        touched: Keys set or deleted through the editor.
+    """
+
+    __slots__ = ("_count", "_edit", "_root", "touched")
+
+    def __init__(self, root: _Bitmap, count: int) -> None:
+        """Edit the map rooted at ``root``."""
+        self._root = root
+        self._count = count
+        self._edit: object = object()
+        self.touched: set[Any] = set()
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._root.find(0, _hash(key), key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self._root.find(0, _hash(key), key) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value of ``key``, or ``default``."""
+        value = self._root.find(0, _hash(key), key)
+        return default if value is _MISSING else value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        root, added = self._root.assoc(self._edit, 0, _hash(key), key, value)
+        self._root = root  # type: ignore[assignment]
+        self._count += added
+        self.touched.add(key)
+
+    def __delitem__(self, key: Any) -> None:
+        root, removed = self._root.without(self._edit, 0, _hash(key), key)
+        if not removed:
+            raise KeyError(key)
+        self._root = root or _EMPTY  # type: ignore[assignment]
+        self._count -= 1
+        self.touched.add(key)
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """Delete ``key`` and return its value, or ``default`` if absent."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        del self[key]
+        return value
+
+    def update(self, items: Mapping[Any, Any] | Iterable[tuple[Any, Any]]) -> None:
+        """Set all of ``items``."""
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            self[key] = value
+
+    def finish(self) -> PersistentMap:
+        """
+        Return the edited map.
+
+        The editor stays usable; its later changes copy nodes again and do
+        not affect the returned map.
+        """
+        self._edit = object()
+        return PersistentMap._of(self._root, self._count)  # noqa: SLF001
+
+
+@dataclass(frozen=True, slots=True)
+class MapState:
+    """
+    ``ProtocolState`` whose payload is a ``PersistentMap``.
+
+    Attributes:
+        data: State payload.
+        version: Actions applied since the initial state.
+        last_updated: Timestamp of the last action applied, if any.
+        metadata: State metadata, carried over unchanged by dispatch.
+    """
+
+    data: PersistentMap = field(default_factory=PersistentMap)
+    version: int = 0
+    last_updated: Any = None
+    metadata: Any = field(default_factory=dict)
+
+    async def validate_state(self) -> bool:
+        """Return whether the state is consistent."""
+        return self.is_consistent()
+
+    def is_consistent(self) -> bool:
+        """Return whether the version is not negative."""
+        return self.version >= 0
+
+
+@dataclass(frozen=True, slots=True)
+class DispatchResult:
+    """``ProtocolNodeResult`` of ``MapStateReducer.dispatch_async``."""
+
+    value: Any
+    error: Any = None
+    trust_score: float = 1.0
+    provenance: list[str] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    events: list[Any] = field(default_factory=list)
+    state_delta: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def is_success(self) -> bool:
+        """Whether the action was applied."""
+        return self.error is None
+
+    @property
+    def is_failure(self) -> bool:
+        """Whether applying the action failed."""
+        return self.error is not None
+
+    async def validate_result(self) -> bool:
+        """Return whether the result carries a state or an error."""
+        return (self.value is None) != (self.error is None)
+
+    def is_successful(self) -> bool:
+        """Return whether the action was applied."""
+        return self.is_success
+
+
+class MapStateReducer:
+    """
+    ``ProtocolWorkflowReducer`` over ``MapState`` built from an apply function.
+
+    ``apply(editor, action)`` changes the payload of the state through a
+    ``MapEditor`` and must not keep the editor. Each applied action adds
+    one to the state's version and sets its ``last_updated`` to the
+    action's timestamp.
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[MapEditor, ProtocolAction], None],
+        *,
+        initial: Mapping[Any, Any] | None = None,
+    ) -> None:
+        """
+        Reduce with ``apply``.
+
+        Args:
+            apply: Applies one action to the payload.
+            initial: Payload of the initial state; empty if omitted.
+        """
+        self._apply = apply
+        self._initial = MapState(PersistentMap(initial or {}))
+
+    def initial_state(self) -> MapState:
+        """Return the state with the initial payload and version 0."""
+        return self._initial
+
+    def _run(
+        self, state: MapState, actions: Iterable[ProtocolAction]
+    ) -> tuple[MapState, set[Any]]:
+        editor = state.data.mutate()
+        version, last_updated = state.version, state.last_updated
+        for action in actions:
+            self._apply(editor, action)
+            version += 1
+            last_updated = action.timestamp
+        if version == state.version:
+            return state, editor.touched
+        new = MapState(editor.finish(), version, last_updated, state.metadata)
+        return new, editor.touched
+
+    def dispatch(self, state: MapState, action: ProtocolAction) -> MapState:
+        """Return the state after ``action``."""
+        return self._run(state, (action,))[0]
+
+    def dispatch_many(
+        self, state: MapState, actions: Iterable[ProtocolAction]
+    ) -> MapState:
+        """Return the state after all of ``actions``, applied in order."""
+        return self._run(state, actions)[0]
+
+    async def dispatch_async(
+        self, state: MapState, action: ProtocolAction
+    ) -> DispatchResult:
+        """
+        Apply ``action``, reporting a failure of ``apply`` as the result.
+
+        ``state_delta`` holds the new value of every key ``action`` touched,
+        ``None`` for deleted keys.
+        """
+        try:
+            new, touched = self._run(state, (action,))
+        except Exception as e:  # noqa: BLE001 - reported through the result
+            return DispatchResult(value=None, error=e)
+        delta = {str(key): new.data.get(key) for key in touched}
+        return DispatchResult(value=new, state_delta=delta)
+
+    async def create_workflow(self) -> object | None:
+        """Workflows are not supported."""
+        return None
+
+    async def validate_state_transition(
+        self, from_state: MapState, action: ProtocolAction, to_state: MapState
+    ) -> bool:
+        """Return whether dispatching ``action`` leads to ``to_state``."""
+        try:
+            return self.dispatch(from_state, action) == to_state
+        except Exception:  # noqa: BLE001 - a failing action is no transition
+            return False
+
+    async def get_state_schema(self) -> dict[str, Any] | None:
+        """Payloads are free-form."""
+        return None
+
+    async def get_action_schema(self) -> dict[str, Any] | None:
+        """Actions are free-form."""
+        return None
+
+
+def dispatch_many(
+    reducer: ProtocolWorkflowReducer,
+    state: ProtocolState,
+    actions: Iterable[ProtocolAction],
+) -> ProtocolState:
+    """
+    Apply ``actions`` in order and return the final state.
+
+    Uses the reducer's ``dispatch_many`` when it has one, which may avoid
+    building the intermediate states, and folds ``dispatch`` otherwise.
+    """
+    batch = getattr(reducer, "dispatch_many", None)
+    if batch is not None:
+        result: ProtocolState = batch(state, actions)
+        return result
+    for action in actions:
+        state = reducer.dispatch(state, action)
+    return state
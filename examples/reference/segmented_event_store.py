@@ -0,0 +1,846 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Append-only segmented file ``ProtocolEventStore``.
+
+``SegmentedEventStore`` keeps workflow events in a directory of segment
+files, for deployments without a database server:
+
+- Every event is one length-prefixed record, checksummed with CRC-32 and
+  appended to the active segment. A segment is sealed, and a new one
+  started, once it holds ``segment_bytes``.
+- Each stream, a ``(workflow_type, instance_id)`` pair, has a sparse
+  in-memory index of record positions: one entry every
+  ``index_interval`` events of the stream, and one for its first event in
+  each segment. A range read starts at the nearest entry at or before
+  ``from_sequence`` and scans forward, reading records through ``mmap``
+  and decoding only those of the stream.
+- ``append_events`` checks ``expected_sequence`` against the stream's last
+  sequence number and requires the events to continue it without gaps; a
+  conflict is reported as an unsuccessful result. Appends are written
+  immediately, then wait for an ``fsync``. Concurrent appends share one
+  ``fsync`` (group commit), and events become readable once it is done.
+- ``archive_old_events`` drops, or moves to ``archive_directory``, whole
+  sealed segments whose newest event is older than the cut-off. A stream
+  left without events first gets a marker record of its last sequence
+  number in the active segment, so its numbering continues after a
+  reopen instead of starting again at 1.
+- ``begin_transaction`` buffers appends until ``commit``, which writes all
+  of them or none.
+
+Opening a store rebuilds the indexes by scanning its segments; a torn
+record at the end of the last segment, left by a crash, is truncated. The
+store belongs to one event loop in one process. Events are encoded with
+``encode_event`` and decoded into ``StoredWorkflowEvent`` unless other
+functions are given.
+
+Example:
+    ```python
+    store = SegmentedEventStore(Path("/var/lib/onex/events"))
+    last = await store.get_last_sequence_number("deploy", instance_id)
+    result = await store.append_events(new_events, last, None)
+    if not result.success:
+        print(result.error_message)
+    events = await store.get_event_stream("deploy", instance_id, 1, None)
+    store.close()
+    ```
+"""
+
+import asyncio
+import bisect
+import json
+import math
+import mmap
+import os
+import shutil
+import struct
+import time
+import zlib
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+from omnibase_spi.exceptions import InvalidProtocolStateError
+from omnibase_spi.protocols.types.protocol_workflow_orchestration_types import (
+    ProtocolWorkflowEvent,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence import (
+    ProtocolEventQueryOptions,
+)
+
+DEFAULT_SEGMENT_BYTES = 64 * 1024 * 1024
+DEFAULT_INDEX_INTERVAL = 64
+
+_SUFFIX = ".seg"
+# body length, CRC-32 of the rest, kind, sequence, epoch timestamp,
+# workflow type length, instance id; then the workflow type and the body.
+_HEADER = struct.Struct("<IIBqdH16s")
+_EVENT = 0
+_TOMBSTONE = 1
+# Last sequence number of a stream whose events were all archived.
+_MARKER = 2
+
+_MAX_SEQUENCE = 2**63 - 1
+
+_StreamKey = tuple[str, UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class EventStoreResult:
+    """``ProtocolEventStoreResult`` value."""
+
+    success: bool
+    events_processed: int
+    sequence_numbers: list[int]
+    error_message: str | None
+    operation_time_ms: float
+    storage_size_bytes: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class StoredWorkflowValue:
+    """``ProtocolWorkflowValue`` holding a decoded ``serialize()`` result."""
+
+    data: dict[str, object]
+
+    def serialize(self) -> dict[str, object]:
+        """Return the stored dictionary."""
+        return self.data
+
+    async def validate(self) -> bool:
+        """Stored values were valid when written."""
+        return True
+
+    async def get_type_info(self) -> str:
+        """Return the stored ``type``, if any."""
+        return str(self.data.get("type", "stored"))
+
+
+@dataclass(frozen=True, slots=True)
+class StoredWorkflowEvent:
+    """``ProtocolWorkflowEvent`` read back from a segment."""
+
+    event_id: UUID
+    event_type: Any
+    workflow_type: str
+    instance_id: UUID
+    correlation_id: UUID
+    sequence_number: int
+    timestamp: datetime
+    source: str
+    idempotency_key: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+    causation_id: UUID | None = None
+    correlation_chain: list[UUID] = field(default_factory=list)
+
+    async def validate_event(self) -> bool:
+        """Return whether the event has an id and a type."""
+        return bool(self.event_id and self.event_type)
+
+    def is_valid_sequence(self) -> bool:
+        """Return whether the sequence number is positive."""
+        return self.sequence_number > 0
+
+
+def _serialize(value: object) -> object:
+    serialize = getattr(value, "serialize", None)
+    return serialize() if callable(serialize) else value
+
+
+def encode_event(event: ProtocolWorkflowEvent) -> bytes:
+    """Encode an event as compact JSON; payload values via ``serialize()``."""
+    causation = event.causation_id
+    return json.dumps(
+        {
+            "event_id": str(event.event_id),
+            "event_type": event.event_type,
+            "workflow_type": event.workflow_type,
+            "instance_id": str(event.instance_id),
+            "correlation_id": str(event.correlation_id),
+            "sequence_number": event.sequence_number,
+            "timestamp": event.timestamp.isoformat(),
+            "source": event.source,
+            "idempotency_key": event.idempotency_key,
+            "payload": {k: _serialize(v) for k, v in event.payload.items()},
+            "metadata": event.metadata,
+            "causation_id": None if causation is None else str(causation),
+            "correlation_chain": [str(c) for c in event.correlation_chain],
+        },
+        separators=(",", ":"),
+        default=str,
+    ).encode()
+
+
+def decode_event(body: bytes) -> StoredWorkflowEvent:
+    """Decode an ``encode_event`` record into a ``StoredWorkflowEvent``."""
+    record = json.loads(body)
+    causation = record["causation_id"]
+    return StoredWorkflowEvent(
+        event_id=UUID(record["event_id"]),
+        event_type=record["event_type"],
+        workflow_type=record["workflow_type"],
+        instance_id=UUID(record["instance_id"]),
+        correlation_id=UUID(record["correlation_id"]),
+        sequence_number=record["sequence_number"],
+        timestamp=datetime.fromisoformat(record["timestamp"]),
+        source=record["source"],
+        idempotency_key=record["idempotency_key"],
+        payload={
+            k: StoredWorkflowValue(v) if isinstance(v, dict) else v
+            for k, v in record["payload"].items()
+        },
+        metadata=record["metadata"],
+        causation_id=None if causation is None else UUID(causation),
+        correlation_chain=[UUID(c) for c in record["correlation_chain"]],
+    )
+
+
+@dataclass(slots=True, eq=False)
+class _Segment:
+    """One segment file; only the active one has a write descriptor."""
+
+    id: int
+    path: Path
+    size: int = 0
+    events: int = 0
+    newest: float = -math.inf
+    fd: int | None = None
+    mapped: mmap.mmap | None = None
+
+    def view(self) -> mmap.mmap:
+        """Map the segment, again if it has grown since it was mapped."""
+        if self.mapped is None or len(self.mapped) < self.size:
+            if self.mapped is not None:
+                self.mapped.close()
+            with self.path.open("rb") as f:
+                self.mapped = mmap.mmap(f.fileno(), self.size, access=mmap.ACCESS_READ)
+        return self.mapped
+
+    def close(self) -> None:
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+@dataclass(slots=True, eq=False)
+class _Stream:
+    """Sparse index and sequence numbers of one stream."""
+
+    last: int = 0
+    # Highest sequence that is fsynced and so visible to readers.
+    durable: int = 0
+    count: int = 0
+    marks: list[int] = field(default_factory=list)
+    places: list[tuple[int, int]] = field(default_factory=list)
+    # Position of the first event; records before it belong to a deleted
+    # stream of the same key.
+    origin: tuple[int, int] = (0, 0)
+    # Segment holding the latest sequence marker of the stream; 0 for none.
+    marked: int = 0
+
+    def add(self, sequence: int, segment: int, offset: int, interval: int) -> None:
+        if not self.count:
+            self.origin = (segment, offset)
+        if (
+            not self.places
+            or self.places[-1][0] != segment
+            or self.count % interval == 0
+        ):
+            self.marks.append(sequence)
+            self.places.append((segment, offset))
+        self.count += 1
+        self.last = sequence
+
+
+def _records(
+    view: mmap.mmap, start: int, end: int
+) -> Iterator[tuple[int, int, float, bytes, int, int, int]]:
+    """Yield kind, sequence, timestamp, instance, name start, body start, end."""
+    offset = start
+    header = _HEADER.size
+    unpack = _HEADER.unpack_from
+    while offset < end:
+        length, _, kind, sequence, stamp, type_length, instance = unpack(view, offset)
+        name = offset + header
+        body = name + type_length
+        offset = body + length
+        yield kind, sequence, stamp, instance, name, body, offset
+
+
+def _pack(
+    kind: int, sequence: int, stamp: float, key: _StreamKey, body: bytes
+) -> bytes:
+    name = key[0].encode()
+    rest = _HEADER.pack(len(body), 0, kind, sequence, stamp, len(name), key[1].bytes)
+    crc = zlib.crc32(body, zlib.crc32(name, zlib.crc32(rest[8:])))
+    return rest[:4] + struct.pack("<I", crc) + rest[8:] + name + body
+
+
+class _Transaction:
+    """``ProtocolEventStoreTransaction`` buffering appends until commit."""
+
+    def __init__(self, store: "SegmentedEventStore") -> None:
+        self.transaction_id = uuid4()
+        self.is_active = True
+        self._store = store
+        self.batches: list[tuple[list[ProtocolWorkflowEvent], int | None]] = []
+
+    async def commit(self) -> bool:
+        """Append every buffered batch, or none if any conflicts."""
+        if not self.is_active:
+            raise InvalidProtocolStateError("transaction is not active")
+        self.is_active = False
+        result = await self._store.append_batches(self.batches)
+        return result.success
+
+    async def rollback(self) -> None:
+        """Discard the buffered batches."""
+        self.is_active = False
+        self.batches.clear()
+
+
+def _result(
+    start: float,
+    *,
+    processed: int = 0,
+    sequences: list[int] | None = None,
+    error: str | None = None,
+    size: int | None = None,
+) -> EventStoreResult:
+    return EventStoreResult(
+        success=error is None,
+        events_processed=processed,
+        sequence_numbers=sequences or [],
+        error_message=error,
+        operation_time_ms=(time.perf_counter() - start) * 1000,
+        storage_size_bytes=size,
+    )
+
+
+class SegmentedEventStore:
+    """
+    ``ProtocolEventStore`` over append-only segment files.
+
+    Attributes:
+        fsyncs: Group commits performed.
+        appends: Batches written.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        index_interval: int = DEFAULT_INDEX_INTERVAL,
+        fsync: bool = True,
+        archive_directory: Path | None = None,
+        encode: Callable[[ProtocolWorkflowEvent], bytes] = encode_event,
+        decode: Callable[[bytes], ProtocolWorkflowEvent] = decode_event,
+    ) -> None:
+        """
+        Open, or create, the store in ``directory``.
+
+        Args:
+            directory: Directory holding the segment files.
+            segment_bytes: Size at which the active segment is sealed.
+            index_interval: Events of a stream between index entries.
+            fsync: Whether appends wait for ``fsync``; without it they are
+                only as durable as the page cache.
+            archive_directory: Where archived segments are moved; they are
+                deleted if None.
+            encode: Serializes an event into a record body.
+            decode: Deserializes a record body.
+
+        Raises:
+            ValueError: If ``segment_bytes`` or ``index_interval`` is not
+                positive.
+            InvalidProtocolStateError: If a sealed segment is corrupt.
+        """
+        if segment_bytes < 1:
+            raise ValueError("segment_bytes must be positive")
+        if index_interval < 1:
+            raise ValueError("index_interval must be positive")
+        directory.mkdir(parents=True, exist_ok=True)
+        self._directory = directory
+        self._segment_bytes = segment_bytes
+        self._interval = index_interval
+        self._fsync = fsync
+        self._archive_directory = archive_directory
+        self._encode = encode
+        self._decode = decode
+        self._segments: dict[int, _Segment] = {}
+        self._streams: dict[_StreamKey, _Stream] = {}
+        # Batches written, and the number of them known to be fsynced.
+        self._written = 0
+        self._synced = 0
+        self._syncing: asyncio.Future[None] | None = None
+        # Descriptors of sealed segments, closed after their final fsync.
+        self._retired: list[int] = []
+        self.fsyncs = 0
+        self.appends = 0
+        self._recover()
+
+    # -- segments -------------------------------------------------------------
+
+    def _recover(self) -> None:
+        paths = sorted(self._directory.glob(f"*{_SUFFIX}"))
+        for i, path in enumerate(paths):
+            segment = _Segment(int(path.stem), path, path.stat().st_size)
+            self._segments[segment.id] = segment
+            valid = self._scan(segment)
+            if valid < segment.size:
+                if i != len(paths) - 1:
+                    raise InvalidProtocolStateError(
+                        f"corrupt record in sealed segment {path} at {valid}"
+                    )
+                # A crash tore the last append; it was never acknowledged.
+                os.truncate(path, valid)
+                segment.size = valid
+        for stream in self._streams.values():
+            stream.durable = stream.last
+        if not self._segments:
+            self._roll()
+        else:
+            active = self._segments[max(self._segments)]
+            active.fd = os.open(active.path, os.O_WRONLY | os.O_APPEND)
+
+    def _scan(self, segment: _Segment) -> int:
+        if segment.size == 0:
+            return 0
+        view = segment.view()
+        offset = 0
+        header = _HEADER.size
+        while offset + header <= segment.size:
+            length, crc, kind, sequence, stamp, type_length, instance = (
+                _HEADER.unpack_from(view, offset)
+            )
+            end = offset + header + type_length + length
+            if end > segment.size or zlib.crc32(view[offset + 8 : end]) != crc:
+                break
+            name = view[offset + header : offset + header + type_length].decode()
+            key = (name, UUID(bytes=instance))
+            if kind == _TOMBSTONE:
+                self._streams.pop(key, None)
+            elif kind == _MARKER:
+                stream = self._streams.setdefault(key, _Stream())
+                stream.last = max(stream.last, sequence)
+                stream.marked = segment.id
+            else:
+                stream = self._streams.setdefault(key, _Stream())
+                stream.add(sequence, segment.id, offset, self._interval)
+                segment.events += 1
+                segment.newest = max(segment.newest, stamp)
+            offset = end
+        return offset
+
+    def _roll(self) -> _Segment:
+        next_id = max(self._segments, default=0) + 1
+        path = self._directory / f"{next_id:020d}{_SUFFIX}"
+        segment = _Segment(next_id, path)
+        segment.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        if self._segments:
+            sealed = self._segments[max(self._segments)]
+            if sealed.fd is not None:
+                self._retired.append(sealed.fd)
+                sealed.fd = None
+                if not self._fsync:
+                    self._close_retired()
+        self._segments[next_id] = segment
+        return segment
+
+    def _close_retired(self) -> None:
+        for fd in self._retired:
+            os.close(fd)
+        self._retired.clear()
+
+    @property
+    def storage_size_bytes(self) -> int:
+        """Bytes held in segment files."""
+        return sum(segment.size for segment in self._segments.values())
+
+    def close(self) -> None:
+        """Close every segment; pending appends must have returned."""
+        self._close_retired()
+        for segment in self._segments.values():
+            segment.close()
+
+    # -- appends --------------------------------------------------------------
+
+    def _check(
+        self,
+        batches: Sequence[tuple[list[ProtocolWorkflowEvent], int | None]],
+    ) -> str | None:
+        # Sequences already claimed by earlier batches of the same call.
+        claimed: dict[_StreamKey, int] = {}
+        for events, expected in batches:
+            if not events:
+                continue
+            key = (events[0].workflow_type, events[0].instance_id)
+            stream = self._streams.get(key)
+            last = claimed.get(key, stream.last if stream is not None else 0)
+            if expected is not None and expected != last:
+                return (
+                    f"expected sequence {expected} for {key[0]}/{key[1]}, "
+                    f"stream is at {last}"
+                )
+            for event in events:
+                if (event.workflow_type, event.instance_id) != key:
+                    return "events of one append must belong to one stream"
+                last += 1
+                if event.sequence_number != last:
+                    return (
+                        f"event {event.event_id} has sequence "
+                        f"{event.sequence_number}, expected {last}"
+                    )
+            claimed[key] = last
+        return None
+
+    def _write(self, events: list[ProtocolWorkflowEvent]) -> None:
+        records = []
+        for event in events:
+            stamp = event.timestamp.timestamp()
+            body = self._encode(event)
+            records.append(
+                (
+                    event,
+                    stamp,
+                    _pack(
+                        _EVENT,
+                        event.sequence_number,
+                        stamp,
+                        (event.workflow_type, event.instance_id),
+                        body,
+                    ),
+                )
+            )
+        segment = self._segments[max(self._segments)]
+        total = sum(len(record) for _, _, record in records)
+        if segment.size and segment.size + total > self._segment_bytes:
+            segment = self._roll()
+        assert segment.fd is not None
+        os.write(segment.fd, b"".join(record for _, _, record in records))
+        offset = segment.size
+        for event, stamp, record in records:
+            key = (event.workflow_type, event.instance_id)
+            stream = self._streams.setdefault(key, _Stream())
+            stream.add(event.sequence_number, segment.id, offset, self._interval)
+            segment.newest = max(segment.newest, stamp)
+            offset += len(record)
+        segment.size = offset
+        segment.events += len(records)
+
+    async def _sync(self, upto: int) -> None:
+        """Return once the first ``upto`` batches are fsynced."""
+        if not self._fsync:
+            self._synced = max(self._synced, upto)
+            return
+        while self._synced < upto:
+            if self._syncing is not None:
+                await asyncio.shield(self._syncing)
+                continue
+            # Lead a group commit for every batch written so far.
+            target = self._written
+            retired, self._retired = self._retired, []
+            active = self._segments[max(self._segments)].fd
+            self._syncing = asyncio.get_running_loop().create_future()
+            try:
+                await asyncio.to_thread(_fsync_all, retired, active)
+                self._synced = target
+                self.fsyncs += 1
+            finally:
+                self._syncing.set_result(None)
+                self._syncing = None
+
+    async def append_batches(
+        self,
+        batches: Sequence[tuple[list[ProtocolWorkflowEvent], int | None]],
+    ) -> EventStoreResult:
+        """
+        Append several ``(events, expected_sequence)`` batches atomically.
+
+        Either every batch is written or, if any conflicts, none is.
+        """
+        start = time.perf_counter()
+        error = self._check(batches)
+        if error is not None:
+            return _result(start, error=error, size=self.storage_size_bytes)
+        written = [events for events, _ in batches if events]
+        for events in written:
+            self._write(events)
+        self._written += 1
+        self.appends += 1
+        await self._sync(self._written)
+        sequences = []
+        for events in written:
+            stream = self._streams.get((events[0].workflow_type, events[0].instance_id))
+            if stream is not None:
+                stream.durable = max(stream.durable, events[-1].sequence_number)
+            sequences.extend(event.sequence_number for event in events)
+        return _result(
+            start,
+            processed=len(sequences),
+            sequences=sequences,
+            size=self.storage_size_bytes,
+        )
+
+    # -- ProtocolEventStore ---------------------------------------------------
+
+    async def append_events(
+        self,
+        events: list[ProtocolWorkflowEvent],
+        expected_sequence: int | None,
+        transaction: _Transaction | None,
+    ) -> EventStoreResult:
+        """
+        Append events of one stream after ``expected_sequence``.
+
+        Args:
+            events: Events numbered on from the stream's last sequence.
+            expected_sequence: Last sequence the caller has seen; None to
+                skip the check.
+            transaction: Transaction to buffer the append in, if any.
+
+        Returns:
+            An unsuccessful result on a sequence conflict or gap.
+        """
+        if transaction is None:
+            return await self.append_batches([(events, expected_sequence)])
+        if not transaction.is_active:
+            raise InvalidProtocolStateError("transaction is not active")
+        start = time.perf_counter()
+        transaction.batches.append((list(events), expected_sequence))
+        return _result(
+            start,
+            processed=len(events),
+            sequences=[event.sequence_number for event in events],
+        )
+
+    def _scan_stream(
+        self, key: _StreamKey, low: int, high: int
+    ) -> Iterator[tuple[float, bytes]]:
+        """Yield timestamp and body of the stream's durable events in range."""
+        stream = self._streams.get(key)
+        if stream is None or not stream.marks:
+            return
+        high = min(high, stream.durable)
+        if low > high:
+            return
+        position = max(0, bisect.bisect_right(stream.marks, low) - 1)
+        first, offset = stream.places[position]
+        name, instance = key[0].encode(), key[1].bytes
+        for i in sorted(i for i in self._segments if i >= first):
+            segment = self._segments[i]
+            if segment.size == 0:
+                continue
+            view = segment.view()
+            start = offset if i == first else 0
+            for kind, sequence, stamp, owner, at, body, end in _records(
+                view, start, segment.size
+            ):
+                if owner != instance or kind != _EVENT or view[at:body] != name:
+                    continue
+                if sequence > high:
+                    return
+                if sequence >= low:
+                    yield stamp, view[body:end]
+                if sequence == high:
+                    return
+
+    async def get_event_stream(
+        self,
+        workflow_type: str,
+        instance_id: UUID,
+        from_sequence: int,
+        to_sequence: int | None,
+    ) -> list[ProtocolWorkflowEvent]:
+        """Events of a stream from ``from_sequence`` to ``to_sequence``, inclusive."""
+        high = _MAX_SEQUENCE if to_sequence is None else to_sequence
+        decode = self._decode
+        return [
+            decode(body)
+            for _, body in self._scan_stream(
+                (workflow_type, instance_id), from_sequence, high
+            )
+        ]
+
+    async def read_events(
+        self,
+        query_options: ProtocolEventQueryOptions,
+        transaction: _Transaction | None,
+    ) -> list[ProtocolWorkflowEvent]:
+        """
+        Events matching ``query_options``.
+
+        A query naming both workflow type and instance reads that stream
+        through its index; other queries scan every segment. ``order_by``
+        may be ``sequence_number`` or ``timestamp``, prefixed with ``-``
+        for descending order; events are otherwise in append order.
+        Buffered appends of ``transaction`` are not visible.
+        """
+        q = query_options
+        low = q.from_sequence or 0
+        high = _MAX_SEQUENCE if q.to_sequence is None else q.to_sequence
+        if q.workflow_type is not None and q.instance_id is not None:
+            found = self._scan_stream((q.workflow_type, q.instance_id), low, high)
+        else:
+            found = self._scan_all(q.workflow_type, q.instance_id, low, high)
+        lower = q.from_timestamp.timestamp() if q.from_timestamp else -math.inf
+        upper = q.to_timestamp.timestamp() if q.to_timestamp else math.inf
+        events = [
+            self._decode(body) for stamp, body in found if lower <= stamp <= upper
+        ]
+        if q.event_types is not None:
+            types = set(q.event_types)
+            events = [e for e in events if e.event_type in types]
+        if q.order_by:
+            name = q.order_by.lstrip("-")
+            if name not in {"sequence_number", "timestamp"}:
+                raise ValueError(f"cannot order events by {q.order_by!r}")
+            events.sort(
+                key=lambda e: getattr(e, name), reverse=q.order_by.startswith("-")
+            )
+        start = q.offset or 0
+        return events[start : None if q.limit is None else start + q.limit]
+
+    def _scan_all(
+        self, workflow_type: str | None, instance_id: UUID | None, low: int, high: int
+    ) -> Iterator[tuple[float, bytes]]:
+        """Yield timestamp and body of matching durable events of every stream."""
+        name = None if workflow_type is None else workflow_type.encode()
+        instance = None if instance_id is None else instance_id.bytes
+        for i in sorted(self._segments):
+            segment = self._segments[i]
+            if segment.size == 0:
+                continue
+            view = segment.view()
+            for kind, sequence, stamp, owner, at, body, end in _records(
+                view, 0, segment.size
+            ):
+                if kind != _EVENT or not low <= sequence <= high:
+                    continue
+                if (instance is not None and owner != instance) or (
+                    name is not None and view[at:body] != name
+                ):
+                    continue
+                stream = self._streams.get((view[at:body].decode(), UUID(bytes=owner)))
+                # Skips deleted streams and appends not yet fsynced.
+                if (
+                    stream is not None
+                    and sequence <= stream.durable
+                    and (i, at - _HEADER.size) >= stream.origin
+                ):
+                    yield stamp, view[body:end]
+
+    async def get_last_sequence_number(
+        self, workflow_type: str, instance_id: UUID
+    ) -> int:
+        """Last sequence number appended to the stream; 0 if there is none."""
+        stream = self._streams.get((workflow_type, instance_id))
+        return 0 if stream is None else stream.last
+
+    async def begin_transaction(self) -> _Transaction:
+        """Start a transaction that buffers appends until it commits."""
+        return _Transaction(self)
+
+    async def delete_event_stream(
+        self, workflow_type: str, instance_id: UUID
+    ) -> EventStoreResult:
+        """Write a tombstone for the stream; its records go with their segments."""
+        start = time.perf_counter()
+        stream = self._streams.pop((workflow_type, instance_id), None)
+        if stream is None:
+            return _result(start, size=self.storage_size_bytes)
+        tombstone = _pack(_TOMBSTONE, 0, time.time(), (workflow_type, instance_id), b"")
+        segment = self._segments[max(self._segments)]
+        assert segment.fd is not None
+        os.write(segment.fd, tombstone)
+        segment.size += len(tombstone)
+        self._written += 1
+        await self._sync(self._written)
+        return _result(start, processed=stream.count, size=self.storage_size_bytes)
+
+    async def archive_old_events(
+        self, before_timestamp: datetime, batch_size: int
+    ) -> EventStoreResult:
+        """
+        Drop sealed segments whose newest event is before ``before_timestamp``.
+
+        Whole segments are dropped, oldest first, until at least
+        ``batch_size`` events are archived. Streams with no event left get
+        a sequence marker, fsynced before any segment is dropped. The
+        result's ``storage_size_bytes`` is the space freed.
+        """
+        start = time.perf_counter()
+        cutoff = before_timestamp.timestamp()
+        active = max(self._segments)
+        dropped: list[_Segment] = []
+        archived = 0
+        for i in sorted(self._segments):
+            segment = self._segments[i]
+            if i == active or segment.newest >= cutoff or archived >= batch_size:
+                break
+            dropped.append(segment)
+            archived += segment.events
+        gone = {segment.id for segment in dropped}
+        if gone:
+            await self._mark_orphans(gone)
+        for segment in dropped:
+            segment.close()
+            del self._segments[segment.id]
+            if self._archive_directory is None:
+                segment.path.unlink()
+            else:
+                self._archive_directory.mkdir(parents=True, exist_ok=True)
+                shutil.move(segment.path, self._archive_directory / segment.path.name)
+        if dropped:
+            for stream in self._streams.values():
+                keep = [i for i, p in enumerate(stream.places) if p[0] not in gone]
+                stream.marks = [stream.marks[i] for i in keep]
+                stream.places = [stream.places[i] for i in keep]
+        return _result(
+            start,
+            processed=archived,
+            size=sum(segment.size for segment in dropped),
+        )
+
+    async def _mark_orphans(self, gone: set[int]) -> None:
+        """Record the last sequence of streams that only live in ``gone``."""
+        # Dropped segments are the oldest ones, so a stream keeps an event
+        # exactly when its last indexed one is in a surviving segment.
+        kept = self._segments.keys() - gone
+        orphans = [
+            (key, stream)
+            for key, stream in self._streams.items()
+            if stream.marked not in kept
+            and (not stream.places or stream.places[-1][0] in gone)
+        ]
+        if not orphans:
+            return
+        now = time.time()
+        markers = b"".join(
+            _pack(_MARKER, stream.last, now, key, b"") for key, stream in orphans
+        )
+        segment = self._segments[max(self._segments)]
+        assert segment.fd is not None
+        os.write(segment.fd, markers)
+        segment.size += len(markers)
+        for _, stream in orphans:
+            stream.marked = segment.id
+        self._written += 1
+        await self._sync(self._written)
+
+
+def _fsync_all(retired: list[int], active: int | None) -> None:
+    for fd in retired:
+        os.fsync(fd)
+        os.close(fd)
+    if active is not None:
+        os.fsync(active)
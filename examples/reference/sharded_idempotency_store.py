@@ -0,0 +1,460 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Sharded in-memory reference implementation of ``ProtocolIdempotencyStore``.
+
+``ShardedIdempotencyStore`` is meant for tests and single-node consumers
+that deduplicate at high rates:
+
+- Records are spread over a power-of-two number of shards by a hash of
+  ``(domain, message_id)``. Each shard has its own ``threading.Lock``, so
+  concurrent callers only contend when they hit the same shard, and
+  ``check_and_record`` stays atomic across threads and event loops.
+- ``check_and_record_many`` groups a batch by shard and takes each shard
+  lock once for all of the batch's messages in that shard.
+- Message ids are kept as their 128-bit integer value and timestamps as
+  epoch-second floats, in one ``dict`` per domain and shard; no ``UUID``,
+  ``datetime`` or tuple object is kept per record.
+- Every shard files its records into a hierarchical timing wheel keyed by
+  ``processed_at``: recent records sit in fine buckets that are merged into
+  coarser ones as they age. Each level keeps a heap of its bucket indexes,
+  so ``cleanup_expired`` only visits the buckets that start before the
+  cutoff, instead of scanning every record or bucket, and a cleanup with
+  nothing due costs a few comparisons per shard.
+
+Correlation ids are stored only for the messages they are passed with.
+With ``ttl_seconds`` set, records older than the TTL count as unprocessed
+before ``cleanup_expired`` removes them.
+
+Example:
+    ```python
+    store = ShardedIdempotencyStore(ttl_seconds=7 * 24 * 3600)
+    if await store.check_and_record(event.message_id, domain="billing"):
+        await handle_event(event)
+    fresh = await store.check_and_record_many(ids, domain="billing")
+    removed = await store.cleanup_expired(ttl_seconds=7 * 24 * 3600)
+    ```
+"""
+
+import heapq
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from uuid import UUID
+
+DEFAULT_SHARDS = 64
+
+# Each wheel level keeps _SPAN buckets of its width before merging them into
+# the next level, whose buckets are 2 ** _FANOUT_BITS times wider. A record
+# older than the finest level is thus filed in a bucket at most 1/16 of its
+# age wide, which bounds the work spent on the bucket straddling a cleanup
+# cutoff.
+_FANOUT_BITS = 4
+_SPAN = 256
+_LEVELS = 6
+_TOP_LEVEL = _LEVELS - 1
+
+
+class _Bucket:
+    """Message id ints filed under one time range, by domain."""
+
+    __slots__ = ("ids", "oldest")
+
+    def __init__(self, oldest: float) -> None:
+        self.ids: dict[str | None, list[int]] = {}
+        # Oldest timestamp filed here; lets cleanup skip the bucket whole.
+        self.oldest = oldest
+
+    def add(self, domain: str | None, id_int: int, timestamp: float) -> None:
+        ids = self.ids.get(domain)
+        if ids is None:
+            self.ids[domain] = [id_int]
+        else:
+            ids.append(id_int)
+        self.oldest = min(self.oldest, timestamp)
+
+    def merge(self, other: "_Bucket") -> None:
+        for domain, ids in other.ids.items():
+            mine = self.ids.get(domain)
+            if mine is None:
+                self.ids[domain] = ids
+            else:
+                mine.extend(ids)
+        self.oldest = min(self.oldest, other.oldest)
+
+
+class _TimingWheel:
+    """Hierarchical time buckets of the records of one shard."""
+
+    __slots__ = ("heaps", "levels", "resolution", "tick")
+
+    def __init__(self, resolution: float) -> None:
+        self.resolution = resolution
+        # levels[i] maps bucket index -> bucket; a level-i bucket spans
+        # 2 ** (i * _FANOUT_BITS) ticks of ``resolution`` seconds.
+        self.levels: list[dict[int, _Bucket]] = [{} for _ in range(_LEVELS)]
+        # heaps[i] holds exactly the bucket indexes of levels[i].
+        self.heaps: list[list[int]] = [[] for _ in range(_LEVELS)]
+        self.tick: int | None = None
+
+    def add(
+        self, domain: str | None, id_int: int, timestamp: float, now: float
+    ) -> None:
+        now_tick = int(now // self.resolution)
+        if now_tick != self.tick:
+            self._cascade(now_tick)
+        tick = int(timestamp // self.resolution)
+        level = 0
+        while level < _TOP_LEVEL:
+            shift = level * _FANOUT_BITS
+            if (now_tick >> shift) - (tick >> shift) < _SPAN:
+                break
+            level += 1
+        index = tick >> (level * _FANOUT_BITS)
+        bucket = self.levels[level].get(index)
+        if bucket is None:
+            bucket = self.levels[level][index] = _Bucket(timestamp)
+            heapq.heappush(self.heaps[level], index)
+        bucket.add(domain, id_int, timestamp)
+
+    def _cascade(self, now_tick: int) -> None:
+        """Merge buckets that aged out of their level into the next one."""
+        previous, self.tick = self.tick, now_tick
+        for level in range(_TOP_LEVEL):
+            shift = level * _FANOUT_BITS
+            # Coarser levels only move when their own tick changes.
+            if previous is not None and (now_tick >> shift) == (previous >> shift):
+                break
+            buckets, heap = self.levels[level], self.heaps[level]
+            limit = (now_tick >> shift) - _SPAN
+            upper = self.levels[level + 1]
+            while heap and heap[0] <= limit:
+                index = heapq.heappop(heap)
+                bucket = buckets.pop(index)
+                target = upper.get(index >> _FANOUT_BITS)
+                if target is None:
+                    upper[index >> _FANOUT_BITS] = bucket
+                    heapq.heappush(self.heaps[level + 1], index >> _FANOUT_BITS)
+                else:
+                    target.merge(bucket)
+
+
+class _Shard:
+    """Records of one shard, guarded by ``lock``."""
+
+    __slots__ = ("correlations", "entries", "lock", "wheel")
+
+    def __init__(self, resolution: float) -> None:
+        self.lock = threading.Lock()
+        # domain -> message id int -> processed_at (epoch seconds)
+        self.entries: dict[str | None, dict[int, float]] = {}
+        # domain -> message id int -> correlation id int
+        self.correlations: dict[str | None, dict[int, int]] = {}
+        self.wheel = _TimingWheel(resolution)
+
+    def record(
+        self,
+        domain: str | None,
+        id_int: int,
+        correlation_id: UUID | None,
+        timestamp: float,
+        now: float,
+    ) -> None:
+        entries = self.entries.get(domain)
+        if entries is None:
+            entries = self.entries[domain] = {}
+        entries[id_int] = timestamp
+        self.wheel.add(domain, id_int, timestamp, now)
+        if correlation_id is not None:
+            correlations = self.correlations.get(domain)
+            if correlations is None:
+                correlations = self.correlations[domain] = {}
+            correlations[id_int] = correlation_id.int
+
+    def check_and_record(
+        self,
+        domain: str | None,
+        id_int: int,
+        correlation_id: UUID | None,
+        now: float,
+        fresh_after: float,
+    ) -> bool:
+        entries = self.entries.get(domain)
+        if entries is not None:
+            timestamp = entries.get(id_int)
+            if timestamp is not None:
+                if timestamp >= fresh_after:
+                    return False
+                # Expired: this is a new record, not an update of the old one.
+                if correlation_id is None:
+                    self.correlations.get(domain, {}).pop(id_int, None)
+        self.record(domain, id_int, correlation_id, now, now)
+        return True
+
+    def expire(self, cutoff: float) -> int:
+        """Remove records processed before ``cutoff``; return how many."""
+        wheel = self.wheel
+        cutoff_tick = int(cutoff // wheel.resolution)
+        removed = 0
+        for level, buckets in enumerate(wheel.levels):
+            heap, shift = wheel.heaps[level], level * _FANOUT_BITS
+            # Buckets starting before the cutoff; all but the last of them
+            # end before it too.
+            started: list[int] = []
+            while heap and heap[0] << shift <= cutoff_tick:
+                started.append(heapq.heappop(heap))
+            for index in started:
+                bucket = buckets[index]
+                if bucket.oldest >= cutoff:
+                    heapq.heappush(heap, index)
+                    continue
+                kept = _Bucket(math.inf)
+                for domain, ids in bucket.ids.items():
+                    removed += self._expire_ids(domain, ids, cutoff, kept, index, shift)
+                if kept.ids:
+                    buckets[index] = kept
+                    heapq.heappush(heap, index)
+                else:
+                    del buckets[index]
+        return removed
+
+    def _expire_ids(
+        self,
+        domain: str | None,
+        ids: list[int],
+        cutoff: float,
+        kept: _Bucket,
+        index: int,
+        shift: int,
+    ) -> int:
+        entries = self.entries.get(domain)
+        if entries is None:
+            return 0
+        correlations = self.correlations.get(domain)
+        resolution = self.wheel.resolution
+        removed = 0
+        for id_int in ids:
+            timestamp = entries.get(id_int)
+            if timestamp is None:
+                continue
+            if timestamp < cutoff:
+                del entries[id_int]
+                if correlations is not None:
+                    correlations.pop(id_int, None)
+                removed += 1
+            # Keep the id only if this bucket still files the live record;
+            # records re-marked since are filed in another bucket too.
+            elif int(timestamp // resolution) >> shift == index:
+                kept.add(domain, id_int, timestamp)
+        if not entries:
+            del self.entries[domain]
+        if correlations is not None and not correlations:
+            del self.correlations[domain]
+        return removed
+
+
+class ShardedIdempotencyStore:
+    """
+    Lock-striped ``ProtocolIdempotencyStore`` with timing-wheel expiry.
+
+    Safe to share between threads and event loops. No method awaits, so
+    the async methods never yield to the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = DEFAULT_SHARDS,
+        ttl_seconds: float | None = None,
+        resolution_seconds: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Create an empty store.
+
+        Args:
+            shards: Number of shards; a power of two.
+            ttl_seconds: Age after which a record counts as unprocessed even
+                before ``cleanup_expired`` removes it. ``None`` keeps records
+                valid until they are cleaned up.
+            resolution_seconds: Width of the finest timing wheel bucket.
+            clock: Wall clock in epoch seconds, used for ``processed_at``.
+
+        Raises:
+            ValueError: If ``shards`` is not a positive power of two, or
+                ``ttl_seconds`` or ``resolution_seconds`` is not positive.
+        """
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a positive power of two")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if resolution_seconds <= 0:
+            raise ValueError("resolution_seconds must be positive")
+        self._shards = [_Shard(resolution_seconds) for _ in range(shards)]
+        self._mask = shards - 1
+        self._ttl = ttl_seconds
+        self._clock = clock
+
+    def __len__(self) -> int:
+        """Number of records currently stored, expired or not."""
+        return sum(
+            len(entries)
+            for shard in self._shards
+            for entries in list(shard.entries.values())
+        )
+
+    def _shard(self, id_int: int, domain: str | None) -> _Shard:
+        # Hashing the pair mixes every bit of the id into the shard index;
+        # the low bits alone are the host node of uuid1 ids. The id comes
+        # first: the tuple hash mixes earlier items into the low bits more.
+        return self._shards[hash((id_int, domain)) & self._mask]
+
+    def _fresh_after(self, now: float) -> float:
+        return -math.inf if self._ttl is None else now - self._ttl
+
+    # -- ProtocolIdempotencyStore ---------------------------------------------
+
+    async def check_and_record(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> bool:
+        """
+        Record ``message_id`` unless it is already recorded in ``domain``.
+
+        Returns:
+            True for the one caller that recorded the message, False for
+            every other caller.
+        """
+        id_int = message_id.int
+        shard = self._shard(id_int, domain)
+        with shard.lock:
+            now = self._clock()
+            return shard.check_and_record(
+                domain, id_int, correlation_id, now, self._fresh_after(now)
+            )
+
+    async def check_and_record_many(
+        self,
+        message_ids: Iterable[UUID],
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> list[bool]:
+        """
+        ``check_and_record`` every id of a batch, taking each shard lock once.
+
+        Each id is checked and recorded atomically; the batch as a whole is
+        not. An id repeated within the batch is new at most once.
+
+        Returns:
+            One result per id, in the order given.
+        """
+        ids = [message_id.int for message_id in message_ids]
+        mask = self._mask
+        positions_by_shard: dict[int, list[int]] = {}
+        for position, id_int in enumerate(ids):
+            index = hash((id_int, domain)) & mask
+            positions = positions_by_shard.get(index)
+            if positions is None:
+                positions_by_shard[index] = [position]
+            else:
+                positions.append(position)
+
+        results = [False] * len(ids)
+        for index, positions in positions_by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                now = self._clock()
+                fresh_after = self._fresh_after(now)
+                for position in positions:
+                    results[position] = shard.check_and_record(
+                        domain, ids[position], correlation_id, now, fresh_after
+                    )
+        return results
+
+    async def is_processed(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+    ) -> bool:
+        """Whether ``message_id`` is recorded in ``domain`` and not expired."""
+        id_int = message_id.int
+        # A single dict lookup is atomic; no lock needed for a read.
+        entries = self._shard(id_int, domain).entries.get(domain)
+        timestamp = None if entries is None else entries.get(id_int)
+        if timestamp is None:
+            return False
+        return timestamp >= self._fresh_after(self._clock())
+
+    async def mark_processed(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+        processed_at: datetime | None = None,
+    ) -> None:
+        """
+        Record ``message_id`` as processed at ``processed_at``.
+
+        Overwrites the timestamp of an existing record.
+
+        Raises:
+            ValueError: If ``processed_at`` is a naive datetime.
+        """
+        if processed_at is not None and processed_at.utcoffset() is None:
+            raise ValueError("processed_at must be timezone-aware")
+        id_int = message_id.int
+        shard = self._shard(id_int, domain)
+        with shard.lock:
+            now = self._clock()
+            timestamp = now if processed_at is None else processed_at.timestamp()
+            shard.record(domain, id_int, correlation_id, timestamp, now)
+
+    async def cleanup_expired(
+        self,
+        ttl_seconds: int,
+    ) -> int:
+        """
+        Remove records processed more than ``ttl_seconds`` ago.
+
+        Shards are cleaned one at a time, so only callers hitting the shard
+        being cleaned wait.
+
+        Returns:
+            Number of records removed.
+
+        Raises:
+            ValueError: If ``ttl_seconds`` is negative.
+        """
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds must not be negative")
+        cutoff = self._clock() - ttl_seconds
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.expire(cutoff)
+        return removed
+
+    # -- introspection --------------------------------------------------------
+
+    def processed_at(
+        self, message_id: UUID, domain: str | None = None
+    ) -> datetime | None:
+        """When ``message_id`` was recorded in ``domain``, if it is."""
+        id_int = message_id.int
+        entries = self._shard(id_int, domain).entries.get(domain)
+        timestamp = None if entries is None else entries.get(id_int)
+        return None if timestamp is None else datetime.fromtimestamp(timestamp, UTC)
+
+    def correlation_id(
+        self, message_id: UUID, domain: str | None = None
+    ) -> UUID | None:
+        """Correlation id ``message_id`` was last recorded with, if any."""
+        id_int = message_id.int
+        correlations = self._shard(id_int, domain).correlations.get(domain)
+        value = None if correlations is None else correlations.get(id_int)
+        return None if value is None else UUID(int=value)
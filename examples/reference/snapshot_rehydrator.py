@@ -0,0 +1,440 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Snapshot-accelerated workflow state rehydration.
+
+``SnapshotRehydrator`` rebuilds the reducer state of a workflow instance
+from a ``ProtocolSnapshotStore`` and a ``ProtocolEventStore`` instead of
+replaying the instance's whole stream:
+
+- ``rehydrate`` loads the latest snapshot at or before the requested
+  sequence number, reads only the events after it with
+  ``get_event_stream(from_sequence=snapshot + 1)`` and folds them into the
+  snapshot's state with ``ProtocolWorkflowReducer.dispatch``, or in one
+  batch with ``dispatch_many`` if the reducer has it. Without a snapshot
+  it starts from ``initial_state()``.
+- After a replay, a new snapshot of the rebuilt state is saved when the
+  ``SnapshotPolicy`` asks for one: once the tail held ``every_events``
+  events, or once reading and replaying it took ``max_replay_seconds``.
+  Each save is followed by ``cleanup_old_snapshots`` keeping the newest
+  ``keep_count`` snapshots.
+- Concurrent rehydrations of the same instance and sequence number share
+  one replay (singleflight); a caller that is cancelled does not cancel it
+  for the others.
+
+Events are turned into actions by ``to_action``, ``ReplayedAction.of``
+unless another function is given. Snapshots are built by ``to_snapshot``
+and read back by ``from_snapshot``; by default a ``StateSnapshot`` holds
+the reducer state object itself, which suits ``InMemorySnapshotStore``.
+Stores that serialize snapshots need functions that encode and decode the
+state. Reducer states must be immutable, as ``ProtocolWorkflowReducer``
+requires, since rebuilt states are shared with the snapshot store.
+
+Example:
+    ```python
+    rehydrator = SnapshotRehydrator(
+        event_store,
+        InMemorySnapshotStore(),
+        reducer,
+        policy=SnapshotPolicy(every_events=500, max_replay_seconds=0.05),
+    )
+    rehydrated = await rehydrator.rehydrate("deploy", instance_id)
+    print(rehydrated.events_replayed, rehydrated.snapshot_saved)
+    ```
+"""
+
+import asyncio
+import bisect
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from examples.reference.persistent_state import dispatch_many
+from omnibase_spi.exceptions import InvalidProtocolStateError
+from omnibase_spi.protocols.types.protocol_core_types import (
+    ContextValue,
+    ProtocolAction,
+    ProtocolState,
+)
+from omnibase_spi.protocols.types.protocol_workflow_orchestration_types import (
+    ProtocolWorkflowEvent,
+    ProtocolWorkflowSnapshot,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence import (
+    ProtocolEventStore,
+    ProtocolEventStoreTransaction,
+    ProtocolSnapshotStore,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_reducer import (
+    ProtocolWorkflowReducer,
+)
+
+# (workflow type, instance id, requested sequence number or None for latest)
+_Key = tuple[str, UUID, int | None]
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayedAction:
+    """``ProtocolAction`` replaying a stored workflow event."""
+
+    type: str
+    payload: Any
+    timestamp: Any
+
+    @classmethod
+    def of(cls, event: ProtocolWorkflowEvent) -> "ReplayedAction":
+        """Return the action of ``event``: its type, payload and time."""
+        return cls(str(event.event_type), event.payload, event.timestamp)
+
+    async def validate_action(self) -> bool:
+        """Return whether the action has a type."""
+        return bool(self.type)
+
+    def is_executable(self) -> bool:
+        """Stored events were accepted when written."""
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """``ProtocolWorkflowSnapshot`` holding a reducer state."""
+
+    workflow_type: str
+    instance_id: UUID
+    sequence_number: int
+    reducer_state: Any
+    created_at: datetime
+    state: str = "running"
+    context: Any = None
+    tasks: list[Any] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def of(
+        cls,
+        workflow_type: str,
+        instance_id: UUID,
+        sequence_number: int,
+        reducer_state: ProtocolState,
+    ) -> "StateSnapshot":
+        """Return a snapshot of ``reducer_state`` taken now."""
+        return cls(
+            workflow_type,
+            instance_id,
+            sequence_number,
+            reducer_state,
+            datetime.now(UTC),
+        )
+
+    async def validate_snapshot(self) -> bool:
+        """Return whether the snapshot is consistent."""
+        return self.is_consistent()
+
+    def is_consistent(self) -> bool:
+        """Return whether the snapshot covers a valid stream position."""
+        return self.sequence_number >= 0
+
+
+def snapshot_state(snapshot: ProtocolWorkflowSnapshot) -> ProtocolState:
+    """Return the reducer state held by a ``StateSnapshot``."""
+    state: ProtocolState = snapshot.reducer_state  # type: ignore[attr-defined]
+    return state
+
+
+class InMemorySnapshotStore:
+    """
+    ``ProtocolSnapshotStore`` keeping snapshots in memory.
+
+    Snapshots of each instance are kept ordered by sequence number; saving
+    one at a sequence number already held replaces it. Transactions are
+    not supported and ``transaction`` is ignored.
+    """
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self._sequences: dict[tuple[str, UUID], list[int]] = {}
+        self._snapshots: dict[tuple[str, UUID], list[ProtocolWorkflowSnapshot]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self._sequences.values())
+
+    async def save_snapshot(
+        self,
+        snapshot: ProtocolWorkflowSnapshot,
+        transaction: ProtocolEventStoreTransaction | None,
+    ) -> bool:
+        """Store ``snapshot``."""
+        key = (snapshot.workflow_type, snapshot.instance_id)
+        sequences = self._sequences.setdefault(key, [])
+        snapshots = self._snapshots.setdefault(key, [])
+        at = bisect.bisect_left(sequences, snapshot.sequence_number)
+        if at < len(sequences) and sequences[at] == snapshot.sequence_number:
+            snapshots[at] = snapshot
+        else:
+            sequences.insert(at, snapshot.sequence_number)
+            snapshots.insert(at, snapshot)
+        return True
+
+    async def load_snapshot(
+        self, workflow_type: str, instance_id: UUID, sequence_number: int | None
+    ) -> ProtocolWorkflowSnapshot | None:
+        """Return the newest snapshot at or before ``sequence_number``."""
+        key = (workflow_type, instance_id)
+        sequences = self._sequences.get(key, [])
+        at = (
+            len(sequences)
+            if sequence_number is None
+            else bisect.bisect_right(sequences, sequence_number)
+        )
+        return self._snapshots[key][at - 1] if at else None
+
+    async def list_snapshots(
+        self, workflow_type: str, instance_id: UUID, limit: int
+    ) -> list[dict[str, ContextValue]]:
+        """Describe up to ``limit`` snapshots, newest first."""
+        snapshots = self._snapshots.get((workflow_type, instance_id), [])
+        return [
+            {
+                "sequence_number": s.sequence_number,
+                "created_at": str(s.created_at),
+                "state": s.state,
+            }
+            for s in reversed(snapshots[-limit:] if limit > 0 else [])
+        ]
+
+    async def delete_snapshot(
+        self, workflow_type: str, instance_id: UUID, sequence_number: int
+    ) -> bool:
+        """Delete the snapshot at ``sequence_number``, if there is one."""
+        key = (workflow_type, instance_id)
+        sequences = self._sequences.get(key, [])
+        at = bisect.bisect_left(sequences, sequence_number)
+        if at == len(sequences) or sequences[at] != sequence_number:
+            return False
+        del sequences[at]
+        del self._snapshots[key][at]
+        return True
+
+    async def cleanup_old_snapshots(
+        self, workflow_type: str, instance_id: UUID, keep_count: int
+    ) -> int:
+        """Delete all but the newest ``keep_count`` snapshots."""
+        key = (workflow_type, instance_id)
+        sequences = self._sequences.get(key, [])
+        removed = max(0, len(sequences) - max(0, keep_count))
+        del sequences[:removed]
+        del self._snapshots.get(key, [])[:removed]
+        return removed
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotPolicy:
+    """
+    When ``SnapshotRehydrator`` saves snapshots, and how many it keeps.
+
+    Attributes:
+        every_events: Save a snapshot once a replayed tail holds this many
+            events; ``None`` never saves by count.
+        max_replay_seconds: Save a snapshot once reading and replaying a
+            tail took this long; ``None`` never saves by cost.
+        keep_count: Newest snapshots kept per instance after a save.
+    """
+
+    every_events: int | None = 1_000
+    max_replay_seconds: float | None = None
+    keep_count: int = 2
+
+    def __post_init__(self) -> None:
+        if self.every_events is not None and self.every_events < 1:
+            raise ValueError("every_events must be positive")
+        if self.max_replay_seconds is not None and self.max_replay_seconds <= 0:
+            raise ValueError("max_replay_seconds must be positive")
+        if self.keep_count < 1:
+            raise ValueError("keep_count must be positive")
+
+    def wants_snapshot(self, events: int, seconds: float) -> bool:
+        """Return whether a replay of ``events`` taking ``seconds`` is due one."""
+        if events == 0:
+            return False
+        by_count = self.every_events is not None and events >= self.every_events
+        by_cost = (
+            self.max_replay_seconds is not None and seconds >= self.max_replay_seconds
+        )
+        return by_count or by_cost
+
+
+@dataclass(frozen=True, slots=True)
+class Rehydration:
+    """
+    Outcome of ``SnapshotRehydrator.rehydrate``.
+
+    Attributes:
+        state: Rebuilt reducer state.
+        sequence_number: Last event folded into ``state``; 0 for none.
+        snapshot_sequence: Sequence number of the snapshot started from;
+            0 when replay started from ``initial_state()``.
+        events_replayed: Events read and dispatched after the snapshot.
+        replay_seconds: Time spent reading and dispatching them.
+        snapshot_saved: Whether a snapshot of ``state`` was saved.
+    """
+
+    state: ProtocolState
+    sequence_number: int
+    snapshot_sequence: int
+    events_replayed: int
+    replay_seconds: float
+    snapshot_saved: bool
+
+
+class SnapshotRehydrator:
+    """
+    Rebuilds reducer states from the latest snapshot and the events after it.
+
+    Attributes:
+        rehydrations: Rehydrations performed, not counting shared ones.
+        coalesced: Rehydrations that joined one already in flight.
+        events_replayed: Events dispatched over all rehydrations.
+        snapshots_saved: Snapshots saved by the policy.
+        snapshots_removed: Snapshots removed by retention.
+    """
+
+    def __init__(
+        self,
+        event_store: ProtocolEventStore,
+        snapshot_store: ProtocolSnapshotStore,
+        reducer: ProtocolWorkflowReducer,
+        *,
+        policy: SnapshotPolicy | None = None,
+        to_action: Callable[[ProtocolWorkflowEvent], ProtocolAction] = (
+            ReplayedAction.of
+        ),
+        to_snapshot: Callable[
+            [str, UUID, int, ProtocolState], ProtocolWorkflowSnapshot
+        ] = StateSnapshot.of,
+        from_snapshot: Callable[
+            [ProtocolWorkflowSnapshot], ProtocolState
+        ] = snapshot_state,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Rehydrate from ``snapshot_store`` and ``event_store``.
+
+        Args:
+            event_store: Store holding the workflow event streams.
+            snapshot_store: Store to load snapshots from and save them to.
+            reducer: Reducer folding replayed actions into states.
+            policy: When to save snapshots; ``SnapshotPolicy()`` if omitted.
+            to_action: Turns a stored event into the action to dispatch.
+            to_snapshot: Builds a snapshot from the workflow type, instance
+                id, last sequence number and reducer state.
+            from_snapshot: Returns the reducer state of a loaded snapshot.
+            clock: Time source used to measure replays, in seconds.
+        """
+        self._events = event_store
+        self._snapshots = snapshot_store
+        self._reducer = reducer
+        self._policy = policy or SnapshotPolicy()
+        self._to_action = to_action
+        self._to_snapshot = to_snapshot
+        self._from_snapshot = from_snapshot
+        self._clock = clock
+        self._inflight: dict[_Key, asyncio.Future[Rehydration]] = {}
+        self.rehydrations = 0
+        self.coalesced = 0
+        self.events_replayed = 0
+        self.snapshots_saved = 0
+        self.snapshots_removed = 0
+
+    async def rehydrate(
+        self,
+        workflow_type: str,
+        instance_id: UUID,
+        to_sequence: int | None = None,
+    ) -> Rehydration:
+        """
+        Rebuild the state of an instance.
+
+        Args:
+            workflow_type: Workflow type of the instance.
+            instance_id: Instance to rebuild.
+            to_sequence: Last event to fold in; ``None`` for the whole
+                stream.
+
+        Returns:
+            The rebuilt state and how it was obtained.
+
+        Raises:
+            InvalidProtocolStateError: If the events after the snapshot do
+                not continue it without gaps.
+        """
+        key = (workflow_type, instance_id, to_sequence)
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._rehydrate(*key))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shielded so that one cancelled caller leaves the replay running
+        # for the others.
+        return await asyncio.shield(future)
+
+    async def _rehydrate(
+        self, workflow_type: str, instance_id: UUID, to_sequence: int | None
+    ) -> Rehydration:
+        self.rehydrations += 1
+        start = self._clock()
+        snapshot = await self._snapshots.load_snapshot(
+            workflow_type, instance_id, to_sequence
+        )
+        if snapshot is None:
+            state, base = self._reducer.initial_state(), 0
+        else:
+            state, base = self._from_snapshot(snapshot), snapshot.sequence_number
+        events = await self._events.get_event_stream(
+            workflow_type, instance_id, base + 1, to_sequence
+        )
+        last = base
+        for event in events:
+            if event.sequence_number != last + 1:
+                raise InvalidProtocolStateError(
+                    f"stream {workflow_type}/{instance_id} continues at "
+                    f"{event.sequence_number} after {last}"
+                )
+            last = event.sequence_number
+        state = dispatch_many(
+            self._reducer, state, [self._to_action(e) for e in events]
+        )
+        elapsed = self._clock() - start
+        self.events_replayed += len(events)
+        saved = self._policy.wants_snapshot(len(events), elapsed)
+        if saved:
+            saved = await self._save(workflow_type, instance_id, last, state)
+        return Rehydration(
+            state=state,
+            sequence_number=last,
+            snapshot_sequence=base,
+            events_replayed=len(events),
+            replay_seconds=elapsed,
+            snapshot_saved=saved,
+        )
+
+    async def _save(
+        self,
+        workflow_type: str,
+        instance_id: UUID,
+        sequence_number: int,
+        state: ProtocolState,
+    ) -> bool:
+        snapshot = self._to_snapshot(workflow_type, instance_id, sequence_number, state)
+        if not await self._snapshots.save_snapshot(snapshot, None):
+            return False
+        self.snapshots_saved += 1
+        self.snapshots_removed += await self._snapshots.cleanup_old_snapshots(
+            workflow_type, instance_id, self._policy.keep_count
+        )
+        return True
@@ -10,6 +10,10 @@ the repository (excluding the defining module and ``__init__.py`` re-exports).
 
 Supports an allowlist for newly added APIs that may not yet have consumers.
 
+Every candidate file is read and parsed once into a reverse index
+(``build_symbol_index``) mapping referenced names to consuming files, so the
+cost of a run no longer grows with the number of exports.
+
 Usage:
     # Check for unused exports (warns but does not fail)
     uv run python scripts/check_unused_exports.py
@@ -20,6 +24,9 @@ Usage:
     # JSON output
     uv run python scripts/check_unused_exports.py --json
 
+    # Build the symbol index with 4 worker processes
+    uv run python scripts/check_unused_exports.py --jobs 4
+
     # With custom allowlist
     uv run python scripts/check_unused_exports.py --allowlist scripts/export_allowlist.txt
 
@@ -33,12 +40,17 @@ import ast
 import json
 import re
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # Repository root (relative to this script)
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SRC_DIR = REPO_ROOT / "src"
 PROTOCOLS_INIT = SRC_DIR / "omnibase_spi" / "protocols" / "__init__.py"
+# Generated lazy-loading index for the barrel (maps every export by name)
+PROTOCOLS_SYMBOL_INDEX = SRC_DIR / "omnibase_spi" / "protocols" / "_symbol_index.py"
 
 # Default allowlist: symbols that are exported but may not yet have consumers.
 # These are typically newly added APIs or types used only by downstream repos.
@@ -122,6 +134,9 @@ def _find_symbol_consumers(symbol: str, search_dirs: list[Path]) -> list[str]:
             # Skip the protocols __init__.py itself (it defines the exports)
             if py_file == PROTOCOLS_INIT:
                 continue
+            # Skip the generated symbol index (it names every export)
+            if py_file == PROTOCOLS_SYMBOL_INDEX:
+                continue
 
             try:
                 content = py_file.read_text(encoding="utf-8")
@@ -170,13 +185,135 @@ def _find_symbol_consumers(symbol: str, search_dirs: list[Path]) -> list[str]:
     return consumers
 
 
+def _iter_candidate_files(search_dirs: list[Path]) -> list[Path]:
+    """List the files ``_find_symbol_consumers`` inspects, in the same order."""
+    return [
+        py_file
+        for search_dir in search_dirs
+        for py_file in search_dir.rglob("*.py")
+        if py_file.name not in EXCLUDE_PATTERNS
+        and py_file != PROTOCOLS_INIT
+        and py_file != PROTOCOLS_SYMBOL_INDEX
+    ]
+
+
+def _referenced_names(content: str) -> frozenset[str]:
+    """Collect every name ``_find_symbol_consumers`` would match in a module.
+
+    Covers ``Name`` ids, ``Attribute`` attrs, import ``alias`` names and
+    asnames, string constants (forward references) and ``ClassDef`` names.
+
+    Raises:
+        SyntaxError: If ``content`` cannot be parsed.
+    """
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(content)):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            names.add(node.attr)
+        elif isinstance(node, ast.alias):
+            names.add(node.name)
+            if node.asname:
+                names.add(node.asname)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            names.add(node.value)
+        elif isinstance(node, ast.ClassDef):
+            names.add(node.name)
+    return frozenset(names)
+
+
+# Per-file scan result: referenced names, or the raw source when the file
+# does not parse (matched with the regex fallback instead), or None when the
+# file cannot be read.
+_ScanResult = frozenset[str] | str | None
+
+
+def _scan_file(py_file: Path) -> _ScanResult:
+    try:
+        content = py_file.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    try:
+        return _referenced_names(content)
+    except SyntaxError:
+        return content
+
+
+@dataclass(frozen=True)
+class SymbolIndex:
+    """Reverse index from referenced name to consuming files.
+
+    Attributes:
+        paths: Repository-relative path of every indexed file, in scan order.
+        files_by_name: Name -> positions in ``paths`` of files referencing it.
+        unparsed: ``(position, source)`` of files that failed to parse.
+    """
+
+    paths: tuple[str, ...]
+    files_by_name: dict[str, list[int]]
+    unparsed: tuple[tuple[int, str], ...]
+
+    def consumers(self, symbol: str) -> list[str]:
+        """Return the files referencing ``symbol``.
+
+        Equivalent to ``_find_symbol_consumers(symbol, search_dirs)`` for the
+        directories the index was built from, including file order.
+        """
+        positions = self.files_by_name.get(symbol, [])
+        if self.unparsed:
+            pattern = re.compile(rf"\b{re.escape(symbol)}\b")
+            fallback = [pos for pos, src in self.unparsed if pattern.search(src)]
+            if fallback:
+                positions = sorted(positions + fallback)
+        return [self.paths[pos] for pos in positions]
+
+
+def build_symbol_index(search_dirs: list[Path], jobs: int = 1) -> SymbolIndex:
+    """Read and parse every candidate file once and index referenced names.
+
+    Args:
+        search_dirs: Directories to search in.
+        jobs: Worker processes used to parse files; 1 parses in-process.
+
+    Returns:
+        The reverse index for ``search_dirs``.
+    """
+    files = _iter_candidate_files(search_dirs)
+    scans: Iterable[_ScanResult]
+    if jobs > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(files) // (jobs * 4))
+            scans = list(executor.map(_scan_file, files, chunksize=chunksize))
+    else:
+        scans = map(_scan_file, files)
+
+    paths: list[str] = []
+    files_by_name: dict[str, list[int]] = {}
+    unparsed: list[tuple[int, str]] = []
+    for py_file, scan in zip(files, scans, strict=True):
+        if scan is None:
+            continue
+        position = len(paths)
+        paths.append(str(py_file.relative_to(REPO_ROOT)))
+        if isinstance(scan, str):
+            unparsed.append((position, scan))
+            continue
+        for name in scan:
+            files_by_name.setdefault(name, []).append(position)
+
+    return SymbolIndex(tuple(paths), files_by_name, tuple(unparsed))
+
+
 def check_unused_exports(
     allowlist_path: Path | None = None,
+    jobs: int = 1,
 ) -> dict[str, list[str]]:
     """Check all protocol exports for usage.
 
     Args:
         allowlist_path: Optional path to an allowlist file.
+        jobs: Worker processes used to build the symbol index.
 
     Returns:
         Dictionary mapping each exported symbol to its list of consumer files.
@@ -194,12 +331,13 @@ def check_unused_exports(
     # Only search dirs that exist
     search_dirs = [d for d in search_dirs if d.exists()]
 
+    index = build_symbol_index(search_dirs, jobs=jobs)
+
     results: dict[str, list[str]] = {}
     for symbol in sorted(exports):
         if symbol in allowlist:
             continue
-        consumers = _find_symbol_consumers(symbol, search_dirs)
-        results[symbol] = consumers
+        results[symbol] = index.consumers(symbol)
 
     return results
 
@@ -230,9 +368,15 @@ def main() -> int:
         default=None,
         help="Path to allowlist file (one symbol per line)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to parse files (default: 1)",
+    )
     args = parser.parse_args()
 
-    results = check_unused_exports(allowlist_path=args.allowlist)
+    results = check_unused_exports(allowlist_path=args.allowlist, jobs=args.jobs)
 
     used = {k: v for k, v in results.items() if v}
     unused = {k: v for k, v in results.items() if not v}
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Generate the lazy symbol index for the ``omnibase_spi.protocols`` barrel.
+
+The frozen ``omnibase_spi.protocols`` barrel resolves its exports on first
+access through a PEP 562 ``__getattr__`` backed by a ``{symbol: module}``
+index stored in ``omnibase_spi/protocols/_symbol_index.py``. This script
+builds that index from the barrel itself:
+
+1. The ``from ... import ...`` statements inside the barrel's
+   ``if TYPE_CHECKING:`` block declare where each exported symbol comes from.
+2. Each declared source package is imported and, when the exported object
+   carries a ``__module__`` that is a submodule of the source package and
+   binds the very same object, the entry is narrowed to that defining module
+   so first access only pays for the package it actually needs.
+
+Literal aliases and renamed re-exports (which have no usable ``__module__``)
+keep the package they are imported from in the barrel.
+
+Usage:
+    # Regenerate the index in place
+    uv run python scripts/generate_protocol_symbol_index.py
+
+    # CI: exit 1 if the checked-in index is stale
+    uv run python scripts/generate_protocol_symbol_index.py --check
+
+Exit codes:
+    0 - Index written (or up to date with --check)
+    1 - Index is stale (--check) or the barrel could not be resolved
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib
+import sys
+from pathlib import Path
+
+# Repository root (relative to this script)
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+PROTOCOLS_INIT = SRC_DIR / "omnibase_spi" / "protocols" / "__init__.py"
+SYMBOL_INDEX = SRC_DIR / "omnibase_spi" / "protocols" / "_symbol_index.py"
+
+INDEX_HEADER = '''\
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+# AUTO-GENERATED by scripts/generate_protocol_symbol_index.py -- DO NOT EDIT.
+# Regenerate with: uv run python scripts/generate_protocol_symbol_index.py
+
+"""Symbol index for the lazy ``omnibase_spi.protocols`` barrel.
+
+Maps every symbol exported by ``omnibase_spi.protocols`` to the module that
+``__getattr__`` imports on first access.
+"""
+'''
+
+
+def _is_type_checking_block(node: ast.stmt) -> bool:
+    """Return True if ``node`` is an ``if TYPE_CHECKING:`` statement."""
+    if not isinstance(node, ast.If):
+        return False
+    test = node.test
+    return (isinstance(test, ast.Name) and test.id == "TYPE_CHECKING") or (
+        isinstance(test, ast.Attribute) and test.attr == "TYPE_CHECKING"
+    )
+
+
+def extract_barrel_exports(init_path: Path) -> list[str]:
+    """Extract the literal ``__all__`` list from the barrel.
+
+    Args:
+        init_path: Path to the barrel ``__init__.py``.
+
+    Returns:
+        Exported symbol names in declaration order (duplicates preserved).
+
+    Raises:
+        ValueError: If the barrel has no literal ``__all__`` list.
+    """
+    tree = ast.parse(init_path.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__all__"
+            for target in node.targets
+        ):
+            if not isinstance(node.value, ast.List):
+                break
+            return [
+                elt.value
+                for elt in node.value.elts
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+            ]
+    raise ValueError(f"No literal __all__ list found in {init_path}")
+
+
+def extract_declared_sources(init_path: Path) -> dict[str, tuple[str, str]]:
+    """Extract ``{exported_name: (source_module, attribute)}`` from the barrel.
+
+    Only imports inside the barrel's ``if TYPE_CHECKING:`` block are
+    considered; they are the single declaration of where each export lives.
+
+    Args:
+        init_path: Path to the barrel ``__init__.py``.
+
+    Returns:
+        Mapping of the bound name to its source module and attribute name.
+    """
+    tree = ast.parse(init_path.read_text(encoding="utf-8"))
+    sources: dict[str, tuple[str, str]] = {}
+    for node in tree.body:
+        if not _is_type_checking_block(node):
+            continue
+        for stmt in ast.walk(node):
+            if isinstance(stmt, ast.ImportFrom) and stmt.module and stmt.level == 0:
+                for alias in stmt.names:
+                    sources[alias.asname or alias.name] = (stmt.module, alias.name)
+    return sources
+
+
+def resolve_symbol_index(init_path: Path = PROTOCOLS_INIT) -> dict[str, str]:
+    """Resolve every barrel export to the module that should be imported.
+
+    Args:
+        init_path: Path to the barrel ``__init__.py``.
+
+    Returns:
+        Mapping of exported symbol name to importable module path, sorted
+        by symbol name.
+
+    Raises:
+        ValueError: If an export has no declared source, or the source
+            binds it under a different name (the lazy loader looks symbols
+            up by their exported name).
+    """
+    exports = dict.fromkeys(extract_barrel_exports(init_path))
+    sources = extract_declared_sources(init_path)
+
+    missing = sorted(name for name in exports if name not in sources)
+    if missing:
+        raise ValueError(
+            "Exports without a TYPE_CHECKING import in the barrel: "
+            + ", ".join(missing)
+        )
+
+    index: dict[str, str] = {}
+    for name in sorted(exports):
+        source_module, attribute = sources[name]
+        if attribute != name:
+            raise ValueError(
+                f"{name} is imported as an alias of {source_module}.{attribute}; "
+                "the lazy barrel requires the exported name to match"
+            )
+        module = importlib.import_module(source_module)
+        obj = getattr(module, name)
+
+        # Narrow to the defining submodule when it provably binds the same
+        # object; Literal aliases and renamed re-exports keep the package.
+        defining = getattr(obj, "__module__", None)
+        if (
+            isinstance(defining, str)
+            and defining.startswith(source_module + ".")
+            and getattr(importlib.import_module(defining), name, None) is obj
+        ):
+            index[name] = defining
+        else:
+            index[name] = source_module
+    return index
+
+
+def render_symbol_index(index: dict[str, str]) -> str:
+    """Render the symbol index module source.
+
+    Args:
+        index: Mapping of symbol name to module path.
+
+    Returns:
+        Python source for ``_symbol_index.py``.
+    """
+    lines = [INDEX_HEADER, "_LAZY_SYMBOL_MAP: dict[str, str] = {"]
+    for name, module in sorted(index.items()):
+        entry = f'    "{name}": "{module}",'
+        if len(entry) > 88:
+            entry = f'    "{name}": (\n        "{module}"\n    ),'
+        lines.append(entry)
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    """Main entry point for the symbol index generator.
+
+    Returns:
+        Exit code: 0 on success, 1 if stale (with --check) or unresolvable.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate the lazy symbol index for omnibase_spi.protocols"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with code 1 if the checked-in index is out of date",
+    )
+    args = parser.parse_args()
+
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+
+    if not SYMBOL_INDEX.exists():
+        if args.check:
+            print(f"MISSING: {SYMBOL_INDEX.relative_to(REPO_ROOT)} does not exist.")
+            return 1
+        # The barrel imports the index, so bootstrap an empty one before
+        # importing any protocol package.
+        SYMBOL_INDEX.write_text(render_symbol_index({}), encoding="utf-8")
+
+    try:
+        rendered = render_symbol_index(resolve_symbol_index())
+    except (ImportError, AttributeError, ValueError) as e:
+        print(f"ERROR: could not resolve barrel exports: {e}")
+        return 1
+
+    current = SYMBOL_INDEX.read_text(encoding="utf-8")
+    if args.check:
+        if current != rendered:
+            print(f"STALE: {SYMBOL_INDEX.relative_to(REPO_ROOT)} is out of date.")
+            print("Run: uv run python scripts/generate_protocol_symbol_index.py")
+            return 1
+        print("Symbol index is up to date.")
+        return 0
+
+    if current != rendered:
+        SYMBOL_INDEX.write_text(rendered, encoding="utf-8")
+        print(f"Wrote {SYMBOL_INDEX.relative_to(REPO_ROOT)}")
+    else:
+        print("Symbol index is up to date.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,4 +13,5 @@ Available Validators:
     - validate_naming_patterns.py: Naming conventions and @runtime_checkable
     - validate_namespace_isolation.py: No Infra imports, no Pydantic models
     - run_all_validations.py: Unified runner for all validators
+    - ast_cache.py: Shared parse cache used by the validators
 """
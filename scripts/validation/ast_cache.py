@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Shared AST cache for the standalone SPI validators.
+
+Each validator walks ``src/`` and parses every file with ``ast.parse``. When
+several validators run in one interpreter (``run_all_validations.py
+--in-process``) this module lets them share a single parse per file.
+
+Cache entries are keyed by resolved path and invalidated when the file's
+mtime or size changes. Only successful parses are cached: a file with a
+syntax error is re-parsed by every caller, so each validator still reports
+the error exactly as it would on its own (the ``filename`` argument only
+affects ``SyntaxError`` messages).
+
+Validators must treat returned trees as read-only.
+
+This is a STANDALONE module using only Python stdlib.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Iterable
+from pathlib import Path
+
+# resolved path -> (st_mtime_ns, st_size, tree)
+_cache: dict[Path, tuple[int, int, ast.Module]] = {}
+
+
+def parse_file(file_path: Path, filename: str = "<unknown>") -> ast.Module:
+    """
+    Parse a Python file, reusing the cached tree when the file is unchanged.
+
+    Args:
+        file_path: Path to the Python file
+        filename: Filename reported in ``SyntaxError`` (as for ``ast.parse``)
+
+    Returns:
+        The parsed module
+
+    Raises:
+        SyntaxError: If the file contains invalid Python syntax
+        OSError: If the file cannot be read
+    """
+    key = file_path.resolve()
+    stat = key.stat()
+    cached = _cache.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    source = file_path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=filename)
+    _cache[key] = (stat.st_mtime_ns, stat.st_size, tree)
+    return tree
+
+
+def preload(paths: Iterable[Path]) -> int:
+    """
+    Parse files ahead of time, skipping any that fail to read or parse.
+
+    Args:
+        paths: Python files to parse
+
+    Returns:
+        Number of files now cached
+    """
+    for path in paths:
+        try:
+            parse_file(path)
+        except (SyntaxError, OSError, RecursionError, ValueError):
+            continue
+    return len(_cache)
+
+
+def clear() -> None:
+    """Drop every cached tree."""
+    _cache.clear()
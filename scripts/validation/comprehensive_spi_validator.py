@@ -38,6 +38,9 @@ Usage:
     # Pre-commit integration mode
     python scripts/validation/comprehensive_spi_validator.py --pre-commit
 
+    # Incremental mode: re-validate only files whose content changed
+    python scripts/validation/comprehensive_spi_validator.py src/ --cache-dir .spi_validator_cache
+
 Author: Claude Code Agent (ONEX Framework)
 Version: 2.0.0
 """
@@ -84,6 +87,7 @@ Examples:
   %(prog)s src/ --json-report                     # Generate JSON report
   %(prog)s --create-config validation.yaml        # Create sample config
   %(prog)s --pre-commit                           # Pre-commit mode
+  %(prog)s src/ --cache-dir .spi_validator_cache  # Incremental validation
         """,
     )
 
@@ -114,6 +118,11 @@ Examples:
         action="store_true",
         help="Pre-commit integration mode (faster validation)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Persist per-file results here and re-validate only changed files",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -137,7 +146,7 @@ Examples:
                 if rule.category in ["documentation", "performance"]:
                     rule.enabled = False
 
-        engine = ComprehensiveSPIValidationEngine(config)
+        engine = ComprehensiveSPIValidationEngine(config, cache_dir=args.cache_dir)
 
         target_path = Path(args.path)
         if not target_path.exists():
@@ -150,6 +159,7 @@ Examples:
             print(f"   Config: {args.config or 'built-in defaults'}")
             print(f"   Auto-fix: {'enabled' if args.fix else 'disabled'}")
             print(f"   Mode: {'pre-commit' if args.pre_commit else 'standard'}")
+            print(f"   Cache: {args.cache_dir or 'disabled'}")
 
         if target_path.is_file():
             report = engine.validate_single_file(target_path)
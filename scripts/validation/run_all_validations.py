@@ -5,9 +5,16 @@
 """
 Unified Validation Runner for omnibase_spi.
 
-Runs all SPI validation scripts in sequence and provides a summary report.
+Runs all SPI validation scripts and provides a summary report.
 This is a STANDALONE script using only Python stdlib (no omnibase_core imports).
 
+By default each validator runs as its own subprocess, in sequence. With
+--in-process the validators are imported into this interpreter instead:
+every file under src/ is parsed once into the shared AST cache
+(ast_cache.py), then the validators run concurrently in forked worker
+processes that inherit the cache (sequentially when --jobs 1 or when fork
+is unavailable). Both modes produce the same summary and JSON output.
+
 Validators Executed:
     1. Architecture Validation - Domain cohesion rule (max protocols per file)
     2. Naming Pattern Validation - Protocol/Error naming and @runtime_checkable
@@ -18,11 +25,15 @@ Usage:
     python scripts/validation/run_all_validations.py --strict
     python scripts/validation/run_all_validations.py --verbose
     python scripts/validation/run_all_validations.py --strict --verbose
+    python scripts/validation/run_all_validations.py --in-process --jobs 3
 
 Options:
     --strict    Fail on any violation (exit code 1)
     --verbose   Show detailed output from each validator
     --json      Output results as JSON (includes all validator results)
+    --in-process  Run validators in this interpreter with a shared AST cache
+    --jobs N    Worker processes for --in-process (default: one per validator,
+                capped at the CPU count)
 
 Exit Codes:
     0 - All validators passed (or --strict not set)
@@ -36,13 +47,22 @@ Version: 1.0.0 (Temporary - standalone until Core removes SPI dependency)
 from __future__ import annotations
 
 import argparse
+import importlib
+import io
 import json
+import multiprocessing
+import os
 import subprocess
 import sys
 import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import ast_cache
+
 # ============================================================================
 # Data Structures
 # ============================================================================
@@ -139,6 +159,11 @@ class ValidatorConfig:
     description: str
     extra_args: list[str] = field(default_factory=list)
 
+    @property
+    def module_name(self) -> str:
+        """Importable module name of the validator script."""
+        return Path(self.script_name).stem
+
 
 # Define all validators to run
 VALIDATORS: list[ValidatorConfig] = [
@@ -256,6 +281,198 @@ def run_validator(
         )
 
 
+def run_validator_in_process(
+    config: ValidatorConfig,
+    repo_root: Path,
+    verbose: bool = False,
+) -> ValidatorResult:
+    """
+    Run a single validator's ``main()`` in the current interpreter.
+
+    Mirrors ``run_validator``: ``sys.argv`` is set to the same arguments,
+    stdout/stderr are captured, and an uncaught exception yields exit code 1
+    with the traceback on stderr, as the subprocess would. The caller is
+    responsible for the working directory and ``sys.path``
+    (see ``run_all_validators_in_process``).
+
+    Args:
+        config: Validator configuration
+        repo_root: Path to repository root
+        verbose: Whether to show verbose output
+
+    Returns:
+        ValidatorResult with execution details
+    """
+    script_path = repo_root / "scripts" / "validation" / config.script_name
+
+    if not script_path.exists():
+        return ValidatorResult(
+            name=config.name,
+            description=config.description,
+            exit_code=2,
+            duration_seconds=0.0,
+            error=f"Script not found: {script_path}",
+        )
+
+    argv = [str(script_path)] + config.extra_args
+    if verbose:
+        argv.append("--verbose")
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    saved_argv = sys.argv
+    start_time = time.time()
+
+    try:
+        module = importlib.import_module(config.module_name)
+        sys.argv = argv
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                exit_code = module.main()
+            except SystemExit as e:
+                exit_code = e.code
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    except Exception as e:
+        return ValidatorResult(
+            name=config.name,
+            description=config.description,
+            exit_code=2,
+            duration_seconds=time.time() - start_time,
+            error=str(e),
+        )
+    finally:
+        sys.argv = saved_argv
+
+    # Same mapping as the interpreter applies to sys.exit() arguments
+    if exit_code is None:
+        exit_code = 0
+    elif not isinstance(exit_code, int):
+        print(exit_code, file=stderr)
+        exit_code = 1
+
+    return ValidatorResult(
+        name=config.name,
+        description=config.description,
+        exit_code=exit_code,
+        duration_seconds=time.time() - start_time,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+    )
+
+
+def default_jobs() -> int:
+    """Default worker count for --in-process: one per validator, capped at CPUs."""
+    return max(1, min(len(VALIDATORS), os.cpu_count() or 1))
+
+
+def _run_in_pool(
+    repo_root: Path,
+    verbose: bool,
+    jobs: int,
+) -> list[ValidatorResult]:
+    """Run every validator in forked workers, returning results in VALIDATORS order."""
+    executor = ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+    )
+    try:
+        futures = [
+            executor.submit(run_validator_in_process, config, repo_root, verbose)
+            for config in VALIDATORS
+        ]
+        results = []
+        for config, future in zip(VALIDATORS, futures, strict=True):
+            try:
+                results.append(future.result(timeout=300))
+            except FutureTimeoutError:
+                results.append(
+                    ValidatorResult(
+                        name=config.name,
+                        description=config.description,
+                        exit_code=2,
+                        duration_seconds=300.0,
+                        error="Validator timed out after 5 minutes",
+                    )
+                )
+            except Exception as e:
+                results.append(
+                    ValidatorResult(
+                        name=config.name,
+                        description=config.description,
+                        exit_code=2,
+                        duration_seconds=0.0,
+                        error=str(e),
+                    )
+                )
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def run_all_validators_in_process(
+    verbose: bool = False,
+    jobs: int | None = None,
+) -> ValidationSummary:
+    """
+    Run all validators in-process from a single parse of ``src/``.
+
+    Every ``src/**/*.py`` file is parsed once into ``ast_cache`` before any
+    validator runs. With ``jobs > 1`` and the ``fork`` start method
+    available, validators then run concurrently in worker processes that
+    inherit the warm cache; otherwise they run sequentially here.
+
+    Args:
+        verbose: Whether to show verbose output
+        jobs: Worker processes (default: ``default_jobs()``)
+
+    Returns:
+        ValidationSummary with all results, in VALIDATORS order
+    """
+    repo_root = find_repo_root()
+    validation_dir = str(repo_root / "scripts" / "validation")
+    summary = ValidationSummary()
+    jobs = default_jobs() if jobs is None else max(1, jobs)
+
+    total_start = time.time()
+
+    saved_cwd = Path.cwd()
+    added_to_path = validation_dir not in sys.path
+    if added_to_path:
+        sys.path.insert(0, validation_dir)
+    # Validators resolve their default paths relative to the working directory
+    os.chdir(repo_root)
+    try:
+        ast_cache.preload(sorted((repo_root / "src").rglob("*.py")))
+
+        if jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+            summary.results = _run_in_pool(repo_root, verbose, jobs)
+        else:
+            summary.results = [
+                run_validator_in_process(config, repo_root, verbose)
+                for config in VALIDATORS
+            ]
+    finally:
+        os.chdir(saved_cwd)
+        if added_to_path:
+            sys.path.remove(validation_dir)
+
+    for config, result in zip(VALIDATORS, summary.results, strict=True):
+        if verbose:
+            print(f"\n{'=' * 60}")
+            print(f"Running: {config.name}")
+            print(f"Description: {config.description}")
+            print("=" * 60)
+        if verbose and result.stdout:
+            print(result.stdout)
+        if verbose and result.stderr:
+            print(result.stderr, file=sys.stderr)
+
+    summary.total_duration_seconds = time.time() - total_start
+
+    return summary
+
+
 def run_all_validators(
     verbose: bool = False,
 ) -> ValidationSummary:
@@ -373,6 +590,7 @@ Examples:
   %(prog)s --strict            Exit 1 on any failure
   %(prog)s --verbose           Show detailed output
   %(prog)s --json              Output as JSON
+  %(prog)s --in-process        Parse src/ once, run validators in parallel
 
 Note: These are TEMPORARY standalone validators. They will be replaced
 by omnibase_core.validation when Core removes its SPI dependency.
@@ -395,6 +613,19 @@ by omnibase_core.validation when Core removes its SPI dependency.
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run validators in this interpreter from a shared AST cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes for --in-process (default: one per validator, "
+        "capped at the CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -404,7 +635,10 @@ by omnibase_core.validation when Core removes its SPI dependency.
         print(f"Validators to run: {len(VALIDATORS)}")
 
     # Run all validators
-    summary = run_all_validators(verbose=args.verbose)
+    if args.in_process:
+        summary = run_all_validators_in_process(verbose=args.verbose, jobs=args.jobs)
+    else:
+        summary = run_all_validators(verbose=args.verbose)
 
     # Output results
     if args.json:
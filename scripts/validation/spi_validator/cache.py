@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+"""Persistent per-file result cache for incremental SPI validation.
+
+Entries are keyed by file path and the SHA-256 of the file's content, and the
+whole cache is tied to a fingerprint of the validator configuration and of the
+``spi_validator`` sources. Any rule/setting change or validator code change
+discards every entry; an edited file misses only its own entry. Cached data is
+the per-file ``ProtocolViolation`` and ``ProtocolInfo`` lists, so cross-file
+duplicate analysis still runs on every invocation.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .config import ValidationConfig
+from .models import ProtocolInfo, ProtocolViolation
+
+CACHE_FILE_NAME = "spi_validation_cache.json"
+
+# Bump when the on-disk layout changes.
+CACHE_FORMAT_VERSION = 1
+
+# Global settings that change per-file results. Run-wide settings such as
+# timeout_seconds do not invalidate the cache.
+_PER_FILE_SETTINGS = ("max_file_size",)
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def _sources_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for source in sorted(_PACKAGE_DIR.glob("*.py")):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def config_fingerprint(config: ValidationConfig) -> str:
+    """Hash everything that can change a single file's validation result."""
+    payload = {
+        "format": CACHE_FORMAT_VERSION,
+        "sources": _sources_fingerprint(),
+        "rules": {
+            rule_id: dataclasses.asdict(rule)
+            for rule_id, rule in sorted(config.rules.items())
+        },
+        "settings": {
+            key: config.global_settings.get(key) for key in _PER_FILE_SETTINGS
+        },
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ValidationCache:
+    """On-disk map of ``path -> (content hash, violations, protocols)``."""
+
+    def __init__(self, cache_dir: Path, config: ValidationConfig):
+        self.cache_file = Path(cache_dir) / CACHE_FILE_NAME
+        self.fingerprint = config_fingerprint(config)
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("fingerprint") == self.fingerprint:
+            entries = data.get("files")
+            if isinstance(entries, dict):
+                self.entries = entries
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def get(
+        self, file_path: Path, digest: str
+    ) -> tuple[list[ProtocolViolation], list[ProtocolInfo]] | None:
+        entry = self.entries.get(str(file_path))
+        if entry is None or entry.get("sha256") != digest:
+            self.misses += 1
+            return None
+        try:
+            violations = [ProtocolViolation(**v) for v in entry["violations"]]
+            protocols = [ProtocolInfo(**p) for p in entry["protocols"]]
+        except (KeyError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return violations, protocols
+
+    def put(
+        self,
+        file_path: Path,
+        digest: str,
+        violations: list[ProtocolViolation],
+        protocols: list[ProtocolInfo],
+    ) -> None:
+        self.entries[str(file_path)] = {
+            "sha256": digest,
+            "violations": [v.to_dict() for v in violations],
+            "protocols": [p.to_dict() for p in protocols],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically, dropping entries for deleted files."""
+        stale = [path for path in self.entries if not Path(path).exists()]
+        for path in stale:
+            del self.entries[path]
+        if not (self._dirty or stale):
+            return
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"fingerprint": self.fingerprint, "files": self.entries}
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_file.parent, prefix=".spi_cache_", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            Path(tmp_name).replace(self.cache_file)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._dirty = False
@@ -12,6 +12,7 @@ from typing import Any
 from timeout_utils import timeout_context
 
 from .autofix import AutoFixEngine
+from .cache import ValidationCache
 from .config import ValidationConfig
 from .duplicate_analyzer import DuplicateProtocolAnalyzer
 from .file_validator import ComprehensiveSPIValidator
@@ -20,8 +21,13 @@ from .reporter import ReportGenerator
 
 
 class ComprehensiveSPIValidationEngine:
-    def __init__(self, config: ValidationConfig):
+    def __init__(self, config: ValidationConfig, cache_dir: Path | None = None):
         self.config = config
+        # Opt-in: results are only persisted when a cache directory is given
+        # and the config has not disabled caching.
+        self.cache: ValidationCache | None = None
+        if cache_dir is not None and config.global_settings.get("enable_caching", True):
+            self.cache = ValidationCache(cache_dir, config)
         self.duplicate_analyzer = DuplicateProtocolAnalyzer(config)
         self.auto_fix_engine = AutoFixEngine(config)
         self.report_generator = ReportGenerator(config)
@@ -47,14 +53,18 @@ class ComprehensiveSPIValidationEngine:
         all_violations: list[ProtocolViolation] = []
         all_protocols: list[ProtocolInfo] = []
 
-        with timeout_context(
-            "validation", self.config.global_settings.get("timeout_seconds", 300)
-        ):
-            for py_file in python_files:
-                print(f"   📄 Validating {py_file.name}...")
-                violations, protocols = self._validate_file(py_file)
-                all_violations.extend(violations)
-                all_protocols.extend(protocols)
+        try:
+            with timeout_context(
+                "validation", self.config.global_settings.get("timeout_seconds", 300)
+            ):
+                for py_file in python_files:
+                    print(f"   📄 Validating {py_file.name}...")
+                    violations, protocols = self._validate_file_cached(py_file)
+                    all_violations.extend(violations)
+                    all_protocols.extend(protocols)
+        finally:
+            if self.cache is not None:
+                self.cache.save()
 
         all_violations.extend(self.duplicate_analyzer.analyze_duplicates(all_protocols))
 
@@ -84,7 +94,9 @@ class ComprehensiveSPIValidationEngine:
     def validate_single_file(self, file_path: Path) -> ValidationReport:
         start_time = time.time()
         print(f"🔍 Validating single file: {file_path}")
-        violations, protocols = self._validate_file(file_path)
+        violations, protocols = self._validate_file_cached(file_path)
+        if self.cache is not None:
+            self.cache.save()
 
         report = ValidationReport()
         report.total_files = 1
@@ -128,6 +140,26 @@ class ComprehensiveSPIValidationEngine:
         ]
         return any(indicator in content for indicator in indicators)
 
+    def _validate_file_cached(
+        self, file_path: Path
+    ) -> tuple[list[ProtocolViolation], list[ProtocolInfo]]:
+        if self.cache is None:
+            return self._validate_file(file_path)
+        try:
+            digest = self.cache.content_hash(file_path.read_bytes())
+        except OSError:
+            return self._validate_file(file_path)
+
+        cached = self.cache.get(file_path, digest)
+        if cached is not None:
+            return cached
+
+        violations, protocols = self._validate_file(file_path)
+        # Unexpected failures may be transient; only cache real results.
+        if not any(v.violation_type == "Validation Error" for v in violations):
+            self.cache.put(file_path, digest, violations, protocols)
+        return violations, protocols
+
     def _validate_file(
         self, file_path: Path
     ) -> tuple[list[ProtocolViolation], list[ProtocolInfo]]:
@@ -184,7 +216,7 @@ class ComprehensiveSPIValidationEngine:
 
     def _generate_performance_metrics(self, report: ValidationReport) -> dict[str, Any]:
         t = report.execution_time
-        return {
+        metrics: dict[str, Any] = {
             "files_per_second": report.total_files / t if t > 0 else 0,
             "protocols_per_second": report.total_protocols / t if t > 0 else 0,
             "average_protocols_per_file": (
@@ -198,6 +230,10 @@ class ComprehensiveSPIValidationEngine:
                 else 0
             ),
         }
+        if self.cache is not None:
+            metrics["cache_hits"] = self.cache.hits
+            metrics["cache_misses"] = self.cache.misses
+        return metrics
 
     def _generate_recommendations(self, report: ValidationReport) -> list[str]:
         recommendations = []
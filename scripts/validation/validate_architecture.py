@@ -41,6 +41,8 @@ import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import ast_cache
+
 # Type aliases for clarity
 type LineNumber = int
 type ClassName = str
@@ -203,8 +205,7 @@ def analyze_file(file_path: Path) -> list[ProtocolDefinition]:
         SyntaxError: If the file contains invalid Python syntax
         IOError: If the file cannot be read
     """
-    source = file_path.read_text(encoding="utf-8")
-    tree = ast.parse(source, filename=str(file_path))
+    tree = ast_cache.parse_file(file_path, filename=str(file_path))
 
     visitor = ProtocolVisitor()
     visitor.visit(tree)
@@ -39,6 +39,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import ClassVar
 
+import ast_cache
+
 # ============================================================================
 # Data Structures
 # ============================================================================
@@ -349,10 +351,7 @@ def validate_file(file_path: Path) -> tuple[list[NamespaceViolation], str | None
         Tuple of (violations list, error message or None)
     """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        tree = ast.parse(content)
+        tree = ast_cache.parse_file(file_path)
         validator = NamespaceIsolationValidator(
             str(file_path),
             is_protocol_file=is_protocol_file(file_path),
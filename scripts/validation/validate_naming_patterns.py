@@ -39,6 +39,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import ClassVar
 
+import ast_cache
+
 
 @dataclass
 class Violation:
@@ -402,10 +404,7 @@ def validate_file(file_path: Path) -> tuple[list[Violation], int, int]:
         Tuple of (violations, protocols_found, exceptions_found)
     """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-
-        tree = ast.parse(content)
+        tree = ast_cache.parse_file(file_path)
         validator = NamingPatternValidator(str(file_path))
         validator.visit(tree)
 
@@ -110,8 +110,7 @@ _LAZY_PROTOCOL_MAP = {
     "ProtocolNodeRegistry": "omnibase_spi.protocols.node.protocol_node_registry",
     "ProtocolWorkflowReducer": "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_reducer",
     # Event bus protocols
-    "ProtocolEventBusProvider": "omnibase_spi.protocols.event_bus.protocol_event_bus",
-    "ProtocolEventBusAdapter": "omnibase_spi.protocols.event_bus.protocol_event_bus",
+    "ProtocolEventBusProvider": "omnibase_spi.protocols.event_bus.protocol_event_bus_provider",
     # Workflow orchestration protocols
     "ProtocolWorkflowEventBus": "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_event_bus",
     "ProtocolWorkflowNodeRegistry": "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry",
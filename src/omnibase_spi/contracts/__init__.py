@@ -92,6 +92,10 @@ from omnibase_spi.contracts.pipeline.contract_artifact_pointer import (
 from omnibase_spi.contracts.pipeline.contract_auth_gate_input import (
     ContractAuthGateInput,
 )
+from omnibase_spi.contracts.pipeline.contract_binary_codec import (
+    from_msgpack,
+    to_msgpack,
+)
 from omnibase_spi.contracts.pipeline.contract_checkpoint import ContractCheckpoint
 from omnibase_spi.contracts.pipeline.contract_execution_context import (
     ContractExecutionContext,
@@ -119,8 +123,11 @@ from omnibase_spi.contracts.pipeline.contract_schema_compat import (
 from omnibase_spi.contracts.pipeline.contract_session_index import ContractSessionIndex
 from omnibase_spi.contracts.pipeline.contract_wire_codec import (
     from_json,
+    from_ndjson,
     from_yaml,
+    iter_ndjson,
     to_json,
+    to_ndjson,
     to_yaml,
 )
 from omnibase_spi.contracts.pipeline.contract_work_authorization import (
@@ -192,6 +199,11 @@ __all__ = [
     "from_json",
     "to_yaml",
     "from_yaml",
+    "to_ndjson",
+    "from_ndjson",
+    "iter_ndjson",
+    "to_msgpack",
+    "from_msgpack",
     # Validation contracts
     "ContractAttributionRecord",
     "ContractPatternCandidate",
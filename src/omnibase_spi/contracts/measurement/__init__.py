@@ -68,7 +68,13 @@ from omnibase_spi.contracts.measurement.enum_result_classification import (
 from omnibase_spi.contracts.measurement.enum_usage_source import (
     ContractEnumUsageSource,
 )
-from omnibase_spi.contracts.measurement.vts import compute_vts, compute_vts_per_kloc
+from omnibase_spi.contracts.measurement.vts import (
+    VTS_COUNTER_FIELDS,
+    compute_vts,
+    compute_vts_batch,
+    compute_vts_per_kloc,
+    compute_vts_per_kloc_batch,
+)
 
 __all__ = [
     "ContractAggregatedRun",
@@ -101,7 +107,10 @@ __all__ = [
     "PatternInjectionEvidence",
     "RagEvidence",
     "ValidatorCatchEvidence",
+    "VTS_COUNTER_FIELDS",
     "compute_vts",
+    "compute_vts_batch",
     "compute_vts_per_kloc",
+    "compute_vts_per_kloc_batch",
     "derive_baseline_key",
 ]
@@ -7,10 +7,16 @@ Provides deterministic serialization and deserialization for all
 Contract* models.  Deterministic means: sorted keys, consistent
 formatting, and stable output for the same input.
 
+``to_json(model, indent=None)`` produces the compact canonical form (sorted
+keys, no whitespace) used on the wire and in newline-delimited JSON
+(NDJSON) streams.  ``to_ndjson`` / ``from_ndjson`` encode and decode whole
+batches, and ``iter_ndjson`` decodes large streams one line at a time.
+
 This module must NOT import from omnibase_core, omnibase_infra, or omniclaude.
 """
 
 import json
+from collections.abc import Iterable, Iterator
 from typing import TypeVar
 
 from pydantic import BaseModel
@@ -25,37 +31,118 @@ try:
 except ImportError:
     _HAS_YAML = False
 
+# Reused encoders: json.dumps() builds a new JSONEncoder per call whenever
+# non-default options are passed.  Without indent the C encoder is used.
+_COMPACT_ENCODER = json.JSONEncoder(
+    sort_keys=True, separators=(",", ":"), ensure_ascii=False
+)
+_PRETTY_ENCODER = json.JSONEncoder(sort_keys=True, indent=2, ensure_ascii=False)
+
 
-def to_json(model: BaseModel, *, indent: int = 2) -> str:
+def to_json(model: BaseModel, *, indent: int | None = 2) -> str:
     """Serialize a contract model to canonical JSON.
 
     Keys are sorted for deterministic output.
 
     Args:
         model: A Pydantic BaseModel instance.
-        indent: Number of spaces for indentation (default 2).
+        indent: Number of spaces for indentation (default 2).  ``None``
+            selects the compact canonical form with no whitespace.
 
     Returns:
         A JSON string with sorted keys.
     """
     raw = model.model_dump(mode="json")
+    if indent is None:
+        return _COMPACT_ENCODER.encode(raw)
+    if indent == 2:
+        return _PRETTY_ENCODER.encode(raw)
     return json.dumps(raw, sort_keys=True, indent=indent, ensure_ascii=False)
 
 
-def from_json[T: BaseModel](json_str: str, model_class: type[T]) -> T:
+def from_json[T: BaseModel](json_str: str | bytes, model_class: type[T]) -> T:
     """Deserialize a contract model from JSON.
 
-    Unknown fields are tolerated (extra='allow' on models).
+    Unknown fields are tolerated (extra='allow' on models).  The JSON is
+    parsed and validated in a single pass by pydantic.
 
     Args:
-        json_str: A JSON string.
+        json_str: A JSON string (or UTF-8 bytes).
         model_class: The target Pydantic model class.
 
     Returns:
         An instance of model_class.
+
+    Raises:
+        pydantic.ValidationError: If the input is not valid JSON or does not
+            match model_class.
     """
-    data = json.loads(json_str)
-    return model_class.model_validate(data)
+    return model_class.model_validate_json(json_str)
+
+
+def to_ndjson(models: Iterable[BaseModel]) -> str:
+    """Serialize contract models to newline-delimited JSON.
+
+    Each model is written as one compact canonical JSON line
+    (``to_json(model, indent=None)``), terminated by a newline.
+
+    Args:
+        models: Pydantic BaseModel instances, in output order.
+
+    Returns:
+        An NDJSON string (empty when no models are given).
+    """
+    encode = _COMPACT_ENCODER.encode
+    return "".join([encode(model.model_dump(mode="json")) + "\n" for model in models])
+
+
+def iter_ndjson[T: BaseModel](
+    lines: Iterable[str | bytes], model_class: type[T]
+) -> Iterator[T]:
+    """Lazily deserialize contract models from newline-delimited JSON.
+
+    Accepts any iterable of lines, so an open text or binary file can be
+    streamed without reading it into memory.  Blank lines are skipped.
+
+    Args:
+        lines: NDJSON lines (e.g. an open file).
+        model_class: The target Pydantic model class.
+
+    Yields:
+        One model_class instance per non-blank line.
+
+    Raises:
+        ValueError: If a line is not valid JSON or does not match
+            model_class; the message includes the 1-based line number.
+    """
+    validate = model_class.model_validate_json
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield validate(line)
+        except ValueError as e:
+            raise ValueError(f"NDJSON line {line_number}: {e}") from e
+
+
+def from_ndjson[T: BaseModel](ndjson: str | bytes, model_class: type[T]) -> list[T]:
+    """Deserialize every contract model in a newline-delimited JSON document.
+
+    Args:
+        ndjson: An NDJSON string (or UTF-8 bytes).
+        model_class: The target Pydantic model class.
+
+    Returns:
+        The decoded models, in input order.
+
+    Raises:
+        ValueError: If a line is not valid JSON or does not match
+            model_class; the message includes the 1-based line number.
+    """
+    # Split on "\n" only: str.splitlines() also breaks on U+2028 and similar
+    # characters, which may appear unescaped inside JSON strings.
+    lines = ndjson.split(b"\n") if isinstance(ndjson, bytes) else ndjson.split("\n")
+    return list(iter_ndjson(lines, model_class))
 
 
 def to_yaml(model: BaseModel) -> str:
@@ -116,385 +116,403 @@ Best Practices:
     - Follow the protocol naming convention: "Protocol"[Domain][Purpose]
     - Implement all protocol methods in concrete classes
     - Use dependency injection containers for protocol-based services
-"""
-
-# Analytics protocols (1 protocol) - Analytics data collection and reporting
-from omnibase_spi.protocols.analytics import ProtocolAnalyticsDataProvider
-
-# CLI protocols (7 protocols) - Command line interface operations
-from omnibase_spi.protocols.cli import (
-    ProtocolCLI,
-    ProtocolCLIDirFixtureCase,
-    ProtocolCLIDirFixtureRegistry,
-    ProtocolCLIResult,
-    ProtocolCLIToolDiscovery,
-    ProtocolCliWorkflow,
-    ProtocolNodeCliAdapter,
-)
-
-# Import container protocols for dependency injection and service management
-# Container protocols (22 protocols) - Service lifecycle and dependency resolution
-from omnibase_spi.protocols.container import (  # Phase 3 additions
-    InjectionScope,
-    LiteralContainerArtifactType,
-    LiteralInjectionScope,
-    LiteralOnexStatus,
-    LiteralServiceLifecycle,
-    LiteralServiceResolutionStatus,
-    ProtocolArtifactContainer,
-    ProtocolArtifactContainerStatus,
-    ProtocolArtifactInfo,
-    ProtocolArtifactMetadata,
-    ProtocolContainer,
-    ProtocolContainerService,
-    ProtocolDependencyGraph,
-    ProtocolDIServiceInstance,
-    ProtocolDIServiceMetadata,
-    ProtocolInjectionContext,
-    ProtocolServiceDependency,
-    ProtocolServiceFactory,
-    ProtocolServiceRegistration,
-    ProtocolServiceRegistry,
-    ProtocolServiceRegistryConfig,
-    ProtocolServiceRegistryStatus,
-    ProtocolServiceValidator,
-    ServiceHealthStatus,
-)
-
-# Note: ProtocolEnvelope is now imported directly from protocols.onex
-# (previously was an alias: ProtocolEnvelope = ProtocolOnexEnvelope)
-# v0.3.0 Contract compiler protocols (7 protocols) - YAML contract compilation
-# Includes handler contract interface and supporting types
-from omnibase_spi.protocols.contracts import (
-    ProtocolCapabilityDependency,
-    ProtocolEffectContractCompiler,
-    ProtocolExecutionConstraints,
-    ProtocolFSMContractCompiler,
-    ProtocolHandlerBehaviorDescriptor,
-    ProtocolHandlerContract,
-    ProtocolWorkflowContractCompiler,
-)
-
-# Core protocols (16 protocols) - Fundamental system contracts
-# Includes serialization, logging, health monitoring, and service discovery
-from omnibase_spi.protocols.core import (
-    ProtocolAuditLogger,
-    ProtocolCanonicalSerializer,
-    ProtocolDistributedTracing,
-    ProtocolErrorHandler,
-    ProtocolErrorSanitizer,
-    ProtocolErrorSanitizerFactory,
-    ProtocolHealthDetails,
-    ProtocolHealthMonitor,
-    ProtocolLogger,
-    ProtocolMetricsCollector,
-    ProtocolPerformanceMetricsCollector,
-    ProtocolRetryable,
-    ProtocolServiceDiscovery,
-    ProtocolTimeBasedOperations,
-    ProtocolUriParser,
-    ProtocolVersionManager,
-)
 
-# Dashboard protocols (6 protocols) - Dashboard UI and widget rendering
-from omnibase_spi.protocols.dashboard import (
-    ProtocolDashboardEventSubscriber,
-    ProtocolDashboardService,
-    ProtocolRegistryQueryService,
-    ProtocolRenderer,
-    ProtocolRendererCapabilityNegotiator,
-    ProtocolWidgetRenderer,
-)
-
-# Discovery protocols (4 protocols) - Node and handler discovery
-# Enables dynamic service discovery and handler registration
-from omnibase_spi.protocols.discovery import (
-    ProtocolBaseHandler,
-    ProtocolFileHandlerRegistry,
-    ProtocolHandlerDiscovery,
-    ProtocolHandlerInfo,
-)
-
-# Effects protocols (2 protocols) - Effect execution for kernel
-# ProtocolEffect: synchronous effect boundary (ordering guarantee)
-# ProtocolPrimitiveEffectExecutor: async primitive effects (kernel dispatch)
-from omnibase_spi.protocols.effects import (
-    LiteralEffectCategory,
-    LiteralEffectId,
-    ProtocolEffect,
-    ProtocolPrimitiveEffectExecutor,
-)
-
-# Event bus protocols - Distributed messaging infrastructure
-# Supports multiple backends (Kafka, Redis, in-memory) with async/sync patterns
-# Note: Interface protocols (ProtocolEventBus, ProtocolEventBusHeaders,
-#       ProtocolKafkaEventBusAdapter) are in omnibase_core
-from omnibase_spi.protocols.event_bus import (
-    ProtocolAsyncEventBus,
-    ProtocolDLQHandler,
-    ProtocolEventBusBase,
-    ProtocolEventBusBatchProducer,
-    ProtocolEventBusClient,
-    ProtocolEventBusClientProvider,
-    ProtocolEventBusConsumer,
-    ProtocolEventBusContextManager,
-    ProtocolEventBusExtendedClient,
-    ProtocolEventBusLogEmitter,
-    ProtocolEventBusMessage,
-    ProtocolEventBusProducerHandler,
-    ProtocolEventBusProvider,  # Factory protocol (SPI)
-    ProtocolEventBusRegistry,
-    ProtocolEventBusService,
-    ProtocolEventBusTransactionalProducer,
-    ProtocolEventEnvelope,
-    ProtocolEventMessage,
-    ProtocolEventPublisher,
-    ProtocolHttpEventBusAdapter,
-    ProtocolKafkaAdapter,
-    ProtocolRedpandaAdapter,
-    ProtocolSchemaRegistry,
-    ProtocolSyncEventBus,
-)
-
-# v0.3.0 Factory protocols (1 protocol) - Handler contract factories
-from omnibase_spi.protocols.factories import ProtocolHandlerContractFactory
-
-# File handling protocols (5 protocols) - File processing, ONEX metadata, rate limiting
-# Handles file type detection, processing, metadata stamping, and rate limiting
-from omnibase_spi.protocols.file_handling import (
-    ProtocolFileProcessingTypeHandler,
-    ProtocolFileReader,
-    ProtocolRateLimiter,
-    ProtocolStampOptions,
-    ProtocolValidationOptions,
-)
-
-# v0.3.0 Handler protocols (2 protocols) - DI-based protocol handlers and sources
-from omnibase_spi.protocols.handlers import ProtocolHandler, ProtocolHandlerSource
-
-# Intelligence protocols (4 protocols) - Intent classification, pattern extraction, context enrichment, and analysis
-from omnibase_spi.protocols.intelligence import (
-    ProtocolContextEnrichment,
-    ProtocolIntentClassifier,
-    ProtocolIntentGraph,
-    ProtocolPatternExtractor,
-)
-
-# LLM protocols (3 protocols) - Large Language Model integration
-# LLM provider interfaces, model routing, and semantic processing
-from omnibase_spi.protocols.llm import (
-    ProtocolLLMProvider,
-    ProtocolLLMToolProvider,
-    ProtocolModelRouter,
-)
-
-# MCP protocols (15 protocols) - Model Context Protocol integration
-# Multi-subsystem tool registration, execution, and health monitoring
-from omnibase_spi.protocols.mcp import (  # Phase 3 additions
-    ProtocolMCPDiscovery,
-    ProtocolMCPHealthMonitor,
-    ProtocolMCPMonitor,
-    ProtocolMCPRegistry,
-    ProtocolMCPRegistryAdmin,
-    ProtocolMCPRegistryMetricsOperations,
-    ProtocolMCPServiceDiscovery,
-    ProtocolMCPSubsystemClient,
-    ProtocolMCPSubsystemConfig,
-    ProtocolMCPToolExecutor,
-    ProtocolMCPToolProxy,
-    ProtocolMCPToolRouter,
-    ProtocolMCPToolValidator,
-    ProtocolMCPValidator,
-    ProtocolToolDiscoveryService,
-)
-
-# Memory protocols (7 protocols) - Memory operations and workflow management
-# Key-value store, workflow management, and composable memory operations
-from omnibase_spi.protocols.memory import (
-    ProtocolAgentCoordinator,
-    ProtocolClusterCoordinator,
-    ProtocolKeyValueStore,
-    ProtocolLifecycleManager,
-    ProtocolMemoryOrchestrator,
-    ProtocolMemoryRecord,
-    ProtocolWorkflowManager,
-)
-
-# Networking protocols (4 protocols) - HTTP, circuit breaker, and communication protocols
-from omnibase_spi.protocols.networking import (
-    ProtocolCircuitBreaker,
-    ProtocolCommunicationBridge,
-    ProtocolHttpClient,
-    ProtocolHttpExtendedClient,
-)
-
-# Node protocols (4 protocols) - Node management, configuration, and registry
-from omnibase_spi.protocols.node import (
-    ProtocolNodeConfiguration,
-    ProtocolNodeRegistry,
-    ProtocolNodeRunner,
-    ProtocolUtilsNodeConfiguration,
-)
-
-# v0.3.0 Node protocols (5 protocols) - Standard node interfaces with unified execute()
-from omnibase_spi.protocols.nodes import (
-    ProtocolComputeNode,
-    ProtocolEffectNode,
-    ProtocolNode,
-    ProtocolOrchestratorNode,
-    ProtocolReducerNode,
-)
-
-# Observability protocols (3 protocols) - Hot path metrics and logging sinks
-from omnibase_spi.protocols.observability import (
-    ProtocolHotPathLoggingSink,
-    ProtocolHotPathMetricsSink,
-    ProtocolObservabilitySinkFactory,
-)
-
-# ONEX protocols (15 protocols) - ONEX platform specific protocols
-# Note: Node protocols (ProtocolComputeNode, ProtocolEffectNode, ProtocolNode,
-# ProtocolOrchestratorNode, ProtocolReducerNode) are imported from protocols.nodes
-from omnibase_spi.protocols.onex import (
-    ProtocolContractData,
-    ProtocolEnvelope,
-    ProtocolOnexMetadata,
-    ProtocolOnexSecurityContext,
-    ProtocolOnexValidationReport,
-    ProtocolReply,
-    ProtocolSchema,
-    ProtocolValidation,
-    ProtocolVersionLoader,
-)
-
-# PrimitiveEffectExecutor SPI - typed kernel-level HTTP and Kafka dispatch (internal issue)
-# Zero upstream deps; contracts expressed via typing.Protocol structural subtyping.
-from omnibase_spi.protocols.primitive_effect_executor import (
-    ProtocolHttpRequestContract,
-    ProtocolHttpResponseContract,
-    ProtocolPrimitiveEffectExecutorV2,
-)
-
-# Projections protocols (7 protocols) - Projection persistence and state reading
-# Projector writes projections with ordering; Reader queries materialized state
-from omnibase_spi.protocols.projections import (
-    ProtocolBatchPersistResult,
-    ProtocolPersistResult,
-    ProtocolProjectionDatabase,
-    ProtocolProjectionDatabaseSync,
-    ProtocolProjectionReader,
-    ProtocolProjector,
-    ProtocolSequenceInfo,
-)
-
-# Projectors protocols (2 protocols) - Event-to-state projection and loader
-# Note: ProtocolEventProjector here handles event-to-state projection
-# projections.ProtocolProjector handles projection persistence with ordering
-from omnibase_spi.protocols.projectors import (
-    ProtocolEventProjector,
-    ProtocolProjectorLoader,
-)
-
-# v0.3.0 Execution constraint protocol - Mixin for constrainable objects
-from omnibase_spi.protocols.protocol_execution_constrainable import (
-    ProtocolExecutionConstrainable,
-)
+Lazy Loading:
+    This barrel is frozen and lazy. Importing ``omnibase_spi.protocols`` only
+    loads a generated ``{symbol: module}`` index
+    (``omnibase_spi.protocols._symbol_index``); each exported symbol is imported
+    from its defining module on first access via PEP 562 ``__getattr__`` and
+    cached afterwards. The imports below are evaluated by type checkers only
+    and are the source the index is generated from:
 
-# v0.3.0 Registry protocols (3 protocols) - Handler, provider, and capability registration
-from omnibase_spi.protocols.registry import (
-    ProtocolCapabilityRegistry,
-    ProtocolHandlerRegistry,
-    ProtocolProviderRegistry,
-)
-
-# Runtime protocols - Domain plugin lifecycle management + handler resolver
-# ModelDomainPluginConfig and ModelDomainPluginResult live in omnibase_core.models.runtime.
-from omnibase_spi.protocols.runtime.protocol_domain_plugin import ProtocolDomainPlugin
-from omnibase_spi.protocols.runtime.protocol_handleable import ProtocolHandleable
-from omnibase_spi.protocols.runtime.protocol_handler_ownership_query import (
-    ProtocolHandlerOwnershipQuery,
-)
-from omnibase_spi.protocols.runtime.protocol_handler_resolver import (
-    ProtocolHandlerResolver,
-)
-
-# Schema protocols (2 protocols) - Schema loading and validation
-from omnibase_spi.protocols.schema import (
-    ProtocolSchemaLoader,
-    ProtocolTrustedSchemaLoader,
-)
-
-# Security protocols (2 protocols) - Security event and detection interfaces
-# Breaking circular import dependencies for security models
-from omnibase_spi.protocols.security import (
-    ProtocolDetectionMatch,
-    ProtocolSecurityEvent,
-)
-
-# Semantic protocols (2 protocols) - Semantic processing and retrieval
-# Advanced text preprocessing and hybrid semantic retrieval systems
-from omnibase_spi.protocols.semantic import (
-    ProtocolAdvancedPreprocessor,
-    ProtocolHybridRetriever,
-)
-
-# Service lifecycle protocols (3 protocols) - External service integrations
-# Ticket tracking, secret management, and code hosting platform abstractions
-from omnibase_spi.protocols.services import (
-    ProtocolCodeHost,
-    ProtocolSecretStore,
-    ProtocolTicketService,
-)
-
-# Storage protocols (6 protocols) - Data storage and persistence
-from omnibase_spi.protocols.storage import (
-    ProtocolDatabaseConnection,
-    ProtocolGraphDatabaseHandler,
-    ProtocolIdempotencyStore,
-    ProtocolStorageBackend,
-    ProtocolStorageBackendFactory,
-    ProtocolVectorStoreHandler,
-)
-
-# Validation protocols (5 protocols) - Input validation and error handling
-# Provides structured validation with error reporting and compliance checking
-from omnibase_spi.protocols.validation import (
-    ProtocolConstraintValidator,
-    ProtocolValidationDecorator,
-    ProtocolValidationError,
-    ProtocolValidationResult,
-    ProtocolValidator,
-)
-
-# Verification protocols (1 protocol) - Package integrity and signature verification
-from omnibase_spi.protocols.verification import (
-    LiteralHashAlgorithm,
-    ProtocolPackageVerifier,
-)
+        uv run python scripts/generate_protocol_symbol_index.py
+"""
 
-# Workflow orchestration protocols (15 protocols) - Event-driven FSM coordination
-# Event sourcing, workflow state management, distributed task scheduling, and surface adapters
-from omnibase_spi.protocols.workflow_orchestration import (
-    LiteralAssignmentStrategy,
-    LiteralWorkQueuePriority,
-    ProtocolEventQueryOptions,
-    ProtocolEventStore,
-    ProtocolEventStoreResult,
-    ProtocolEventStoreTransaction,
-    ProtocolFSMSurfaceAdapter,
-    ProtocolLiteralWorkflowStateProjection,
-    ProtocolLiteralWorkflowStateStore,
-    ProtocolNodeSchedulingResult,
-    ProtocolSnapshotStore,
-    ProtocolTaskSchedulingCriteria,
-    ProtocolWorkflowEventBus,
-    ProtocolWorkflowEventHandler,
-    ProtocolWorkflowEventMessage,
-    ProtocolWorkflowNodeCapability,
-    ProtocolWorkflowNodeInfo,
-    ProtocolWorkflowNodeRegistry,
-    ProtocolWorkQueue,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from omnibase_spi.protocols._symbol_index import _LAZY_SYMBOL_MAP
+
+if TYPE_CHECKING:
+    # Analytics protocols (1 protocol) - Analytics data collection and reporting
+    from omnibase_spi.protocols.analytics import ProtocolAnalyticsDataProvider
+
+    # CLI protocols (7 protocols) - Command line interface operations
+    from omnibase_spi.protocols.cli import (
+        ProtocolCLI,
+        ProtocolCLIDirFixtureCase,
+        ProtocolCLIDirFixtureRegistry,
+        ProtocolCLIResult,
+        ProtocolCLIToolDiscovery,
+        ProtocolCliWorkflow,
+        ProtocolNodeCliAdapter,
+    )
+
+    # Import container protocols for dependency injection and service management
+    # Container protocols (22 protocols) - Service lifecycle and dependency resolution
+    from omnibase_spi.protocols.container import (  # Phase 3 additions
+        InjectionScope,
+        LiteralContainerArtifactType,
+        LiteralInjectionScope,
+        LiteralOnexStatus,
+        LiteralServiceLifecycle,
+        LiteralServiceResolutionStatus,
+        ProtocolArtifactContainer,
+        ProtocolArtifactContainerStatus,
+        ProtocolArtifactInfo,
+        ProtocolArtifactMetadata,
+        ProtocolContainer,
+        ProtocolContainerService,
+        ProtocolDependencyGraph,
+        ProtocolDIServiceInstance,
+        ProtocolDIServiceMetadata,
+        ProtocolInjectionContext,
+        ProtocolServiceDependency,
+        ProtocolServiceFactory,
+        ProtocolServiceRegistration,
+        ProtocolServiceRegistry,
+        ProtocolServiceRegistryConfig,
+        ProtocolServiceRegistryStatus,
+        ProtocolServiceValidator,
+        ServiceHealthStatus,
+    )
+
+    # Note: ProtocolEnvelope is now imported directly from protocols.onex
+    # (previously was an alias: ProtocolEnvelope = ProtocolOnexEnvelope)
+    # v0.3.0 Contract compiler protocols (7 protocols) - YAML contract compilation
+    # Includes handler contract interface and supporting types
+    from omnibase_spi.protocols.contracts import (
+        ProtocolCapabilityDependency,
+        ProtocolEffectContractCompiler,
+        ProtocolExecutionConstraints,
+        ProtocolFSMContractCompiler,
+        ProtocolHandlerBehaviorDescriptor,
+        ProtocolHandlerContract,
+        ProtocolWorkflowContractCompiler,
+    )
+
+    # Core protocols (16 protocols) - Fundamental system contracts
+    # Includes serialization, logging, health monitoring, and service discovery
+    from omnibase_spi.protocols.core import (
+        ProtocolAuditLogger,
+        ProtocolCanonicalSerializer,
+        ProtocolDistributedTracing,
+        ProtocolErrorHandler,
+        ProtocolErrorSanitizer,
+        ProtocolErrorSanitizerFactory,
+        ProtocolHealthDetails,
+        ProtocolHealthMonitor,
+        ProtocolLogger,
+        ProtocolMetricsCollector,
+        ProtocolPerformanceMetricsCollector,
+        ProtocolRetryable,
+        ProtocolServiceDiscovery,
+        ProtocolTimeBasedOperations,
+        ProtocolUriParser,
+        ProtocolVersionManager,
+    )
+
+    # Dashboard protocols (6 protocols) - Dashboard UI and widget rendering
+    from omnibase_spi.protocols.dashboard import (
+        ProtocolDashboardEventSubscriber,
+        ProtocolDashboardService,
+        ProtocolRegistryQueryService,
+        ProtocolRenderer,
+        ProtocolRendererCapabilityNegotiator,
+        ProtocolWidgetRenderer,
+    )
+
+    # Discovery protocols (4 protocols) - Node and handler discovery
+    # Enables dynamic service discovery and handler registration
+    from omnibase_spi.protocols.discovery import (
+        ProtocolBaseHandler,
+        ProtocolFileHandlerRegistry,
+        ProtocolHandlerDiscovery,
+        ProtocolHandlerInfo,
+    )
+
+    # Effects protocols (2 protocols) - Effect execution for kernel
+    # ProtocolEffect: synchronous effect boundary (ordering guarantee)
+    # ProtocolPrimitiveEffectExecutor: async primitive effects (kernel dispatch)
+    from omnibase_spi.protocols.effects import (
+        LiteralEffectCategory,
+        LiteralEffectId,
+        ProtocolEffect,
+        ProtocolPrimitiveEffectExecutor,
+    )
+
+    # Event bus protocols - Distributed messaging infrastructure
+    # Supports multiple backends (Kafka, Redis, in-memory) with async/sync patterns
+    # Note: Interface protocols (ProtocolEventBus, ProtocolEventBusHeaders,
+    #       ProtocolKafkaEventBusAdapter) are in omnibase_core
+    from omnibase_spi.protocols.event_bus import (
+        ProtocolAsyncEventBus,
+        ProtocolDLQHandler,
+        ProtocolEventBusBase,
+        ProtocolEventBusBatchProducer,
+        ProtocolEventBusClient,
+        ProtocolEventBusClientProvider,
+        ProtocolEventBusConsumer,
+        ProtocolEventBusContextManager,
+        ProtocolEventBusExtendedClient,
+        ProtocolEventBusLogEmitter,
+        ProtocolEventBusMessage,
+        ProtocolEventBusProducerHandler,
+        ProtocolEventBusProvider,  # Factory protocol (SPI)
+        ProtocolEventBusRegistry,
+        ProtocolEventBusService,
+        ProtocolEventBusTransactionalProducer,
+        ProtocolEventEnvelope,
+        ProtocolEventMessage,
+        ProtocolEventPublisher,
+        ProtocolHttpEventBusAdapter,
+        ProtocolKafkaAdapter,
+        ProtocolRedpandaAdapter,
+        ProtocolSchemaRegistry,
+        ProtocolSyncEventBus,
+    )
+
+    # v0.3.0 Factory protocols (1 protocol) - Handler contract factories
+    from omnibase_spi.protocols.factories import ProtocolHandlerContractFactory
+
+    # File handling protocols (5 protocols) - File processing, ONEX metadata, rate limiting
+    # Handles file type detection, processing, metadata stamping, and rate limiting
+    from omnibase_spi.protocols.file_handling import (
+        ProtocolFileProcessingTypeHandler,
+        ProtocolFileReader,
+        ProtocolRateLimiter,
+        ProtocolStampOptions,
+        ProtocolValidationOptions,
+    )
+
+    # v0.3.0 Handler protocols (2 protocols) - DI-based protocol handlers and sources
+    from omnibase_spi.protocols.handlers import ProtocolHandler, ProtocolHandlerSource
+
+    # Intelligence protocols (4 protocols) - Intent classification, pattern extraction, context enrichment, and analysis
+    from omnibase_spi.protocols.intelligence import (
+        ProtocolContextEnrichment,
+        ProtocolIntentClassifier,
+        ProtocolIntentGraph,
+        ProtocolPatternExtractor,
+    )
+
+    # LLM protocols (3 protocols) - Large Language Model integration
+    # LLM provider interfaces, model routing, and semantic processing
+    from omnibase_spi.protocols.llm import (
+        ProtocolLLMProvider,
+        ProtocolLLMToolProvider,
+        ProtocolModelRouter,
+    )
+
+    # MCP protocols (15 protocols) - Model Context Protocol integration
+    # Multi-subsystem tool registration, execution, and health monitoring
+    from omnibase_spi.protocols.mcp import (  # Phase 3 additions
+        ProtocolMCPDiscovery,
+        ProtocolMCPHealthMonitor,
+        ProtocolMCPMonitor,
+        ProtocolMCPRegistry,
+        ProtocolMCPRegistryAdmin,
+        ProtocolMCPRegistryMetricsOperations,
+        ProtocolMCPServiceDiscovery,
+        ProtocolMCPSubsystemClient,
+        ProtocolMCPSubsystemConfig,
+        ProtocolMCPToolExecutor,
+        ProtocolMCPToolProxy,
+        ProtocolMCPToolRouter,
+        ProtocolMCPToolValidator,
+        ProtocolMCPValidator,
+        ProtocolToolDiscoveryService,
+    )
+
+    # Memory protocols (7 protocols) - Memory operations and workflow management
+    # Key-value store, workflow management, and composable memory operations
+    from omnibase_spi.protocols.memory import (
+        ProtocolAgentCoordinator,
+        ProtocolClusterCoordinator,
+        ProtocolKeyValueStore,
+        ProtocolLifecycleManager,
+        ProtocolMemoryOrchestrator,
+        ProtocolMemoryRecord,
+        ProtocolWorkflowManager,
+    )
+
+    # Networking protocols (4 protocols) - HTTP, circuit breaker, and communication protocols
+    from omnibase_spi.protocols.networking import (
+        ProtocolCircuitBreaker,
+        ProtocolCommunicationBridge,
+        ProtocolHttpClient,
+        ProtocolHttpExtendedClient,
+    )
+
+    # Node protocols (4 protocols) - Node management, configuration, and registry
+    from omnibase_spi.protocols.node import (
+        ProtocolNodeConfiguration,
+        ProtocolNodeRegistry,
+        ProtocolNodeRunner,
+        ProtocolUtilsNodeConfiguration,
+    )
+
+    # v0.3.0 Node protocols (5 protocols) - Standard node interfaces with unified execute()
+    from omnibase_spi.protocols.nodes import (
+        ProtocolComputeNode,
+        ProtocolEffectNode,
+        ProtocolNode,
+        ProtocolOrchestratorNode,
+        ProtocolReducerNode,
+    )
+
+    # Observability protocols (3 protocols) - Hot path metrics and logging sinks
+    from omnibase_spi.protocols.observability import (
+        ProtocolHotPathLoggingSink,
+        ProtocolHotPathMetricsSink,
+        ProtocolObservabilitySinkFactory,
+    )
+
+    # ONEX protocols (15 protocols) - ONEX platform specific protocols
+    # Note: Node protocols (ProtocolComputeNode, ProtocolEffectNode, ProtocolNode,
+    # ProtocolOrchestratorNode, ProtocolReducerNode) are imported from protocols.nodes
+    from omnibase_spi.protocols.onex import (
+        ProtocolContractData,
+        ProtocolEnvelope,
+        ProtocolOnexMetadata,
+        ProtocolOnexSecurityContext,
+        ProtocolOnexValidationReport,
+        ProtocolReply,
+        ProtocolSchema,
+        ProtocolValidation,
+        ProtocolVersionLoader,
+    )
+
+    # PrimitiveEffectExecutor SPI - typed kernel-level HTTP and Kafka dispatch (internal issue)
+    # Zero upstream deps; contracts expressed via typing.Protocol structural subtyping.
+    from omnibase_spi.protocols.primitive_effect_executor import (
+        ProtocolHttpRequestContract,
+        ProtocolHttpResponseContract,
+        ProtocolPrimitiveEffectExecutorV2,
+    )
+
+    # Projections protocols (7 protocols) - Projection persistence and state reading
+    # Projector writes projections with ordering; Reader queries materialized state
+    from omnibase_spi.protocols.projections import (
+        ProtocolBatchPersistResult,
+        ProtocolPersistResult,
+        ProtocolProjectionDatabase,
+        ProtocolProjectionDatabaseSync,
+        ProtocolProjectionReader,
+        ProtocolProjector,
+        ProtocolSequenceInfo,
+    )
+
+    # Projectors protocols (2 protocols) - Event-to-state projection and loader
+    # Note: ProtocolEventProjector here handles event-to-state projection
+    # projections.ProtocolProjector handles projection persistence with ordering
+    from omnibase_spi.protocols.projectors import (
+        ProtocolEventProjector,
+        ProtocolProjectorLoader,
+    )
+
+    # v0.3.0 Execution constraint protocol - Mixin for constrainable objects
+    from omnibase_spi.protocols.protocol_execution_constrainable import (
+        ProtocolExecutionConstrainable,
+    )
+
+    # v0.3.0 Registry protocols (3 protocols) - Handler, provider, and capability registration
+    from omnibase_spi.protocols.registry import (
+        ProtocolCapabilityRegistry,
+        ProtocolHandlerRegistry,
+        ProtocolProviderRegistry,
+    )
+
+    # Runtime protocols - Domain plugin lifecycle management + handler resolver
+    # ModelDomainPluginConfig and ModelDomainPluginResult live in omnibase_core.models.runtime.
+    from omnibase_spi.protocols.runtime.protocol_domain_plugin import (
+        ProtocolDomainPlugin,
+    )
+    from omnibase_spi.protocols.runtime.protocol_handleable import ProtocolHandleable
+    from omnibase_spi.protocols.runtime.protocol_handler_ownership_query import (
+        ProtocolHandlerOwnershipQuery,
+    )
+    from omnibase_spi.protocols.runtime.protocol_handler_resolver import (
+        ProtocolHandlerResolver,
+    )
+
+    # Schema protocols (2 protocols) - Schema loading and validation
+    from omnibase_spi.protocols.schema import (
+        ProtocolSchemaLoader,
+        ProtocolTrustedSchemaLoader,
+    )
+
+    # Security protocols (2 protocols) - Security event and detection interfaces
+    # Breaking circular import dependencies for security models
+    from omnibase_spi.protocols.security import (
+        ProtocolDetectionMatch,
+        ProtocolSecurityEvent,
+    )
+
+    # Semantic protocols (2 protocols) - Semantic processing and retrieval
+    # Advanced text preprocessing and hybrid semantic retrieval systems
+    from omnibase_spi.protocols.semantic import (
+        ProtocolAdvancedPreprocessor,
+        ProtocolHybridRetriever,
+    )
+
+    # Service lifecycle protocols (3 protocols) - External service integrations
+    # Ticket tracking, secret management, and code hosting platform abstractions
+    from omnibase_spi.protocols.services import (
+        ProtocolCodeHost,
+        ProtocolSecretStore,
+        ProtocolTicketService,
+    )
+
+    # Storage protocols (6 protocols) - Data storage and persistence
+    from omnibase_spi.protocols.storage import (
+        ProtocolDatabaseConnection,
+        ProtocolGraphDatabaseHandler,
+        ProtocolIdempotencyStore,
+        ProtocolStorageBackend,
+        ProtocolStorageBackendFactory,
+        ProtocolVectorStoreHandler,
+    )
+
+    # Validation protocols (5 protocols) - Input validation and error handling
+    # Provides structured validation with error reporting and compliance checking
+    from omnibase_spi.protocols.validation import (
+        ProtocolConstraintValidator,
+        ProtocolValidationDecorator,
+        ProtocolValidationError,
+        ProtocolValidationResult,
+        ProtocolValidator,
+    )
+
+    # Verification protocols (1 protocol) - Package integrity and signature verification
+    from omnibase_spi.protocols.verification import (
+        LiteralHashAlgorithm,
+        ProtocolPackageVerifier,
+    )
+
+    # Workflow orchestration protocols (15 protocols) - Event-driven FSM coordination
+    # Event sourcing, workflow state management, distributed task scheduling, and surface adapters
+    from omnibase_spi.protocols.workflow_orchestration import (
+        LiteralAssignmentStrategy,
+        LiteralWorkQueuePriority,
+        ProtocolEventQueryOptions,
+        ProtocolEventStore,
+        ProtocolEventStoreResult,
+        ProtocolEventStoreTransaction,
+        ProtocolFSMSurfaceAdapter,
+        ProtocolLiteralWorkflowStateProjection,
+        ProtocolLiteralWorkflowStateStore,
+        ProtocolNodeSchedulingResult,
+        ProtocolSnapshotStore,
+        ProtocolTaskSchedulingCriteria,
+        ProtocolWorkflowEventBus,
+        ProtocolWorkflowEventHandler,
+        ProtocolWorkflowEventMessage,
+        ProtocolWorkflowNodeCapability,
+        ProtocolWorkflowNodeInfo,
+        ProtocolWorkflowNodeRegistry,
+        ProtocolWorkQueue,
+    )
 
 # Test protocols (2 protocols) - Testing frameworks and testable components
 # NOTE: Commented out for production builds as test module is excluded from package
@@ -723,3 +741,81 @@ __all__ = [
     "ProtocolWorkflowNodeRegistry",
     "ServiceHealthStatus",
 ]
+
+# Cache for resolved symbols to avoid repeated import lookups
+_symbol_cache: dict[str, Any] = {}
+
+
+def _clear_symbol_cache() -> None:
+    """Clear the resolved symbol cache for testing or memory management."""
+    _symbol_cache.clear()
+
+
+def _load_symbol(symbol_name: str) -> Any:
+    """
+    Lazy load an exported symbol on first access.
+
+    Args:
+        symbol_name: Name of the exported symbol (e.g., 'ProtocolLogger')
+
+    Returns:
+        The protocol, Literal alias, or type bound to ``symbol_name``
+
+    Raises:
+        ImportError: If the defining module cannot be imported or no longer
+            binds the symbol (the generated index is stale)
+    """
+    if symbol_name in _symbol_cache:
+        return _symbol_cache[symbol_name]
+
+    module_path = _LAZY_SYMBOL_MAP[symbol_name]
+
+    try:
+        module = importlib.import_module(module_path)
+        symbol = getattr(module, symbol_name)
+    except (ImportError, AttributeError) as e:
+        raise ImportError(f"Failed to load protocol symbol {symbol_name}: {e}") from e
+
+    _symbol_cache[symbol_name] = symbol
+    return symbol
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Module-level __getattr__ for lazy loading exported symbols.
+
+    Resolves names from the generated symbol index first. Unindexed public
+    names fall back to the protocol subpackage of the same name so that
+    ``omnibase_spi.protocols.core`` style attribute access keeps working
+    without the barrel eagerly importing every domain.
+
+    Args:
+        name: Name of the attribute being accessed
+
+    Returns:
+        The lazy-loaded symbol or subpackage
+
+    Raises:
+        AttributeError: If ``name`` is neither an export nor a subpackage
+    """
+    if name in _LAZY_SYMBOL_MAP:
+        return _load_symbol(name)
+
+    if not name.startswith("_"):
+        submodule = f"{__name__}.{name}"
+        try:
+            return importlib.import_module(submodule)
+        except ModuleNotFoundError as e:
+            if e.name != submodule:
+                raise
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    """
+    Module-level __dir__ to support introspection and IDE completion.
+
+    Returns all module attributes including not-yet-loaded exports.
+    """
+    return sorted(set(globals()) | set(__all__))
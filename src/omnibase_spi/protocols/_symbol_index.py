@@ -0,0 +1,472 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+# AUTO-GENERATED by scripts/generate_protocol_symbol_index.py -- DO NOT EDIT.
+# Regenerate with: uv run python scripts/generate_protocol_symbol_index.py
+
+"""Symbol index for the lazy ``omnibase_spi.protocols`` barrel.
+
+Maps every symbol exported by ``omnibase_spi.protocols`` to the module that
+``__getattr__`` imports on first access.
+"""
+
+_LAZY_SYMBOL_MAP: dict[str, str] = {
+    "InjectionScope": "omnibase_spi.protocols.container",
+    "LiteralAssignmentStrategy": "omnibase_spi.protocols.workflow_orchestration",
+    "LiteralContainerArtifactType": "omnibase_spi.protocols.container",
+    "LiteralEffectCategory": "omnibase_spi.protocols.effects",
+    "LiteralEffectId": "omnibase_spi.protocols.effects",
+    "LiteralHashAlgorithm": "omnibase_spi.protocols.verification",
+    "LiteralInjectionScope": "omnibase_spi.protocols.container",
+    "LiteralOnexStatus": "omnibase_spi.protocols.container",
+    "LiteralServiceLifecycle": "omnibase_spi.protocols.container",
+    "LiteralServiceResolutionStatus": "omnibase_spi.protocols.container",
+    "LiteralWorkQueuePriority": "omnibase_spi.protocols.workflow_orchestration",
+    "ProtocolAdvancedPreprocessor": (
+        "omnibase_spi.protocols.semantic.protocol_advanced_preprocessor"
+    ),
+    "ProtocolAgentCoordinator": (
+        "omnibase_spi.protocols.memory.protocol_memory_composable"
+    ),
+    "ProtocolAnalyticsDataProvider": (
+        "omnibase_spi.protocols.analytics.protocol_analytics_provider"
+    ),
+    "ProtocolArtifactContainer": (
+        "omnibase_spi.protocols.container.protocol_artifact_container"
+    ),
+    "ProtocolArtifactContainerStatus": (
+        "omnibase_spi.protocols.container.protocol_artifact_container"
+    ),
+    "ProtocolArtifactInfo": (
+        "omnibase_spi.protocols.container.protocol_artifact_container"
+    ),
+    "ProtocolArtifactMetadata": (
+        "omnibase_spi.protocols.container.protocol_artifact_container"
+    ),
+    "ProtocolAsyncEventBus": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_mixin"
+    ),
+    "ProtocolAuditLogger": "omnibase_spi.protocols.core.protocol_observability",
+    "ProtocolBaseHandler": "omnibase_spi.protocols.discovery.protocol_base_handler",
+    "ProtocolBatchPersistResult": (
+        "omnibase_spi.protocols.projections.protocol_projector"
+    ),
+    "ProtocolCLI": "omnibase_spi.protocols.cli.protocol_cli",
+    "ProtocolCLIDirFixtureCase": (
+        "omnibase_spi.protocols.cli.protocol_cli_dir_fixture_case"
+    ),
+    "ProtocolCLIDirFixtureRegistry": (
+        "omnibase_spi.protocols.cli.protocol_cli_dir_fixture_registry"
+    ),
+    "ProtocolCLIResult": "omnibase_spi.protocols.cli.protocol_cli",
+    "ProtocolCLIToolDiscovery": (
+        "omnibase_spi.protocols.cli.protocol_cli_tool_discovery"
+    ),
+    "ProtocolCanonicalSerializer": (
+        "omnibase_spi.protocols.core.protocol_canonical_serializer"
+    ),
+    "ProtocolCapabilityDependency": (
+        "omnibase_spi.protocols.contracts.protocol_handler_contract_types"
+    ),
+    "ProtocolCapabilityRegistry": (
+        "omnibase_spi.protocols.registry.protocol_capability_registry"
+    ),
+    "ProtocolCircuitBreaker": (
+        "omnibase_spi.protocols.networking.protocol_circuit_breaker"
+    ),
+    "ProtocolCliWorkflow": "omnibase_spi.protocols.cli.protocol_cli_workflow",
+    "ProtocolClusterCoordinator": (
+        "omnibase_spi.protocols.memory.protocol_memory_composable"
+    ),
+    "ProtocolCodeHost": "omnibase_spi.protocols.services.protocol_code_host",
+    "ProtocolCommunicationBridge": (
+        "omnibase_spi.protocols.networking.protocol_communication_bridge"
+    ),
+    "ProtocolComputeNode": "omnibase_spi.protocols.nodes.compute",
+    "ProtocolConstraintValidator": (
+        "omnibase_spi.protocols.validation.protocol_constraint_validator"
+    ),
+    "ProtocolContainer": "omnibase_spi.protocols.container.protocol_container",
+    "ProtocolContainerService": (
+        "omnibase_spi.protocols.container.protocol_container_service"
+    ),
+    "ProtocolContextEnrichment": (
+        "omnibase_spi.protocols.intelligence.protocol_context_enrichment"
+    ),
+    "ProtocolContractData": "omnibase_spi.protocols.onex.protocol_validation",
+    "ProtocolDIServiceInstance": "omnibase_spi.protocols.container",
+    "ProtocolDIServiceMetadata": "omnibase_spi.protocols.container",
+    "ProtocolDLQHandler": "omnibase_spi.protocols.event_bus.protocol_dlq_handler",
+    "ProtocolDashboardEventSubscriber": (
+        "omnibase_spi.protocols.dashboard.protocol_dashboard_event_subscriber"
+    ),
+    "ProtocolDashboardService": (
+        "omnibase_spi.protocols.dashboard.protocol_dashboard_service"
+    ),
+    "ProtocolDatabaseConnection": (
+        "omnibase_spi.protocols.storage.protocol_database_connection"
+    ),
+    "ProtocolDependencyGraph": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolDetectionMatch": (
+        "omnibase_spi.protocols.security.protocol_detection_match"
+    ),
+    "ProtocolDistributedTracing": "omnibase_spi.protocols.core.protocol_observability",
+    "ProtocolDomainPlugin": "omnibase_spi.protocols.runtime.protocol_domain_plugin",
+    "ProtocolEffect": "omnibase_spi.protocols.effects.protocol_effect",
+    "ProtocolEffectContractCompiler": (
+        "omnibase_spi.protocols.contracts.effect_compiler"
+    ),
+    "ProtocolEffectNode": "omnibase_spi.protocols.nodes.effect",
+    "ProtocolEnvelope": "omnibase_spi.protocols.onex.protocol_envelope",
+    "ProtocolErrorHandler": "omnibase_spi.protocols.core.protocol_error_handler",
+    "ProtocolErrorSanitizer": "omnibase_spi.protocols.core.protocol_error_sanitizer",
+    "ProtocolErrorSanitizerFactory": (
+        "omnibase_spi.protocols.core.protocol_error_sanitizer"
+    ),
+    "ProtocolEventBusBase": "omnibase_spi.protocols.event_bus.protocol_event_bus_mixin",
+    "ProtocolEventBusBatchProducer": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_extended"
+    ),
+    "ProtocolEventBusClient": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_client"
+    ),
+    "ProtocolEventBusClientProvider": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_client"
+    ),
+    "ProtocolEventBusConsumer": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_extended"
+    ),
+    "ProtocolEventBusContextManager": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_context_manager"
+    ),
+    "ProtocolEventBusExtendedClient": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_extended"
+    ),
+    "ProtocolEventBusLogEmitter": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_mixin"
+    ),
+    "ProtocolEventBusMessage": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_extended"
+    ),
+    "ProtocolEventBusProducerHandler": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_producer_handler"
+    ),
+    "ProtocolEventBusProvider": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_provider"
+    ),
+    "ProtocolEventBusRegistry": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_mixin"
+    ),
+    "ProtocolEventBusService": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_service"
+    ),
+    "ProtocolEventBusTransactionalProducer": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_extended"
+    ),
+    "ProtocolEventEnvelope": "omnibase_spi.protocols.event_bus.protocol_event_envelope",
+    "ProtocolEventMessage": "omnibase_spi.protocols.event_bus",
+    "ProtocolEventProjector": (
+        "omnibase_spi.protocols.projectors.protocol_event_projector"
+    ),
+    "ProtocolEventPublisher": (
+        "omnibase_spi.protocols.event_bus.protocol_event_publisher"
+    ),
+    "ProtocolEventQueryOptions": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence"
+    ),
+    "ProtocolEventStore": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence"
+    ),
+    "ProtocolEventStoreResult": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence"
+    ),
+    "ProtocolEventStoreTransaction": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence"
+    ),
+    "ProtocolExecutionConstrainable": (
+        "omnibase_spi.protocols.protocol_execution_constrainable"
+    ),
+    "ProtocolExecutionConstraints": (
+        "omnibase_spi.protocols.contracts.protocol_handler_contract_types"
+    ),
+    "ProtocolFSMContractCompiler": "omnibase_spi.protocols.contracts.fsm_compiler",
+    "ProtocolFSMSurfaceAdapter": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_fsm_surface_adapter"
+    ),
+    "ProtocolFileHandlerRegistry": (
+        "omnibase_spi.protocols.discovery.protocol_handler_discovery"
+    ),
+    "ProtocolFileProcessingTypeHandler": (
+        "omnibase_spi.protocols.file_handling.protocol_file_type_handler"
+    ),
+    "ProtocolFileReader": "omnibase_spi.protocols.file_handling.protocol_file_reader",
+    "ProtocolGraphDatabaseHandler": (
+        "omnibase_spi.protocols.storage.protocol_graph_database_handler"
+    ),
+    "ProtocolHandleable": "omnibase_spi.protocols.runtime.protocol_handleable",
+    "ProtocolHandler": "omnibase_spi.protocols.handlers.protocol_handler",
+    "ProtocolHandlerBehaviorDescriptor": (
+        "omnibase_spi.protocols.contracts.protocol_handler_contract_types"
+    ),
+    "ProtocolHandlerContract": (
+        "omnibase_spi.protocols.contracts.protocol_handler_contract"
+    ),
+    "ProtocolHandlerContractFactory": (
+        "omnibase_spi.protocols.factories.protocol_handler_contract_factory"
+    ),
+    "ProtocolHandlerDiscovery": (
+        "omnibase_spi.protocols.discovery.protocol_handler_discovery"
+    ),
+    "ProtocolHandlerInfo": (
+        "omnibase_spi.protocols.discovery.protocol_handler_discovery"
+    ),
+    "ProtocolHandlerOwnershipQuery": (
+        "omnibase_spi.protocols.runtime.protocol_handler_ownership_query"
+    ),
+    "ProtocolHandlerRegistry": "omnibase_spi.protocols.registry.handler_registry",
+    "ProtocolHandlerResolver": (
+        "omnibase_spi.protocols.runtime.protocol_handler_resolver"
+    ),
+    "ProtocolHandlerSource": "omnibase_spi.protocols.handlers.protocol_handler_source",
+    "ProtocolHealthDetails": "omnibase_spi.protocols.core.protocol_health_details",
+    "ProtocolHealthMonitor": "omnibase_spi.protocols.core.protocol_health_monitor",
+    "ProtocolHotPathLoggingSink": (
+        "omnibase_spi.protocols.observability.protocol_hot_path_logging_sink"
+    ),
+    "ProtocolHotPathMetricsSink": (
+        "omnibase_spi.protocols.observability.protocol_hot_path_metrics_sink"
+    ),
+    "ProtocolHttpClient": "omnibase_spi.protocols.networking.protocol_http_client",
+    "ProtocolHttpEventBusAdapter": (
+        "omnibase_spi.protocols.event_bus.protocol_event_bus_service"
+    ),
+    "ProtocolHttpExtendedClient": (
+        "omnibase_spi.protocols.networking.protocol_http_extended"
+    ),
+    "ProtocolHttpRequestContract": "omnibase_spi.protocols.primitive_effect_executor",
+    "ProtocolHttpResponseContract": "omnibase_spi.protocols.primitive_effect_executor",
+    "ProtocolHybridRetriever": (
+        "omnibase_spi.protocols.semantic.protocol_hybrid_retriever"
+    ),
+    "ProtocolIdempotencyStore": (
+        "omnibase_spi.protocols.storage.protocol_idempotency_store"
+    ),
+    "ProtocolInjectionContext": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolIntentClassifier": (
+        "omnibase_spi.protocols.intelligence.protocol_intent_classifier"
+    ),
+    "ProtocolIntentGraph": "omnibase_spi.protocols.intelligence.protocol_intent_graph",
+    "ProtocolKafkaAdapter": "omnibase_spi.protocols.event_bus.protocol_kafka_adapter",
+    "ProtocolKeyValueStore": "omnibase_spi.protocols.memory.protocol_memory_base",
+    "ProtocolLLMProvider": "omnibase_spi.protocols.llm.protocol_llm_provider",
+    "ProtocolLLMToolProvider": "omnibase_spi.protocols.llm.protocol_llm_tool_provider",
+    "ProtocolLifecycleManager": (
+        "omnibase_spi.protocols.memory.protocol_memory_composable"
+    ),
+    "ProtocolLiteralWorkflowStateProjection": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_event_bus"
+    ),
+    "ProtocolLiteralWorkflowStateStore": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence"
+    ),
+    "ProtocolLogger": "omnibase_spi.protocols.core.protocol_logger",
+    "ProtocolMCPDiscovery": "omnibase_spi.protocols.mcp.protocol_mcp_discovery",
+    "ProtocolMCPHealthMonitor": "omnibase_spi.protocols.mcp.protocol_mcp_monitor",
+    "ProtocolMCPMonitor": "omnibase_spi.protocols.mcp.protocol_mcp_monitor",
+    "ProtocolMCPRegistry": "omnibase_spi.protocols.mcp.protocol_mcp_registry",
+    "ProtocolMCPRegistryAdmin": "omnibase_spi.protocols.mcp.protocol_mcp_registry",
+    "ProtocolMCPRegistryMetricsOperations": (
+        "omnibase_spi.protocols.mcp.protocol_mcp_registry"
+    ),
+    "ProtocolMCPServiceDiscovery": "omnibase_spi.protocols.mcp.protocol_mcp_discovery",
+    "ProtocolMCPSubsystemClient": (
+        "omnibase_spi.protocols.mcp.protocol_mcp_subsystem_client"
+    ),
+    "ProtocolMCPSubsystemConfig": (
+        "omnibase_spi.protocols.mcp.protocol_mcp_subsystem_client"
+    ),
+    "ProtocolMCPToolExecutor": "omnibase_spi.protocols.mcp.protocol_mcp_tool_proxy",
+    "ProtocolMCPToolProxy": "omnibase_spi.protocols.mcp.protocol_mcp_tool_proxy",
+    "ProtocolMCPToolRouter": "omnibase_spi.protocols.mcp.protocol_mcp_tool_proxy",
+    "ProtocolMCPToolValidator": "omnibase_spi.protocols.mcp.protocol_mcp_validator",
+    "ProtocolMCPValidator": "omnibase_spi.protocols.mcp.protocol_mcp_validator",
+    "ProtocolMemoryOrchestrator": (
+        "omnibase_spi.protocols.memory.protocol_memory_composable"
+    ),
+    "ProtocolMemoryRecord": "omnibase_spi.protocols.memory.protocol_memory_base",
+    "ProtocolMetricsCollector": "omnibase_spi.protocols.core.protocol_observability",
+    "ProtocolModelRouter": "omnibase_spi.protocols.llm.protocol_llm_tool_provider",
+    "ProtocolNode": "omnibase_spi.protocols.nodes.base",
+    "ProtocolNodeCliAdapter": "omnibase_spi.protocols.cli.protocol_node_cli_adapter",
+    "ProtocolNodeConfiguration": (
+        "omnibase_spi.protocols.node.protocol_node_configuration"
+    ),
+    "ProtocolNodeRegistry": "omnibase_spi.protocols.node.protocol_node_registry",
+    "ProtocolNodeRunner": "omnibase_spi.protocols.node.protocol_node_runner",
+    "ProtocolNodeSchedulingResult": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry"
+    ),
+    "ProtocolObservabilitySinkFactory": (
+        "omnibase_spi.protocols.observability.protocol_observability_sink_factory"
+    ),
+    "ProtocolOnexMetadata": "omnibase_spi.protocols.onex.protocol_validation",
+    "ProtocolOnexSecurityContext": "omnibase_spi.protocols.onex.protocol_validation",
+    "ProtocolOnexValidationReport": "omnibase_spi.protocols.onex.protocol_validation",
+    "ProtocolOrchestratorNode": "omnibase_spi.protocols.nodes.orchestrator",
+    "ProtocolPackageVerifier": (
+        "omnibase_spi.protocols.verification.protocol_package_verifier"
+    ),
+    "ProtocolPatternExtractor": (
+        "omnibase_spi.protocols.intelligence.protocol_pattern_extractor"
+    ),
+    "ProtocolPerformanceMetricsCollector": (
+        "omnibase_spi.protocols.core.protocol_performance_metrics"
+    ),
+    "ProtocolPersistResult": "omnibase_spi.protocols.projections.protocol_projector",
+    "ProtocolPrimitiveEffectExecutor": (
+        "omnibase_spi.protocols.effects.protocol_primitive_effect_executor"
+    ),
+    "ProtocolPrimitiveEffectExecutorV2": (
+        "omnibase_spi.protocols.primitive_effect_executor"
+    ),
+    "ProtocolProjectionDatabase": (
+        "omnibase_spi.protocols.projections.protocol_projection_database"
+    ),
+    "ProtocolProjectionDatabaseSync": (
+        "omnibase_spi.protocols.projections.protocol_projection_database_sync"
+    ),
+    "ProtocolProjectionReader": (
+        "omnibase_spi.protocols.projections.protocol_projection_reader"
+    ),
+    "ProtocolProjector": "omnibase_spi.protocols.projections.protocol_projector",
+    "ProtocolProjectorLoader": (
+        "omnibase_spi.protocols.projectors.protocol_projector_loader"
+    ),
+    "ProtocolProviderRegistry": (
+        "omnibase_spi.protocols.registry.protocol_provider_registry"
+    ),
+    "ProtocolRateLimiter": (
+        "omnibase_spi.protocols.file_handling.protocol_file_processing"
+    ),
+    "ProtocolRedpandaAdapter": (
+        "omnibase_spi.protocols.event_bus.protocol_redpanda_adapter"
+    ),
+    "ProtocolReducerNode": "omnibase_spi.protocols.nodes.reducer",
+    "ProtocolRegistryQueryService": (
+        "omnibase_spi.protocols.dashboard.protocol_registry_query_service"
+    ),
+    "ProtocolRenderer": "omnibase_spi.protocols.dashboard.protocol_renderer",
+    "ProtocolRendererCapabilityNegotiator": (
+        "omnibase_spi.protocols.dashboard.protocol_renderer_capability_negotiator"
+    ),
+    "ProtocolReply": "omnibase_spi.protocols.onex.protocol_reply",
+    "ProtocolRetryable": "omnibase_spi.protocols.core.protocol_retryable",
+    "ProtocolSchema": "omnibase_spi.protocols.onex.protocol_validation",
+    "ProtocolSchemaLoader": "omnibase_spi.protocols.schema.protocol_schema_loader",
+    "ProtocolSchemaRegistry": (
+        "omnibase_spi.protocols.event_bus.protocol_schema_registry"
+    ),
+    "ProtocolSecretStore": "omnibase_spi.protocols.services.protocol_secret_store",
+    "ProtocolSecurityEvent": "omnibase_spi.protocols.security.protocol_security_event",
+    "ProtocolSequenceInfo": "omnibase_spi.protocols.projections.protocol_projector",
+    "ProtocolServiceDependency": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolServiceDiscovery": (
+        "omnibase_spi.protocols.core.protocol_service_discovery"
+    ),
+    "ProtocolServiceFactory": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolServiceRegistration": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolServiceRegistry": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolServiceRegistryConfig": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolServiceRegistryStatus": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolServiceValidator": (
+        "omnibase_spi.protocols.container.protocol_service_registry"
+    ),
+    "ProtocolSnapshotStore": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence"
+    ),
+    "ProtocolStampOptions": (
+        "omnibase_spi.protocols.file_handling.protocol_file_type_handler"
+    ),
+    "ProtocolStorageBackend": "omnibase_spi.protocols.storage.protocol_storage_backend",
+    "ProtocolStorageBackendFactory": (
+        "omnibase_spi.protocols.storage.protocol_storage_backend"
+    ),
+    "ProtocolSyncEventBus": "omnibase_spi.protocols.event_bus.protocol_event_bus_mixin",
+    "ProtocolTaskSchedulingCriteria": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry"
+    ),
+    "ProtocolTicketService": "omnibase_spi.protocols.services.protocol_ticket_service",
+    "ProtocolTimeBasedOperations": "omnibase_spi.protocols.core.protocol_time_based",
+    "ProtocolToolDiscoveryService": (
+        "omnibase_spi.protocols.mcp.protocol_tool_discovery_service"
+    ),
+    "ProtocolTrustedSchemaLoader": (
+        "omnibase_spi.protocols.schema.protocol_trusted_schema_loader"
+    ),
+    "ProtocolUriParser": "omnibase_spi.protocols.core.protocol_uri_parser",
+    "ProtocolUtilsNodeConfiguration": (
+        "omnibase_spi.protocols.node.protocol_node_configuration_utils"
+    ),
+    "ProtocolValidation": "omnibase_spi.protocols.onex.protocol_validation",
+    "ProtocolValidationDecorator": (
+        "omnibase_spi.protocols.validation.protocol_validation"
+    ),
+    "ProtocolValidationError": "omnibase_spi.protocols.validation.protocol_validation",
+    "ProtocolValidationOptions": (
+        "omnibase_spi.protocols.file_handling.protocol_file_type_handler"
+    ),
+    "ProtocolValidationResult": "omnibase_spi.protocols.validation.protocol_validation",
+    "ProtocolValidator": "omnibase_spi.protocols.validation.protocol_validation",
+    "ProtocolVectorStoreHandler": (
+        "omnibase_spi.protocols.storage.protocol_vector_store_handler"
+    ),
+    "ProtocolVersionLoader": "omnibase_spi.protocols.onex.protocol_version_loader",
+    "ProtocolVersionManager": "omnibase_spi.protocols.core.protocol_version_manager",
+    "ProtocolWidgetRenderer": (
+        "omnibase_spi.protocols.dashboard.protocol_widget_renderer"
+    ),
+    "ProtocolWorkQueue": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_work_queue"
+    ),
+    "ProtocolWorkflowContractCompiler": (
+        "omnibase_spi.protocols.contracts.workflow_compiler"
+    ),
+    "ProtocolWorkflowEventBus": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_event_bus"
+    ),
+    "ProtocolWorkflowEventHandler": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_event_bus"
+    ),
+    "ProtocolWorkflowEventMessage": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_event_bus"
+    ),
+    "ProtocolWorkflowManager": (
+        "omnibase_spi.protocols.memory.protocol_memory_composable"
+    ),
+    "ProtocolWorkflowNodeCapability": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry"
+    ),
+    "ProtocolWorkflowNodeInfo": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry"
+    ),
+    "ProtocolWorkflowNodeRegistry": (
+        "omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry"
+    ),
+    "ServiceHealthStatus": "omnibase_spi.protocols.container",
+}
@@ -0,0 +1,276 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Cached structural conformance checks for ``@runtime_checkable`` protocols.
+
+``isinstance(obj, SomeProtocol)`` re-resolves every protocol member with
+``inspect.getattr_static`` on each call that the ABC machinery cannot answer
+from its positive cache, which makes negative checks on a dispatcher hot path
+cost several microseconds per protocol. This module answers the same question
+from a per ``(concrete_type, protocol)`` verdict table:
+
+* Each protocol's required member set (and which members are callable) is
+  computed once from ``__protocol_attrs__``.
+* Classes the ABC machinery accepts (nominal subclasses, registered virtual
+  subclasses and classes whose own members already satisfy the protocol) are
+  cached as conforming permanently, exactly like ``isinstance`` does.
+* For every other class the table records which members the class cannot
+  provide, so a check only has to look those up in the instance ``__dict__``.
+  These entries record which protocol members each class in the MRO
+  defines, and are invalidated when that changes (a member is added,
+  deleted or moved to another class) or when any ABC registration happens.
+
+Verdicts match ``isinstance``. The one mutation the table does not notice is
+rebinding an existing class member in place to ``None`` (the set of defined
+members is unchanged); call ``invalidate`` after doing that.
+
+Example:
+    from omnibase_spi.protocols.conformance import check_many, conforms
+    from omnibase_spi.protocols.handlers import ProtocolHandler
+
+    if conforms(handler, ProtocolHandler):
+        ...
+
+    capabilities = check_many(handler, (ProtocolHandler, ProtocolHandleable))
+"""
+
+import weakref
+from abc import ABCMeta, get_cache_token
+from collections.abc import Callable, Iterable
+from typing import Protocol, cast
+
+# (members, callable members, names whose definition on a class decides the
+#  verdict: the members plus ``__class__``)
+_Shape = tuple[tuple[str, ...], frozenset[str], frozenset[str]]
+
+# (missing members, shadowable callable members, instances have __dict__,
+#  watched names defined by each class in the MRO, ABC cache token)
+_StructuralEntry = tuple[tuple[str, ...], frozenset[str], bool, list[set[str]], object]
+
+# protocol -> shape, or None for non-protocol classes
+_shapes: dict[type, _Shape | None] = {}
+
+# protocol -> {id(concrete type): verdict}. True means the type always
+# conforms, False means always defer to isinstance, and a structural entry
+# means only the listed members have to be looked up on the instance.
+_verdicts: dict[type, dict[int, bool | _StructuralEntry]] = {}
+
+# id(concrete type) -> weak reference evicting its verdicts when collected
+_class_refs: dict[int, weakref.ref[type]] = {}
+
+_MISSING = object()
+_object_getattribute = object.__getattribute__
+
+
+def _protocol_shape(protocol: type) -> _Shape | None:
+    """Return the cached member set of ``protocol``.
+
+    Raises:
+        TypeError: If ``protocol`` is a protocol that is not runtime checkable,
+            matching the error ``isinstance`` raises.
+    """
+    try:
+        return _shapes[protocol]
+    except KeyError:
+        pass
+
+    if cast("object", protocol) is Protocol or not getattr(
+        protocol, "_is_protocol", False
+    ):
+        shape = None
+    else:
+        if not getattr(protocol, "_is_runtime_protocol", False):
+            raise TypeError(
+                "Instance and class checks can only be used with"
+                " @runtime_checkable protocols"
+            )
+        members = tuple(sorted(protocol.__protocol_attrs__))  # type: ignore[attr-defined]
+        callables = frozenset(
+            name for name in members if callable(getattr(protocol, name, None))
+        )
+        shape = (members, callables, frozenset((*members, "__class__")))
+    _shapes[protocol] = shape
+    return shape
+
+
+def _evict(key: int) -> None:
+    """Drop every verdict recorded for the class whose ``id`` is ``key``."""
+    _class_refs.pop(key, None)
+    for table in _verdicts.values():
+        table.pop(key, None)
+
+
+def _evictor(key: int) -> Callable[[weakref.ref[type]], None]:
+    """Build the weak reference callback that evicts ``key`` on collection."""
+
+    def callback(_ref: weakref.ref[type]) -> None:
+        _evict(key)
+
+    return callback
+
+
+def _defined_on_class(cls: type, name: str, is_callable: bool) -> bool:
+    """Return True if ``cls`` provides ``name`` the way ``getattr_static`` sees it."""
+    for klass in cls.__mro__:
+        namespace = klass.__dict__
+        if name in namespace:
+            return not (is_callable and namespace[name] is None)
+    return False
+
+
+def _defined_names(cls: type, watched: frozenset[str]) -> list[set[str]]:
+    """Return which ``watched`` names each class in the MRO defines.
+
+    ``object`` is skipped: its namespace cannot be mutated.
+    """
+    return [klass.__dict__.keys() & watched for klass in cls.__mro__[:-1]]
+
+
+def _build_entry(
+    obj: object,
+    cls: type,
+    protocol: type,
+    shape: _Shape,
+) -> bool | _StructuralEntry:
+    """Compute the cached verdict for ``(cls, protocol)``."""
+    # Classes (whose own MRO is searched) and proxies that fake __class__
+    # are looked up differently by isinstance; always defer for them.
+    if isinstance(obj, type) or any(
+        "__class__" in klass.__dict__ for klass in cls.__mro__[:-1]
+    ):
+        return False
+
+    # ABC positives are cached by typing forever; mirror that.
+    if ABCMeta.__instancecheck__(cast("ABCMeta", protocol), obj):
+        return True
+
+    members, callables, watched = shape
+    missing = tuple(
+        name for name in members if not _defined_on_class(cls, name, name in callables)
+    )
+    return (
+        missing,
+        callables.difference(missing),
+        cls.__dictoffset__ != 0,
+        _defined_names(cls, watched),
+        get_cache_token(),
+    )
+
+
+def _check_structural(
+    obj: object,
+    protocol: type,
+    entry: _StructuralEntry,
+    callables: frozenset[str],
+) -> bool:
+    """Evaluate a structural entry against a single instance."""
+    missing, shadowable, has_dict, _, _ = entry
+    if not has_dict:
+        return not missing
+
+    try:
+        namespace = _object_getattribute(obj, "__dict__")
+    except AttributeError:
+        return not missing
+    if not namespace:
+        return not missing
+    # An instance attribute may shadow a method with None; let isinstance
+    # resolve that rare case.
+    if not shadowable.isdisjoint(namespace):
+        return isinstance(obj, protocol)
+    for name in missing:
+        value = namespace.get(name, _MISSING)
+        if value is _MISSING or (value is None and name in callables):
+            return False
+    return True
+
+
+def conforms(obj: object, protocol: type) -> bool:
+    """Return ``isinstance(obj, protocol)`` using the cached verdict table.
+
+    Args:
+        obj: The object to check.
+        protocol: A ``@runtime_checkable`` protocol. Any other class is
+            checked with plain ``isinstance``.
+
+    Returns:
+        True if ``obj`` conforms to ``protocol``.
+
+    Raises:
+        TypeError: If ``protocol`` is not runtime checkable.
+    """
+    shape = _protocol_shape(protocol)
+    if shape is None:
+        return isinstance(obj, protocol)
+
+    cls = type(obj)
+    key = id(cls)
+    table = _verdicts.get(protocol)
+    if table is None:
+        table = _verdicts[protocol] = {}
+
+    entry = table.get(key)
+    if entry is True:
+        return True
+    if entry is False:
+        return isinstance(obj, protocol)
+    if (
+        entry is None
+        or entry[4] != get_cache_token()
+        or entry[3] != _defined_names(cls, shape[2])
+    ):
+        entry = _build_entry(obj, cls, protocol, shape)
+        if key not in _class_refs:
+            _class_refs[key] = weakref.ref(cls, _evictor(key))
+        table[key] = entry
+        if entry is True:
+            return True
+        if entry is False:
+            return isinstance(obj, protocol)
+
+    return _check_structural(obj, protocol, entry, shape[1])
+
+
+def check_many(obj: object, protocols: Iterable[type]) -> dict[type, bool]:
+    """Check ``obj`` against several protocols at once.
+
+    Args:
+        obj: The object to check.
+        protocols: Protocols to check, typically every capability a
+            dispatcher routes on.
+
+    Returns:
+        Mapping of each protocol to its verdict, in the order given.
+
+    Raises:
+        TypeError: If any protocol is not runtime checkable.
+    """
+    return {protocol: conforms(obj, protocol) for protocol in protocols}
+
+
+def required_members(protocol: type) -> frozenset[str]:
+    """Return the member names an object must provide to conform to ``protocol``.
+
+    Raises:
+        TypeError: If ``protocol`` is not a protocol, or is a protocol that is
+            not runtime checkable.
+    """
+    shape = _protocol_shape(protocol)
+    if shape is None:
+        raise TypeError(f"{protocol!r} is not a Protocol class")
+    return frozenset(shape[0])
+
+
+def invalidate(cls: type) -> None:
+    """Forget every cached verdict for ``cls`` and its subclasses."""
+    for key, ref in list(_class_refs.items()):
+        klass = ref()
+        if klass is None or issubclass(klass, cls):
+            _evict(key)
+
+
+def clear_conformance_cache() -> None:
+    """Clear every cached protocol shape and verdict (primarily for testing)."""
+    _shapes.clear()
+    _verdicts.clear()
+    _class_refs.clear()
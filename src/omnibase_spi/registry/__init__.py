@@ -10,8 +10,23 @@ fields, and the SPI producer protocol responsible for emitting it.
 Exports:
     EventRegistryEntry: Named tuple describing one registered event.
     EVENT_REGISTRY: The singleton registry dict keyed by event_type.
+    CompiledEventRegistry: Indexed view with reverse lookups, lazily
+        resolved producer protocols and batch partition-key extraction.
+    PartitionKeyExtractor: Precompiled partition-key builder for one entry.
+    compile_event_registry: Build a CompiledEventRegistry.
 """
 
+from omnibase_spi.registry.compiled_event_registry import (
+    CompiledEventRegistry,
+    PartitionKeyExtractor,
+    compile_event_registry,
+)
 from omnibase_spi.registry.event_registry import EVENT_REGISTRY, EventRegistryEntry
 
-__all__ = ["EVENT_REGISTRY", "EventRegistryEntry"]
+__all__ = [
+    "EVENT_REGISTRY",
+    "CompiledEventRegistry",
+    "EventRegistryEntry",
+    "PartitionKeyExtractor",
+    "compile_event_registry",
+]
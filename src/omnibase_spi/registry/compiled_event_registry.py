@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Compiled, indexed view of the SPI Event Registry.
+
+``EVENT_REGISTRY`` is the canonical source of truth, but producers on the hot
+path need more than a dict lookup per message: they resolve the
+``producer_protocol`` dotted path and build a partition key from
+``partition_key_fields``.  ``compile_event_registry()`` does that work once:
+
+- producer protocol classes are imported lazily on first use and cached;
+- reverse indexes answer "which event types does this protocol produce",
+  "which use schema version X" and "which live under topic prefix Y" with a
+  single dict lookup;
+- every entry gets a precompiled ``PartitionKeyExtractor`` built on
+  ``operator.attrgetter`` / ``operator.itemgetter``, with a batch API.
+
+The compiled view is a snapshot of the mapping it was built from.  Compile
+again after mutating the underlying registry.
+
+This file must NOT import from omnibase_core, omnibase_infra, or omniclaude.
+"""
+
+import importlib
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import starmap
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from omnibase_spi.registry.event_registry import EVENT_REGISTRY, EventRegistryEntry
+
+PARTITION_KEY_SEPARATOR = ":"
+
+_Getter = Callable[[Any], Any]
+
+
+class PartitionKeyExtractor(NamedTuple):
+    """Precompiled partition-key builder for one registry entry.
+
+    The key is the ``str()`` of each ``partition_key_fields`` value joined
+    with ``":"`` -- e.g. ``"omnibase_spi:42"`` for ``("repo", "pr_number")``.
+    Payloads may be objects (fields read as attributes) or mappings (fields
+    read as keys).  Build instances with ``PartitionKeyExtractor.compile``.
+
+    Attributes:
+        fields: The partition key fields, in key order.
+        by_attribute: ``attrgetter`` over ``fields``.
+        by_key: ``itemgetter`` over ``fields``.
+        join_values: ``"{!s}:{!s}".format``-style joiner, equivalent to
+            ``":".join(map(str, values))`` but evaluated in C.
+        getters: Getter chosen per payload type, filled on first sight.
+    """
+
+    fields: tuple[str, ...]
+    by_attribute: _Getter
+    by_key: _Getter
+    join_values: Callable[..., str]
+    getters: dict[type, _Getter]
+
+    @classmethod
+    def compile(cls, fields: tuple[str, ...]) -> "PartitionKeyExtractor":
+        """Build the extractor for ``partition_key_fields``.
+
+        Raises:
+            ValueError: If ``fields`` is empty.
+        """
+        if not fields:
+            raise ValueError("partition_key_fields must not be empty")
+        template = PARTITION_KEY_SEPARATOR.join(["{!s}"] * len(fields))
+        return cls(
+            fields, attrgetter(*fields), itemgetter(*fields), template.format, {}
+        )
+
+    def getter_for(self, payload: object) -> _Getter:
+        """Return the field getter for ``payload``'s type."""
+        payload_type = type(payload)
+        try:
+            return self.getters[payload_type]
+        except KeyError:
+            pass
+        getter = self.by_key if isinstance(payload, Mapping) else self.by_attribute
+        self.getters[payload_type] = getter
+        return getter
+
+    def __call__(self, payload: object) -> str:
+        """Return the partition key of a single payload."""
+        values = self.getter_for(payload)(payload)
+        if len(self.fields) == 1:
+            return str(values)
+        return self.join_values(*values)
+
+    def many(self, payloads: Iterable[object]) -> list[str]:
+        """Return the partition keys of ``payloads``, in order.
+
+        Batches of a single payload type (the common case) are extracted
+        with one ``map`` over the precompiled getter.
+        """
+        items = payloads if isinstance(payloads, list | tuple) else list(payloads)
+        if not items:
+            return []
+        if len(set(map(type, items))) != 1:
+            return [self(payload) for payload in items]
+
+        values = map(self.getter_for(items[0]), items)
+        if len(self.fields) == 1:
+            return list(map(str, values))
+        return list(starmap(self.join_values, values))
+
+
+def _topic_prefixes(topic: str) -> Iterator[str]:
+    """Yield every dotted prefix of ``topic``, including the topic itself."""
+    segments = topic.split(".")
+    for end in range(1, len(segments) + 1):
+        yield ".".join(segments[:end])
+
+
+def _resolve(dotted_path: str) -> type:
+    module_name, _, attr = dotted_path.rpartition(".")
+    if not module_name:
+        raise ImportError(f"'{dotted_path}' is not a fully-qualified class name")
+    try:
+        resolved = getattr(importlib.import_module(module_name), attr)
+    except AttributeError as e:
+        raise ImportError(f"cannot resolve producer protocol '{dotted_path}'") from e
+    if not isinstance(resolved, type):
+        raise ImportError(f"producer protocol '{dotted_path}' is not a class")
+    return resolved
+
+
+class CompiledEventRegistry(NamedTuple):
+    """Indexed snapshot of an event registry mapping.
+
+    Build with ``compile_event_registry()``.
+
+    Attributes:
+        entries: Read-only copy of the compiled registry.
+        extractors: Partition-key extractor per event type.
+        producer_index: Event types per producer protocol dotted path.
+        schema_version_index: Event types per schema version.
+        topic_prefix_index: Event types per dotted topic prefix.
+        protocols: Producer protocol classes resolved so far.
+    """
+
+    entries: Mapping[str, EventRegistryEntry]
+    extractors: Mapping[str, PartitionKeyExtractor]
+    producer_index: Mapping[str, tuple[str, ...]]
+    schema_version_index: Mapping[str, tuple[str, ...]]
+    topic_prefix_index: Mapping[str, tuple[str, ...]]
+    protocols: dict[str, type]
+
+    def producer_protocol(self, event_type: str) -> type:
+        """Return the producer protocol class of ``event_type``.
+
+        The dotted ``producer_protocol`` path is imported on first use and
+        cached for the lifetime of the compiled view.
+
+        Raises:
+            KeyError: If ``event_type`` is not registered.
+            ImportError: If the producer protocol cannot be resolved.
+        """
+        try:
+            return self.protocols[event_type]
+        except KeyError:
+            pass
+        resolved = _resolve(self.entries[event_type].producer_protocol)
+        self.protocols[event_type] = resolved
+        return resolved
+
+    def by_producer_protocol(self, producer: str | type) -> tuple[str, ...]:
+        """Return the event types produced by ``producer``.
+
+        Args:
+            producer: A fully-qualified class name, as stored in
+                ``EventRegistryEntry.producer_protocol``, or the class itself.
+        """
+        if isinstance(producer, type):
+            producer = f"{producer.__module__}.{producer.__qualname__}"
+        return self.producer_index.get(producer, ())
+
+    def by_schema_version(self, schema_version: str) -> tuple[str, ...]:
+        """Return the event types registered with ``schema_version``."""
+        return self.schema_version_index.get(schema_version, ())
+
+    def by_topic_prefix(self, prefix: str) -> tuple[str, ...]:
+        """Return the event types whose topic starts with dotted ``prefix``.
+
+        Prefixes match whole dot-separated segments: ``"onex.evt.git"``
+        matches ``onex.evt.git.hook.v1`` but not ``onex.evt.github.*``.
+        A trailing ``"."`` is ignored.
+        """
+        return self.topic_prefix_index.get(prefix.rstrip("."), ())
+
+    def partition_key(self, event_type: str, payload: object) -> str:
+        """Return the partition key of one ``event_type`` payload.
+
+        Raises:
+            KeyError: If ``event_type`` is not registered.
+        """
+        return self.extractors[event_type](payload)
+
+    def partition_keys(self, event_type: str, payloads: Iterable[object]) -> list[str]:
+        """Return the partition keys of a batch of ``event_type`` payloads.
+
+        Raises:
+            KeyError: If ``event_type`` is not registered.
+        """
+        return self.extractors[event_type].many(payloads)
+
+
+def _freeze(index: dict[str, list[str]]) -> Mapping[str, tuple[str, ...]]:
+    return MappingProxyType({key: tuple(values) for key, values in index.items()})
+
+
+def compile_event_registry(
+    registry: Mapping[str, EventRegistryEntry] = EVENT_REGISTRY,
+) -> CompiledEventRegistry:
+    """Build the indexed view of ``registry``.
+
+    Example:
+        >>> compiled = compile_event_registry()
+        >>> compiled.partition_key(
+        ...     "onex.evt.git.hook.v1", {"repo": "spi", "branch": "main"}
+        ... )
+        'spi:main'
+        >>> compiled.by_topic_prefix("onex.evt.git")
+        ('onex.evt.git.hook.v1',)
+    """
+    extractors: dict[str, PartitionKeyExtractor] = {}
+    by_producer: dict[str, list[str]] = {}
+    by_version: dict[str, list[str]] = {}
+    by_prefix: dict[str, list[str]] = {}
+    for event_type, entry in registry.items():
+        extractors[event_type] = PartitionKeyExtractor.compile(
+            entry.partition_key_fields
+        )
+        by_producer.setdefault(entry.producer_protocol, []).append(event_type)
+        by_version.setdefault(entry.schema_version, []).append(event_type)
+        for prefix in _topic_prefixes(entry.topic):
+            by_prefix.setdefault(prefix, []).append(event_type)
+
+    return CompiledEventRegistry(
+        entries=MappingProxyType(dict(registry)),
+        extractors=MappingProxyType(extractors),
+        producer_index=_freeze(by_producer),
+        schema_version_index=_freeze(by_version),
+        topic_prefix_index=_freeze(by_prefix),
+        protocols={},
+    )
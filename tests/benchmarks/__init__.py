@@ -0,0 +1,12 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Performance benchmarks for omnibase_spi.
+
+Benchmarks are opt-in: they are skipped unless the ``benchmark`` marker is
+selected explicitly.
+
+Run benchmarks with:
+    uv run pytest -m benchmark tests/benchmarks/ -v -s
+"""
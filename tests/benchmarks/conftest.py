@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark configuration.
+
+Benchmarks spawn interpreters or run tight loops and are far slower than the
+unit suite, so they only run when selected with ``-m benchmark``. A plain
+``uv run pytest`` collects and skips them.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip benchmark tests unless the ``benchmark`` marker is selected."""
+    if "benchmark" in (config.getoption("-m") or ""):
+        return
+    skip_benchmark = pytest.mark.skip(
+        reason="benchmark: run with `uv run pytest -m benchmark`"
+    )
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,67 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Contract stream fixtures shared by the codec benchmarks.
+
+Builds deterministic measurement events and checkpoints, one per index, so
+``test_wire_codec_benchmark.py`` and ``test_binary_codec_benchmark.py``
+encode the same streams.
+"""
+
+from __future__ import annotations
+
+from omnibase_spi.contracts.measurement import (
+    ContractArtifactPointerMeasurement,
+    ContractCostMetrics,
+    ContractDurationMetrics,
+    ContractEnumPipelinePhase,
+    ContractEnumResultClassification,
+    ContractMeasurementContext,
+    ContractMeasurementEvent,
+    ContractOutcomeMetrics,
+    ContractPhaseMetrics,
+    ContractProducer,
+    ContractTestMetrics,
+)
+from omnibase_spi.contracts.pipeline.contract_checkpoint import ContractCheckpoint
+
+
+def measurement_event(index: int) -> ContractMeasurementEvent:
+    """Build the ``index``-th phase-completed measurement event of a stream."""
+    metrics = ContractPhaseMetrics(
+        run_id=f"run-{index:05d}",
+        phase=ContractEnumPipelinePhase.VERIFY,
+        phase_id=f"phase-verify-{index}",
+        attempt=1 + index % 3,
+        context=ContractMeasurementContext(ticket_id=f"T-{index}", repo_id="repo"),
+        producer=ContractProducer(name="ticket-pipeline"),
+        duration=ContractDurationMetrics(wall_clock_ms=5000.0 + index),
+        cost=ContractCostMetrics(llm_total_tokens=1000 + index),
+        outcome=ContractOutcomeMetrics(
+            result_classification=ContractEnumResultClassification.SUCCESS,
+        ),
+        tests=ContractTestMetrics(total_tests=50, passed_tests=49, pass_rate=0.98),
+        artifact_pointers=[
+            ContractArtifactPointerMeasurement(artifact_type="commit", uri=f"{index:x}")
+        ],
+        extensions={"zeta": index, "alpha": ["b", "a"], "note": "résumé"},
+    )
+    return ContractMeasurementEvent(
+        event_id=f"evt-{index}",
+        event_type="phase_completed",
+        timestamp_iso="2025-01-01T00:00:00Z",
+        payload=metrics,
+    )
+
+
+def checkpoint(index: int) -> ContractCheckpoint:
+    """Build the ``index``-th completed checkpoint of a stream."""
+    return ContractCheckpoint(
+        run_id=f"run-{index:05d}",
+        phase="local_review",
+        status="completed",
+        created_at_iso="2025-01-01T00:00:00Z",
+        artifacts={"report": f"s3://bucket/{index}", "diff": {"files": index}},
+        metadata={"z": 1, "a": 2},
+    )
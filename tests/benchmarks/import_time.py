@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Import-time measurement harness.
+
+Spawns fresh interpreters with ``python -X importtime``, parses the trace
+written to stderr and attributes the cost of importing a target to the
+submodules it pulled in. Used by ``test_import_time_budget.py`` and runnable
+directly to print a report or refresh the checked-in budget file.
+
+Targets:
+    - ``omnibase_spi``, ``omnibase_spi.protocols``, ``omnibase_spi.protocols.types``
+    - every ``omnibase_spi.contracts.<subpackage>``
+    - every root-level lazy export, written ``omnibase_spi.<Name>``; its cost
+      is the import work triggered by the first attribute access after
+      ``import omnibase_spi`` has completed.
+
+Usage:
+    # Print a per-target report with the heaviest submodules
+    uv run python -m tests.benchmarks.import_time
+
+    # Refresh tests/benchmarks/import_time_budget.json (2x measured median)
+    uv run python -m tests.benchmarks.import_time --write-budget --headroom 2.0
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import NamedTuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+SRC_DIR = REPO_ROOT / "src"
+CONTRACTS_DIR = SRC_DIR / "omnibase_spi" / "contracts"
+BUDGET_FILE = Path(__file__).resolve().parent / "import_time_budget.json"
+
+# Module targets measured in addition to contracts subpackages and lazy exports
+MODULE_TARGETS = (
+    "omnibase_spi",
+    "omnibase_spi.protocols",
+    "omnibase_spi.protocols.types",
+)
+
+# "import time:       123 |       4567 |   package.module"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+class ImportRecord(NamedTuple):
+    """A single ``-X importtime`` trace line."""
+
+    self_us: int
+    cumulative_us: int
+    depth: int
+    module: str
+
+
+class ImportMeasurement(NamedTuple):
+    """Cost of one target in one fresh interpreter."""
+
+    target: str
+    cumulative_us: int
+    attribution_us: dict[str, int]
+
+
+def _subprocess_env() -> dict[str, str]:
+    """Build an environment whose ``PYTHONPATH`` resolves this checkout."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(SRC_DIR) + (
+        os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else ""
+    )
+    return env
+
+
+def contracts_targets() -> list[str]:
+    """List every ``omnibase_spi.contracts`` subpackage."""
+    return sorted(
+        f"omnibase_spi.contracts.{path.parent.name}"
+        for path in CONTRACTS_DIR.glob("*/__init__.py")
+    )
+
+
+def lazy_export_targets() -> list[str]:
+    """List every root-level lazy protocol export as ``omnibase_spi.<Name>``."""
+    import omnibase_spi
+
+    return [f"omnibase_spi.{name}" for name in sorted(omnibase_spi._LAZY_PROTOCOL_MAP)]
+
+
+def all_targets() -> list[str]:
+    """List every import-time target in report order."""
+    return [*MODULE_TARGETS, *contracts_targets(), *lazy_export_targets()]
+
+
+def _is_lazy_export(target: str) -> bool:
+    """Return True for ``omnibase_spi.<Name>`` root lazy export targets."""
+    head, _, attribute = target.rpartition(".")
+    return head == "omnibase_spi" and attribute[:1].isupper()
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` output into records (in trace order).
+
+    Args:
+        stderr: Standard error of a ``python -X importtime`` run.
+
+    Returns:
+        One record per imported module; nesting depth is derived from the
+        two-space indentation CPython uses for nested imports.
+    """
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        records.append(
+            ImportRecord(int(self_us), int(cumulative_us), len(indent) // 2, module)
+        )
+    return records
+
+
+def target_cost_us(records: list[ImportRecord], target: str) -> int:
+    """Compute the cumulative import cost of ``target`` from a trace.
+
+    Module targets use the cumulative time of their own trace line. Lazy
+    export targets sum every top-level import that happened after
+    ``omnibase_spi`` itself finished importing (i.e. the work triggered by
+    the first attribute access).
+
+    Raises:
+        ValueError: If the target does not appear in the trace.
+    """
+    if not _is_lazy_export(target):
+        for record in records:
+            if record.module == target:
+                return record.cumulative_us
+        raise ValueError(f"{target} not found in importtime trace")
+
+    # CPython prints a module's line after its children, so everything
+    # after the top-level omnibase_spi line was imported by the access.
+    for index, record in enumerate(records):
+        if record.module == "omnibase_spi" and record.depth == 0:
+            return sum(r.cumulative_us for r in records[index + 1 :] if r.depth == 0)
+    raise ValueError("omnibase_spi not found in importtime trace")
+
+
+def attribute_cost(records: list[ImportRecord], target: str) -> dict[str, int]:
+    """Attribute self time to submodule groups for the part of the trace owned by ``target``.
+
+    ``omnibase_*`` modules are grouped by their first two dotted components
+    (e.g. ``omnibase_spi.protocols``, ``omnibase_core.models``); any other
+    module is grouped by its top-level package.
+    """
+    if _is_lazy_export(target):
+        start = next(
+            i + 1
+            for i, r in enumerate(records)
+            if r.module == "omnibase_spi" and r.depth == 0
+        )
+        owned = records[start:]
+    else:
+        # Children of a module precede it in the trace; walk back from the
+        # target line until the next line at the same or shallower depth.
+        end = next(i for i, r in enumerate(records) if r.module == target)
+        depth = records[end].depth
+        start = end
+        while start > 0 and records[start - 1].depth > depth:
+            start -= 1
+        owned = records[start : end + 1]
+
+    groups: dict[str, int] = defaultdict(int)
+    for record in owned:
+        parts = record.module.split(".")
+        group = ".".join(parts[:2]) if parts[0].startswith("omnibase_") else parts[0]
+        groups[group] += record.self_us
+    return dict(sorted(groups.items(), key=lambda item: item[1], reverse=True))
+
+
+def measure_once(target: str) -> ImportMeasurement:
+    """Measure ``target`` in a single fresh interpreter."""
+    if _is_lazy_export(target):
+        statement = f"import omnibase_spi; omnibase_spi.{target.rpartition('.')[2]}"
+    else:
+        statement = f"import {target}"
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=_subprocess_env(),
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{result.stderr[-2000:]}")
+
+    records = parse_importtime(result.stderr)
+    return ImportMeasurement(
+        target=target,
+        cumulative_us=target_cost_us(records, target),
+        attribution_us=attribute_cost(records, target),
+    )
+
+
+def measure(target: str, repeats: int = 3) -> ImportMeasurement:
+    """Measure ``target`` ``repeats`` times and return the median run."""
+    # Discarded run: compiling stale bytecode is not import time.
+    measure_once(target)
+    runs = sorted(
+        (measure_once(target) for _ in range(repeats)),
+        key=lambda m: m.cumulative_us,
+    )
+    median_us = statistics.median_low([m.cumulative_us for m in runs])
+    return next(m for m in runs if m.cumulative_us == median_us)
+
+
+def load_budget(path: Path = BUDGET_FILE) -> dict[str, float]:
+    """Load the ``{target: max_cumulative_ms}`` budget."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {str(k): float(v) for k, v in data["budgets_ms"].items()}
+
+
+def format_attribution(measurement: ImportMeasurement, limit: int = 10) -> str:
+    """Render the heaviest groups of a measurement as an indented table."""
+    lines = [
+        f"  {group:<40} {self_us / 1000:>9.2f} ms"
+        for group, self_us in list(measurement.attribution_us.items())[:limit]
+    ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Print an import-time report or refresh the budget file."""
+    parser = argparse.ArgumentParser(description="omnibase_spi import-time report")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--write-budget",
+        action="store_true",
+        help=f"Rewrite {BUDGET_FILE.name} from the measured medians",
+    )
+    parser.add_argument(
+        "--headroom",
+        type=float,
+        default=2.0,
+        help="Budget multiplier applied to measured medians (default: 2.0)",
+    )
+    args = parser.parse_args()
+
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+
+    baselines: dict[str, float] = {}
+    budgets: dict[str, float] = {}
+    for target in all_targets():
+        measurement = measure(target, repeats=args.repeats)
+        cumulative_ms = measurement.cumulative_us / 1000
+        print(f"{target:<70} {cumulative_ms:>9.2f} ms")
+        print(format_attribution(measurement, limit=5))
+        baselines[target] = round(cumulative_ms, 1)
+        # Round up to 5 ms so sub-millisecond lazy exports keep a usable floor.
+        budgets[target] = max(5, math.ceil(cumulative_ms * args.headroom / 5) * 5)
+
+    if args.write_budget:
+        payload = {
+            "description": (
+                "Maximum median cumulative import time (ms) per target in a fresh "
+                f"interpreter: {args.headroom:g}x the median in baselines_ms, "
+                "rounded up to 5 ms. Regenerate with: "
+                "uv run python -m tests.benchmarks.import_time --write-budget"
+            ),
+            "baselines_ms": baselines,
+            "budgets_ms": budgets,
+        }
+        BUDGET_FILE.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {BUDGET_FILE.relative_to(REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Micro-batching producer benchmark.
+
+Drives a fake broker, where every ``send`` or ``send_batch`` request costs one
+simulated round trip, with unbatched ``send`` calls and through
+``examples.reference.BatchingProducer`` with a fixed and with an adaptive
+linger window. Two loads are measured:
+
+- flood: one task sends as fast as ``send`` returns; reports msgs/sec and
+  send-to-delivery latency. Batching must beat unbatched throughput.
+- paced: the next message is sent only after the previous one is delivered;
+  reports the latency batching adds on top of the round trip. The adaptive
+  window must add less than the fixed one.
+
+Every message must be delivered exactly once in send order. Each
+configuration reports its fastest of three runs.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_batching_producer_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+import pytest
+
+from examples.reference.batching_producer import BatchingProducer
+from omnibase_core.models.event_bus import (
+    ModelProducerHealthStatus,
+    ModelProducerMessage,
+)
+from omnibase_spi.protocols.event_bus.protocol_event_bus_producer_handler import (
+    DeliveryCallback,
+)
+
+TOPIC = "onex.evt.benchmark.v1"
+ROUND_TRIP_SECONDS = 0.0005
+FLOOD_MESSAGES = 2_000
+PACED_MESSAGES = 200
+VALUE_BYTES = 100
+BATCH_SIZE_BYTES = 16_384
+LINGER_MS = 5.0
+REPEAT = 3
+
+
+class _FakeBroker:
+    """Producer whose every request costs one simulated round trip."""
+
+    handler_type = "event_bus_producer"
+    supports_transactions = False
+    supports_exactly_once = False
+
+    def __init__(self) -> None:
+        self.delivered: list[bytes] = []
+        self.requests = 0
+
+    async def send(
+        self,
+        topic: str,
+        value: bytes,
+        key: bytes | None = None,
+        headers: dict[str, bytes] | None = None,
+        partition: int | None = None,
+        on_success: DeliveryCallback | None = None,
+        on_error: DeliveryCallback | None = None,
+    ) -> None:
+        """Deliver one message per round trip."""
+        self.requests += 1
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        self.delivered.append(value)
+        if on_success is not None:
+            on_success(topic, key, value, None)
+
+    async def send_batch(
+        self,
+        messages: Sequence[ModelProducerMessage],
+        on_success: DeliveryCallback | None = None,
+        on_error: DeliveryCallback | None = None,
+    ) -> int:
+        """Deliver a whole batch per round trip."""
+        self.requests += 1
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        for message in messages:
+            self.delivered.append(message.value)
+            if on_success is not None:
+                on_success(message.topic, message.key, message.value, None)
+        return len(messages)
+
+    async def flush(self, timeout_seconds: float = 30.0) -> None:
+        """Nothing is buffered."""
+
+    async def close(self, timeout_seconds: float = 30.0) -> None:
+        """Nothing to release."""
+
+    async def health_check(self) -> ModelProducerHealthStatus:
+        """Always healthy."""
+        return ModelProducerHealthStatus(healthy=True, connected=True)
+
+    async def begin_transaction(self) -> None:
+        """Unsupported."""
+
+    async def commit_transaction(self) -> None:
+        """Unsupported."""
+
+    async def abort_transaction(self) -> None:
+        """Unsupported."""
+
+
+class _Latencies:
+    """Delivery callback recording send-to-delivery latency per value."""
+
+    def __init__(self) -> None:
+        self.sent_ns: dict[bytes, int] = {}
+        self.latencies_ns: list[int] = []
+        self.delivered = asyncio.Event()
+
+    def on_success(
+        self, topic: str, key: bytes | None, value: bytes, error: Exception | None
+    ) -> None:
+        self.latencies_ns.append(time.perf_counter_ns() - self.sent_ns.pop(value))
+        self.delivered.set()
+
+    def percentile_ms(self, n: int) -> float:
+        return statistics.quantiles(self.latencies_ns, n=100)[n - 1] / 1e6
+
+
+_Send = Callable[..., Awaitable[None]]
+
+
+def _values(count: int) -> list[bytes]:
+    return [str(i).encode().rjust(VALUE_BYTES, b"0") for i in range(count)]
+
+
+async def _flood(send: _Send, latencies: _Latencies, values: list[bytes]) -> None:
+    for i, value in enumerate(values):
+        latencies.sent_ns[value] = time.perf_counter_ns()
+        await send(
+            TOPIC, value, key=f"k{i % 16}".encode(), on_success=latencies.on_success
+        )
+
+
+async def _paced(send: _Send, latencies: _Latencies, values: list[bytes]) -> None:
+    for value in values:
+        latencies.delivered.clear()
+        latencies.sent_ns[value] = time.perf_counter_ns()
+        await send(TOPIC, value, on_success=latencies.on_success)
+        await latencies.delivered.wait()
+
+
+async def _run(
+    mode: str, load: str, count: int
+) -> tuple[float, _Latencies, _FakeBroker]:
+    broker = _FakeBroker()
+    latencies = _Latencies()
+    values = _values(count)
+    if mode == "unbatched":
+        send: _Send = broker.send
+        producer = None
+    else:
+        producer = BatchingProducer(
+            broker,
+            batch_size_bytes=BATCH_SIZE_BYTES,
+            linger_ms=LINGER_MS,
+            adaptive=mode == "adaptive linger",
+        )
+        send = producer.send
+    drive = _flood if load == "flood" else _paced
+
+    start = time.perf_counter()
+    await drive(send, latencies, values)
+    if producer is not None:
+        await producer.flush()
+    elapsed = time.perf_counter() - start
+
+    assert broker.delivered == values
+    return elapsed, latencies, broker
+
+
+@pytest.mark.benchmark
+def test_batching_beats_unbatched_sends() -> None:
+    """Compare throughput and added latency against unbatched sends."""
+    modes = ("unbatched", "fixed linger", "adaptive linger")
+    print(
+        f"\nround trip {ROUND_TRIP_SECONDS * 1000:.1f} ms, "
+        f"batch {BATCH_SIZE_BYTES} B, linger {LINGER_MS} ms"
+    )
+    print(
+        f"{'load':<6} {'producer':<16} {'msgs/s':>9} {'requests':>9} "
+        f"{'p50 ms':>8} {'p99 ms':>8}"
+    )
+    rates: dict[str, float] = {}
+    paced_p50: dict[str, float] = {}
+    for load, count in (("flood", FLOOD_MESSAGES), ("paced", PACED_MESSAGES)):
+        for mode in modes:
+            elapsed, latencies, broker = min(
+                (asyncio.run(_run(mode, load, count)) for _ in range(REPEAT)),
+                key=lambda run: run[0],
+            )
+            rate = count / elapsed
+            p50, p99 = latencies.percentile_ms(50), latencies.percentile_ms(99)
+            print(
+                f"{load:<6} {mode:<16} {rate:>9.0f} {broker.requests:>9} "
+                f"{p50:>8.2f} {p99:>8.2f}"
+            )
+            if load == "flood":
+                rates[mode] = rate
+            else:
+                paced_p50[mode] = p50
+
+    assert rates["fixed linger"] > rates["unbatched"]
+    assert rates["adaptive linger"] > rates["unbatched"]
+    assert paced_p50["adaptive linger"] < paced_p50["fixed linger"]
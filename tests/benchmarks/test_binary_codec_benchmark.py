@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Binary codec benchmark.
+
+Compares the schema-indexed MessagePack codec with compact canonical JSON on a
+stream of measurement events and checkpoints. Every message must round-trip to
+the same canonical JSON; binary payloads must be smaller, and faster to encode
+when the ``msgpack`` package is installed (the pure-Python fallback is reported
+but not asserted). Decoding is reported only: it ends in pydantic's
+Python-mode validation, which is slower than its native JSON parser.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_binary_codec_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+import pytest
+
+from omnibase_spi.contracts.measurement import ContractMeasurementEvent
+from omnibase_spi.contracts.pipeline import contract_binary_codec
+from omnibase_spi.contracts.pipeline.contract_binary_codec import (
+    from_msgpack,
+    to_msgpack,
+)
+from omnibase_spi.contracts.pipeline.contract_checkpoint import ContractCheckpoint
+from omnibase_spi.contracts.pipeline.contract_wire_codec import from_json, to_json
+from tests.benchmarks.contract_streams import checkpoint, measurement_event
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+STREAM_SIZE = 200
+REPEAT = 5
+
+
+def _best_ms(func: Callable[[], object]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEAT)) * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    ("factory", "model_class"),
+    [
+        (measurement_event, ContractMeasurementEvent),
+        (checkpoint, ContractCheckpoint),
+    ],
+    ids=["measurement_event", "checkpoint"],
+)
+def test_binary_codec_is_smaller_and_faster(
+    factory: Callable[[int], BaseModel], model_class: type[BaseModel]
+) -> None:
+    """Compare MessagePack and compact JSON for a contract stream."""
+    models = [factory(i) for i in range(STREAM_SIZE)]
+    compact = [to_json(m, indent=None) for m in models]
+    packed = [to_msgpack(m) for m in models]
+
+    for model, data in zip(models, packed, strict=True):
+        assert to_json(from_msgpack(data, model_class)) == to_json(model)
+
+    json_bytes = sum(len(s.encode()) for s in compact)
+    binary_bytes = sum(len(b) for b in packed)
+
+    timings = {
+        "encode json": _best_ms(lambda: [to_json(m, indent=None) for m in models]),
+        "encode msgpack": _best_ms(lambda: [to_msgpack(m) for m in models]),
+        "decode json": _best_ms(lambda: [from_json(s, model_class) for s in compact]),
+        "decode msgpack": _best_ms(
+            lambda: [from_msgpack(b, model_class) for b in packed]
+        ),
+    }
+
+    backend = "msgpack" if contract_binary_codec._HAS_MSGPACK else "pure-python"
+    print(f"\n{model_class.__name__} x {STREAM_SIZE} ({backend})")
+    print(f"  size json {json_bytes} B, msgpack {binary_bytes} B")
+    for label, elapsed in timings.items():
+        print(f"  {label:<16} {elapsed:>8.2f} ms")
+
+    assert binary_bytes < json_bytes
+    if contract_binary_codec._HAS_MSGPACK:
+        assert timings["encode msgpack"] < timings["encode json"]
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Bloom filter idempotency tier benchmark.
+
+Puts ``examples.reference.BloomFilteredIdempotencyStore`` in front of a
+simulated remote store, where every call holds one of a few pooled
+connections for a round trip, and compares it with calling the store
+directly. Two loads are measured, each with 90% new messages:
+
+- lookups: ``is_processed`` one message at a time; reports elapsed time,
+  store round trips and the filter hit ratio. Negative filter answers must
+  skip the store, so the filtered tier must be faster.
+- dedupe: concurrent handlers call ``check_and_record``; the tier sends
+  them as ``check_and_record_many`` batches and must be faster with fewer
+  round trips.
+
+Both must give the same answers, and the filter must answer all but about
+twice the configured false positive rate of the new-message lookups.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_bloom_idempotency_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Iterable
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.bloom_idempotency_store import BloomFilteredIdempotencyStore
+from examples.reference.sharded_idempotency_store import ShardedIdempotencyStore
+
+ROUND_TRIP_SECONDS = 0.0005
+CONNECTIONS = 4
+MESSAGES = 2_000
+SEEN_SHARE = 0.1
+HANDLERS = 64
+FALSE_POSITIVE_RATE = 0.01
+DAY = 24 * 3600
+
+# Reproducible message mix; not used for anything security related.
+_RNG = random.Random(7)  # noqa: S311
+
+
+class _RemoteStore(ShardedIdempotencyStore):
+    """Store whose every call holds a pooled connection for a round trip."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.round_trips = 0
+        self._pool = asyncio.Semaphore(CONNECTIONS)
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        async with self._pool:
+            await asyncio.sleep(ROUND_TRIP_SECONDS)
+
+    async def check_and_record(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> bool:
+        """One round trip per message."""
+        await self._round_trip()
+        return await super().check_and_record(message_id, domain, correlation_id)
+
+    async def check_and_record_many(
+        self,
+        message_ids: Iterable[UUID],
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> list[bool]:
+        """One round trip per batch."""
+        await self._round_trip()
+        return await super().check_and_record_many(message_ids, domain, correlation_id)
+
+    async def is_processed(self, message_id: UUID, domain: str | None = None) -> bool:
+        """One round trip per lookup."""
+        await self._round_trip()
+        return await super().is_processed(message_id, domain)
+
+
+def _workload() -> tuple[list[UUID], list[UUID]]:
+    """Return previously seen ids and a 90% new message stream."""
+    seen = [uuid4() for _ in range(int(MESSAGES * SEEN_SHARE))]
+    stream = seen + [uuid4() for _ in range(MESSAGES - len(seen))]
+    _RNG.shuffle(stream)
+    return seen, stream
+
+
+async def _prepare(
+    filtered: bool, seen: list[UUID]
+) -> tuple[_RemoteStore, ShardedIdempotencyStore | BloomFilteredIdempotencyStore]:
+    remote = _RemoteStore()
+    store: ShardedIdempotencyStore | BloomFilteredIdempotencyStore = remote
+    if filtered:
+        store = BloomFilteredIdempotencyStore(
+            remote,
+            retention_seconds=7 * DAY,
+            expected_records=MESSAGES * 10,
+            false_positive_rate=FALSE_POSITIVE_RATE,
+            warm=True,
+        )
+    for message_id in seen:
+        await store.mark_processed(message_id, "billing")
+    remote.round_trips = 0
+    return remote, store
+
+
+async def _lookups(
+    filtered: bool, seen: list[UUID], stream: list[UUID]
+) -> tuple[float, int, list[bool], float]:
+    remote, store = await _prepare(filtered, seen)
+    start = time.perf_counter()
+    answers = [await store.is_processed(m, "billing") for m in stream]
+    elapsed = time.perf_counter() - start
+    hit_ratio = getattr(store, "hit_ratio", 0.0)
+    return elapsed, remote.round_trips, answers, hit_ratio
+
+
+async def _dedupe(
+    filtered: bool, seen: list[UUID], stream: list[UUID]
+) -> tuple[float, int, list[bool]]:
+    remote, store = await _prepare(filtered, seen)
+    answers: list[bool] = [False] * len(stream)
+
+    async def handler(offset: int) -> None:
+        for position in range(offset, len(stream), HANDLERS):
+            answers[position] = await store.check_and_record(
+                stream[position], "billing"
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handler(i) for i in range(HANDLERS)))
+    return time.perf_counter() - start, remote.round_trips, answers
+
+
+@pytest.mark.benchmark
+def test_bloom_tier_skips_round_trips() -> None:
+    """Compare lookups and dedupe against calling the remote store directly."""
+    seen, stream = _workload()
+    print(
+        f"\nround trip {ROUND_TRIP_SECONDS * 1000:.1f} ms over {CONNECTIONS} "
+        f"connections, {MESSAGES} messages, "
+        f"{1 - SEEN_SHARE:.0%} new, {HANDLERS} dedupe handlers"
+    )
+    print(f"{'load':<8} {'store':<9} {'ms':>8} {'round trips':>12} {'hit ratio':>10}")
+    lookups = {
+        label: asyncio.run(_lookups(label == "filtered", seen, stream))
+        for label in ("direct", "filtered")
+    }
+    dedupe = {
+        label: asyncio.run(_dedupe(label == "filtered", seen, stream))
+        for label in ("direct", "filtered")
+    }
+    for label, (elapsed, trips, _, hit_ratio) in lookups.items():
+        print(
+            f"{'lookups':<8} {label:<9} {elapsed * 1000:>8.1f} {trips:>12} "
+            f"{hit_ratio:>10.2%}"
+        )
+    for label, (elapsed, trips, _) in dedupe.items():
+        print(f"{'dedupe':<8} {label:<9} {elapsed * 1000:>8.1f} {trips:>12}")
+
+    expected = [m in set(seen) for m in stream]
+    assert lookups["direct"][2] == lookups["filtered"][2] == expected
+    assert dedupe["direct"][2] == dedupe["filtered"][2] == [not e for e in expected]
+    new_share = 1 - SEEN_SHARE
+    assert lookups["filtered"][3] > new_share * (1 - 2 * FALSE_POSITIVE_RATE)
+    assert lookups["filtered"][0] < lookups["direct"][0]
+    assert dedupe["filtered"][1] < dedupe["direct"][1]
+    assert dedupe["filtered"][0] < dedupe["direct"][0]
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Conformance check microbenchmark.
+
+Compares ``omnibase_spi.protocols.conformance.conforms`` with plain
+``isinstance`` for every runtime-checkable protocol in
+``omnibase_spi._LAZY_PROTOCOL_MAP``, against a conforming object, an object
+missing one member and an unrelated object.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_conformance_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import pytest
+
+import omnibase_spi
+from omnibase_spi.protocols.conformance import clear_conformance_cache, conforms
+
+NUMBER = 2_000
+REPEAT = 5
+
+
+class Unrelated:
+    """Conforms to no protocol."""
+
+
+def _runtime_protocols() -> list[type]:
+    """Resolve every runtime-checkable protocol exported lazily from the root."""
+    protocols = [
+        getattr(omnibase_spi, name) for name in omnibase_spi._LAZY_PROTOCOL_MAP
+    ]
+    return [p for p in protocols if getattr(p, "_is_runtime_protocol", False)]
+
+
+def _samples(protocol: type) -> dict[str, object]:
+    """Build a conforming, a near-miss and an unrelated object for ``protocol``."""
+    members = sorted(protocol.__protocol_attrs__)  # type: ignore[attr-defined]
+    full = type("Full", (), dict.fromkeys(members, lambda _self: None))
+    near_miss = type("NearMiss", (), dict.fromkeys(members[:-1], lambda _self: None))
+    return {"conforming": full(), "near-miss": near_miss(), "unrelated": Unrelated()}
+
+
+def _best_ns(func: object) -> float:
+    """Return the best per-call time of ``func`` in nanoseconds."""
+    timer = timeit.Timer(func)  # type: ignore[arg-type]
+    return min(timer.repeat(repeat=REPEAT, number=NUMBER)) / NUMBER * 1e9
+
+
+@pytest.mark.benchmark
+def test_conforms_matches_and_outpaces_isinstance() -> None:
+    """Report per-protocol timings and require identical verdicts overall."""
+    clear_conformance_cache()
+    totals = {"isinstance": 0.0, "conforms": 0.0}
+
+    print(f"\n{'protocol':<42} {'sample':<11} {'isinstance':>11} {'conforms':>10}")
+    for protocol in _runtime_protocols():
+        for label, obj in _samples(protocol).items():
+            assert conforms(obj, protocol) is isinstance(obj, protocol), (
+                f"{protocol.__name__}/{label}: conforms disagrees with isinstance"
+            )
+            baseline = _best_ns(lambda obj=obj, p=protocol: isinstance(obj, p))
+            cached = _best_ns(lambda obj=obj, p=protocol: conforms(obj, p))
+            totals["isinstance"] += baseline
+            totals["conforms"] += cached
+            print(
+                f"{protocol.__name__:<42} {label:<11} "
+                f"{baseline:>8.0f} ns {cached:>7.0f} ns"
+            )
+
+    speedup = totals["isinstance"] / totals["conforms"]
+    print(
+        f"{'total':<54} {totals['isinstance']:>8.0f} ns {totals['conforms']:>7.0f} ns"
+    )
+    print(f"speedup: {speedup:.2f}x")
+    assert totals["conforms"] < totals["isinstance"]
@@ -0,0 +1,224 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+DLQ replay benchmark.
+
+Drains an in-memory DLQ of 1,000,000 entries with
+``examples.reference.ReplayingDLQHandler``: half in one replay that
+checkpoints to a file, the rest in a new handler resuming from that file.
+Reports elapsed time, throughput and the ETA ``get_metrics`` gave after the
+first half. Every entry must be replayed exactly once, each key in DLQ
+order.
+
+Then replays a smaller DLQ to a producer that simulates send latency, and
+compares:
+
+- serial: each entry decoded and sent one at a time, the loop of a plain
+  ``ProtocolDLQHandler.reprocess_dlq``.
+- parallel: the replayer with bounded concurrency and no rate limit.
+- rate limited: the replayer held to a fixed rate.
+
+The parallel replay must be faster than the serial one, and the rate
+limited one must stay within its rate.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_dlq_replay_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from examples.reference.dlq_replayer import ReplayingDLQHandler
+
+DLQ = "onex.evt.git.hook.v1.dlq"
+ENTRIES = 1_000_000
+KEYS = 1_000
+PAGE_SIZE = 10_000
+CONCURRENCY = 64
+
+LATENCY_ENTRIES = 2_000
+SEND_SECONDS = 0.001
+RATE_PER_SECOND = 2_000.0
+
+_RECORD = (
+    b'{"original_topic":"onex.evt.git.hook.v1",'
+    b'"original_envelope":{"sequence":%d},'
+    b'"error_message":"TimeoutError: downstream timed out",'
+    b'"error_timestamp":1735689600.0,"retry_count":3}'
+)
+# Length of b'{"sequence":', the prefix of each replayed envelope.
+_PREFIX = 12
+
+
+@dataclass(slots=True)
+class _Message:
+    key: bytes | None
+    value: bytes
+    topic: str = DLQ
+    partition: int | None = 0
+    offset: int | None = None
+    timestamp: int | None = None
+    headers: dict[str, bytes] = field(default_factory=dict)
+
+
+class _Reader:
+    """DLQ held in a list."""
+
+    def __init__(self, entries: list[_Message]) -> None:
+        self.entries = entries
+
+    async def read(
+        self, dlq_topic: str, position: int, max_entries: int
+    ) -> Sequence[_Message]:
+        """Slice of the DLQ."""
+        return self.entries[position : position + max_entries]
+
+    async def end_position(self, dlq_topic: str) -> int:
+        """DLQ length."""
+        return len(self.entries)
+
+
+class _Producer:
+    """Producer recording each key's sequences, with optional latency."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.sent: dict[bytes | None, list[int]] = {}
+
+    async def send(
+        self, topic: str, value: bytes, key: bytes | None = None, **_: object
+    ) -> None:
+        """Record the send."""
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.setdefault(key, []).append(int(value[_PREFIX:-1]))
+
+    async def flush(self, timeout_seconds: float = 30.0) -> None:
+        """Nothing is buffered."""
+
+
+def _entries(count: int) -> list[_Message]:
+    keys = [f"repo-{k}".encode() for k in range(KEYS)]
+    return [_Message(keys[i % KEYS], _RECORD % i) for i in range(count)]
+
+
+def _assert_replayed_once(producer: _Producer, count: int) -> None:
+    assert sum(map(len, producer.sent.values())) == count
+    assert all(values == sorted(values) for values in producer.sent.values())
+    assert sorted(v for values in producer.sent.values() for v in values) == list(
+        range(count)
+    )
+
+
+async def _serial(reader: _Reader, producer: _Producer) -> int:
+    replayed = 0
+    for message in await reader.read(DLQ, 0, len(reader.entries)):
+        record = json.loads(message.value)
+        envelope = json.dumps(record["original_envelope"], separators=(",", ":"))
+        await producer.send(
+            record["original_topic"], envelope.encode(), key=message.key
+        )
+        replayed += 1
+    return replayed
+
+
+@pytest.mark.benchmark
+def test_drains_a_million_entries_across_a_restart(tmp_path: Path) -> None:
+    """Replay 1M entries in two runs joined by a checkpoint file."""
+    path = tmp_path / "checkpoints.json"
+    reader = _Reader(_entries(ENTRIES))
+    producer = _Producer()
+
+    async def drain() -> tuple[float, float, dict[str, object]]:
+        start = time.perf_counter()
+        first = ReplayingDLQHandler(
+            reader,
+            producer,  # type: ignore[arg-type]
+            concurrency=CONCURRENCY,
+            page_size=PAGE_SIZE,
+            checkpoint_path=path,
+        )
+        await first.reprocess_dlq(DLQ, limit=ENTRIES // 2)
+        halfway = time.perf_counter() - start
+        metrics = await first.get_metrics()
+        assert isinstance(metrics, dict)
+        resumed = ReplayingDLQHandler(
+            reader,
+            producer,  # type: ignore[arg-type]
+            concurrency=CONCURRENCY,
+            page_size=PAGE_SIZE,
+            checkpoint_path=path,
+        )
+        results = await resumed.reprocess_dlq(DLQ)
+        assert isinstance(results, dict)
+        assert results["checkpoint"] == ENTRIES
+        return halfway, time.perf_counter() - start, metrics
+
+    halfway, elapsed, metrics = asyncio.run(drain())
+    eta, rate = metrics["replay_eta_seconds"], metrics["replay_rate_per_second"]
+    assert isinstance(eta, float) and isinstance(rate, float)
+    print(
+        f"\n{ENTRIES} entries, {KEYS} keys, pages of {PAGE_SIZE}, "
+        f"concurrency {CONCURRENCY}"
+    )
+    print(
+        f"first half {halfway:.2f} s at {rate:,.0f} entries/s, "
+        f"ETA for the rest {eta:.2f} s"
+    )
+    print(
+        f"resumed half {elapsed - halfway:.2f} s, "
+        f"total {elapsed:.2f} s, {ENTRIES / elapsed:,.0f} entries/s"
+    )
+
+    _assert_replayed_once(producer, ENTRIES)
+    assert json.loads(path.read_text()) == {DLQ: ENTRIES}
+
+
+@pytest.mark.benchmark
+def test_parallel_replay_hides_send_latency() -> None:
+    """Compare serial, parallel and rate-limited replay over a slow producer."""
+    entries = _entries(LATENCY_ENTRIES)
+
+    async def replay(label: str) -> tuple[float, _Producer]:
+        reader = _Reader(entries)
+        producer = _Producer(SEND_SECONDS)
+        start = time.perf_counter()
+        if label == "serial":
+            await _serial(reader, producer)
+        else:
+            handler = ReplayingDLQHandler(
+                reader,
+                producer,  # type: ignore[arg-type]
+                concurrency=CONCURRENCY,
+                rate_per_second=RATE_PER_SECOND if label == "rate limited" else None,
+                page_size=1_000,
+            )
+            await handler.reprocess_dlq(DLQ)
+        return time.perf_counter() - start, producer
+
+    print(
+        f"\nsend {SEND_SECONDS * 1000:.1f} ms, {LATENCY_ENTRIES} entries, "
+        f"concurrency {CONCURRENCY}, limit {RATE_PER_SECOND:.0f}/s"
+    )
+    print(f"{'path':<13} {'ms':>8} {'entries/s':>10}")
+    runs = {
+        label: asyncio.run(replay(label))
+        for label in ("serial", "parallel", "rate limited")
+    }
+    for label, (elapsed, producer) in runs.items():
+        print(f"{label:<13} {elapsed * 1000:>8.1f} {LATENCY_ENTRIES / elapsed:>10.0f}")
+        _assert_replayed_once(producer, LATENCY_ENTRIES)
+
+    assert runs["parallel"][0] < runs["serial"][0]
+    # The burst of CONCURRENCY replays is allowed above the rate.
+    floor = (LATENCY_ENTRIES - CONCURRENCY) / RATE_PER_SECOND
+    assert runs["rate limited"][0] >= floor * 0.9
@@ -0,0 +1,215 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Envelope chunker benchmark.
+
+Chunks and reassembles 1 MB, 16 MB and 128 MB envelopes with the reference
+``examples.reference.EnvelopeChunker`` / ``ChunkReassembler`` and with the
+straightforward chunker the protocol docstring describes (``bytes`` slices,
+separate checksum passes, sort and ``b"".join`` on reassembly). Reported:
+
+- chunk: time and peak traced memory to produce all chunks;
+- reassemble: batch reassembly of shuffled chunks, and streaming
+  reassembly fed the same chunks one at a time;
+- last chunk: time from the final chunk's arrival to the envelope, which
+  is what a consumer waits for once the transport has delivered everything.
+
+Chunks from either implementation must reassemble with the other. The
+reference chunker must use less memory (and be faster at 128 MB, where
+the saved copy outweighs timing noise), and streaming reassembly must hand
+over the envelope sooner after the last in-order chunk than batch
+reassembly takes.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_envelope_chunker_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from uuid import uuid4
+
+import pytest
+
+from examples.reference.envelope_chunker import ChunkReassembler, EnvelopeChunker
+from omnibase_core.models.chunking.model_chunk_metadata import ModelChunkMetadata
+from omnibase_core.models.chunking.model_chunked_envelope import (
+    ModelChunkedEnvelope,
+)
+
+SIZES_MB = (1, 16, 128)
+CHUNK_SIZE = 256_000
+MAX_CHUNK_COUNT = 1024
+REPEAT = 3
+
+# Reproducible shuffles; not used for anything security related.
+_RNG = random.Random(7)  # noqa: S311
+
+
+class _Envelope:
+    """Chunkable envelope wrapping raw bytes."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def to_bytes(self) -> bytes:
+        return self.data
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> _Envelope:
+        return cls(data)
+
+
+def _sha256(data: bytes) -> str:
+    return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+
+class _NaiveChunker:
+    """Slice-copy chunker with a separate pass per checksum."""
+
+    def chunk(
+        self, envelope: _Envelope, max_chunk_size: int
+    ) -> list[ModelChunkedEnvelope]:
+        data = envelope.to_bytes()
+        series_id = uuid4()
+        payload_checksum = _sha256(data)
+        starts = range(0, len(data), max_chunk_size)
+        chunks = []
+        for index, start in enumerate(starts):
+            piece = data[start : start + max_chunk_size]
+            chunks.append(
+                ModelChunkedEnvelope(
+                    envelope_headers={},
+                    chunk_metadata=ModelChunkMetadata(
+                        chunk_series_id=series_id,
+                        chunk_index=index,
+                        chunk_count=len(starts),
+                        chunk_size=len(piece),
+                        total_size=len(data),
+                        payload_checksum=payload_checksum,
+                        chunk_checksum=_sha256(piece),
+                        reassembly_strategy="any_order",
+                    ),
+                    chunk_payload=piece,
+                )
+            )
+        return chunks
+
+    def reassemble(self, chunks: list[ModelChunkedEnvelope]) -> _Envelope:
+        ordered = sorted(chunks, key=lambda c: c.chunk_metadata.chunk_index)
+        for chunk in ordered:
+            if (
+                _sha256(bytes(chunk.chunk_payload))
+                != chunk.chunk_metadata.chunk_checksum
+            ):
+                raise ValueError("chunk checksum mismatch")
+        data = b"".join(chunk.chunk_payload for chunk in ordered)
+        if _sha256(data) != ordered[0].chunk_metadata.payload_checksum:
+            raise ValueError("payload checksum mismatch")
+        return _Envelope.from_bytes(data)
+
+
+def _best_ms(func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def _peak_mb(func: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def _stream(chunks: list[ModelChunkedEnvelope]) -> _Envelope:
+    reassembler = ChunkReassembler(
+        _Envelope, max_chunk_count=MAX_CHUNK_COUNT, max_buffered_bytes=2**30
+    )
+    for chunk in chunks:
+        envelope = reassembler.add(chunk)
+    assert envelope is not None
+    return envelope  # type: ignore[return-value]
+
+
+def _last_chunk_ms(chunks: list[ModelChunkedEnvelope]) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        reassembler = ChunkReassembler(
+            _Envelope, max_chunk_count=MAX_CHUNK_COUNT, max_buffered_bytes=2**30
+        )
+        for chunk in chunks[:-1]:
+            reassembler.add(chunk)
+        start = time.perf_counter()
+        envelope = reassembler.add(chunks[-1])
+        best = min(best, time.perf_counter() - start)
+        assert envelope is not None
+    return best * 1000
+
+
+@pytest.mark.benchmark
+def test_reference_chunker_is_faster_and_leaner() -> None:
+    """Compare chunking, reassembly and last-chunk latency at 1/16/128 MB."""
+    reference = EnvelopeChunker(_Envelope, max_chunk_count=MAX_CHUNK_COUNT)
+    naive = _NaiveChunker()
+    print(f"\nchunk size {CHUNK_SIZE} B")
+    print(
+        f"{'size':>6} {'chunker':<10} {'chunk ms':>9} {'peak MB':>8} "
+        f"{'batch ms':>9} {'stream ms':>10} {'last ms':>8}"
+    )
+    for size_mb in SIZES_MB:
+        envelope = _Envelope(os.urandom(size_mb * 2**20))
+        reference_chunks = reference.chunk(envelope, CHUNK_SIZE)
+        naive_chunks = naive.chunk(envelope, CHUNK_SIZE)
+        order = list(range(len(reference_chunks)))
+        _RNG.shuffle(order)
+        shuffled_reference = [reference_chunks[i] for i in order]
+        shuffled_naive = [naive_chunks[i] for i in order]
+
+        assert reference.reassemble(shuffled_naive).to_bytes() == envelope.data  # type: ignore[attr-defined]
+        assert naive.reassemble(shuffled_reference).to_bytes() == envelope.data
+
+        def chunk_reference(envelope: _Envelope = envelope) -> object:
+            return reference.chunk(envelope, CHUNK_SIZE)
+
+        def chunk_naive(envelope: _Envelope = envelope) -> object:
+            return naive.chunk(envelope, CHUNK_SIZE)
+
+        reference_row = (
+            _best_ms(chunk_reference),
+            _peak_mb(chunk_reference),
+            _best_ms(partial(reference.reassemble, shuffled_reference)),
+            _best_ms(partial(_stream, shuffled_reference)),
+            _last_chunk_ms(reference_chunks),
+        )
+        naive_ms = _best_ms(partial(naive.reassemble, shuffled_naive))
+        naive_row = (
+            _best_ms(chunk_naive),
+            _peak_mb(chunk_naive),
+            naive_ms,
+            naive_ms,
+            naive_ms,
+        )
+        for label, row in (("reference", reference_row), ("naive", naive_row)):
+            chunk_ms, peak_mb, batch_ms, stream_ms, last_ms = row
+            print(
+                f"{size_mb:>4}MB {label:<10} {chunk_ms:>9.1f} {peak_mb:>8.1f} "
+                f"{batch_ms:>9.1f} {stream_ms:>10.1f} {last_ms:>8.1f}"
+            )
+
+        assert reference_row[1] < naive_row[1]
+        assert reference_row[4] < naive_row[4]
+        if size_mb == SIZES_MB[-1]:
+            assert reference_row[0] < naive_row[0]
@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+In-memory event bus benchmark.
+
+Publishes keyed messages through ``examples.reference.InMemoryEventBus`` and
+through the common hand-rolled bus it replaces (one bounded
+``asyncio.Queue`` and consumer task per subscriber) at 1, 8 and 64
+subscribers. Reports messages/sec (published messages until every
+subscriber has handled them) and p50/p99 publish-to-handler latency. Every
+subscriber must receive every message in both buses, and the reference bus
+must deliver more messages/sec at 8 and 64 subscribers.
+
+The numbers are a baseline that other ``ProtocolEventBusBase`` adapters can
+be measured against with the same harness.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_event_bus_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections.abc import Callable
+from typing import Protocol
+
+import pytest
+
+from examples.reference.in_memory_event_bus import InMemoryEventBus
+
+TOPIC = "onex.evt.benchmark.v1"
+SUBSCRIBER_COUNTS = (1, 8, 64)
+# Deliveries per run; the message count shrinks as subscribers grow.
+DELIVERIES = 128_000
+MIN_MESSAGES = 2_000
+KEYS = 256
+# Both buses buffer at most QUEUE_SIZE messages per subscriber.
+QUEUE_SIZE = 1024
+PARTITIONS = 8
+REPEAT = 3
+
+
+class _Event:
+    """ProtocolEventMessage stand-in stamped with its publish time."""
+
+    __slots__ = ("headers", "key", "offset", "partition", "published_ns", "topic")
+
+    def __init__(self, key: bytes) -> None:
+        self.topic = TOPIC
+        self.key = key
+        self.headers = None
+        self.offset = None
+        self.partition = None
+        self.published_ns = 0
+
+    @property
+    def value(self) -> bytes:
+        return b""
+
+    async def ack(self) -> None:
+        """No-op acknowledgement."""
+
+
+class _Subscriber:
+    """Handler that counts deliveries and records their latency."""
+
+    def __init__(self, latencies: list[int]) -> None:
+        self.received = 0
+        self._latencies = latencies
+
+    async def __call__(self, message: _Event) -> None:
+        self.received += 1
+        self._latencies.append(time.perf_counter_ns() - message.published_ns)
+
+
+class _Bus(Protocol):
+    async def publish(self, event: _Event) -> None: ...
+    async def subscribe(self, topic: str, handler: _Subscriber) -> None: ...
+    async def start_consuming(self) -> None: ...
+    async def stop_consuming(self) -> None: ...
+
+
+def _reference_bus() -> InMemoryEventBus:
+    return InMemoryEventBus(
+        partitions=PARTITIONS, partition_capacity=QUEUE_SIZE // PARTITIONS
+    )
+
+
+class _QueuePerSubscriberBus:
+    """The baseline: a bounded queue and a consumer task per subscriber."""
+
+    def __init__(self) -> None:
+        self._subscribers: list[tuple[asyncio.Queue[_Event], _Subscriber]] = []
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def publish(self, event: _Event) -> None:
+        for queue, _ in self._subscribers:
+            await queue.put(event)
+
+    async def subscribe(self, topic: str, handler: _Subscriber) -> None:
+        self._subscribers.append((asyncio.Queue(QUEUE_SIZE), handler))
+
+    async def start_consuming(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._consume(queue, handler))
+            for queue, handler in self._subscribers
+        ]
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def stop_consuming(self) -> None:
+        for queue, _ in self._subscribers:
+            await queue.join()
+        for task in self._tasks:
+            task.cancel()
+
+    @staticmethod
+    async def _consume(queue: asyncio.Queue[_Event], handler: _Subscriber) -> None:
+        while True:
+            message = await queue.get()
+            await handler(message)
+            queue.task_done()
+
+
+async def _run_once(
+    bus: _Bus, subscribers: int, messages: int
+) -> tuple[float, list[int], int]:
+    latencies: list[int] = []
+    handlers = [_Subscriber(latencies) for _ in range(subscribers)]
+    for handler in handlers:
+        await bus.subscribe(TOPIC, handler)
+    keys = [f"entity-{i}".encode() for i in range(KEYS)]
+    events = [_Event(keys[i % KEYS]) for i in range(messages)]
+
+    consumer = asyncio.create_task(bus.start_consuming())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for event in events:
+        event.published_ns = time.perf_counter_ns()
+        await bus.publish(event)
+    await bus.stop_consuming()
+    elapsed = time.perf_counter() - start
+    await consumer
+    return elapsed, latencies, min(handler.received for handler in handlers)
+
+
+def _measure(
+    make_bus: Callable[[], _Bus], subscribers: int
+) -> tuple[float, float, float]:
+    """Return best msgs/sec and the p50/p99 latency (µs) of that run."""
+    messages = max(MIN_MESSAGES, DELIVERIES // subscribers)
+    best: tuple[float, list[int]] | None = None
+    for _ in range(REPEAT):
+        elapsed, latencies, received = asyncio.run(
+            _run_once(make_bus(), subscribers, messages)
+        )
+        assert received == messages
+        if best is None or elapsed < best[0]:
+            best = (elapsed, latencies)
+    assert best is not None
+    elapsed, latencies = best
+    percentiles = statistics.quantiles(latencies, n=100)
+    return messages / elapsed, percentiles[49] / 1000, percentiles[98] / 1000
+
+
+@pytest.mark.benchmark
+def test_reference_bus_outpaces_queue_per_subscriber() -> None:
+    """Compare throughput and latency at 1, 8 and 64 subscribers."""
+    print(
+        f"\n{'subscribers':>11} {'bus':<22} {'msgs/s':>10} "
+        f"{'p50 µs':>10} {'p99 µs':>10}"
+    )
+    results: dict[int, tuple[float, float]] = {}
+    for subscribers in SUBSCRIBER_COUNTS:
+        rates = []
+        for label, make_bus in (
+            ("InMemoryEventBus", _reference_bus),
+            ("queue per subscriber", _QueuePerSubscriberBus),
+        ):
+            rate, p50, p99 = _measure(make_bus, subscribers)
+            rates.append(rate)
+            print(
+                f"{subscribers:>11} {label:<22} {rate:>10.0f} {p50:>10.1f} {p99:>10.1f}"
+            )
+        results[subscribers] = (rates[0], rates[1])
+
+    for subscribers in (8, 64):
+        reference, baseline = results[subscribers]
+        assert reference > baseline
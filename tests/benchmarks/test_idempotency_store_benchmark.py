@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Idempotency store benchmark.
+
+Compares ``examples.reference.ShardedIdempotencyStore`` with the store the
+``ProtocolIdempotencyStore`` docstring describes for testing: one ``dict``
+keyed by ``(domain, UUID)`` holding ``datetime`` values behind a single
+``threading.Lock``, cleaned up by scanning every record. Reported:
+
+- dedupe: threads, each with its own event loop and starting at its own
+  offset, race to record the same ids in several domains; checks/sec for
+  per-message calls and for the sharded store's ``check_and_record_many``.
+  The GIL serializes the threads, so per-message throughput is bound by
+  interpreter overhead rather than by lock contention, and the sharded
+  store's extra shard lookup makes it slightly slower per message. It is
+  reported, not asserted;
+- memory: traced bytes per stored record;
+- cleanup: ``cleanup_expired`` on a store holding ten days of records,
+  once with a cutoff that removes a day's worth and once, as a periodic
+  job runs most of the time, with nothing due. Each is the best of
+  three freshly filled stores.
+
+Every id must be won exactly once per domain in both stores. The sharded
+store must use less memory, its batch API must outpace per-message calls
+on the single-lock store, and its cleanups must beat the full scans.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_idempotency_store_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.sharded_idempotency_store import ShardedIdempotencyStore
+
+THREADS = 8
+DOMAINS = ("billing", "registration", "notifications", "audit")
+IDS_PER_DOMAIN = 25_000
+BATCH_SIZE = 256
+MEMORY_RECORDS = 100_000
+CLEANUP_RECORDS = 300_000
+CLEANUP_DAYS = 10
+CLEANUP_REPEAT = 3
+DAY = 24 * 3600
+# 2025-01-01T00:00:00Z
+EPOCH = 1_735_689_600.0
+
+
+class _LockedDictStore:
+    """Single-lock dict store with full-scan cleanup."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._processed: dict[tuple[str | None, UUID], datetime] = {}
+        self._lock = threading.Lock()
+        self._clock = clock
+
+    async def check_and_record(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> bool:
+        """Record unless recorded."""
+        key = (domain, message_id)
+        with self._lock:
+            if key in self._processed:
+                return False
+            self._processed[key] = datetime.fromtimestamp(self._clock(), UTC)
+            return True
+
+    async def mark_processed(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+        processed_at: datetime | None = None,
+    ) -> None:
+        """Record unconditionally."""
+        with self._lock:
+            self._processed[domain, message_id] = processed_at or datetime.now(UTC)
+
+    async def cleanup_expired(self, ttl_seconds: int) -> int:
+        """Scan every record."""
+        cutoff = datetime.fromtimestamp(self._clock(), UTC) - timedelta(
+            seconds=ttl_seconds
+        )
+        with self._lock:
+            expired = [k for k, at in self._processed.items() if at < cutoff]
+            for key in expired:
+                del self._processed[key]
+        return len(expired)
+
+
+_Race = Callable[[list[UUID], str], Awaitable[list[bool]]]
+
+
+def _race(race: _Race, ids: list[UUID]) -> tuple[float, list[list[bool]]]:
+    """Run ``race`` for every domain on every thread; return secs and wins."""
+    barrier = threading.Barrier(THREADS)
+    wins: list[list[bool]] = [[] for _ in range(THREADS)]
+
+    async def drive(offset: int, results: list[bool]) -> None:
+        # Each thread starts at its own offset, as consumers of different
+        # partitions would, and wraps around to see every id.
+        rotated = ids[offset:] + ids[:offset]
+        for domain in DOMAINS:
+            won = await race(rotated, domain)
+            results.extend(won[len(ids) - offset :] + won[: len(ids) - offset])
+
+    def worker(offset: int, results: list[bool]) -> None:
+        barrier.wait()
+        asyncio.run(drive(offset, results))
+
+    threads = [
+        threading.Thread(target=worker, args=(i * len(ids) // THREADS, results))
+        for i, results in enumerate(wins)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, wins
+
+
+def _per_message(store: _LockedDictStore | ShardedIdempotencyStore) -> _Race:
+    async def race(ids: list[UUID], domain: str) -> list[bool]:
+        return [await store.check_and_record(message_id, domain) for message_id in ids]
+
+    return race
+
+
+def _batched(store: ShardedIdempotencyStore) -> _Race:
+    async def race(ids: list[UUID], domain: str) -> list[bool]:
+        results: list[bool] = []
+        for start in range(0, len(ids), BATCH_SIZE):
+            batch = ids[start : start + BATCH_SIZE]
+            results.extend(await store.check_and_record_many(batch, domain))
+        return results
+
+    return race
+
+
+def _assert_single_winner(wins: Sequence[list[bool]]) -> None:
+    assert [sum(column) for column in zip(*wins, strict=True)] == [1] * len(wins[0])
+
+
+def _bytes_per_record(build: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        store = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert store is not None
+    return size / MEMORY_RECORDS
+
+
+def _fill(store: _LockedDictStore | ShardedIdempotencyStore, count: int) -> object:
+    async def fill() -> None:
+        step = CLEANUP_DAYS * DAY / count
+        for i in range(count):
+            at = datetime.fromtimestamp(EPOCH - i * step, UTC)
+            await store.mark_processed(uuid4(), DOMAINS[i % 4], processed_at=at)
+
+    asyncio.run(fill())
+    return store
+
+
+def _cleanup_ms(store: _LockedDictStore | ShardedIdempotencyStore, ttl: int) -> float:
+    start = time.perf_counter()
+    asyncio.run(store.cleanup_expired(ttl))
+    return (time.perf_counter() - start) * 1000
+
+
+def _cleanups(store: _LockedDictStore | ShardedIdempotencyStore) -> tuple[float, float]:
+    """Fill ``store``; time a cleanup removing a day, then one with none due."""
+    _fill(store, CLEANUP_RECORDS)
+    ttl = (CLEANUP_DAYS - 1) * DAY
+    return _cleanup_ms(store, ttl), _cleanup_ms(store, ttl)
+
+
+@pytest.mark.benchmark
+def test_sharded_store_dedupes_and_cleans_up_faster() -> None:
+    """Compare dedupe throughput, memory and cleanup against a locked dict."""
+    ids = [uuid4() for _ in range(IDS_PER_DOMAIN)]
+    checks = THREADS * len(DOMAINS) * len(ids)
+    locked = _LockedDictStore()
+    sharded = ShardedIdempotencyStore()
+    rows = {
+        "locked dict": _race(_per_message(locked), ids),
+        "sharded": _race(_per_message(sharded), ids),
+        "sharded batch": _race(_batched(ShardedIdempotencyStore()), ids),
+    }
+    print(f"\n{THREADS} threads x {len(DOMAINS)} domains x {len(ids)} ids")
+    print(f"{'store':<14} {'checks/s':>10}")
+    for label, (elapsed, wins) in rows.items():
+        _assert_single_winner(wins)
+        print(f"{label:<14} {checks / elapsed:>10.0f}")
+
+    def build_locked() -> object:
+        return _fill(_LockedDictStore(), MEMORY_RECORDS)
+
+    def build_sharded() -> object:
+        return _fill(ShardedIdempotencyStore(), MEMORY_RECORDS)
+
+    locked_bytes = _bytes_per_record(build_locked)
+    sharded_bytes = _bytes_per_record(build_sharded)
+    print(f"bytes/record: locked dict {locked_bytes:.0f}, sharded {sharded_bytes:.0f}")
+
+    def clock() -> float:
+        return EPOCH
+
+    cleanup: dict[str, tuple[float, float]] = {}
+    for label, factory in (
+        ("locked dict", lambda: _LockedDictStore(clock)),
+        ("sharded", lambda: ShardedIdempotencyStore(clock=clock)),
+    ):
+        runs = [_cleanups(factory()) for _ in range(CLEANUP_REPEAT)]
+        cleanup[label] = (min(day for day, _ in runs), min(none for _, none in runs))
+    print(f"cleanup of {CLEANUP_RECORDS} records over {CLEANUP_DAYS} days")
+    print(f"{'store':<14} {'1 day ms':>9} {'none ms':>9}")
+    for label, (day_ms, none_ms) in cleanup.items():
+        print(f"{label:<14} {day_ms:>9.1f} {none_ms:>9.2f}")
+
+    assert sharded_bytes < locked_bytes
+    assert rows["sharded batch"][0] < rows["locked dict"][0]
+    assert cleanup["sharded"][0] < cleanup["locked dict"][0]
+    assert cleanup["sharded"][1] < cleanup["locked dict"][1]
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Import-time budget benchmarks.
+
+Each target is imported in fresh interpreters under ``-X importtime`` and its
+median cumulative import time is compared with the checked-in budget in
+``import_time_budget.json``. On failure the heaviest submodule groups are
+reported so the regression can be attributed.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_import_time_budget.py -v -s
+
+Refresh budgets after an intentional change with:
+    uv run python -m tests.benchmarks.import_time --write-budget
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.benchmarks.import_time import (
+    all_targets,
+    attribute_cost,
+    format_attribution,
+    load_budget,
+    measure,
+    parse_importtime,
+    target_cost_us,
+)
+
+SAMPLE_TRACE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | _io
+import time:        40 |         40 |     omnibase_core.enums.enum_a
+import time:        60 |        100 |   omnibase_core.enums
+import time:       300 |        400 | omnibase_spi
+import time:        20 |         20 |   omnibase_spi.protocols.core.protocol_logger
+import time:        30 |         50 | omnibase_spi.protocols.core
+import time:        10 |         10 | typing_extensions
+"""
+
+
+@pytest.mark.unit
+class TestImportTimeHarness:
+    """Tests for the ``-X importtime`` trace parser and attribution."""
+
+    def test_parse_importtime_depths(self) -> None:
+        """Verify nesting depth is derived from trace indentation."""
+        records = parse_importtime(SAMPLE_TRACE)
+
+        assert [r.module for r in records][:3] == [
+            "_io",
+            "omnibase_core.enums.enum_a",
+            "omnibase_core.enums",
+        ]
+        assert [r.depth for r in records] == [0, 2, 1, 0, 1, 0, 0]
+
+    def test_module_target_cost_and_attribution(self) -> None:
+        """Verify a module target owns only the lines nested beneath it."""
+        records = parse_importtime(SAMPLE_TRACE)
+
+        assert target_cost_us(records, "omnibase_spi") == 400
+        assert attribute_cost(records, "omnibase_spi") == {
+            "omnibase_spi": 300,
+            "omnibase_core.enums": 100,
+        }
+
+    def test_lazy_export_cost_counts_imports_after_root(self) -> None:
+        """Verify a lazy export owns top-level imports after ``omnibase_spi``."""
+        records = parse_importtime(SAMPLE_TRACE)
+
+        assert target_cost_us(records, "omnibase_spi.ProtocolLogger") == 60
+        assert attribute_cost(records, "omnibase_spi.ProtocolLogger") == {
+            "omnibase_spi.protocols": 50,
+            "typing_extensions": 10,
+        }
+
+    def test_budget_covers_every_target(self) -> None:
+        """Verify the budget file has exactly one entry per measured target."""
+        assert sorted(load_budget()) == sorted(all_targets())
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("target", all_targets())
+def test_import_time_within_budget(target: str) -> None:
+    """Fail when a target's median cold import time exceeds its budget."""
+    budget_ms = load_budget()[target]
+
+    measurement = measure(target)
+    cumulative_ms = measurement.cumulative_us / 1000
+    print(f"\n{target}: {cumulative_ms:.2f} ms (budget {budget_ms:.0f} ms)")
+    print(format_attribution(measurement))
+
+    assert cumulative_ms <= budget_ms, (
+        f"{target} imports in {cumulative_ms:.2f} ms, over its {budget_ms:.0f} ms "
+        f"budget. Heaviest submodules:\n{format_attribution(measurement)}"
+    )
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Indexed node scheduling benchmark.
+
+Schedules 1,000,000 tasks over 10,000 nodes with
+``examples.reference.IndexedNodeRegistry``. Each node has 3 of 20
+capabilities, one of 4 node types, 16 task slots and 32 CPUs. Each task
+requires one capability, prefers another and needs 1 or 2 CPUs. For every
+task the benchmark discovers a node, reserves the CPUs and assigns the
+task. Once 60,000 tasks run, the oldest one finishes: it is completed,
+its CPUs are released and its execution metrics are recorded. Every one
+of these calls rescores the node.
+
+Every 5,000th task is also scheduled the naive way, by scoring all 10,000
+nodes with ``calculate_scheduling_score``. Reports the mean time of an
+indexed discovery, of a whole scheduling cycle, and of a naive
+discovery. Both ways must pick the same nodes, and indexed discovery
+must be faster.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_node_scheduling_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from examples.reference.indexed_node_registry import (
+    IndexedNodeRegistry,
+    TaskSchedulingCriteria,
+    WorkflowNodeCapability,
+    WorkflowNodeInfo,
+)
+
+TASKS = 1_000_000
+NODES = 10_000
+CAPABILITIES = [f"capability-{i}" for i in range(20)]
+NODE_TYPES = ("COMPUTE", "EFFECT", "REDUCER", "ORCHESTRATOR")
+RUNNING = 60_000
+SAMPLE_EVERY = 5_000
+
+
+@dataclass(slots=True)
+class _Task:
+    task_id: UUID
+    task_type: str = "compute"
+    resource_requirements: dict[str, Any] = field(default_factory=dict)
+
+
+def _nodes(rng: random.Random) -> list[WorkflowNodeInfo]:
+    return [
+        WorkflowNodeInfo(
+            node_id=f"node-{i}",
+            node_type=rng.choice(NODE_TYPES),  # type: ignore[arg-type]
+            workflow_capabilities=[
+                WorkflowNodeCapability(f"node-{i}-{name}", name)
+                for name in rng.sample(CAPABILITIES, 3)
+            ],
+            max_concurrent_tasks=16,
+        )
+        for i in range(NODES)
+    ]
+
+
+def _criteria(rng: random.Random) -> TaskSchedulingCriteria:
+    required, preferred = rng.sample(CAPABILITIES, 2)
+    return TaskSchedulingCriteria(
+        task_type="compute",
+        node_type=rng.choice(NODE_TYPES),  # type: ignore[arg-type]
+        required_capabilities=[required],
+        preferred_capabilities=[preferred],
+        resource_requirements={"cpu": rng.choice((1, 2))},
+    )
+
+
+async def _naive(
+    registry: IndexedNodeRegistry,
+    nodes: list[WorkflowNodeInfo],
+    task: _Task,
+    criteria: TaskSchedulingCriteria,
+) -> list[str]:
+    """Score every node and keep the best three."""
+    scores = []
+    for i, node in enumerate(nodes):
+        score = await registry.calculate_scheduling_score(node, task, criteria)  # type: ignore[arg-type]
+        if score > 0:
+            scores.append((-score, i, node.node_id))
+    return [node_id for _, _, node_id in sorted(scores)[:3]]
+
+
+async def _schedule() -> dict[str, float]:
+    rng = random.Random(7)  # noqa: S311
+    registry = IndexedNodeRegistry(object())  # type: ignore[arg-type]
+    nodes = _nodes(rng)
+    for node in nodes:
+        registry.add_node(node, capacity={"cpu": 32})
+
+    running: deque[tuple[str, UUID]] = deque()
+    discover = naive = 0.0
+    samples = unscheduled = 0
+    start = time.perf_counter()
+    for i in range(TASKS):
+        task = _Task(UUID(int=i))
+        criteria = _criteria(rng)
+        begin = time.perf_counter()
+        result = await registry.discover_nodes_for_task(task, criteria)  # type: ignore[arg-type]
+        discover += time.perf_counter() - begin
+        if i % SAMPLE_EVERY == 0:
+            begin = time.perf_counter()
+            expected = await _naive(registry, nodes, task, criteria)
+            naive += time.perf_counter() - begin
+            picked = result.selected_nodes + result.fallback_nodes
+            assert [node.node_id for node in picked] == expected
+            samples += 1
+        if not result.selected_nodes:
+            unscheduled += 1
+            continue
+        node_id = result.selected_nodes[0].node_id
+        assert await registry.reserve_resources(
+            node_id, task.task_id, result.resource_allocation, 3_600
+        )
+        await registry.update_node_workload(node_id, task.task_id, "assigned")
+        running.append((node_id, task.task_id))
+        if len(running) > RUNNING:
+            done_node, done_task = running.popleft()
+            await registry.update_node_workload(done_node, done_task, "completed")
+            await registry.release_resources(done_node, done_task)
+            await registry.record_task_execution_metrics(
+                done_node,
+                done_task,
+                {"success": rng.random() < 0.95, "duration_seconds": 1.0},
+            )
+    total = time.perf_counter() - start - naive
+    return {
+        "total": total,
+        "discover": discover / TASKS,
+        "cycle": total / TASKS,
+        "naive": naive / samples,
+        "unscheduled": unscheduled,
+        "examined": registry.nodes_examined / TASKS,
+        "rescores": registry.rescores,
+        "purges": registry.purges,
+    }
+
+
+@pytest.mark.benchmark
+def test_indexed_scheduling() -> None:
+    """Compare indexed discovery with scoring every node."""
+    run = asyncio.run(_schedule())
+
+    print(f"\n{TASKS} tasks over {NODES} nodes in {run['total']:.1f} s")
+    print(f"indexed discovery   {run['discover'] * 1e6:>10.1f} us/task")
+    print(f"full cycle          {run['cycle'] * 1e6:>10.1f} us/task")
+    print(f"naive discovery     {run['naive'] * 1e6:>10.1f} us/task")
+    print(
+        f"nodes examined {run['examined']:.1f}/task, "
+        f"{run['rescores']:.0f} rescores, {run['purges']:.0f} purges, "
+        f"{run['unscheduled']:.0f} tasks unscheduled"
+    )
+
+    assert run["discover"] < run["naive"]
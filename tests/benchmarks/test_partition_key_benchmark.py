@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Partition-key extraction benchmark.
+
+Builds partition keys for 1M payloads of a two-field (``repo:pr_number``) and
+a one-field (``skill_name``) event type, comparing
+``compile_event_registry().partition_keys`` with the per-message pattern it
+replaces (``EVENT_REGISTRY`` lookup, then ``":".join`` over ``getattr`` of each
+``partition_key_fields`` entry). Keys must be identical and the batch API
+must be faster.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_partition_key_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from omnibase_spi.registry import EVENT_REGISTRY, compile_event_registry
+from omnibase_spi.registry.event_registry import TOPIC_SKILL_ROUTING_FAILED
+
+PAYLOAD_COUNT = 1_000_000
+PR_STATUS = "onex.evt.github.pr-status.v1"
+
+
+class _PRStatus:
+    __slots__ = ("pr_number", "repo")
+
+    def __init__(self, repo: str, pr_number: int) -> None:
+        self.repo = repo
+        self.pr_number = pr_number
+
+
+class _SkillFailure:
+    __slots__ = ("skill_name",)
+
+    def __init__(self, skill_name: str) -> None:
+        self.skill_name = skill_name
+
+
+def _naive_keys(event_type: str, payloads: list[object]) -> list[str]:
+    keys = []
+    for payload in payloads:
+        entry = EVENT_REGISTRY[event_type]
+        keys.append(
+            ":".join(str(getattr(payload, f)) for f in entry.partition_key_fields)
+        )
+    return keys
+
+
+def _timed(func: Callable[[], list[str]]) -> tuple[list[str], float]:
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    ("event_type", "factory"),
+    [
+        (PR_STATUS, lambda i: _PRStatus(f"org/repo-{i % 97}", i)),
+        (TOPIC_SKILL_ROUTING_FAILED, lambda i: _SkillFailure(f"skill-{i % 31}")),
+    ],
+    ids=["two_fields", "one_field"],
+)
+def test_partition_keys_batch_is_faster(
+    event_type: str, factory: Callable[[int], object]
+) -> None:
+    """Compare batch extraction with per-message concatenation."""
+    payloads = [factory(i) for i in range(PAYLOAD_COUNT)]
+    compiled = compile_event_registry()
+
+    naive, naive_ms = _timed(lambda: _naive_keys(event_type, payloads))
+    single, single_ms = _timed(
+        lambda: [compiled.partition_key(event_type, p) for p in payloads]
+    )
+    batch, batch_ms = _timed(lambda: compiled.partition_keys(event_type, payloads))
+
+    print(f"\n{event_type} x {PAYLOAD_COUNT:,}")
+    print(f"  per-message join      {naive_ms:>9.1f} ms")
+    print(f"  partition_key (loop)  {single_ms:>9.1f} ms")
+    print(f"  partition_keys        {batch_ms:>9.1f} ms")
+
+    assert batch == naive
+    assert single == naive
+    assert batch_ms < naive_ms
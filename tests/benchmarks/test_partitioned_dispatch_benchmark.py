@@ -0,0 +1,176 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Partition-key ordered dispatch benchmark.
+
+Consumes a stream of keyed messages from an in-memory consumer with a
+handler that simulates I/O latency, and compares:
+
+- serial: each fetched batch handled one message at a time, then
+  ``commit_offsets``, the loop in the ``ProtocolEventBusConsumer`` example.
+- dispatcher: ``examples.reference.PartitionedDispatcher`` with parallel
+  lanes and watermark commits.
+
+Reports elapsed time, throughput, commits and the deepest lane seen. Both
+must handle every message, with the messages of each key in offset order,
+and commit every partition to its end; the dispatcher must be faster.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_partitioned_dispatch_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import pytest
+
+from examples.reference.partitioned_dispatcher import PartitionedDispatcher
+from omnibase_spi.protocols.event_bus.protocol_event_bus_extended import (
+    ProtocolEventBusMessage,
+)
+
+HANDLER_SECONDS = 0.001
+MESSAGES = 2_000
+PARTITIONS = 4
+KEYS = 200
+BATCH_SIZE = 100
+LANES = 32
+
+# Reproducible key order; not used for anything security related.
+_RNG = random.Random(7)  # noqa: S311
+
+
+@dataclass
+class _Message:
+    key: bytes | None
+    value: bytes
+    topic: str
+    partition: int | None
+    offset: int | None
+    timestamp: int | None = None
+    headers: dict[str, bytes] = field(default_factory=dict)
+
+
+class _Consumer:
+    """In-memory consumer over pre-built batches."""
+
+    def __init__(self, batches: list[list[_Message]]) -> None:
+        self.batches = deque(batches)
+        self.committed: dict[int, int] = {}
+        self.commits = 0
+        self.position: dict[int, int] = {}
+        self.drained = asyncio.Event()
+
+    async def consume_messages_stream(self, batch_timeout_ms: int) -> list[_Message]:
+        """Next batch; empty once drained."""
+        if not self.batches:
+            self.drained.set()
+            await asyncio.sleep(0.001)
+            return []
+        batch = self.batches.popleft()
+        for message in batch:
+            assert message.partition is not None and message.offset is not None
+            self.position[message.partition] = message.offset + 1
+        return batch
+
+    async def commit_offsets(self) -> None:
+        """Commit everything consumed."""
+        self.committed.update(self.position)
+        self.commits += 1
+
+    async def commit(self, offsets: dict[str, dict[int, int]]) -> None:
+        """Commit chosen offsets."""
+        self.committed.update(offsets["events"])
+        self.commits += 1
+
+
+def _batches() -> list[list[_Message]]:
+    """Return fetch batches of keyed messages spread over partitions."""
+    offsets = [0] * PARTITIONS
+    messages = []
+    for sequence in range(MESSAGES):
+        key = _RNG.randrange(KEYS)
+        partition = key % PARTITIONS
+        messages.append(
+            _Message(
+                f"key-{key}".encode(),
+                str(sequence).encode(),
+                "events",
+                partition,
+                offsets[partition],
+            )
+        )
+        offsets[partition] += 1
+    return [
+        messages[start : start + BATCH_SIZE] for start in range(0, MESSAGES, BATCH_SIZE)
+    ]
+
+
+async def _run(
+    parallel: bool, batches: list[list[_Message]]
+) -> tuple[float, int, int, dict[bytes | None, list[int]], dict[int, int]]:
+    consumer = _Consumer([list(batch) for batch in batches])
+    handled: dict[bytes | None, list[int]] = {}
+    deepest = 0
+    dispatcher: PartitionedDispatcher | None = None
+
+    async def handler(message: ProtocolEventBusMessage) -> None:
+        nonlocal deepest
+        if dispatcher is not None:
+            deepest = max(deepest, *dispatcher.lane_depths)
+        await asyncio.sleep(HANDLER_SECONDS)
+        handled.setdefault(message.key, []).append(int(message.value))
+
+    start = time.perf_counter()
+    if parallel:
+        dispatcher = PartitionedDispatcher(
+            consumer, handler, lanes=LANES, batch_timeout_ms=10
+        )
+        runner = asyncio.create_task(dispatcher.run())
+        await consumer.drained.wait()
+        dispatcher.stop()
+        await runner
+    else:
+        while not consumer.drained.is_set():
+            for message in await consumer.consume_messages_stream(10):
+                await handler(message)
+            await consumer.commit_offsets()
+    elapsed = time.perf_counter() - start
+    return elapsed, consumer.commits, deepest, handled, consumer.committed
+
+
+@pytest.mark.benchmark
+def test_dispatcher_parallelizes_unrelated_keys() -> None:
+    """Compare serial handling with key-ordered parallel dispatch."""
+    batches = _batches()
+    print(
+        f"\nhandler {HANDLER_SECONDS * 1000:.1f} ms, {MESSAGES} messages, "
+        f"{KEYS} keys over {PARTITIONS} partitions, batches of {BATCH_SIZE}, "
+        f"{LANES} lanes"
+    )
+    print(f"{'path':<11} {'ms':>8} {'msg/s':>8} {'commits':>8} {'deepest lane':>13}")
+    runs = {
+        label: asyncio.run(_run(label == "dispatcher", batches))
+        for label in ("serial", "dispatcher")
+    }
+    for label, (elapsed, commits, deepest, _, _) in runs.items():
+        print(
+            f"{label:<11} {elapsed * 1000:>8.1f} {MESSAGES / elapsed:>8.0f} "
+            f"{commits:>8} {deepest:>13}"
+        )
+
+    ends = {
+        p: sum(m.partition == p for b in batches for m in b) for p in range(PARTITIONS)
+    }
+    for _, _, _, handled, committed in runs.values():
+        assert sum(map(len, handled.values())) == MESSAGES
+        assert all(values == sorted(values) for values in handled.values())
+        assert committed == ends
+    assert runs["dispatcher"][3] == runs["serial"][3]
+    assert runs["dispatcher"][0] < runs["serial"][0]
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Structural sharing reducer benchmark.
+
+Replays 100,000 task actions against a state payload of 4,096 tasks, each
+action changing one task, with three reducers:
+
+- naive: a frozen state holding a ``dict`` copied for every action, as
+  immutable reducers commonly do.
+- dispatch: ``examples.reference.MapStateReducer.dispatch``, copying only
+  the trie path of the changed task.
+- dispatch_many: the same reducer applying batches of 1,000 actions
+  through one editor.
+
+Reports the time per replay and, traced separately with ``tracemalloc``,
+the peak memory of a replay that keeps every 100th state as history.
+All three must end in the same payload, and structural sharing must be
+faster and keep less memory than the naive copies.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_persistent_state_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from examples.reference.persistent_state import MapEditor, MapStateReducer
+
+ACTIONS = 100_000
+TASKS = 4_096
+BATCH = 1_000
+HISTORY_EVERY = 100
+START = datetime(2025, 1, 1, tzinfo=UTC)
+KINDS = ("task.started", "task.completed", "task.retried")
+
+
+@dataclass(frozen=True, slots=True)
+class _Action:
+    type: str
+    payload: dict[str, Any]
+    timestamp: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class _DictState:
+    data: dict[str, Any]
+    version: int = 0
+    last_updated: datetime | None = None
+
+
+def _task(action: _Action) -> tuple[str, tuple[str, int]]:
+    return action.payload["task"], (action.type, action.payload["attempt"])
+
+
+class _CopyingReducer:
+    def dispatch(self, state: _DictState, action: _Action) -> _DictState:
+        data = dict(state.data)
+        key, value = _task(action)
+        data[key] = value
+        return _DictState(data, state.version + 1, action.timestamp)
+
+
+def _apply(tasks: MapEditor, action: Any) -> None:
+    key, value = _task(action)
+    tasks[key] = value
+
+
+def _actions() -> list[_Action]:
+    return [
+        _Action(
+            KINDS[i % len(KINDS)],
+            {"task": f"task-{(i * 7919) % TASKS}", "attempt": i // TASKS},
+            START + timedelta(milliseconds=i),
+        )
+        for i in range(ACTIONS)
+    ]
+
+
+def _initial() -> dict[str, Any]:
+    return {f"task-{i}": ("task.pending", 0) for i in range(TASKS)}
+
+
+def _naive(actions: list[_Action], history: list[Any]) -> dict[str, Any]:
+    reducer = _CopyingReducer()
+    state = _DictState(_initial())
+    for i, action in enumerate(actions):
+        state = reducer.dispatch(state, action)
+        if i % HISTORY_EVERY == 0:
+            history.append(state)
+    return state.data
+
+
+def _shared(actions: list[_Action], history: list[Any]) -> dict[str, Any]:
+    reducer = MapStateReducer(_apply, initial=_initial())
+    state = reducer.initial_state()
+    for i, action in enumerate(actions):
+        state = reducer.dispatch(state, action)
+        if i % HISTORY_EVERY == 0:
+            history.append(state)
+    return dict(state.data)
+
+
+def _batched(actions: list[_Action], history: list[Any]) -> dict[str, Any]:
+    reducer = MapStateReducer(_apply, initial=_initial())
+    state = reducer.initial_state()
+    for offset in range(0, len(actions), BATCH):
+        # Every 100th state of a batch is kept, as in the other replays.
+        for first in range(offset, offset + BATCH, HISTORY_EVERY):
+            state = reducer.dispatch_many(state, actions[first : first + 1])
+            history.append(state)
+            state = reducer.dispatch_many(
+                state, actions[first + 1 : first + HISTORY_EVERY]
+            )
+    return dict(state.data)
+
+
+def _timed(
+    replay: Callable[[list[_Action], list[Any]], dict[str, Any]],
+) -> tuple[float, dict[str, Any]]:
+    actions = _actions()
+    start = time.perf_counter()
+    final = replay(actions, [])
+    return time.perf_counter() - start, final
+
+
+def _peak(replay: Callable[[list[_Action], list[Any]], dict[str, Any]]) -> int:
+    actions = _actions()
+    history: list[Any] = []
+    tracemalloc.start()
+    replay(actions, history)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(history) == ACTIONS // HISTORY_EVERY
+    return peak
+
+
+@pytest.mark.benchmark
+def test_structural_sharing_replay() -> None:
+    """Compare copying states with sharing their unchanged structure."""
+    replays = {"naive": _naive, "dispatch": _shared, "dispatch_many": _batched}
+    runs = {label: _timed(replay) for label, replay in replays.items()}
+    peaks = {label: _peak(replay) for label, replay in replays.items()}
+
+    print(
+        f"\n{ACTIONS} actions over {TASKS} tasks, "
+        f"every {HISTORY_EVERY}th state kept for the memory run"
+    )
+    print(f"{'reducer':<14} {'ms':>8} {'us/action':>10} {'peak MiB':>9}")
+    for label, (elapsed, _) in runs.items():
+        print(
+            f"{label:<14} {elapsed * 1000:>8.0f} {elapsed / ACTIONS * 1e6:>10.2f} "
+            f"{peaks[label] / 2**20:>9.1f}"
+        )
+
+    finals = [final for _, final in runs.values()]
+    assert all(final == finals[0] for final in finals)
+    for label in ("dispatch", "dispatch_many"):
+        assert runs[label][0] < runs["naive"][0]
+        assert peaks[label] < peaks["naive"]
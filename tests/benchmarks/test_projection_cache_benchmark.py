@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Read-through projection cache benchmark.
+
+Runs a Zipfian ``get_entity_state`` workload, with a small share of
+projection writes, from concurrent readers against a simulated remote
+projection reader whose every call holds one of a few pooled connections
+for a round trip. The same workload runs against the reader directly and
+through ``examples.reference.CachingProjectionReader``, whose writes go
+through ``InvalidatingProjector``.
+
+Reports elapsed time, reader round trips and the cache hit ratio. The
+cached path must be faster with fewer round trips, answer most reads from
+the cache, and still return every entity's latest state afterwards.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_projection_cache_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import random
+import time
+
+import pytest
+
+from examples.reference.caching_projection_reader import (
+    CachingProjectionReader,
+    InvalidatingProjector,
+)
+from omnibase_core.types import JsonType
+
+ROUND_TRIP_SECONDS = 0.0005
+CONNECTIONS = 4
+ENTITIES = 1_000
+OPERATIONS = 10_000
+WRITE_SHARE = 0.02
+ZIPF_EXPONENT = 1.1
+READERS = 32
+
+# Reproducible workload; not used for anything security related.
+_RNG = random.Random(7)  # noqa: S311
+
+
+class _RemoteReader:
+    """Projection reader whose calls each hold a pooled connection."""
+
+    def __init__(self, rows: dict[str, tuple[int, JsonType]]) -> None:
+        self.rows = rows
+        self.round_trips = 0
+        self._pool = asyncio.Semaphore(CONNECTIONS)
+
+    async def get_entity_state(self, entity_id: str, domain: str) -> JsonType | None:
+        """One round trip per lookup."""
+        self.round_trips += 1
+        async with self._pool:
+            await asyncio.sleep(ROUND_TRIP_SECONDS)
+        row = self.rows.get(entity_id)
+        return None if row is None else row[1]
+
+
+class _LocalProjector:
+    """Projector writing straight into the remote reader's rows."""
+
+    def __init__(self, rows: dict[str, tuple[int, JsonType]]) -> None:
+        self.rows = rows
+
+    async def persist(
+        self,
+        projection: JsonType,
+        entity_id: str,
+        domain: str,
+        sequence_info: object,
+        *,
+        correlation_id: str | None = None,
+    ) -> object:
+        """Always applied."""
+        sequence = self.rows[entity_id][0] + 1
+        self.rows[entity_id] = (sequence, projection)
+        return _Applied(entity_id, sequence)
+
+
+class _Applied:
+    status = "applied"
+
+    def __init__(self, entity_id: str, sequence: int) -> None:
+        self.entity_id = entity_id
+        self.applied_sequence = sequence
+
+
+def _workload() -> list[tuple[bool, str]]:
+    """Return (is_write, entity_id) operations with Zipfian entity choice."""
+    weights = itertools.accumulate(
+        1 / rank**ZIPF_EXPONENT for rank in range(1, ENTITIES + 1)
+    )
+    entity_ids = _RNG.choices(
+        [f"node-{i}" for i in range(ENTITIES)], cum_weights=list(weights), k=OPERATIONS
+    )
+    return [(_RNG.random() < WRITE_SHARE, entity_id) for entity_id in entity_ids]
+
+
+async def _run(
+    cached: bool, operations: list[tuple[bool, str]]
+) -> tuple[float, int, float, bool]:
+    rows: dict[str, tuple[int, JsonType]] = {
+        f"node-{i}": (0, {"load": 0}) for i in range(ENTITIES)
+    }
+    remote = _RemoteReader(rows)
+    reader: _RemoteReader | CachingProjectionReader = remote
+    projector: _LocalProjector | InvalidatingProjector = _LocalProjector(rows)
+    if cached:
+        reader = CachingProjectionReader(remote, max_entries=ENTITIES // 4)
+        projector = InvalidatingProjector(projector, reader)  # type: ignore[arg-type]
+
+    async def client(offset: int) -> None:
+        for position in range(offset, len(operations), READERS):
+            is_write, entity_id = operations[position]
+            if is_write:
+                await projector.persist(
+                    {"load": position},
+                    entity_id,
+                    "registration",
+                    None,  # type: ignore[arg-type]
+                )
+            else:
+                await reader.get_entity_state(entity_id, "registration")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(READERS)))
+    elapsed = time.perf_counter() - start
+    round_trips = remote.round_trips
+    hit_ratio = getattr(reader, "hit_ratio", 0.0)
+
+    hot = {entity_id for _, entity_id in operations}
+    fresh = [
+        await reader.get_entity_state(entity_id, "registration") == rows[entity_id][1]
+        for entity_id in hot
+    ]
+    return elapsed, round_trips, hit_ratio, all(fresh)
+
+
+@pytest.mark.benchmark
+def test_cache_absorbs_zipfian_reads() -> None:
+    """Compare a Zipfian read workload with and without the cache."""
+    operations = _workload()
+    print(
+        f"\nround trip {ROUND_TRIP_SECONDS * 1000:.1f} ms over {CONNECTIONS} "
+        f"connections, {OPERATIONS} operations on {ENTITIES} entities "
+        f"(zipf {ZIPF_EXPONENT}, {WRITE_SHARE:.0%} writes), {READERS} readers"
+    )
+    print(f"{'reader':<8} {'ms':>8} {'round trips':>12} {'hit ratio':>10}")
+    runs = {
+        label: asyncio.run(_run(label == "cached", operations))
+        for label in ("direct", "cached")
+    }
+    for label, (elapsed, trips, hit_ratio, _) in runs.items():
+        print(f"{label:<8} {elapsed * 1000:>8.1f} {trips:>12} {hit_ratio:>10.2%}")
+
+    assert runs["direct"][3]
+    assert runs["cached"][3]
+    assert runs["cached"][2] > 0.7
+    assert runs["cached"][1] < runs["direct"][1]
+    assert runs["cached"][0] < runs["direct"][0]
@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Write-coalescing projector benchmark.
+
+Replays an event stream with repeated updates per entity through
+``examples.reference.CoalescingProjector`` over SQLite, where every
+database call costs a simulated network round trip, and compares:
+
+- per-event: one ``persist`` awaited per event, as a naive consumer does.
+- coalesced: ``batch_persist`` per consumer batch, which writes only the
+  latest projection per entity in one ``execute_many``.
+
+Reports elapsed time, database round trips and rows written. Both must
+leave the table in the same state; the coalesced path must be faster,
+with fewer round trips and rows.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_projector_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sqlite3
+import time
+from typing import Any
+
+import pytest
+
+from examples.reference.coalescing_projector import CoalescingProjector, SequenceInfo
+
+ROUND_TRIP_SECONDS = 0.0005
+EVENTS = 2_000
+ENTITIES = 200
+BATCH_SIZE = 200
+
+# Reproducible event order; not used for anything security related.
+_RNG = random.Random(7)  # noqa: S311
+
+
+class _RemoteSQLite:
+    """SQLite database whose every call costs one round trip."""
+
+    def __init__(self) -> None:
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.row_factory = sqlite3.Row
+        self.round_trips = 0
+
+    async def _round_trip(self) -> None:
+        self.round_trips += 1
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+
+    async def execute(self, query: str, *params: Any) -> list[dict[str, Any]]:
+        """Run one statement."""
+        await self._round_trip()
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    async def execute_many(
+        self, query: str, params_list: list[tuple[Any, ...]]
+    ) -> None:
+        """Run one statement per parameter set in one round trip."""
+        await self._round_trip()
+        self.connection.executemany(query, params_list)
+
+    async def fetchval(self, query: str, *params: Any) -> Any:
+        """Return the first column of the first row."""
+        await self._round_trip()
+        row = self.connection.execute(query, params).fetchone()
+        return None if row is None else row[0]
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self.connection.close()
+
+
+def _workload() -> list[tuple[dict[str, int], str, str, SequenceInfo]]:
+    """Return events with increasing offsets over a few hot entities."""
+    entity_ids = [f"order-{_RNG.randrange(ENTITIES)}" for _ in range(EVENTS)]
+    return [
+        ({"offset": offset}, entity_id, "orders", SequenceInfo(offset, "orders-0"))
+        for offset, entity_id in enumerate(entity_ids)
+    ]
+
+
+async def _replay(
+    coalesced: bool, events: list[tuple[dict[str, int], str, str, SequenceInfo]]
+) -> tuple[float, int, int, list[tuple[Any, ...]]]:
+    database = _RemoteSQLite()
+    projector = CoalescingProjector(database, paramstyle="qmark")
+    await projector.create_table()
+    database.round_trips = 0
+
+    start = time.perf_counter()
+    if coalesced:
+        for first in range(0, len(events), BATCH_SIZE):
+            await projector.batch_persist(events[first : first + BATCH_SIZE])
+    else:
+        for projection, entity_id, domain, sequence_info in events:
+            await projector.persist(projection, entity_id, domain, sequence_info)
+    elapsed = time.perf_counter() - start
+
+    table = [
+        tuple(row)
+        for row in database.connection.execute(
+            "SELECT * FROM projections ORDER BY entity_id"
+        )
+    ]
+    return elapsed, database.round_trips, projector.rows_written, table
+
+
+@pytest.mark.benchmark
+def test_coalescing_reduces_round_trips() -> None:
+    """Compare per-event persist with coalesced batch_persist."""
+    events = _workload()
+    print(
+        f"\nround trip {ROUND_TRIP_SECONDS * 1000:.1f} ms, {EVENTS} events over "
+        f"{ENTITIES} entities, batches of {BATCH_SIZE}"
+    )
+    print(f"{'path':<10} {'ms':>8} {'round trips':>12} {'rows':>6}")
+    runs = {
+        label: asyncio.run(_replay(label == "coalesced", events))
+        for label in ("per-event", "coalesced")
+    }
+    for label, (elapsed, trips, rows, _) in runs.items():
+        print(f"{label:<10} {elapsed * 1000:>8.1f} {trips:>12} {rows:>6}")
+
+    assert runs["per-event"][3] == runs["coalesced"][3]
+    assert len(runs["coalesced"][3]) <= ENTITIES
+    assert runs["coalesced"][1] < runs["per-event"][1]
+    assert runs["coalesced"][2] < runs["per-event"][2]
+    assert runs["coalesced"][0] < runs["per-event"][0]
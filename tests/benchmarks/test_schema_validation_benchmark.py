@@ -0,0 +1,320 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Compiled schema validation benchmark.
+
+Validates git hook event envelopes, with five commits each, against a
+draft-07 schema held by a simulated remote registry whose ``get_schema``
+costs a 0.2 ms round trip. Reports the cost per event of:
+
+- interpreted: the registry's own ``validate_event``, fetching the schema
+  and walking the schema dict for every event, as typical clients do.
+- cold: ``examples.reference.CompilingSchemaRegistry`` on the first event
+  of a subject, which fetches and compiles the schema.
+- warm: the same layer once the schema is compiled, through
+  ``validate_event`` and through ``validate_events`` in batches of 100.
+- compiled / walked: the compiled validator and the schema walk alone,
+  without the registry, to isolate the cost of interpreting the schema.
+
+Every path must agree on which events are valid, and warm validation must
+be cheaper per event than both interpreted and cold validation.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_schema_validation_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from examples.reference.compiled_schema_registry import (
+    CompilingSchemaRegistry,
+    compile_schema,
+)
+
+ROUND_TRIP_SECONDS = 0.0002
+EVENTS = 2_000
+SUBJECTS = 50
+BATCH_SIZE = 100
+
+SCHEMA: dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": [
+        "envelope_id",
+        "correlation_id",
+        "event_type",
+        "source",
+        "timestamp",
+        "payload",
+    ],
+    "additionalProperties": False,
+    "properties": {
+        "envelope_id": {"$ref": "#/definitions/uuid"},
+        "correlation_id": {"$ref": "#/definitions/uuid"},
+        "event_type": {"enum": ["git.push", "git.tag", "git.merge"]},
+        "schema_version": {"type": "string", "pattern": r"^\d+\.\d+\.\d+$"},
+        "timestamp": {
+            "type": "string",
+            "pattern": r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$",
+        },
+        "source": {
+            "type": "object",
+            "required": ["node_id", "node_type"],
+            "properties": {
+                "node_id": {"type": "string", "minLength": 1, "maxLength": 128},
+                "node_type": {"enum": ["effect", "compute", "reducer", "orchestrator"]},
+                "version": {"type": "string", "pattern": r"^\d+\.\d+\.\d+$"},
+            },
+        },
+        "payload": {
+            "type": "object",
+            "required": ["repository", "ref", "commits"],
+            "properties": {
+                "repository": {"type": "string", "minLength": 1},
+                "ref": {"type": "string", "pattern": "^refs/"},
+                "forced": {"type": "boolean"},
+                "commits": {
+                    "type": "array",
+                    "minItems": 1,
+                    "maxItems": 100,
+                    "items": {"$ref": "#/definitions/commit"},
+                },
+            },
+        },
+        "metadata": {
+            "type": "object",
+            "additionalProperties": {"type": "string", "maxLength": 256},
+        },
+    },
+    "definitions": {
+        "uuid": {
+            "type": "string",
+            "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+        },
+        "commit": {
+            "type": "object",
+            "required": ["sha", "author", "message"],
+            "properties": {
+                "sha": {"type": "string", "pattern": "^[0-9a-f]{40}$"},
+                "author": {
+                    "type": "object",
+                    "required": ["name", "email"],
+                    "properties": {
+                        "name": {"type": "string"},
+                        "email": {"type": "string", "pattern": "^[^@]+@[^@]+$"},
+                    },
+                },
+                "message": {"type": "string", "maxLength": 4096},
+                "files_changed": {"type": "integer", "minimum": 0},
+                "files": {"type": "array", "items": {"type": "string"}},
+            },
+        },
+    },
+}
+
+
+def _envelope(i: int) -> dict[str, Any]:
+    envelope: dict[str, Any] = {
+        "envelope_id": f"{i:08x}-2fa1-11d2-883f-0016d3cca427",
+        "correlation_id": "1b4e28ba-2fa1-11d2-883f-0016d3cca427",
+        "event_type": "git.push",
+        "schema_version": "1.0.0",
+        "timestamp": "2025-10-18T12:00:00.123Z",
+        "source": {"node_id": "git-hook-effect", "node_type": "effect"},
+        "payload": {
+            "repository": "OmniNode-ai/omnibase_spi",
+            "ref": "refs/heads/main",
+            "forced": False,
+            "commits": [
+                {
+                    "sha": f"{i * 5 + c:040x}",
+                    "author": {"name": "Dev", "email": "dev@omninode.ai"},
+                    "message": "Refine protocol docstrings\n\nLonger body. " * 4,
+                    "files_changed": 3,
+                    "files": ["src/a.py", "src/b.py", "tests/test_a.py"],
+                }
+                for c in range(5)
+            ],
+        },
+        "metadata": {"hook": "post-receive", "runner": "ci-7"},
+    }
+    # Every tenth event is invalid, deep inside the payload.
+    if i % 10 == 0:
+        envelope["payload"]["commits"][3]["sha"] = "not-a-sha"
+    return envelope
+
+
+_TYPES: dict[str, Callable[[object], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+}
+
+
+def _walk(schema: dict[str, Any], value: Any, root: dict[str, Any]) -> str | None:
+    """Interpret the schema keywords used above against ``value``."""
+    if "$ref" in schema:
+        target: Any = root
+        for part in schema["$ref"][2:].split("/"):
+            target = target[part]
+        return _walk(target, value, root)
+    if "type" in schema and not _TYPES[schema["type"]](value):
+        return f"expected {schema['type']}"
+    if "enum" in schema and value not in schema["enum"]:
+        return "not in enum"
+    if isinstance(value, str):
+        if len(value) < schema.get("minLength", 0):
+            return "too short"
+        if len(value) > schema.get("maxLength", len(value)):
+            return "too long"
+        if "pattern" in schema and re.search(schema["pattern"], value) is None:
+            return "pattern mismatch"
+    if isinstance(value, int) and value < schema.get("minimum", value):
+        return "too small"
+    if isinstance(value, list):
+        if (
+            not schema.get("minItems", 0)
+            <= len(value)
+            <= schema.get("maxItems", len(value))
+        ):
+            return "bad length"
+        if "items" in schema:
+            for item in value:
+                error = _walk(schema["items"], item, root)
+                if error is not None:
+                    return error
+    if isinstance(value, dict):
+        for name in schema.get("required", ()):
+            if name not in value:
+                return f"missing {name}"
+        properties = schema.get("properties", {})
+        extra = schema.get("additionalProperties", True)
+        for name, item in value.items():
+            if name in properties:
+                error = _walk(properties[name], item, root)
+            elif extra is False:
+                error = f"unexpected {name}"
+            elif isinstance(extra, dict):
+                error = _walk(extra, item, root)
+            else:
+                error = None
+            if error is not None:
+                return error
+    return None
+
+
+class _RemoteRegistry:
+    """Registry that pays a round trip per schema fetch and interprets schemas."""
+
+    def __init__(self) -> None:
+        self.schemas: dict[str, Any] = {}
+
+    async def register_schema(
+        self, subject: str, schema: Any, schema_type: str = "JSON"
+    ) -> int:
+        """Store the schema."""
+        self.schemas[subject] = schema
+        return len(self.schemas)
+
+    async def get_schema(self, subject: str, version: str) -> Any:
+        """Fetch the schema over a simulated round trip."""
+        await asyncio.sleep(ROUND_TRIP_SECONDS)
+        return self.schemas.get(subject)
+
+    async def validate_event(
+        self, subject: str, event_data: Any
+    ) -> tuple[bool, str | None]:
+        """Fetch the schema and walk it."""
+        schema = await self.get_schema(subject, "latest")
+        error = _walk(schema, event_data, schema)
+        return error is None, error
+
+    async def close(self, timeout_seconds: float = 30.0) -> None:
+        """Nothing to release."""
+
+
+def _per_event_us(elapsed: float, events: int) -> float:
+    return elapsed / events * 1e6
+
+
+async def _measure(events: list[dict[str, Any]]) -> dict[str, tuple[float, list[bool]]]:
+    remote = _RemoteRegistry()
+    subjects = [f"onex.evt.git.hook.v{s}-value" for s in range(SUBJECTS)]
+    for subject in subjects:
+        await remote.register_schema(subject, SCHEMA)
+    registry = CompilingSchemaRegistry(remote)  # type: ignore[arg-type]
+    runs: dict[str, tuple[float, list[bool]]] = {}
+
+    start = time.perf_counter()
+    results = [(await remote.validate_event(subjects[0], e))[0] for e in events]
+    runs["interpreted"] = (
+        _per_event_us(time.perf_counter() - start, len(events)),
+        results,
+    )
+
+    start = time.perf_counter()
+    cold = [
+        (await registry.validate_event(subject, events[i]))[0]
+        for i, subject in enumerate(subjects)
+    ]
+    runs["cold"] = (_per_event_us(time.perf_counter() - start, SUBJECTS), cold)
+
+    start = time.perf_counter()
+    results = [(await registry.validate_event(subjects[0], e))[0] for e in events]
+    runs["warm"] = (_per_event_us(time.perf_counter() - start, len(events)), results)
+
+    start = time.perf_counter()
+    results = []
+    for offset in range(0, len(events), BATCH_SIZE):
+        batch = events[offset : offset + BATCH_SIZE]
+        results += [ok for ok, _ in await registry.validate_events(subjects[0], batch)]
+    runs["warm batch"] = (
+        _per_event_us(time.perf_counter() - start, len(events)),
+        results,
+    )
+
+    validate = compile_schema(SCHEMA)
+    start = time.perf_counter()
+    results = [validate(e) is None for e in events]
+    runs["compiled"] = (
+        _per_event_us(time.perf_counter() - start, len(events)),
+        results,
+    )
+
+    start = time.perf_counter()
+    results = [_walk(SCHEMA, e, SCHEMA) is None for e in events]
+    runs["walked"] = (_per_event_us(time.perf_counter() - start, len(events)), results)
+    return runs
+
+
+@pytest.mark.benchmark
+def test_compiled_validation_is_cheaper_once_warm() -> None:
+    """Compare interpreted, cold and warm per-event validation cost."""
+    events = [_envelope(i) for i in range(EVENTS)]
+    runs = asyncio.run(_measure(events))
+
+    print(
+        f"\n{EVENTS} envelopes with 5 commits, {SUBJECTS} cold subjects, "
+        f"round trip {ROUND_TRIP_SECONDS * 1000:.1f} ms"
+    )
+    print(f"{'path':<12} {'us/event':>9}")
+    for label, (cost, _) in runs.items():
+        print(f"{label:<12} {cost:>9.1f}")
+
+    expected = [i % 10 != 0 for i in range(EVENTS)]
+    for label, (_, results) in runs.items():
+        assert results == expected[: len(results)], label
+    warm = runs["warm"][0]
+    assert warm < runs["interpreted"][0]
+    assert warm < runs["cold"][0]
+    assert runs["warm batch"][0] < runs["interpreted"][0]
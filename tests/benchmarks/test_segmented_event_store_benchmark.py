@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Segmented file event store benchmark.
+
+Measures ``examples.reference.SegmentedEventStore`` on a temporary
+directory:
+
+- append throughput: 6,400 events appended in batches of 10 by one
+  appender, then by 64 concurrent appenders whose batches share group
+  commits. Reports events per second and fsyncs.
+- stream-read latency against stream length: streams of 100 to 30,000
+  events written interleaved in 4 MiB segments, each read whole and
+  read for its last 100 events through the sparse index.
+
+Every read must return the stream's events in order, concurrent appends
+must need fewer fsyncs than batches, and a tail read of the longest
+stream must be faster than reading it whole.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_segmented_event_store_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.segmented_event_store import (
+    SegmentedEventStore,
+    StoredWorkflowEvent,
+)
+
+WORKFLOW = "deploy"
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+APPEND_EVENTS = 6_400
+BATCH = 10
+APPENDERS = 64
+
+LENGTHS = (100, 1_000, 10_000, 30_000)
+ROUND = 100
+TAIL = 100
+SEGMENT_BYTES = 4 * 1024 * 1024
+
+
+def _events(instance: UUID, first: int, count: int) -> list[StoredWorkflowEvent]:
+    return [
+        StoredWorkflowEvent(
+            event_id=uuid4(),
+            event_type="task.completed",
+            workflow_type=WORKFLOW,
+            instance_id=instance,
+            correlation_id=instance,
+            sequence_number=sequence,
+            timestamp=START + timedelta(seconds=sequence),
+            source="workflow-engine",
+            idempotency_key=f"{instance}-{sequence}",
+            payload={"task": f"task-{sequence}", "attempt": 1, "duration_ms": 12.5},
+            metadata={"node": "effect", "region": "edge-1"},
+        )
+        for sequence in range(first, first + count)
+    ]
+
+
+async def _append(directory: Path, appenders: int) -> tuple[float, int]:
+    store = SegmentedEventStore(directory, segment_bytes=SEGMENT_BYTES)
+    per_appender = APPEND_EVENTS // appenders
+    batches = [
+        _events(instance, first, BATCH)
+        for instance in (uuid4() for _ in range(appenders))
+        for first in range(1, per_appender + 1, BATCH)
+    ]
+
+    async def appender(mine: list[list[StoredWorkflowEvent]]) -> None:
+        for events in mine:
+            result = await store.append_events(
+                events, events[0].sequence_number - 1, None
+            )
+            assert result.success, result.error_message
+
+    per_batch = per_appender // BATCH
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            appender(batches[i * per_batch : (i + 1) * per_batch])
+            for i in range(appenders)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    fsyncs = store.fsyncs
+    store.close()
+    return elapsed, fsyncs
+
+
+async def _reads(directory: Path) -> dict[int, tuple[float, float]]:
+    store = SegmentedEventStore(directory, segment_bytes=SEGMENT_BYTES, fsync=False)
+    streams = {length: uuid4() for length in LENGTHS}
+    for first in range(1, max(LENGTHS) + 1, ROUND):
+        for length, instance in streams.items():
+            if first <= length:
+                await store.append_events(
+                    _events(instance, first, min(ROUND, length - first + 1)),
+                    first - 1,
+                    None,
+                )
+    latencies = {}
+    for length, instance in streams.items():
+        start = time.perf_counter()
+        whole = await store.get_event_stream(WORKFLOW, instance, 1, None)
+        full = time.perf_counter() - start
+        start = time.perf_counter()
+        tail = await store.get_event_stream(WORKFLOW, instance, length - TAIL + 1, None)
+        last = time.perf_counter() - start
+        assert [e.sequence_number for e in whole] == list(range(1, length + 1))
+        assert [e.sequence_number for e in tail] == list(
+            range(max(1, length - TAIL + 1), length + 1)
+        )
+        latencies[length] = (full, last)
+    store.close()
+    return latencies
+
+
+@pytest.mark.benchmark
+def test_append_throughput_with_group_commit(tmp_path: Path) -> None:
+    """Compare one appender with concurrent appenders sharing fsyncs."""
+    runs = {
+        appenders: asyncio.run(_append(tmp_path / f"append-{appenders}", appenders))
+        for appenders in (1, APPENDERS)
+    }
+
+    print(f"\n{APPEND_EVENTS} events in batches of {BATCH}, fsync on")
+    print(f"{'appenders':>9} {'ms':>8} {'events/s':>9} {'fsyncs':>7}")
+    for appenders, (elapsed, fsyncs) in runs.items():
+        print(
+            f"{appenders:>9} {elapsed * 1000:>8.1f} "
+            f"{APPEND_EVENTS / elapsed:>9.0f} {fsyncs:>7}"
+        )
+
+    batches = APPEND_EVENTS // BATCH
+    assert runs[1][1] == batches
+    assert runs[APPENDERS][1] < batches
+
+
+@pytest.mark.benchmark
+def test_stream_read_latency_by_length(tmp_path: Path) -> None:
+    """Read interleaved streams whole and by their tail."""
+    latencies = asyncio.run(_reads(tmp_path))
+
+    total = sum(LENGTHS)
+    print(f"\n{total} events over {len(LENGTHS)} interleaved streams")
+    print(f"{'length':>7} {'whole ms':>9} {'tail ms':>8}")
+    for length, (full, tail) in latencies.items():
+        print(f"{length:>7} {full * 1000:>9.2f} {tail * 1000:>8.2f}")
+
+    longest = latencies[max(LENGTHS)]
+    assert longest[1] < longest[0]
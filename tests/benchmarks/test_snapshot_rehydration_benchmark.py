@@ -0,0 +1,170 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Snapshot rehydration benchmark.
+
+Rebuilds workflow states with ``examples.reference.SnapshotRehydrator``
+from streams of 100 to 30,000 events, written interleaved to an
+``examples.reference.SegmentedEventStore`` with 4 MiB segments, folding
+them with a reducer that tracks status, task counts and the last task of
+each instance:
+
+- without snapshots: every rehydration replays the whole stream.
+- with snapshots: a first rehydration replays the stream and saves a
+  snapshot; after ``TAIL`` more events are appended, the next one loads
+  the snapshot and replays only those.
+
+Reports rehydration latency against stream length for both. Both must
+rebuild the same state, and with a snapshot the longest stream must
+rehydrate faster than without.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_snapshot_rehydration_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.segmented_event_store import (
+    SegmentedEventStore,
+    StoredWorkflowEvent,
+)
+from examples.reference.snapshot_rehydrator import (
+    InMemorySnapshotStore,
+    ReplayedAction,
+    SnapshotPolicy,
+    SnapshotRehydrator,
+)
+
+WORKFLOW = "deploy"
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+LENGTHS = (100, 1_000, 10_000, 30_000)
+TAIL = 100
+ROUND = 100
+SEGMENT_BYTES = 4 * 1024 * 1024
+EVENT_TYPES = ("task.started", "task.completed", "task.completed", "task.failed")
+
+
+@dataclass(frozen=True, slots=True)
+class _Workflow:
+    status: str = "pending"
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    last_task: str | None = None
+
+
+class _Reducer:
+    def initial_state(self) -> _Workflow:
+        return _Workflow()
+
+    def dispatch(self, state: _Workflow, action: ReplayedAction) -> _Workflow:
+        task = action.payload["task"]
+        if action.type == "task.started":
+            return replace(
+                state, status="running", started=state.started + 1, last_task=task
+            )
+        if action.type == "task.completed":
+            return replace(state, completed=state.completed + 1, last_task=task)
+        return replace(state, failed=state.failed + 1, last_task=task)
+
+
+def _events(instance: UUID, first: int, count: int) -> list[StoredWorkflowEvent]:
+    return [
+        StoredWorkflowEvent(
+            event_id=uuid4(),
+            event_type=EVENT_TYPES[sequence % len(EVENT_TYPES)],
+            workflow_type=WORKFLOW,
+            instance_id=instance,
+            correlation_id=instance,
+            sequence_number=sequence,
+            timestamp=START + timedelta(seconds=sequence),
+            source="workflow-engine",
+            idempotency_key=f"{instance}-{sequence}",
+            payload={"task": f"task-{sequence}", "attempt": 1, "duration_ms": 12.5},
+            metadata={"node": "effect"},
+        )
+        for sequence in range(first, first + count)
+    ]
+
+
+async def _append(
+    store: SegmentedEventStore, streams: dict[int, UUID], held_back: int
+) -> None:
+    """Extend every stream to its length less ``held_back``, interleaved."""
+    ends = {
+        length: await store.get_last_sequence_number(WORKFLOW, instance)
+        for length, instance in streams.items()
+    }
+    while any(end < length - held_back for length, end in ends.items()):
+        for length, instance in streams.items():
+            first = ends[length] + 1
+            last = min(first + ROUND - 1, length - held_back)
+            if first <= last:
+                result = await store.append_events(
+                    _events(instance, first, last - first + 1), first - 1, None
+                )
+                assert result.success, result.error_message
+                ends[length] = last
+
+
+async def _measure(directory: Path) -> dict[int, tuple[float, float, int]]:
+    store = SegmentedEventStore(directory, segment_bytes=SEGMENT_BYTES, fsync=False)
+    reducer = _Reducer()
+    streams = {length: uuid4() for length in LENGTHS}
+    await _append(store, streams, TAIL)
+
+    plain = SnapshotRehydrator(
+        store,
+        InMemorySnapshotStore(),
+        reducer,  # type: ignore[arg-type]
+        policy=SnapshotPolicy(every_events=None),
+    )
+    snapshotting = SnapshotRehydrator(
+        store,
+        InMemorySnapshotStore(),
+        reducer,  # type: ignore[arg-type]
+        policy=SnapshotPolicy(every_events=TAIL, max_replay_seconds=0.001),
+    )
+    for instance in streams.values():
+        await snapshotting.rehydrate(WORKFLOW, instance)
+    await _append(store, streams, 0)
+
+    latencies = {}
+    for length, instance in streams.items():
+        start = time.perf_counter()
+        whole = await plain.rehydrate(WORKFLOW, instance)
+        full = time.perf_counter() - start
+        start = time.perf_counter()
+        tail = await snapshotting.rehydrate(WORKFLOW, instance)
+        fast = time.perf_counter() - start
+        assert whole.state == tail.state
+        assert whole.sequence_number == tail.sequence_number == length
+        latencies[length] = (full, fast, tail.events_replayed)
+    store.close()
+    return latencies
+
+
+@pytest.mark.benchmark
+def test_rehydration_latency_by_stream_length(tmp_path: Path) -> None:
+    """Compare full replays with a snapshot plus tail replay."""
+    latencies = asyncio.run(_measure(tmp_path))
+
+    print(f"\nRehydration, {TAIL} events appended after the snapshot")
+    print(f"{'length':>7} {'full ms':>8} {'snapshot ms':>12} {'replayed':>9}")
+    for length, (full, fast, replayed) in latencies.items():
+        print(f"{length:>7} {full * 1000:>8.2f} {fast * 1000:>12.2f} {replayed:>9}")
+
+    full, fast, replayed = latencies[max(LENGTHS)]
+    assert replayed == TAIL
+    assert fast < full
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Incremental SPI validation benchmark.
+
+Validates the full ``src/omnibase_spi`` tree with
+``ComprehensiveSPIValidationEngine`` without a cache, with an empty cache
+(cold: validate and write every entry), with a populated cache (warm) and with
+one protocol file edited since the cache was written. Every run must produce
+the same report; the warm run must be faster than the uncached one.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_spi_validator_cache_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import io
+import shutil
+import sys
+import timeit
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_VALIDATION_ROOT = REPO_ROOT / "scripts" / "validation"
+sys.path.insert(0, str(SCRIPTS_VALIDATION_ROOT))
+
+from spi_validator.config import ValidationConfig
+from spi_validator.engine import ComprehensiveSPIValidationEngine
+
+if TYPE_CHECKING:
+    from spi_validator.models import ValidationReport
+
+REPEAT = 3
+
+
+def _best_ms(func: Callable[[], object], setup: Callable[[], object]) -> float:
+    return min(timeit.repeat(func, setup=setup, number=1, repeat=REPEAT)) * 1000
+
+
+def _comparable(report: ValidationReport) -> tuple[list[dict], list[dict]]:
+    return (
+        [v.to_dict() for v in report.violations],
+        [p.to_dict() for p in report.protocols],
+    )
+
+
+@pytest.mark.benchmark
+def test_warm_cache_is_identical_and_faster(tmp_path: Path) -> None:
+    """Compare uncached, cold-cache, warm-cache and one-file-edited runs."""
+    tree = tmp_path / "omnibase_spi"
+    shutil.copytree(
+        REPO_ROOT / "src" / "omnibase_spi",
+        tree,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    cache_dir = tmp_path / "cache"
+    config = ValidationConfig(str(REPO_ROOT / "validation_config.yaml"))
+
+    def validate(*, use_cache: bool) -> ValidationReport:
+        engine = ComprehensiveSPIValidationEngine(
+            config, cache_dir=cache_dir if use_cache else None
+        )
+        with redirect_stdout(io.StringIO()):
+            return engine.validate_directory(tree)
+
+    def drop_cache() -> None:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    def keep_cache() -> None:
+        pass
+
+    edited = tree / "protocols" / "event_bus" / "protocol_event_bus_client.py"
+    original = edited.read_text(encoding="utf-8")
+
+    def edit_one_file() -> None:
+        edited.write_text(
+            original + f"\n# edit {len(edited.read_text())}\n", encoding="utf-8"
+        )
+
+    uncached_ms = _best_ms(lambda: validate(use_cache=False), keep_cache)
+    cold_ms = _best_ms(lambda: validate(use_cache=True), drop_cache)
+    warm_ms = _best_ms(lambda: validate(use_cache=True), keep_cache)
+    edited_ms = _best_ms(lambda: validate(use_cache=True), edit_one_file)
+
+    edited.write_text(original, encoding="utf-8")
+    drop_cache()
+    expected = _comparable(validate(use_cache=False))
+    cold = validate(use_cache=True)
+    warm = validate(use_cache=True)
+
+    print(f"\nsrc/omnibase_spi: {cold.total_files} protocol files")
+    print(f"  no cache              {uncached_ms:>9.1f} ms")
+    print(f"  cold cache (write)    {cold_ms:>9.1f} ms")
+    print(f"  warm cache            {warm_ms:>9.1f} ms")
+    print(f"  warm, one file edited {edited_ms:>9.1f} ms")
+
+    assert _comparable(cold) == expected
+    assert _comparable(warm) == expected
+    assert warm_ms < uncached_ms
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Unused-export check benchmark.
+
+Resolves the consumers of every ``omnibase_spi.protocols`` export with the
+one-pass ``build_symbol_index`` and compares it with the per-symbol
+``_find_symbol_consumers`` search it replaced, which re-reads and re-parses
+every file for each export. The per-symbol search is timed on a sample of
+exports and extrapolated; results for the sample must be identical, and
+indexing all exports must beat searching the sample.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_unused_exports_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+from check_unused_exports import (
+    PROTOCOLS_INIT,
+    _extract_all_exports,
+    _find_symbol_consumers,
+    build_symbol_index,
+)
+
+SAMPLE_SIZE = 5
+
+
+@pytest.mark.benchmark
+def test_symbol_index_is_identical_and_faster() -> None:
+    """Compare the one-pass index with per-symbol searches."""
+    search_dirs = [
+        d
+        for d in (REPO_ROOT / name for name in ("src", "tests", "scripts", "examples"))
+        if d.exists()
+    ]
+    exports = sorted(_extract_all_exports(PROTOCOLS_INIT))
+    sample = exports[:: max(1, len(exports) // SAMPLE_SIZE)][:SAMPLE_SIZE]
+
+    def index_all() -> dict[str, list[str]]:
+        index = build_symbol_index(search_dirs)
+        return {symbol: index.consumers(symbol) for symbol in exports}
+
+    def search_sample() -> dict[str, list[str]]:
+        return {
+            symbol: _find_symbol_consumers(symbol, search_dirs) for symbol in sample
+        }
+
+    index_ms = min(timeit.repeat(index_all, number=1, repeat=3)) * 1000
+    search_ms = timeit.timeit(search_sample, number=1) * 1000
+    estimated_full_ms = search_ms / len(sample) * len(exports)
+
+    print(f"\n{len(exports)} exports")
+    for label, ms in (
+        ("build_symbol_index (all exports)", index_ms),
+        (f"per-symbol search ({len(sample)} exports)", search_ms),
+        ("per-symbol search (all, estimated)", estimated_full_ms),
+    ):
+        print(f"  {label:<36} {ms:>10.1f} ms")
+
+    indexed = index_all()
+    assert {symbol: indexed[symbol] for symbol in sample} == search_sample()
+    assert index_ms < search_ms
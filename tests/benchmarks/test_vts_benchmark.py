@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Batch Validation Tax Score benchmark.
+
+Scores a large set of PR rollups with ``compute_vts_batch`` /
+``compute_vts_per_kloc_batch`` and with the scalar ``compute_vts`` /
+``compute_vts_per_kloc`` loop they replace, for model input and columnar
+input (lists, and NumPy arrays when NumPy is installed). Results must be
+identical and the batch path must be faster. NumPy is used when installed;
+the pure-Python fallback is timed as well.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_vts_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+import pytest
+
+from omnibase_spi.contracts.measurement import ContractValidationTax, vts as vts_module
+from omnibase_spi.contracts.measurement.vts import (
+    VTS_COUNTER_FIELDS,
+    compute_vts,
+    compute_vts_batch,
+    compute_vts_per_kloc,
+    compute_vts_per_kloc_batch,
+)
+
+ROLLUP_COUNT = 200_000
+REPEAT = 3
+
+
+def _best_ms(func: Callable[[], object]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEAT)) * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "pure-python"])
+def test_vts_batch_is_identical_and_faster(
+    use_numpy: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Compare batch scoring with the scalar loop."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(vts_module, "_HAS_NUMPY", False)
+
+    taxes = [
+        ContractValidationTax(
+            blocking_failures=i % 4,
+            warn_findings=(i * 7) % 13,
+            reruns=i % 3,
+            validator_runtime_ms=(i * 7919) % 600_000,
+            human_escalations=i % 2,
+            autofix_successes=(i * 5) % 9,
+        )
+        for i in range(ROLLUP_COUNT)
+    ]
+    lines = [(i * 104_729) % 25_000 for i in range(ROLLUP_COUNT)]
+    columns = {name: [getattr(t, name) for t in taxes] for name in VTS_COUNTER_FIELDS}
+
+    def scalar() -> list[float]:
+        return [
+            compute_vts_per_kloc(compute_vts(t), n)
+            for t, n in zip(taxes, lines, strict=True)
+        ]
+
+    def from_models() -> list[float]:
+        return compute_vts_per_kloc_batch(compute_vts_batch(taxes), lines)
+
+    def from_columns() -> list[float]:
+        return compute_vts_per_kloc_batch(compute_vts_batch(columns), lines)
+
+    expected = scalar()
+    assert from_models() == expected
+    assert from_columns() == expected
+
+    scalar_ms = _best_ms(scalar)
+    models_ms = _best_ms(from_models)
+    columns_ms = _best_ms(from_columns)
+    timings = {
+        "scalar loop": scalar_ms,
+        "batch (models)": models_ms,
+        "batch (columns)": columns_ms,
+    }
+    if use_numpy:
+        np = pytest.importorskip("numpy")
+        arrays = {name: np.asarray(column) for name, column in columns.items()}
+        line_array = np.asarray(lines)
+
+        def from_arrays() -> list[float]:
+            return compute_vts_per_kloc_batch(compute_vts_batch(arrays), line_array)
+
+        assert from_arrays() == expected
+        timings["batch (arrays)"] = _best_ms(from_arrays)
+
+    backend = "numpy" if use_numpy else "pure-python"
+    print(f"\nVTS per kLOC x {ROLLUP_COUNT:,} ({backend})")
+    for label, elapsed in timings.items():
+        print(f"  {label:<16} {elapsed:>8.1f} ms")
+
+    assert models_ms < scalar_ms
+    assert columns_ms < scalar_ms
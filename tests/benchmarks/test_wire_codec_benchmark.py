@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Wire codec benchmark.
+
+Compares the contract wire codec with the original implementation
+(``json.dumps(model.model_dump(mode="json"), sort_keys=True, ...)`` to encode,
+``model_validate(json.loads(...))`` to decode) on a stream of measurement
+events and checkpoints. Outputs must be byte-identical for the same options;
+the compact and NDJSON paths must also be faster than the original.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_wire_codec_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from collections.abc import Callable
+
+import pytest
+from pydantic import BaseModel
+
+from omnibase_spi.contracts.measurement import ContractMeasurementEvent
+from omnibase_spi.contracts.pipeline.contract_checkpoint import ContractCheckpoint
+from omnibase_spi.contracts.pipeline.contract_wire_codec import (
+    from_json,
+    from_ndjson,
+    to_json,
+    to_ndjson,
+)
+from tests.benchmarks.contract_streams import checkpoint, measurement_event
+
+STREAM_SIZE = 200
+REPEAT = 5
+
+
+def _legacy_to_json(model: BaseModel, *, indent: int | None = 2) -> str:
+    raw = model.model_dump(mode="json")
+    if indent is None:
+        return json.dumps(
+            raw, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+    return json.dumps(raw, sort_keys=True, indent=indent, ensure_ascii=False)
+
+
+def _legacy_from_json[T: BaseModel](json_str: str, model_class: type[T]) -> T:
+    return model_class.model_validate(json.loads(json_str))
+
+
+def _best_ms(func: Callable[[], object]) -> float:
+    return min(timeit.repeat(func, number=1, repeat=REPEAT)) * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    ("factory", "model_class"),
+    [
+        (measurement_event, ContractMeasurementEvent),
+        (checkpoint, ContractCheckpoint),
+    ],
+    ids=["measurement_event", "checkpoint"],
+)
+def test_wire_codec_is_byte_identical_and_faster(
+    factory: Callable[[int], BaseModel], model_class: type[BaseModel]
+) -> None:
+    """Compare encode/decode of a contract stream with the original codec."""
+    models = [factory(i) for i in range(STREAM_SIZE)]
+
+    # Byte-identical canonical output, pretty and compact.
+    for model in models:
+        assert to_json(model) == _legacy_to_json(model)
+        assert to_json(model, indent=None) == _legacy_to_json(model, indent=None)
+    ndjson = to_ndjson(models)
+    assert ndjson == "".join(_legacy_to_json(m, indent=None) + "\n" for m in models)
+    assert from_ndjson(ndjson, model_class) == models
+    assert [from_json(to_json(m), model_class) for m in models] == models
+
+    pretty = [_legacy_to_json(m) for m in models]
+    timings = {
+        "encode pretty (legacy)": _best_ms(
+            lambda: [_legacy_to_json(m) for m in models]
+        ),
+        "encode pretty": _best_ms(lambda: [to_json(m) for m in models]),
+        "encode compact (legacy)": _best_ms(
+            lambda: [_legacy_to_json(m, indent=None) for m in models]
+        ),
+        "encode ndjson": _best_ms(lambda: to_ndjson(models)),
+        "decode (legacy)": _best_ms(
+            lambda: [_legacy_from_json(s, model_class) for s in pretty]
+        ),
+        "decode": _best_ms(lambda: [from_json(s, model_class) for s in pretty]),
+        "decode ndjson": _best_ms(lambda: from_ndjson(ndjson, model_class)),
+    }
+
+    print(f"\n{model_class.__name__} x {STREAM_SIZE}")
+    for label, elapsed in timings.items():
+        print(f"  {label:<26} {elapsed:>8.2f} ms")
+
+    assert timings["encode ndjson"] < timings["encode pretty (legacy)"]
+    assert timings["decode"] < timings["decode (legacy)"]
+    assert timings["decode ndjson"] < timings["decode (legacy)"]
@@ -0,0 +1,178 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Dependency work queue benchmark.
+
+Builds 100,000 tickets of random priority, each depending on up to three
+earlier tickets, in two queues:
+
+- naive: tickets in a dict; readiness is found by scanning every ticket
+  and checking its dependencies, then sorting by priority.
+- indexed: ``examples.reference.DependencyWorkQueue``, keeping dependency
+  counters and a heap of ready tickets.
+
+Reports the time of ``get_ready_tickets`` with ``limit=100`` and without
+a limit, and the mean time to complete the top ready ticket and read the
+next one. The indexed queue drains all 100,000 tickets that way; the
+naive queue is measured over 50 cycles. Both queues must return the
+same ready tickets, and the indexed one must be faster.
+
+Run with:
+    uv run pytest -m benchmark tests/benchmarks/test_work_queue_benchmark.py -v -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+
+import pytest
+
+from examples.reference.dependency_work_queue import DependencyWorkQueue
+
+TICKETS = 100_000
+MAX_DEPENDENCIES = 3
+LIMIT = 100
+NAIVE_CYCLES = 50
+PRIORITIES = ("urgent", "critical", "high", "normal", "low", "deferred")
+
+
+@dataclass(slots=True)
+class _Ticket:
+    ticket_id: str
+    rank: int
+    dependencies: list[str] = field(default_factory=list)
+    status: str = "pending"
+
+
+@dataclass(frozen=True, slots=True)
+class _Run:
+    top: list[str]
+    everything: list[str]
+    top_seconds: float
+    all_seconds: float
+    cycle_seconds: float
+
+
+class _ScanningQueue:
+    """Answers readiness by looking at every ticket."""
+
+    def __init__(self) -> None:
+        self.tickets: dict[str, _Ticket] = {}
+
+    def ready(self, limit: int | None = None) -> list[str]:
+        tickets = self.tickets
+        ready = [
+            (t.rank, i, t.ticket_id)
+            for i, t in enumerate(tickets.values())
+            if t.status == "pending"
+            and all(tickets[d].status == "completed" for d in t.dependencies)
+        ]
+        ready.sort()
+        return [ticket_id for _, _, ticket_id in ready[:limit]]
+
+    def complete(self, ticket_id: str) -> None:
+        self.tickets[ticket_id].status = "completed"
+
+
+def _graph() -> list[tuple[str, str, list[str]]]:
+    rng = random.Random(7)  # noqa: S311
+    graph = []
+    for i in range(TICKETS):
+        count = min(i, rng.randrange(MAX_DEPENDENCIES + 1))
+        dependencies = {f"t{rng.randrange(i)}" for _ in range(count)}
+        graph.append((f"t{i}", rng.choice(PRIORITIES), sorted(dependencies)))
+    return graph
+
+
+async def _indexed(graph: list[tuple[str, str, list[str]]]) -> DependencyWorkQueue:
+    queue = DependencyWorkQueue()
+    for ticket_id, priority, dependencies in graph:
+        queue.add_ticket(ticket_id, "job", priority=priority)  # type: ignore[arg-type]
+        for dependency in dependencies:
+            assert await queue.add_ticket_dependency(ticket_id, dependency)
+    return queue
+
+
+def _naive(graph: list[tuple[str, str, list[str]]]) -> _ScanningQueue:
+    queue = _ScanningQueue()
+    for ticket_id, priority, dependencies in graph:
+        queue.tickets[ticket_id] = _Ticket(
+            ticket_id, PRIORITIES.index(priority), dependencies
+        )
+    return queue
+
+
+async def _measure_indexed(
+    graph: list[tuple[str, str, list[str]]],
+) -> _Run:
+    queue = await _indexed(graph)
+    start = time.perf_counter()
+    top = await queue.get_ready_tickets(limit=LIMIT)
+    top_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    everything = await queue.get_ready_tickets()
+    all_seconds = time.perf_counter() - start
+
+    completed = 0
+    start = time.perf_counter()
+    while ready := await queue.get_ready_tickets(limit=1):
+        await queue.complete_ticket(ready[0].ticket_id, {})
+        completed += 1
+    cycle_seconds = (time.perf_counter() - start) / completed
+    assert completed == TICKETS
+    assert await queue.get_blocked_tickets() == []
+    return _Run(
+        [t.ticket_id for t in top],
+        [t.ticket_id for t in everything],
+        top_seconds,
+        all_seconds,
+        cycle_seconds,
+    )
+
+
+def _measure_naive(graph: list[tuple[str, str, list[str]]]) -> _Run:
+    queue = _naive(graph)
+    start = time.perf_counter()
+    top = queue.ready(LIMIT)
+    top_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    everything = queue.ready()
+    all_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(NAIVE_CYCLES):
+        queue.complete(queue.ready(1)[0])
+    cycle_seconds = (time.perf_counter() - start) / NAIVE_CYCLES
+    return _Run(top, everything, top_seconds, all_seconds, cycle_seconds)
+
+
+@pytest.mark.benchmark
+def test_ready_tickets_and_completion() -> None:
+    """Compare scanning for ready tickets with maintaining them."""
+    graph = _graph()
+    runs: dict[str, _Run] = {
+        "naive": _measure_naive(graph),
+        "indexed": asyncio.run(_measure_indexed(graph)),
+    }
+
+    print(f"\n{TICKETS} tickets, up to {MAX_DEPENDENCIES} dependencies each")
+    print(
+        f"{'queue':<8} {'ready top ' + str(LIMIT) + ' ms':>18} "
+        f"{'ready all ms':>13} {'complete+next us':>17}"
+    )
+    for label, run in runs.items():
+        print(
+            f"{label:<8} {run.top_seconds * 1000:>18.3f} "
+            f"{run.all_seconds * 1000:>13.1f} {run.cycle_seconds * 1e6:>17.1f}"
+        )
+
+    naive, indexed = runs["naive"], runs["indexed"]
+    assert indexed.top == naive.top
+    assert indexed.everything == naive.everything
+    assert indexed.top_seconds < naive.top_seconds
+    assert indexed.all_seconds < naive.all_seconds
+    assert indexed.cycle_seconds < naive.cycle_seconds
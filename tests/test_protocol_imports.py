@@ -9,6 +9,7 @@ and follow ONEX SPI design principles.
 """
 
 import importlib
+import json
 import os
 import pkgutil
 import subprocess
@@ -124,3 +125,109 @@ except Exception as e:
     assert "LiteralLogLevel type available: True" in result.stdout, (
         "LiteralLogLevel not properly imported"
     )
+
+
+# Upper bound on modules newly loaded by ``import omnibase_spi.protocols`` in a
+# fresh interpreter. The lazy barrel only pulls in the root package, the
+# barrel itself and its generated symbol index (plus stdlib modules used by
+# ``importlib.metadata``); the previous eager barrel loaded ~2,700 modules.
+MAX_BARREL_IMPORT_MODULES = 200
+
+
+def test_protocols_barrel_import_is_lazy() -> None:
+    """Test that importing the protocols barrel does not load protocol domains."""
+    test_script = """
+import json
+import sys
+
+before = set(sys.modules)
+import omnibase_spi.protocols
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(src_dir) + (
+        os.pathsep + env.get("PYTHONPATH", "") if env.get("PYTHONPATH") else ""
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", test_script],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        env=env,
+    )
+    assert result.returncode == 0, f"Barrel import failed: {result.stderr}"
+
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    assert len(loaded) < MAX_BARREL_IMPORT_MODULES, (
+        f"import omnibase_spi.protocols loaded {len(loaded)} modules "
+        f"(budget {MAX_BARREL_IMPORT_MODULES})"
+    )
+    assert sorted(m for m in loaded if m.startswith("omnibase")) == [
+        "omnibase_spi",
+        "omnibase_spi.protocols",
+        "omnibase_spi.protocols._symbol_index",
+    ]
+
+
+def test_protocols_barrel_resolves_every_export() -> None:
+    """Test that every ``__all__`` entry resolves to its indexed definition."""
+    from omnibase_spi.protocols._symbol_index import _LAZY_SYMBOL_MAP
+
+    exports = set(omnibase_spi.protocols.__all__)
+    assert exports == set(_LAZY_SYMBOL_MAP)
+
+    # Other tests re-import protocol modules; drop symbols resolved earlier.
+    omnibase_spi.protocols._clear_symbol_cache()
+    for name in sorted(exports):
+        module = importlib.import_module(_LAZY_SYMBOL_MAP[name])
+        assert getattr(omnibase_spi.protocols, name) is getattr(module, name), name
+
+
+def test_protocols_barrel_dir_lists_unloaded_exports() -> None:
+    """Test that ``dir()`` advertises exports before they are loaded."""
+    listed = set(dir(omnibase_spi.protocols))
+    assert set(omnibase_spi.protocols.__all__) <= listed
+
+
+def test_protocols_barrel_subpackage_attribute_access() -> None:
+    """Test that subpackages remain reachable as barrel attributes."""
+    assert omnibase_spi.protocols.core.__name__ == "omnibase_spi.protocols.core"
+    with pytest.raises(AttributeError):
+        _ = omnibase_spi.protocols.not_a_protocol_domain
+
+
+def test_protocols_symbol_index_is_current() -> None:
+    """Test that the generated symbol index matches the barrel declarations."""
+    # Run in a fresh interpreter: tests that reload protocol modules would
+    # otherwise defeat the generator's defining-module identity check.
+    script = (
+        Path(__file__).parent.parent / "scripts" / "generate_protocol_symbol_index.py"
+    )
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = str(src_dir) + (
+        os.pathsep + env.get("PYTHONPATH", "") if env.get("PYTHONPATH") else ""
+    )
+
+    result = subprocess.run(
+        [sys.executable, str(script), "--check"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env=env,
+    )
+    assert result.returncode == 0, (
+        "Symbol index is stale; run "
+        f"`uv run python scripts/generate_protocol_symbol_index.py`\n{result.stdout}"
+    )
+
+
+def test_root_lazy_protocol_map_entries_resolve() -> None:
+    """Test that every root-level lazy export points at a real definition."""
+    import omnibase_spi
+
+    for name, module_path in sorted(omnibase_spi._LAZY_PROTOCOL_MAP.items()):
+        module = importlib.import_module(module_path)
+        assert getattr(omnibase_spi, name) is getattr(module, name), name
@@ -27,9 +27,11 @@ scripts_dir = Path(__file__).parent.parent / "scripts"
 if str(scripts_dir) not in sys.path:
     sys.path.insert(0, str(scripts_dir))
 
+import check_unused_exports as checker
 from check_unused_exports import (
     _extract_all_exports,
     _find_symbol_consumers,
+    build_symbol_index,
     check_unused_exports,
 )
 
@@ -110,3 +112,79 @@ class TestUnusedExportDetection:
                 f"{', '.join(stale)}\n"
                 f"Remove stale entries from scripts/export_allowlist.txt"
             )
+
+
+_FIXTURE_FILES = {
+    "alias.py": "from pkg import ProtocolAlpha as Alias\n",
+    "forward_ref.py": 'x: "ProtocolBeta" = None\n',
+    "attribute.py": "import pkg\n\npkg.ProtocolGamma\n",
+    "class_def.py": "class ProtocolDelta:\n    pass\n",
+    "mentions.py": '# ProtocolEpsilon\n"""See ProtocolEpsilon."""\n',
+    "broken.py": "def broken(:\n    ProtocolAlpha\n",
+    "__init__.py": "from pkg import ProtocolEpsilon\n",
+    "nested/usage.py": "ProtocolAlpha()\nProtocolDelta\n",
+}
+_FIXTURE_SYMBOLS = [
+    "ProtocolAlpha",
+    "Alias",
+    "ProtocolBeta",
+    "ProtocolGamma",
+    "ProtocolDelta",
+    "ProtocolEpsilon",
+    "pkg",
+    "ProtocolMissing",
+]
+
+
+@pytest.mark.unit
+class TestSymbolIndex:
+    """The one-pass symbol index must match the per-symbol search exactly."""
+
+    @pytest.fixture
+    def fixture_tree(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Write a tree covering every reference kind and a syntax error."""
+        search_dir = tmp_path / "src"
+        for name, source in _FIXTURE_FILES.items():
+            path = search_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source, encoding="utf-8")
+        monkeypatch.setattr(checker, "REPO_ROOT", tmp_path)
+        return search_dir
+
+    def test_index_matches_per_symbol_search(self, fixture_tree: Path) -> None:
+        """Every reference kind resolves to the same files in the same order."""
+        index = build_symbol_index([fixture_tree])
+
+        for symbol in _FIXTURE_SYMBOLS:
+            assert index.consumers(symbol) == _find_symbol_consumers(
+                symbol, [fixture_tree]
+            ), symbol
+
+    def test_regex_fallback_for_unparseable_files(self, fixture_tree: Path) -> None:
+        """Files with syntax errors are matched by word boundary, in scan order."""
+        consumers = build_symbol_index([fixture_tree]).consumers("ProtocolAlpha")
+
+        assert sorted(consumers) == [
+            "src/alias.py",
+            "src/broken.py",
+            "src/nested/usage.py",
+        ]
+        assert build_symbol_index([fixture_tree]).consumers("ProtocolEpsilon") == []
+
+    def test_parallel_index_matches_serial(self, fixture_tree: Path) -> None:
+        """Parsing in worker processes builds the same index."""
+        serial = build_symbol_index([fixture_tree])
+        parallel = build_symbol_index([fixture_tree], jobs=2)
+
+        for symbol in _FIXTURE_SYMBOLS:
+            assert parallel.consumers(symbol) == serial.consumers(symbol)
+
+    def test_index_matches_per_symbol_search_on_repository(self) -> None:
+        """A sample of real exports resolves identically on the repository."""
+        search_dirs = [REPO_ROOT / "src", REPO_ROOT / "tests"]
+        index = build_symbol_index(search_dirs)
+
+        for symbol in ["ProtocolLogger", "ProtocolNode", "ProtocolHealthMonitor"]:
+            assert index.consumers(symbol) == _find_symbol_consumers(
+                symbol, search_dirs
+            ), symbol
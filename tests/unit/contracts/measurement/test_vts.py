@@ -11,12 +11,19 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
+from omnibase_spi.contracts.measurement import vts as vts_module
 from omnibase_spi.contracts.measurement.contract_pr_validation_rollup import (
     ContractPrScope,
     ContractPrValidationRollup,
     ContractValidationTax,
 )
-from omnibase_spi.contracts.measurement.vts import compute_vts, compute_vts_per_kloc
+from omnibase_spi.contracts.measurement.vts import (
+    VTS_COUNTER_FIELDS,
+    compute_vts,
+    compute_vts_batch,
+    compute_vts_per_kloc,
+    compute_vts_per_kloc_batch,
+)
 
 
 @pytest.mark.unit
@@ -149,3 +156,95 @@ class TestContractPrValidationRollup:
                 model_id="sonnet",
                 bad_field="nope",  # type: ignore[call-arg]
             )
+
+
+def _taxes(count: int) -> list[ContractValidationTax]:
+    return [
+        ContractValidationTax(
+            blocking_failures=i % 4,
+            warn_findings=(i * 7) % 13,
+            reruns=i % 3,
+            validator_runtime_ms=(i * 7919) % 600_000,
+            human_escalations=i % 2,
+            autofix_successes=(i * 5) % 9,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each batch test with NumPy and with the pure-Python fallback."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(vts_module, "_HAS_NUMPY", False)
+    return str(request.param)
+
+
+@pytest.mark.unit
+class TestVtsBatch:
+    """Batch VTS functions match the scalar functions element by element."""
+
+    def test_batch_matches_scalar(self, backend: str) -> None:
+        taxes = _taxes(500)
+        assert compute_vts_batch(taxes) == [compute_vts(t) for t in taxes]
+
+    def test_batch_matches_scalar_with_weights(self, backend: str) -> None:
+        taxes = _taxes(100)
+        weights = {
+            "blocking_failures": 0.1,
+            "warn_findings": 1 / 3,
+            "reruns": 2.7,
+            "validator_runtime_s": 0.013,
+            "human_escalations": 7.0,
+            "autofix_successes": -1.1,
+        }
+        assert compute_vts_batch(taxes, weights) == [
+            compute_vts(t, weights) for t in taxes
+        ]
+
+    def test_empty_weights_use_defaults(self, backend: str) -> None:
+        taxes = _taxes(10)
+        assert compute_vts_batch(taxes, {}) == compute_vts_batch(taxes)
+
+    def test_columnar_input(self, backend: str) -> None:
+        taxes = _taxes(200)
+        columns = {
+            name: [getattr(t, name) for t in taxes] for name in VTS_COUNTER_FIELDS
+        }
+        assert compute_vts_batch(columns) == compute_vts_batch(taxes)
+
+    def test_columnar_input_missing_column(self, backend: str) -> None:
+        with pytest.raises(KeyError):
+            compute_vts_batch({"blocking_failures": [1]})
+
+    def test_columnar_input_ragged_columns(self, backend: str) -> None:
+        columns: dict[str, list[int]] = {name: [1, 2] for name in VTS_COUNTER_FIELDS}
+        columns["reruns"] = [1]
+        with pytest.raises(ValueError):
+            compute_vts_batch(columns)
+
+    def test_empty_batch(self, backend: str) -> None:
+        assert compute_vts_batch([]) == []
+        assert compute_vts_per_kloc_batch([], []) == []
+
+    def test_counters_beyond_float_precision(self, backend: str) -> None:
+        taxes = [ContractValidationTax(validator_runtime_ms=2**60 + 1, reruns=1)]
+        assert compute_vts_batch(taxes) == [compute_vts(taxes[0])]
+
+    def test_per_kloc_matches_scalar(self, backend: str) -> None:
+        lines = [0, 5, 999, 1000, 1999, 2000, 123_456, -5, 2**70]
+        values = [100.0, 1.5, -3.0, 7.25, 0.0, 50.0, 1e9, 3.0, 1.0]
+        assert compute_vts_per_kloc_batch(values, lines) == [
+            compute_vts_per_kloc(v, n) for v, n in zip(values, lines, strict=True)
+        ]
+
+    def test_per_kloc_length_mismatch(self, backend: str) -> None:
+        with pytest.raises(ValueError, match="lines_changed"):
+            compute_vts_per_kloc_batch([1.0, 2.0], [1000])
+
+    def test_results_are_python_floats(self, backend: str) -> None:
+        scores = compute_vts_batch(_taxes(3))
+        per_kloc = compute_vts_per_kloc_batch(scores, [10, 2000, 0])
+        assert all(type(v) is float for v in scores + per_kloc)
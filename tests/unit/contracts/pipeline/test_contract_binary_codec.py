@@ -0,0 +1,186 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the schema-indexed MessagePack codec."""
+
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from omnibase_spi.contracts.measurement import (
+    ContractArtifactPointerMeasurement,
+    ContractCostMetrics,
+    ContractDurationMetrics,
+    ContractEnumPipelinePhase,
+    ContractEnumResultClassification,
+    ContractMeasurementContext,
+    ContractMeasurementEvent,
+    ContractOutcomeMetrics,
+    ContractPhaseMetrics,
+    ContractProducer,
+    ContractTestMetrics,
+)
+from omnibase_spi.contracts.pipeline import contract_binary_codec
+from omnibase_spi.contracts.pipeline.contract_binary_codec import (
+    from_msgpack,
+    to_msgpack,
+)
+from omnibase_spi.contracts.pipeline.contract_checkpoint import ContractCheckpoint
+from omnibase_spi.contracts.pipeline.contract_wire_codec import to_json
+from omnibase_spi.contracts.shared.contract_check_result import ContractCheckResult
+
+
+def _phase_metrics() -> ContractPhaseMetrics:
+    return ContractPhaseMetrics(
+        run_id="run-001",
+        phase=ContractEnumPipelinePhase.VERIFY,
+        phase_id="phase-verify-1",
+        attempt=2,
+        context=ContractMeasurementContext(ticket_id="T-1"),
+        producer=ContractProducer(name="ticket-pipeline"),
+        duration=ContractDurationMetrics(wall_clock_ms=5000.0),
+        cost=ContractCostMetrics(llm_total_tokens=1000),
+        outcome=ContractOutcomeMetrics(
+            result_classification=ContractEnumResultClassification.SUCCESS,
+        ),
+        tests=ContractTestMetrics(total_tests=50, passed_tests=50, pass_rate=1.0),
+        artifact_pointers=[
+            ContractArtifactPointerMeasurement(artifact_type="commit", uri="abc123"),
+            ContractArtifactPointerMeasurement(artifact_type="pr", uri="#42"),
+        ],
+        extensions={"ci": True, "nested": {"b": [1, 2.5, None], "a": "é"}},
+    )
+
+
+def _samples() -> list[BaseModel]:
+    return [
+        _phase_metrics(),
+        ContractPhaseMetrics(run_id="run-2", phase=ContractEnumPipelinePhase.PLAN),
+        ContractMeasurementEvent(
+            event_id="evt-1",
+            event_type="phase_completed",
+            timestamp_iso="2025-01-01T00:00:00Z",
+            payload=_phase_metrics(),
+        ),
+        ContractCheckpoint(
+            run_id="run-1",
+            phase="local_review",
+            status="completed",
+            artifacts={"report": "s3://bucket/key", "count": -7},
+            unknown_extra_field={"kept": True},
+        ),
+        ContractCheckResult(check_id="X", domain="rrh", status="pass", value=2**40),
+    ]
+
+
+@pytest.fixture(params=["msgpack", "pure-python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run each test with the msgpack package and with the built-in packer."""
+    if request.param == "msgpack":
+        pytest.importorskip("msgpack")
+    else:
+        monkeypatch.setattr(contract_binary_codec, "_HAS_MSGPACK", False)
+    return str(request.param)
+
+
+@pytest.mark.unit
+class TestMsgpackRoundTrip:
+    """Round-trip equivalence with the canonical JSON form."""
+
+    @pytest.mark.parametrize("model", _samples(), ids=lambda m: type(m).__name__)
+    def test_round_trip_matches_canonical_json(
+        self, backend: str, model: BaseModel
+    ) -> None:
+        """Decoded models equal the original and re-encode to identical JSON."""
+        decoded = from_msgpack(to_msgpack(model), type(model))
+
+        assert decoded == model
+        assert to_json(decoded) == to_json(model)
+
+    def test_smaller_than_compact_json(self, backend: str) -> None:
+        """Field names are not written, so payloads beat compact JSON."""
+        model = _phase_metrics()
+        assert len(to_msgpack(model)) < len(to_json(model, indent=None).encode())
+
+    def test_extras_round_trip(self, backend: str) -> None:
+        """Unknown fields of extra='allow' models survive the round trip."""
+        cp = ContractCheckpoint(run_id="r", phase="p", status="failed", extra_a=1)
+        decoded = from_msgpack(to_msgpack(cp), ContractCheckpoint)
+        assert decoded.model_extra == {"extra_a": 1}
+
+
+@pytest.mark.unit
+class TestMsgpackErrors:
+    """Malformed and mismatched payloads are rejected with ValueError."""
+
+    def test_layout_mismatch_rejected(self, backend: str) -> None:
+        """A payload for a different model is not misread."""
+        data = to_msgpack(
+            ContractCheckResult(check_id="X", domain="rrh", status="pass")
+        )
+        with pytest.raises(ValueError, match="field layout"):
+            from_msgpack(data, ContractCheckpoint)
+
+    @pytest.mark.parametrize("data", [b"", b"\x92\x01", b"\xc1", b"\x01\x02"])
+    def test_malformed_payload(self, backend: str, data: bytes) -> None:
+        """Truncated, unsupported or trailing bytes raise ValueError."""
+        with pytest.raises(ValueError):
+            from_msgpack(data, ContractCheckResult)
+
+
+@pytest.mark.unit
+class TestPurePythonPacker:
+    """The fallback packer is byte-compatible with the msgpack package."""
+
+    VALUES: list[Any] = [
+        0,
+        127,
+        128,
+        2**16,
+        2**64 - 1,
+        -1,
+        -33,
+        -(2**15) - 1,
+        -(2**63),
+        1.5,
+        None,
+        True,
+        False,
+        "",
+        "x" * 31,
+        "x" * 32,
+        "é" * 200,
+        "x" * 70_000,
+        b"\x00" * 300,
+        list(range(16)),
+        {f"k{i}": [i, {"z": None}] for i in range(20)},
+    ]
+
+    @pytest.mark.parametrize("value", VALUES, ids=lambda v: type(v).__name__)
+    def test_matches_msgpack_bytes(self, value: Any) -> None:
+        """Encodings match msgpack.packb(use_bin_type=True) exactly."""
+        msgpack = pytest.importorskip("msgpack")
+        packed = contract_binary_codec._pack(value)
+
+        assert packed == msgpack.packb(value, use_bin_type=True)
+        assert contract_binary_codec._unpack(packed) == value
+
+    def test_integer_overflow(self) -> None:
+        """Integers outside the 64-bit range cannot be encoded."""
+        with pytest.raises(OverflowError):
+            contract_binary_codec._pack(2**64)
+
+
+@pytest.mark.unit
+def test_self_referential_model_layout() -> None:
+    """Recursive models fall back to plain mappings for the nested field."""
+
+    class Node(BaseModel):
+        model_config = ConfigDict(frozen=True)
+
+        name: str
+        child: "Node | None" = None
+
+    tree = Node(name="root", child=Node(name="leaf"))
+    assert from_msgpack(to_msgpack(tree), Node) == tree
@@ -3,14 +3,18 @@
 
 """Tests for pipeline wire codec helpers."""
 
+import io
 import json
 
 import pytest
 
 from omnibase_spi.contracts.pipeline.contract_wire_codec import (
     from_json,
+    from_ndjson,
     from_yaml,
+    iter_ndjson,
     to_json,
+    to_ndjson,
     to_yaml,
 )
 from omnibase_spi.contracts.shared.contract_check_result import ContractCheckResult
@@ -51,6 +55,35 @@ class TestToJson:
         cr2 = from_json(j, ContractCheckResult)
         assert cr == cr2
 
+    def test_compact_is_canonical(self) -> None:
+        """indent=None yields sorted keys with no whitespace."""
+        cr = ContractCheckResult(
+            check_id="RRH-1001",
+            domain="rrh",
+            status="pass",
+            message="caf\u00e9",
+        )
+        expected = json.dumps(
+            cr.model_dump(mode="json"),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        assert to_json(cr, indent=None) == expected
+        assert "\n" not in expected
+
+    @pytest.mark.parametrize("indent", [2, 4])
+    def test_indented_matches_json_dumps(self, indent: int) -> None:
+        """Indented output is unchanged from json.dumps with sorted keys."""
+        cr = ContractCheckResult(check_id="X", domain="rrh", status="pass")
+        expected = json.dumps(
+            cr.model_dump(mode="json"),
+            sort_keys=True,
+            indent=indent,
+            ensure_ascii=False,
+        )
+        assert to_json(cr, indent=indent) == expected
+
 
 @pytest.mark.unit
 class TestFromJson:
@@ -70,6 +103,80 @@ class TestFromJson:
         assert cr.check_id == "X"
         assert cr.model_extra is not None
 
+    def test_accepts_bytes(self) -> None:
+        """UTF-8 bytes decode like text."""
+        cr = ContractCheckResult(check_id="X", domain="rrh", status="pass")
+        assert from_json(to_json(cr).encode(), ContractCheckResult) == cr
+
+    def test_invalid_json_raises_value_error(self) -> None:
+        """Malformed input raises a ValueError subclass."""
+        with pytest.raises(ValueError):
+            from_json("{not json", ContractCheckResult)
+
+
+def _check_results(count: int) -> list[ContractCheckResult]:
+    return [
+        ContractCheckResult(
+            check_id=f"CHECK-{i}",
+            domain="rrh",
+            status="pass" if i % 2 else "fail",
+            message="line\u2028separator" if i == 1 else f"message {i}",
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestNdjson:
+    """Tests for newline-delimited JSON batch and streaming helpers."""
+
+    def test_one_compact_line_per_model(self) -> None:
+        """Each model becomes one canonical compact line."""
+        models = _check_results(3)
+        ndjson = to_ndjson(models)
+
+        assert ndjson.endswith("\n")
+        assert ndjson.split("\n")[:-1] == [to_json(m, indent=None) for m in models]
+
+    def test_empty_batch(self) -> None:
+        """No models encode to an empty document and decode back to []."""
+        assert to_ndjson([]) == ""
+        assert from_ndjson("", ContractCheckResult) == []
+
+    def test_round_trip(self) -> None:
+        """Batch round-trip preserves models and order."""
+        models = _check_results(5)
+        assert from_ndjson(to_ndjson(models), ContractCheckResult) == models
+
+    def test_round_trip_bytes(self) -> None:
+        """Batch decoding accepts UTF-8 bytes."""
+        models = _check_results(3)
+        encoded = to_ndjson(models).encode()
+        assert from_ndjson(encoded, ContractCheckResult) == models
+
+    def test_iter_streams_text_and_binary_files(self) -> None:
+        """iter_ndjson decodes lazily from open text and binary streams."""
+        models = _check_results(4)
+        ndjson = to_ndjson(models)
+
+        decoded = iter_ndjson(io.StringIO(ndjson), ContractCheckResult)
+        assert next(decoded) == models[0]
+        assert list(decoded) == models[1:]
+        binary = io.BytesIO(ndjson.encode())
+        assert list(iter_ndjson(binary, ContractCheckResult)) == models
+
+    def test_blank_lines_skipped(self) -> None:
+        """Blank and whitespace-only lines are ignored."""
+        models = _check_results(2)
+        lines = [to_json(models[0], indent=None), "", "   ", to_json(models[1])]
+        assert list(iter_ndjson(lines, ContractCheckResult)) == models
+
+    def test_error_reports_line_number(self) -> None:
+        """Invalid lines raise ValueError naming the 1-based line."""
+        ndjson = to_ndjson(_check_results(2)) + '{"check_id": "X"}\n'
+        with pytest.raises(ValueError, match="NDJSON line 3"):
+            from_ndjson(ndjson, ContractCheckResult)
+
 
 @pytest.mark.unit
 class TestYamlSerialization:
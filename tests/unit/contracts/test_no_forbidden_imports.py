@@ -23,6 +23,7 @@ FORBIDDEN_PREFIXES = ("omnibase_core", "omnibase_infra", "omniclaude")
 _NON_MODEL_UTILITIES = frozenset(
     {
         "contract_wire_codec.py",
+        "contract_binary_codec.py",
         "contract_schema_compat.py",
     }
 )
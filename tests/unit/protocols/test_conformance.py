@@ -0,0 +1,302 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the cached protocol conformance checker.
+
+Verifies that ``conforms`` and ``check_many`` agree with ``isinstance`` for
+nominal, structural, registered and instance-attribute based conformance,
+and that cached verdicts follow class mutation and garbage collection.
+"""
+
+from __future__ import annotations
+
+import gc
+import importlib
+from collections.abc import Iterator
+from typing import Protocol, runtime_checkable
+
+import pytest
+
+import omnibase_spi
+from omnibase_spi.protocols import conformance
+from omnibase_spi.protocols.conformance import (
+    check_many,
+    clear_conformance_cache,
+    conforms,
+    invalidate,
+    required_members,
+)
+
+
+@runtime_checkable
+class ProtocolGreeter(Protocol):
+    """Protocol with one data member and two methods."""
+
+    name: str
+
+    def greet(self) -> str: ...
+
+    def farewell(self) -> str: ...
+
+
+@runtime_checkable
+class ProtocolCloser(Protocol):
+    """Protocol with a single method."""
+
+    def close(self) -> None: ...
+
+
+class ProtocolNotRuntime(Protocol):
+    """Protocol without ``@runtime_checkable``."""
+
+    def run(self) -> None: ...
+
+
+class StructuralGreeter:
+    """Satisfies ProtocolGreeter purely at class level."""
+
+    name = "structural"
+
+    def greet(self) -> str:
+        return "hello"
+
+    def farewell(self) -> str:
+        return "bye"
+
+
+class InstanceNamedGreeter:
+    """Provides the data member only as an instance attribute."""
+
+    def __init__(self, name: str | None = None) -> None:
+        if name is not None:
+            self.name = name
+
+    def greet(self) -> str:
+        return "hello"
+
+    def farewell(self) -> str:
+        return "bye"
+
+
+class NominalGreeter(ProtocolGreeter):
+    """Explicitly subclasses the protocol."""
+
+    name = "nominal"
+
+    def greet(self) -> str:
+        return "hello"
+
+    def farewell(self) -> str:
+        return "bye"
+
+
+class SlottedCloser:
+    """Has no instance ``__dict__``."""
+
+    __slots__ = ()
+
+    def close(self) -> None:
+        return None
+
+
+class Unrelated:
+    """Conforms to nothing."""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    clear_conformance_cache()
+    yield
+    clear_conformance_cache()
+
+
+def _assert_agrees(obj: object, protocol: type) -> bool:
+    """Assert ``conforms`` matches ``isinstance`` on a cold and a warm cache."""
+    expected = isinstance(obj, protocol)
+    assert conforms(obj, protocol) is expected
+    assert conforms(obj, protocol) is expected
+    return expected
+
+
+@pytest.mark.unit
+class TestConformsAgreesWithIsinstance:
+    """``conforms`` returns exactly what ``isinstance`` returns."""
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            StructuralGreeter(),
+            NominalGreeter(),
+            InstanceNamedGreeter("instance"),
+            InstanceNamedGreeter(),
+            SlottedCloser(),
+            Unrelated(),
+            object(),
+            42,
+            "text",
+            StructuralGreeter,
+        ],
+        ids=lambda obj: type(obj).__name__,
+    )
+    @pytest.mark.parametrize("protocol", [ProtocolGreeter, ProtocolCloser])
+    def test_matches_isinstance(self, obj: object, protocol: type) -> None:
+        """Verify verdicts for assorted objects on cold and warm cache."""
+        _assert_agrees(obj, protocol)
+
+    def test_instance_attributes_are_checked_per_instance(self) -> None:
+        """Verify one cached type serves instances with different attributes."""
+        assert _assert_agrees(InstanceNamedGreeter("a"), ProtocolGreeter) is True
+        assert _assert_agrees(InstanceNamedGreeter(), ProtocolGreeter) is False
+        assert _assert_agrees(InstanceNamedGreeter("b"), ProtocolGreeter) is True
+
+    def test_instance_none_shadowing_method(self) -> None:
+        """Verify an instance attribute set to None hides a method."""
+        obj = InstanceNamedGreeter("shadowed")
+        obj.greet = None  # type: ignore[assignment, method-assign]
+
+        assert _assert_agrees(obj, ProtocolGreeter) is False
+
+    def test_registered_virtual_subclass(self) -> None:
+        """Verify classes registered with the protocol ABC conform."""
+
+        class Registered:
+            pass
+
+        assert _assert_agrees(Registered(), ProtocolCloser) is False
+        ProtocolCloser.register(Registered)
+
+        assert _assert_agrees(Registered(), ProtocolCloser) is True
+
+    def test_non_protocol_class_uses_isinstance(self) -> None:
+        """Verify concrete classes fall back to ``isinstance``."""
+        assert conforms(NominalGreeter(), NominalGreeter) is True
+        assert conforms(StructuralGreeter(), NominalGreeter) is False
+
+    def test_non_runtime_protocol_raises(self) -> None:
+        """Verify the same TypeError as ``isinstance`` is raised."""
+        with pytest.raises(TypeError, match="runtime_checkable"):
+            isinstance(Unrelated(), ProtocolNotRuntime)  # type: ignore[misc]
+        with pytest.raises(TypeError, match="runtime_checkable"):
+            conforms(Unrelated(), ProtocolNotRuntime)
+
+    def test_lazy_protocol_map_protocols(self) -> None:
+        """Verify agreement for every root-level lazily exported protocol."""
+        for name in omnibase_spi._LAZY_PROTOCOL_MAP:
+            protocol = getattr(omnibase_spi, name)
+            members = getattr(protocol, "__protocol_attrs__", ())
+            full = type("Full", (), dict.fromkeys(members, lambda _self: None))
+            partial = type("Partial", (), dict.fromkeys(sorted(members)[:1], 1))
+            for obj in (full(), partial(), Unrelated()):
+                _assert_agrees(obj, protocol)
+
+
+@pytest.mark.unit
+class TestConformanceInvalidation:
+    """Cached verdicts follow class mutation."""
+
+    def test_adding_a_method_is_noticed(self) -> None:
+        """Verify a class that gains the missing member starts conforming."""
+
+        class Growing:
+            pass
+
+        obj = Growing()
+        assert _assert_agrees(obj, ProtocolCloser) is False
+
+        Growing.close = lambda _self: None  # type: ignore[attr-defined]
+        assert _assert_agrees(obj, ProtocolCloser) is True
+
+    def test_adding_a_method_to_a_base_is_noticed(self) -> None:
+        """Verify mutation anywhere in the MRO invalidates the entry."""
+
+        class Base:
+            pass
+
+        class Child(Base):
+            pass
+
+        obj = Child()
+        assert _assert_agrees(obj, ProtocolCloser) is False
+
+        Base.close = lambda _self: None  # type: ignore[attr-defined]
+        assert _assert_agrees(obj, ProtocolCloser) is True
+
+    def test_swapping_members_is_noticed(self) -> None:
+        """Verify deleting one member and adding another invalidates the entry."""
+
+        class Swapped:
+            def foo(self) -> None:
+                return None
+
+        obj = Swapped()
+        assert _assert_agrees(obj, ProtocolCloser) is False
+
+        del Swapped.foo
+        Swapped.close = lambda _self: None  # type: ignore[attr-defined]
+        assert _assert_agrees(obj, ProtocolCloser) is True
+
+    def test_invalidate_after_rebinding_to_none(self) -> None:
+        """Verify ``invalidate`` picks up in-place rebinding of a member."""
+
+        class Rebound:
+            def __init__(self) -> None:
+                self.name = "rebound"
+
+            def greet(self) -> str:
+                return "hello"
+
+            def farewell(self) -> str:
+                return "bye"
+
+        obj = Rebound()
+        assert _assert_agrees(obj, ProtocolGreeter) is True
+
+        Rebound.greet = None  # type: ignore[assignment, method-assign]
+        invalidate(Rebound)
+
+        assert _assert_agrees(obj, ProtocolGreeter) is False
+
+    def test_collected_classes_are_evicted(self) -> None:
+        """Verify verdicts do not keep dynamically created classes alive."""
+
+        class Temporary:
+            def close(self) -> None:
+                return None
+
+        key = id(Temporary)
+        assert conforms(Temporary(), ProtocolCloser) is True
+        assert key in conformance._class_refs
+
+        del Temporary
+        gc.collect()
+
+        assert key not in conformance._class_refs
+        assert all(key not in table for table in conformance._verdicts.values())
+
+
+@pytest.mark.unit
+class TestConformanceHelpers:
+    """Tests for ``check_many`` and ``required_members``."""
+
+    def test_check_many_preserves_order(self) -> None:
+        """Verify bulk checks return one verdict per protocol in order."""
+        result = check_many(StructuralGreeter(), [ProtocolCloser, ProtocolGreeter])
+
+        assert list(result) == [ProtocolCloser, ProtocolGreeter]
+        assert result == {ProtocolCloser: False, ProtocolGreeter: True}
+
+    def test_required_members(self) -> None:
+        """Verify the member set matches the protocol definition."""
+        assert required_members(ProtocolGreeter) == {"name", "greet", "farewell"}
+
+    def test_required_members_rejects_concrete_class(self) -> None:
+        """Verify a concrete class is rejected."""
+        with pytest.raises(TypeError, match="not a Protocol"):
+            required_members(StructuralGreeter)
+
+    def test_handler_protocol_members(self) -> None:
+        """Verify members of a real SPI protocol are resolved."""
+        module = importlib.import_module("omnibase_spi.protocols.handlers")
+        members = required_members(module.ProtocolHandler)
+
+        assert {"execute", "handler_type", "initialize"} <= members
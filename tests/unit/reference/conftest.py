@@ -0,0 +1,18 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""
+Shared test helpers for the reference implementation tests.
+"""
+
+from __future__ import annotations
+
+
+class ManualClock:
+    """Clock that only moves when a test advances ``now``."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
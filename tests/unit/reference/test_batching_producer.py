@@ -0,0 +1,270 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the adaptive micro-batching producer wrapper."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from examples.reference.batching_producer import BatchingProducer
+from omnibase_core.models.event_bus import (
+    ModelProducerHealthStatus,
+    ModelProducerMessage,
+)
+from omnibase_spi.exceptions import InvalidProtocolStateError, ProtocolHandlerError
+from omnibase_spi.protocols.event_bus.protocol_event_bus_producer_handler import (
+    DeliveryCallback,
+    ProtocolEventBusProducerHandler,
+)
+
+TOPIC = "onex.evt.reference.v1"
+
+
+class _FakeProducer:
+    """Producer that records batches and reports every message delivered."""
+
+    handler_type = "event_bus_producer"
+    supports_transactions = True
+    supports_exactly_once = False
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.batches: list[list[ModelProducerMessage]] = []
+        self.calls: list[str] = []
+        self.fail = fail
+
+    async def send(self, topic: str, value: bytes, **kwargs: object) -> None:
+        """Unused by the wrapper."""
+        raise AssertionError("BatchingProducer must only call send_batch")
+
+    async def send_batch(
+        self,
+        messages: Sequence[ModelProducerMessage],
+        on_success: DeliveryCallback | None = None,
+        on_error: DeliveryCallback | None = None,
+    ) -> int:
+        """Record the batch and report each message."""
+        self.calls.append("send_batch")
+        if self.fail:
+            raise RuntimeError("broker down")
+        self.batches.append(list(messages))
+        for message in messages:
+            if on_success is not None:
+                on_success(message.topic, message.key, message.value, None)
+        return len(messages)
+
+    async def flush(self, timeout_seconds: float = 30.0) -> None:
+        """Record the call."""
+        self.calls.append("flush")
+
+    async def close(self, timeout_seconds: float = 30.0) -> None:
+        """Record the call."""
+        self.calls.append("close")
+
+    async def health_check(self) -> ModelProducerHealthStatus:
+        """Report a healthy producer with one in-flight message."""
+        return ModelProducerHealthStatus(
+            healthy=True, connected=True, pending_messages=1
+        )
+
+    async def begin_transaction(self) -> None:
+        """Record the call."""
+        self.calls.append("begin")
+
+    async def commit_transaction(self) -> None:
+        """Record the call."""
+        self.calls.append("commit")
+
+    async def abort_transaction(self) -> None:
+        """Record the call."""
+        self.calls.append("abort")
+
+
+class _Config:
+    """ProtocolRedpandaConfig subset used by from_config."""
+
+    batch_size_bytes = 4096
+    linger_ms = 7
+
+
+def _values(batches: list[list[ModelProducerMessage]]) -> list[bytes]:
+    return [message.value for batch in batches for message in batch]
+
+
+@pytest.mark.unit
+class TestBatchingProducer:
+    def test_conforms_to_producer_protocol(self) -> None:
+        """The wrapper is itself a ProtocolEventBusProducerHandler."""
+        producer = BatchingProducer(_FakeProducer())
+        assert isinstance(producer, ProtocolEventBusProducerHandler)
+        assert producer.handler_type == "event_bus_producer"
+        assert producer.supports_transactions is True
+
+    def test_rejects_invalid_thresholds(self) -> None:
+        """Sizes must be positive and linger bounds ordered."""
+        with pytest.raises(ValueError, match="batch_size_bytes"):
+            BatchingProducer(_FakeProducer(), batch_size_bytes=0)
+        with pytest.raises(ValueError, match="min_linger_ms"):
+            BatchingProducer(_FakeProducer(), linger_ms=1, min_linger_ms=2)
+
+    def test_from_config_uses_batch_size_and_linger(self) -> None:
+        """from_config mirrors ProtocolRedpandaConfig thresholds."""
+        producer = BatchingProducer.from_config(_FakeProducer(), _Config())  # type: ignore[arg-type]
+        assert producer.linger_ms == 7
+
+    async def test_size_threshold_sends_immediately(self) -> None:
+        """Reaching batch_size_bytes sends the batch from send()."""
+        inner = _FakeProducer()
+        producer = BatchingProducer(inner, batch_size_bytes=10, linger_ms=1000)
+
+        for i in range(3):
+            await producer.send(TOPIC, b"abcd", key=str(i).encode())
+
+        assert [len(batch) for batch in inner.batches] == [2]
+        assert producer.pending_messages == 1
+
+    async def test_linger_sends_partial_batch(self) -> None:
+        """A partial batch goes out when the linger window closes."""
+        inner = _FakeProducer()
+        producer = BatchingProducer(inner, linger_ms=1, adaptive=False)
+
+        for i in range(3):
+            await producer.send(TOPIC, str(i).encode())
+        assert inner.batches == []
+        await asyncio.sleep(0.02)
+
+        assert _values(inner.batches) == [b"0", b"1", b"2"]
+        assert producer.batches_sent == 1
+
+    async def test_send_order_is_preserved_across_batches(self) -> None:
+        """Messages reach the wrapped producer in send order."""
+        inner = _FakeProducer()
+        producer = BatchingProducer(inner, batch_size_bytes=7, linger_ms=0.5)
+        values = [str(i).encode() for i in range(50)]
+
+        for i, value in enumerate(values):
+            await producer.send(TOPIC, value, key=f"k{i % 3}".encode())
+            if i % 9 == 0:
+                await asyncio.sleep(0.001)
+        await producer.flush()
+
+        assert _values(inner.batches) == values
+        assert len(inner.batches) > 1
+        assert producer.messages_sent == 50
+
+    async def test_callbacks_are_routed_per_message(self) -> None:
+        """Each message's own callback fires, identical messages included."""
+        inner = _FakeProducer()
+        producer = BatchingProducer(inner)
+        reports: list[tuple[str, bytes]] = []
+
+        def tagged(tag: str) -> DeliveryCallback:
+            def callback(
+                _topic: str,
+                _key: bytes | None,
+                value: bytes,
+                _error: Exception | None,
+            ) -> None:
+                reports.append((tag, value))
+
+            return callback
+
+        await producer.send(TOPIC, b"a", on_success=tagged("first"))
+        await producer.send(TOPIC, b"b")
+        await producer.send(TOPIC, b"a", on_success=tagged("second"))
+        await producer.send(TOPIC, b"c", on_error=tagged("never"))
+        await producer.flush()
+
+        assert reports == [("first", b"a"), ("second", b"a")]
+
+    async def test_failed_batch_reports_errors_and_raises(self) -> None:
+        """A failing send_batch calls on_error per message and propagates."""
+        producer = BatchingProducer(_FakeProducer(fail=True), batch_size_bytes=2)
+        errors: list[tuple[bytes, str]] = []
+
+        def on_error(
+            _topic: str, _key: bytes | None, value: bytes, error: Exception | None
+        ) -> None:
+            errors.append((value, str(error)))
+
+        await producer.send(TOPIC, b"a", on_error=on_error)
+        with pytest.raises(RuntimeError, match="broker down"):
+            await producer.send(TOPIC, b"b", on_error=on_error)
+
+        assert errors == [(b"a", "broker down"), (b"b", "broker down")]
+        assert producer.messages_failed == 2
+        assert producer.last_error == "RuntimeError: broker down"
+
+    async def test_linger_failure_is_raised_by_flush(self) -> None:
+        """Errors from timer-sent batches surface on the next flush."""
+        producer = BatchingProducer(_FakeProducer(fail=True), linger_ms=1)
+        await producer.send(TOPIC, b"a")
+        await asyncio.sleep(0.02)
+
+        with pytest.raises(ProtocolHandlerError, match="broker down"):
+            await producer.flush()
+        await producer.flush()
+
+    async def test_linger_adapts_to_load(self) -> None:
+        """Lone messages shrink the window; bursts grow it back."""
+        producer = BatchingProducer(_FakeProducer(), linger_ms=4)
+
+        for _ in range(12):
+            await producer.send(TOPIC, b"x")
+            await asyncio.sleep(0.01)
+        assert producer.linger_ms == 0
+
+        for _ in range(12):
+            for _ in range(5):
+                await producer.send(TOPIC, b"x")
+            await asyncio.sleep(0.01)
+        assert producer.linger_ms == 4
+
+    async def test_send_batch_flushes_buffer_first(self) -> None:
+        """Direct batches go out after buffered messages."""
+        inner = _FakeProducer()
+        producer = BatchingProducer(inner)
+        await producer.send(TOPIC, b"buffered")
+
+        sent = await producer.send_batch(
+            [ModelProducerMessage(topic=TOPIC, value=b"direct")]
+        )
+
+        assert sent == 1
+        assert _values(inner.batches) == [b"buffered", b"direct"]
+
+    async def test_transactions_include_buffered_messages(self) -> None:
+        """Commit sends buffered messages into the transaction first."""
+        inner = _FakeProducer()
+        producer = BatchingProducer(inner)
+        await producer.begin_transaction()
+        await producer.send(TOPIC, b"tx")
+        await producer.commit_transaction()
+
+        assert inner.calls == ["begin", "send_batch", "commit"]
+
+    async def test_health_counts_buffered_messages(self) -> None:
+        """Buffered messages are added to the wrapped pending count."""
+        producer = BatchingProducer(_FakeProducer())
+        await producer.send(TOPIC, b"a")
+        await producer.send(TOPIC, b"b")
+
+        health = await producer.health_check()
+
+        assert health.pending_messages == 3
+
+    async def test_close_flushes_and_rejects_further_sends(self) -> None:
+        """close() delivers the buffer, closes the inner producer, then refuses."""
+        inner = _FakeProducer()
+        producer = BatchingProducer(inner)
+        await producer.send(TOPIC, b"last")
+
+        await producer.close()
+
+        assert _values(inner.batches) == [b"last"]
+        assert inner.calls[-2:] == ["flush", "close"]
+        with pytest.raises(InvalidProtocolStateError):
+            await producer.send(TOPIC, b"late")
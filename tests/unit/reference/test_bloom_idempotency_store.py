@@ -0,0 +1,252 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the Bloom filter tier in front of an idempotency store."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.bloom_idempotency_store import BloomFilteredIdempotencyStore
+from examples.reference.sharded_idempotency_store import ShardedIdempotencyStore
+from omnibase_spi.exceptions import IdempotencyStoreError
+from omnibase_spi.protocols.storage.protocol_idempotency_store import (
+    ProtocolIdempotencyStore,
+)
+
+from .conftest import ManualClock
+
+EPOCH = 1_735_689_600.0
+DAY = 24 * 3600
+
+
+class _CountingStore(ShardedIdempotencyStore):
+    """Sharded store that counts the calls it receives."""
+
+    def __init__(self, clock: ManualClock | None = None, *, fail: bool = False) -> None:
+        super().__init__(clock=clock or ManualClock(EPOCH))
+        self.calls: list[str] = []
+        self.fail = fail
+
+    async def check_and_record_many(
+        self,
+        message_ids: Iterable[UUID],
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> list[bool]:
+        """Count, then record the batch."""
+        self.calls.append("check_and_record_many")
+        if self.fail:
+            raise IdempotencyStoreError("store down")
+        return await super().check_and_record_many(message_ids, domain, correlation_id)
+
+    async def is_processed(self, message_id: UUID, domain: str | None = None) -> bool:
+        """Count, then look up."""
+        self.calls.append("is_processed")
+        return await super().is_processed(message_id, domain)
+
+
+class _PlainStore:
+    """Store without a batch API."""
+
+    def __init__(self) -> None:
+        self.records: set[tuple[str | None, UUID]] = set()
+        self.calls: list[str] = []
+
+    async def check_and_record(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+    ) -> bool:
+        """Record unless recorded."""
+        self.calls.append("check_and_record")
+        if (domain, message_id) in self.records:
+            return False
+        self.records.add((domain, message_id))
+        return True
+
+    async def is_processed(self, message_id: UUID, domain: str | None = None) -> bool:
+        """Look up."""
+        return (domain, message_id) in self.records
+
+    async def mark_processed(
+        self,
+        message_id: UUID,
+        domain: str | None = None,
+        correlation_id: UUID | None = None,
+        processed_at: datetime | None = None,
+    ) -> None:
+        """Record."""
+        self.records.add((domain, message_id))
+
+    async def cleanup_expired(self, ttl_seconds: int) -> int:
+        """Nothing expires."""
+        return 0
+
+
+def _filtered(
+    store: ProtocolIdempotencyStore, clock: ManualClock | None = None, **kwargs: object
+) -> BloomFilteredIdempotencyStore:
+    options: dict[str, object] = {
+        "retention_seconds": 7 * DAY,
+        "expected_records": 10_000,
+        "warm": True,
+    }
+    options.update(kwargs)
+    return BloomFilteredIdempotencyStore(
+        store,
+        clock=clock or ManualClock(EPOCH),
+        **options,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.unit
+class TestBloomFilteredIdempotencyStore:
+    def test_conforms_to_store_protocol(self) -> None:
+        """The wrapper satisfies ProtocolIdempotencyStore."""
+        assert isinstance(_filtered(_PlainStore()), ProtocolIdempotencyStore)
+
+    async def test_unseen_keys_skip_the_store(self) -> None:
+        """Only keys written through the wrapper reach the store's lookup."""
+        backing = _CountingStore()
+        store = _filtered(backing)
+        seen = uuid4()
+        assert await store.check_and_record(seen, "billing")
+        backing.calls.clear()
+
+        assert not await store.is_processed(uuid4(), "billing")
+        assert not await store.is_processed(seen, "registration")
+        assert backing.calls == []
+        assert await store.is_processed(seen, "billing")
+        assert backing.calls == ["is_processed"]
+        assert store.lookups == 3
+        assert store.filter_negatives == 2
+        assert store.hit_ratio == pytest.approx(2 / 3)
+
+    async def test_cold_filter_defers_to_the_store(self) -> None:
+        """Without warm, negatives are trusted after one retention window."""
+        clock = ManualClock(EPOCH)
+        backing = _CountingStore(clock)
+        old = uuid4()
+        await backing.mark_processed(old)
+        store = _filtered(backing, clock, warm=False, retention_seconds=DAY)
+
+        assert await store.is_processed(old)
+        assert not await store.is_processed(uuid4())
+        assert store.filter_negatives == 0
+        clock.now += DAY
+        assert not await store.is_processed(uuid4())
+        assert store.filter_negatives == 1
+
+    async def test_remember_warms_the_filter(self) -> None:
+        """Keys passed to remember() are looked up in the store."""
+        backing = _CountingStore()
+        known = uuid4()
+        await backing.mark_processed(known, "billing")
+        store = _filtered(backing)
+        store.remember([known], "billing")
+
+        assert await store.is_processed(known, "billing")
+
+    async def test_concurrent_calls_are_batched(self) -> None:
+        """Calls in one loop iteration become one batch; one caller wins each id."""
+        backing = _CountingStore()
+        store = _filtered(backing)
+        message_ids = [uuid4() for _ in range(20)]
+
+        results = await asyncio.gather(
+            *(
+                store.check_and_record(message_id, "billing")
+                for message_id in message_ids * 3
+            )
+        )
+
+        assert results == [True] * 20 + [False] * 40
+        assert backing.calls == ["check_and_record_many"]
+        assert store.store_batches == 1
+
+    async def test_batches_split_by_domain_and_size(self) -> None:
+        """Domains and correlation ids get their own batches, capped in size."""
+        backing = _CountingStore()
+        store = _filtered(backing, max_batch_size=4)
+        correlation_id = uuid4()
+
+        calls = [store.check_and_record(uuid4(), "billing") for _ in range(6)]
+        calls += [store.check_and_record(uuid4(), "audit") for _ in range(2)]
+        calls.append(store.check_and_record(uuid4(), "audit", correlation_id))
+        assert all(await asyncio.gather(*calls))
+
+        assert store.store_batches == 4
+        assert len(backing) == 9
+
+    async def test_batch_failure_reaches_every_caller(self) -> None:
+        """A failed batch raises the store's error in each waiting caller."""
+        store = _filtered(_CountingStore(fail=True))
+
+        results = await asyncio.gather(
+            store.check_and_record(uuid4()),
+            store.check_and_record(uuid4()),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, IdempotencyStoreError) for r in results)
+
+    async def test_stores_without_batch_api_are_called_directly(self) -> None:
+        """check_and_record passes through when there is no batch API."""
+        backing = _PlainStore()
+        store = _filtered(backing)
+        message_id = uuid4()
+
+        assert await store.check_and_record(message_id)
+        assert not await store.check_and_record(message_id)
+        assert backing.calls == ["check_and_record", "check_and_record"]
+        assert store.store_batches == 0
+
+    async def test_keys_are_forgotten_after_the_retention_window(self) -> None:
+        """Generations rotate so keys outlive retention by at most one span."""
+        clock = ManualClock(EPOCH)
+        backing = _PlainStore()
+        store = _filtered(backing, clock, retention_seconds=7 * DAY, generations=8)
+        message_id = uuid4()
+        await store.mark_processed(message_id)
+
+        clock.now += 7 * DAY
+        assert await store.is_processed(message_id)
+        clock.now += DAY
+        assert not await store.is_processed(message_id)
+        assert store.filter_negatives == 1
+
+    async def test_false_positive_rate_stays_near_target(self) -> None:
+        """Unseen lookups pass the filter at about the configured rate."""
+        store = _filtered(
+            _PlainStore(), expected_records=7_000, false_positive_rate=0.01
+        )
+        for _ in range(1_000):
+            await store.mark_processed(uuid4())
+        one_filter = store.filter_bytes
+        # Twice the planned load of one generation: it grows a second filter.
+        for _ in range(1_000):
+            await store.mark_processed(uuid4())
+        assert store.filter_bytes == 2 * one_filter
+
+        for _ in range(20_000):
+            assert not await store.is_processed(uuid4())
+
+        assert store.false_positive_ratio < 0.02
+
+    def test_rejects_invalid_configuration(self) -> None:
+        """Sizes, rates and generation counts are validated."""
+        with pytest.raises(ValueError, match="retention_seconds"):
+            _filtered(_PlainStore(), retention_seconds=0)
+        with pytest.raises(ValueError, match="generations"):
+            _filtered(_PlainStore(), generations=1)
+        with pytest.raises(ValueError, match="false_positive_rate"):
+            _filtered(_PlainStore(), false_positive_rate=1.0)
+        with pytest.raises(ValueError, match="expected_records"):
+            _filtered(_PlainStore(), expected_records=0)
@@ -0,0 +1,381 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the read-through projection cache."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import pytest
+
+from examples.reference.caching_projection_reader import (
+    CachingProjectionReader,
+    InvalidatingProjector,
+)
+from omnibase_core.types import JsonType
+from omnibase_spi.exceptions import ProjectionReadError
+from omnibase_spi.protocols.projections.protocol_projection_reader import (
+    ProtocolProjectionReader,
+)
+from omnibase_spi.protocols.projections.protocol_projector import (
+    ProtocolProjector,
+    ProtocolSequenceInfo,
+)
+
+from .conftest import ManualClock
+
+
+@dataclass(frozen=True)
+class _Sequence:
+    sequence: int
+    partition: str | None = None
+
+
+@dataclass(frozen=True)
+class _Result:
+    status: str
+    entity_id: str
+    applied_sequence: int | None = None
+    rejected_reason: str | None = None
+
+
+@dataclass(frozen=True)
+class _BatchResult:
+    results: tuple[_Result, ...]
+
+    @property
+    def total_count(self) -> int:
+        return len(self.results)
+
+    @property
+    def applied_count(self) -> int:
+        return sum(r.status == "applied" for r in self.results)
+
+    @property
+    def rejected_count(self) -> int:
+        return self.total_count - self.applied_count
+
+
+class _Store:
+    """Projection rows shared by the fake reader and projector."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], tuple[int, JsonType]] = {}
+
+
+class _Reader:
+    """Reader over a ``_Store`` that counts calls and can be held or fail."""
+
+    def __init__(self, store: _Store) -> None:
+        self.store = store
+        self.calls: Counter[str] = Counter()
+        self.gate: asyncio.Event | None = None
+        self.fail = False
+
+    async def _enter(self, name: str) -> None:
+        self.calls[name] += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise ProjectionReadError("projection database unavailable")
+
+    async def get_entity_state(self, entity_id: str, domain: str) -> JsonType | None:
+        """Row state or None."""
+        await self._enter("get_entity_state")
+        row = self.store.rows.get((domain, entity_id))
+        return None if row is None else row[1]
+
+    async def exists(self, entity_id: str, domain: str) -> bool:
+        """Row presence."""
+        await self._enter("exists")
+        return (domain, entity_id) in self.store.rows
+
+    async def get_by_criteria(
+        self,
+        criteria: JsonType,
+        domain: str,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[JsonType]:
+        """Every row of the domain."""
+        await self._enter("get_by_criteria")
+        return [row for (d, _), (_, row) in self.store.rows.items() if d == domain]
+
+    async def get_registration_status(
+        self, node_id: str, domain: str | None = None
+    ) -> JsonType | None:
+        """Registration row state or None."""
+        await self._enter("get_registration_status")
+        row = self.store.rows.get(("registration", node_id))
+        return None if row is None else row[1]
+
+    async def get_registered_nodes(
+        self,
+        domain: str | None = None,
+        state: str | None = None,
+        capabilities: list[str] | None = None,
+        limit: int | None = None,
+    ) -> list[JsonType]:
+        """Every registration row."""
+        await self._enter("get_registered_nodes")
+        return [
+            row for (d, _), (_, row) in self.store.rows.items() if d == "registration"
+        ]
+
+    async def get_node_capabilities(self, node_id: str) -> list[str] | None:
+        """Capabilities of the registration row."""
+        await self._enter("get_node_capabilities")
+        row = self.store.rows.get(("registration", node_id))
+        return None if row is None else ["gpu"] if row[1] else []
+
+
+class _Projector:
+    """Projector over a ``_Store`` applying only newer sequences."""
+
+    def __init__(self, store: _Store) -> None:
+        self.store = store
+
+    async def persist(
+        self,
+        projection: object,
+        entity_id: str,
+        domain: str,
+        sequence_info: ProtocolSequenceInfo,
+        *,
+        correlation_id: str | None = None,
+    ) -> _Result:
+        """Apply if newer."""
+        row = self.store.rows.get((domain, entity_id))
+        if row is not None and row[0] >= sequence_info.sequence:
+            return _Result("rejected_stale", entity_id)
+        self.store.rows[domain, entity_id] = (sequence_info.sequence, projection)  # type: ignore[assignment]
+        return _Result("applied", entity_id, sequence_info.sequence)
+
+    async def batch_persist(
+        self,
+        projections: Sequence[tuple[object, str, str, ProtocolSequenceInfo]],
+        *,
+        correlation_id: str | None = None,
+    ) -> _BatchResult:
+        """Apply each in order."""
+        return _BatchResult(tuple([await self.persist(*p) for p in projections]))
+
+    async def get_last_sequence(
+        self, entity_id: str, domain: str
+    ) -> ProtocolSequenceInfo | None:
+        """Row sequence."""
+        row = self.store.rows.get((domain, entity_id))
+        return None if row is None else _Sequence(row[0])
+
+    async def is_stale(
+        self, entity_id: str, domain: str, sequence_info: ProtocolSequenceInfo
+    ) -> bool:
+        """Compare with the row."""
+        last = await self.get_last_sequence(entity_id, domain)
+        return last is not None and sequence_info.sequence <= last.sequence
+
+    async def cleanup_before_sequence(
+        self,
+        domain: str,
+        sequence: int,
+        *,
+        batch_size: int = 1000,
+        confirmed: bool = False,
+    ) -> int:
+        """Nothing to clean."""
+        return 0
+
+
+def _setup(
+    **kwargs: object,
+) -> tuple[CachingProjectionReader, InvalidatingProjector, _Reader]:
+    store = _Store()
+    store.rows["orders", "o1"] = (1, {"total": 10})
+    store.rows["orders", "o2"] = (1, {"total": 20})
+    store.rows["registration", "n1"] = (1, {"state": "active"})
+    reader = _Reader(store)
+    cache = CachingProjectionReader(reader, **kwargs)  # type: ignore[arg-type]
+    return cache, InvalidatingProjector(_Projector(store), cache), reader
+
+
+@pytest.mark.unit
+class TestCachingProjectionReader:
+    def test_conforms_to_protocols(self) -> None:
+        """The cache is a reader and the wrapper a projector."""
+        cache, projector, _ = _setup()
+
+        assert isinstance(cache, ProtocolProjectionReader)
+        assert isinstance(projector, ProtocolProjector)
+
+    async def test_repeated_reads_are_served_from_the_cache(self) -> None:
+        """Each query reaches the reader once, including None answers."""
+        cache, _, reader = _setup()
+
+        for _ in range(3):
+            assert await cache.get_entity_state("o1", "orders") == {"total": 10}
+            assert await cache.get_entity_state("missing", "orders") is None
+            assert await cache.get_node_capabilities("n1") == ["gpu"]
+
+        assert reader.calls == {"get_entity_state": 2, "get_node_capabilities": 1}
+        assert cache.hits == 6
+        assert cache.hit_ratio == pytest.approx(6 / 9)
+        assert len(cache) == 3
+
+    async def test_exists_uses_a_cached_state(self) -> None:
+        """exists() needs no call once the state is cached."""
+        cache, _, reader = _setup()
+        await cache.get_entity_state("o1", "orders")
+        await cache.get_entity_state("missing", "orders")
+
+        assert await cache.exists("o1", "orders")
+        assert not await cache.exists("missing", "orders")
+        assert await cache.exists("o2", "orders")
+        assert await cache.exists("o2", "orders")
+        assert reader.calls["exists"] == 1
+
+    async def test_entries_expire_after_the_ttl(self) -> None:
+        """An entry is reloaded once ttl_seconds have passed."""
+        clock = ManualClock()
+        cache, _, reader = _setup(ttl_seconds=5.0, clock=clock)
+
+        await cache.get_entity_state("o1", "orders")
+        clock.now = 4.9
+        await cache.get_entity_state("o1", "orders")
+        clock.now = 5.0
+        await cache.get_entity_state("o1", "orders")
+
+        assert reader.calls["get_entity_state"] == 2
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Beyond max_entries the entry read longest ago goes."""
+        cache, _, reader = _setup(max_entries=2)
+
+        await cache.get_entity_state("o1", "orders")
+        await cache.get_entity_state("o2", "orders")
+        await cache.get_entity_state("o1", "orders")
+        await cache.get_registration_status("n1")
+        await cache.get_entity_state("o1", "orders")
+        await cache.get_entity_state("o2", "orders")
+
+        assert reader.calls["get_entity_state"] == 3
+        assert cache.evictions == 2
+        assert len(cache) == 2
+
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        """Identical misses in flight make one reader call."""
+        cache, _, reader = _setup()
+        reader.gate = asyncio.Event()
+
+        calls = [
+            asyncio.create_task(cache.get_entity_state("o1", "orders"))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        calls[0].cancel()
+        reader.gate.set()
+        results = await asyncio.gather(*calls[1:])
+
+        assert results == [{"total": 10}] * 9
+        assert reader.calls["get_entity_state"] == 1
+        assert cache.coalesced == 9
+        assert len(cache) == 1
+
+    async def test_failed_load_reaches_every_caller_and_is_not_cached(self) -> None:
+        """Errors are shared by the waiting callers, then retried."""
+        cache, _, reader = _setup()
+        reader.fail = True
+
+        results = await asyncio.gather(
+            cache.get_entity_state("o1", "orders"),
+            cache.get_entity_state("o1", "orders"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ProjectionReadError) for r in results)
+        reader.fail = False
+
+        assert await cache.get_entity_state("o1", "orders") == {"total": 10}
+        assert reader.calls["get_entity_state"] == 2
+
+    async def test_applied_writes_invalidate_only_that_entity(self) -> None:
+        """An applied persist drops the entity's entries; others stay."""
+        cache, projector, reader = _setup()
+        await cache.get_entity_state("o1", "orders")
+        await cache.get_entity_state("o2", "orders")
+
+        stale = await projector.persist({"total": 0}, "o1", "orders", _Sequence(1))
+        assert stale.status == "rejected_stale"
+        assert cache.invalidations == 0
+        applied = await projector.persist({"total": 11}, "o1", "orders", _Sequence(2))
+        assert applied.status == "applied"
+
+        assert await cache.get_entity_state("o1", "orders") == {"total": 11}
+        assert await cache.get_entity_state("o2", "orders") == {"total": 20}
+        assert reader.calls["get_entity_state"] == 3
+        assert cache.invalidations == 1
+
+    async def test_batch_persist_invalidates_applied_entities(self) -> None:
+        """Entities with an applied projection in the batch are dropped."""
+        cache, projector, reader = _setup()
+        await cache.get_entity_state("o1", "orders")
+        await cache.get_entity_state("o2", "orders")
+
+        result = await projector.batch_persist(
+            [
+                ({"total": 12}, "o1", "orders", _Sequence(3)),
+                ({"total": 0}, "o2", "orders", _Sequence(1)),
+            ]
+        )
+
+        assert result.applied_count == 1
+        assert await cache.get_entity_state("o1", "orders") == {"total": 12}
+        assert await cache.get_entity_state("o2", "orders") == {"total": 20}
+        assert reader.calls["get_entity_state"] == 3
+
+    async def test_node_queries_are_invalidated_by_any_domain(self) -> None:
+        """Node-keyed entries go on a write of the node id in any domain."""
+        cache, projector, reader = _setup()
+        await cache.get_registration_status("n1", "compute")
+        await cache.get_node_capabilities("n1")
+
+        await projector.persist({}, "n1", "registration", _Sequence(2))
+
+        assert await cache.get_registration_status("n1", "compute") == {}
+        assert await cache.get_node_capabilities("n1") == []
+        assert reader.calls["get_registration_status"] == 2
+        assert reader.calls["get_node_capabilities"] == 2
+
+    async def test_load_in_flight_during_a_write_is_not_cached(self) -> None:
+        """A read that raced an applied write is not kept."""
+        cache, projector, reader = _setup()
+        reader.gate = asyncio.Event()
+        racing = asyncio.create_task(cache.get_entity_state("o1", "orders"))
+        await asyncio.sleep(0)
+
+        await projector.persist({"total": 13}, "o1", "orders", _Sequence(2))
+        reader.gate.set()
+        await racing
+
+        assert len(cache) == 0
+        assert await cache.get_entity_state("o1", "orders") == {"total": 13}
+
+    async def test_multi_entity_queries_are_not_cached(self) -> None:
+        """Criteria and node listing queries always reach the reader."""
+        cache, _, reader = _setup()
+
+        for _ in range(2):
+            await cache.get_by_criteria({"state": "active"}, "orders")
+            await cache.get_registered_nodes(state="active")
+
+        assert reader.calls == {"get_by_criteria": 2, "get_registered_nodes": 2}
+        assert cache.lookups == 0
+
+    def test_rejects_invalid_configuration(self) -> None:
+        """Sizes and TTLs must be positive."""
+        with pytest.raises(ValueError, match="max_entries"):
+            _setup(max_entries=0)
+        with pytest.raises(ValueError, match="ttl_seconds"):
+            _setup(ttl_seconds=0)
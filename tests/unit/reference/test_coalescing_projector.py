@@ -0,0 +1,255 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the write-coalescing reference projector."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from typing import Any
+
+import pytest
+
+from examples.reference.coalescing_projector import (
+    CoalescingProjector,
+    SequenceInfo,
+)
+from omnibase_spi.exceptions import ProjectorError
+from omnibase_spi.protocols.projections.protocol_projection_database import (
+    ProtocolProjectionDatabase,
+)
+from omnibase_spi.protocols.projections.protocol_projector import (
+    ProtocolBatchPersistResult,
+    ProtocolPersistResult,
+    ProtocolProjector,
+)
+
+
+class _SQLiteDatabase:
+    """In-memory SQLite behind the async projection database interface."""
+
+    def __init__(self) -> None:
+        self.connection = sqlite3.connect(":memory:")
+        self.connection.row_factory = sqlite3.Row
+        self.calls: list[str] = []
+        self.fail = False
+
+    async def execute(self, query: str, *params: Any) -> list[dict[str, Any]]:
+        """Run one statement."""
+        self.calls.append(query.split(maxsplit=1)[0])
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    async def execute_many(
+        self, query: str, params_list: list[tuple[Any, ...]]
+    ) -> None:
+        """Run one statement per parameter set."""
+        self.calls.append("execute_many")
+        if self.fail:
+            raise sqlite3.OperationalError("disk I/O error")
+        self.connection.executemany(query, params_list)
+
+    async def fetchval(self, query: str, *params: Any) -> Any:
+        """Return the first column of the first row."""
+        row = self.connection.execute(query, params).fetchone()
+        return None if row is None else row[0]
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self.connection.close()
+
+    def rows(self) -> list[tuple[str, str, str, int, Any]]:
+        return [
+            (
+                r["domain"],
+                r["entity_id"],
+                r["partition_key"],
+                r["sequence"],
+                json.loads(r["projection"]),
+            )
+            for r in self.connection.execute(
+                "SELECT * FROM projections ORDER BY domain, entity_id, partition_key"
+            )
+        ]
+
+
+async def _projector(
+    database: _SQLiteDatabase | None = None,
+) -> tuple[CoalescingProjector, _SQLiteDatabase]:
+    database = database or _SQLiteDatabase()
+    projector = CoalescingProjector(database, paramstyle="qmark")
+    await projector.create_table()
+    database.calls.clear()
+    return projector, database
+
+
+@pytest.mark.unit
+class TestCoalescingProjector:
+    async def test_conforms_to_protocols(self) -> None:
+        """Projector, database stand-in and results satisfy the protocols."""
+        projector, database = await _projector()
+        result = await projector.batch_persist(
+            [({"v": 1}, "e1", "orders", SequenceInfo(1))]
+        )
+
+        assert isinstance(projector, ProtocolProjector)
+        assert isinstance(database, ProtocolProjectionDatabase)
+        assert isinstance(result, ProtocolBatchPersistResult)
+        assert isinstance(result.results[0], ProtocolPersistResult)
+
+    async def test_stale_persist_is_rejected_from_the_cache(self) -> None:
+        """Once a sequence is applied, stale ones never reach the database."""
+        projector, database = await _projector()
+
+        applied = await projector.persist({"v": 5}, "e1", "orders", SequenceInfo(5))
+        calls = list(database.calls)
+        equal = await projector.persist({"v": 0}, "e1", "orders", SequenceInfo(5))
+        lower = await projector.persist({"v": 0}, "e1", "orders", SequenceInfo(3))
+
+        assert applied.status == "applied"
+        assert applied.applied_sequence == 5
+        assert calls == ["SELECT", "execute_many"]
+        assert equal.status == lower.status == "rejected_stale"
+        assert lower.rejected_reason == "sequence 3 <= last applied 5"
+        assert database.calls == calls
+        assert database.rows() == [("orders", "e1", "", 5, {"v": 5})]
+
+    async def test_batch_coalesces_updates_per_entity(self) -> None:
+        """Only the highest sequence per entity is written, in one execute_many."""
+        projector, database = await _projector()
+
+        result = await projector.batch_persist(
+            [
+                ({"v": 1}, "e1", "orders", SequenceInfo(1)),
+                ({"v": 3}, "e1", "orders", SequenceInfo(3)),
+                ({"v": 7}, "e2", "orders", SequenceInfo(7)),
+                ({"v": 2}, "e1", "orders", SequenceInfo(2)),
+            ]
+        )
+
+        assert [r.status for r in result.results] == [
+            "rejected_stale",
+            "applied",
+            "applied",
+            "rejected_stale",
+        ]
+        assert result.results[0].rejected_reason == (
+            "sequence 1 superseded by 3 in the same batch"
+        )
+        assert (result.total_count, result.applied_count, result.rejected_count) == (
+            4,
+            2,
+            2,
+        )
+        assert database.calls == ["SELECT", "execute_many"]
+        assert projector.rows_written == 2
+        assert database.rows() == [
+            ("orders", "e1", "", 3, {"v": 3}),
+            ("orders", "e2", "", 7, {"v": 7}),
+        ]
+
+    async def test_concurrent_persist_calls_share_one_flush(self) -> None:
+        """persist() calls in one loop iteration become one batch."""
+        projector, database = await _projector()
+
+        results = await asyncio.gather(
+            *(
+                projector.persist({"v": i}, f"e{i % 5}", "orders", SequenceInfo(i))
+                for i in range(20)
+            )
+        )
+
+        assert sum(r.status == "applied" for r in results) == 5
+        assert database.calls == ["SELECT", "execute_many"]
+        assert [row[3] for row in database.rows()] == [15, 16, 17, 18, 19]
+
+    async def test_cold_cache_loads_sequences_from_the_table(self) -> None:
+        """A new projector rejects sequences the table already holds."""
+        first, database = await _projector()
+        await first.batch_persist(
+            [({"v": 9}, f"e{i}", "orders", SequenceInfo(9)) for i in range(3)]
+        )
+        second, _ = await _projector(database)
+
+        result = await second.batch_persist(
+            [({"v": 4}, f"e{i}", "orders", SequenceInfo(4)) for i in range(3)]
+            + [({"v": 1}, "new", "orders", SequenceInfo(1))]
+        )
+
+        assert [r.status for r in result.results] == [
+            "rejected_stale",
+            "rejected_stale",
+            "rejected_stale",
+            "applied",
+        ]
+        assert second.key_loads == 1
+
+    async def test_partitions_and_domains_are_tracked_separately(self) -> None:
+        """Sequences are per (domain, entity, partition)."""
+        projector, _ = await _projector()
+
+        result = await projector.batch_persist(
+            [
+                ({"v": 1}, "e1", "orders", SequenceInfo(5, "p0")),
+                ({"v": 2}, "e1", "orders", SequenceInfo(3, "p1")),
+                ({"v": 3}, "e1", "billing", SequenceInfo(1, "p0")),
+            ]
+        )
+
+        assert result.applied_count == 3
+        assert await projector.is_stale("e1", "orders", SequenceInfo(4, "p0"))
+        assert not await projector.is_stale("e1", "orders", SequenceInfo(4, "p1"))
+        assert await projector.get_last_sequence("e1", "orders") == SequenceInfo(
+            5, "p0"
+        )
+        assert await projector.get_last_sequence("missing", "orders") is None
+
+    async def test_write_failure_raises_and_reloads_keys(self) -> None:
+        """Database errors surface as ProjectorError to every caller."""
+        projector, database = await _projector()
+        await projector.persist({"v": 1}, "e1", "orders", SequenceInfo(1))
+        database.fail = True
+
+        results = await asyncio.gather(
+            projector.persist({"v": 2}, "e1", "orders", SequenceInfo(2)),
+            projector.persist({"v": 2}, "e2", "orders", SequenceInfo(2)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ProjectorError) for r in results)
+        database.fail = False
+        database.calls.clear()
+
+        result = await projector.persist({"v": 2}, "e1", "orders", SequenceInfo(2))
+        assert result.status == "applied"
+        assert database.calls == ["SELECT", "execute_many"]
+
+    async def test_cleanup_evicts_cache_but_table_still_guards(self) -> None:
+        """Evicted keys are reloaded, so stale writes stay rejected."""
+        projector, _ = await _projector()
+        await projector.persist({"v": 8}, "e1", "orders", SequenceInfo(8))
+
+        with pytest.raises(ValueError, match="confirmed=True"):
+            await projector.cleanup_before_sequence("orders", 10)
+        evicted = await projector.cleanup_before_sequence("orders", 10, confirmed=True)
+        result = await projector.persist({"v": 7}, "e1", "orders", SequenceInfo(7))
+
+        assert evicted == 1
+        assert result.status == "rejected_stale"
+
+    async def test_rejects_invalid_input(self) -> None:
+        """Invalid identifiers and sequences are ValueErrors."""
+        projector, database = await _projector()
+
+        with pytest.raises(ValueError, match="entity_id"):
+            await projector.persist({}, "", "orders", SequenceInfo(1))
+        with pytest.raises(ValueError, match="sequence"):
+            await projector.batch_persist(
+                [
+                    ({}, "e1", "orders", SequenceInfo(1)),
+                    ({}, "e2", "orders", SequenceInfo(-1)),
+                ]
+            )
+        with pytest.raises(ValueError, match="table name"):
+            CoalescingProjector(database, table="projections; DROP TABLE x")
+        assert database.calls == []
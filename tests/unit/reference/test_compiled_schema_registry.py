@@ -0,0 +1,374 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the compiled, cached schema registry layer."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from examples.reference.compiled_schema_registry import (
+    CompilingSchemaRegistry,
+    UnsupportedSchemaError,
+    compile_schema,
+)
+from omnibase_spi.protocols.event_bus.protocol_schema_registry import (
+    ProtocolSchemaRegistry,
+)
+
+from .conftest import ManualClock
+
+SUBJECT = "onex.evt.git.hook.v1-value"
+
+ENVELOPE_SCHEMA: dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["event_type", "correlation_id", "payload"],
+    "additionalProperties": False,
+    "properties": {
+        "event_type": {"enum": ["push", "tag"]},
+        "correlation_id": {"type": "string", "pattern": "^[0-9a-f-]{36}$"},
+        "retries": {"type": "integer", "minimum": 0, "maximum": 5},
+        "payload": {
+            "type": "object",
+            "required": ["commits"],
+            "properties": {
+                "commits": {
+                    "type": "array",
+                    "minItems": 1,
+                    "items": {"$ref": "#/definitions/commit"},
+                },
+            },
+        },
+    },
+    "definitions": {
+        "commit": {
+            "type": "object",
+            "required": ["sha"],
+            "properties": {
+                "sha": {"type": "string", "pattern": "^[0-9a-f]{40}$"},
+                "parent": {
+                    "anyOf": [{"type": "null"}, {"$ref": "#/definitions/commit"}]
+                },
+            },
+        },
+    },
+}
+
+
+def _event(**changes: object) -> dict[str, Any]:
+    event: dict[str, Any] = {
+        "event_type": "push",
+        "correlation_id": "1b4e28ba-2fa1-11d2-883f-0016d3cca427",
+        "retries": 0,
+        "payload": {"commits": [{"sha": "a" * 40, "parent": None}]},
+    }
+    event.update(changes)
+    return event
+
+
+class _Registry:
+    """Registry holding schema versions in memory and counting calls."""
+
+    def __init__(self) -> None:
+        self.schemas: dict[str, list[Any]] = {}
+        self.fetches: Counter[tuple[str, str]] = Counter()
+        self.validations = 0
+        self.delay = 0.0
+        self.closed = False
+
+    async def register_schema(
+        self, subject: str, schema: Any, schema_type: str = "JSON"
+    ) -> int:
+        """Append a version."""
+        self.schemas.setdefault(subject, []).append(schema)
+        return len(self.schemas[subject])
+
+    async def get_schema(self, subject: str, version: str) -> Any:
+        """Return ``latest`` or ``v<n>``, or None."""
+        self.fetches[subject, version] += 1
+        await asyncio.sleep(self.delay)
+        versions = self.schemas.get(subject, [])
+        if not versions:
+            return None
+        if version == "latest":
+            return versions[-1]
+        index = int(version.removeprefix("v")) - 1
+        return versions[index] if 0 <= index < len(versions) else None
+
+    async def validate_event(
+        self, subject: str, event_data: Any
+    ) -> tuple[bool, str | None]:
+        """Accept everything, counting calls."""
+        self.validations += 1
+        return True, None
+
+    async def close(self, timeout_seconds: float = 30.0) -> None:
+        """Record the close."""
+        self.closed = True
+
+
+@pytest.mark.unit
+class TestCompileSchema:
+    def test_accepts_a_valid_envelope(self) -> None:
+        """A conforming event has no error."""
+        assert compile_schema(ENVELOPE_SCHEMA)(_event()) is None
+
+    @pytest.mark.parametrize(
+        ("event", "error"),
+        [
+            (_event(event_type="merge"), "$.event_type: not one of ['push', 'tag']"),
+            (_event(retries=True), "$.retries: expected integer"),
+            (_event(retries=9), "$.retries: greater than 5"),
+            (_event(extra=1), "$: unexpected property 'extra'"),
+            (_event(payload={"commits": []}), "$.payload.commits: fewer than 1 items"),
+            (
+                _event(payload={"commits": [{"sha": "a" * 40}, {"sha": "XYZ"}]}),
+                "$.payload.commits[1].sha: does not match '^[0-9a-f]{40}$'",
+            ),
+            (
+                _event(payload={"commits": [{"sha": "a" * 40, "parent": {"sha": 1}}]}),
+                "$.payload.commits[0].parent: matches none of anyOf",
+            ),
+            ({"event_type": "push"}, "$: missing required property 'correlation_id'"),
+            ([], "$: expected object"),
+        ],
+    )
+    def test_reports_the_path_of_the_first_violation(
+        self, event: Any, error: str
+    ) -> None:
+        """Errors name the JSON path and the failed keyword."""
+        assert compile_schema(ENVELOPE_SCHEMA)(event) == error
+
+    def test_json_number_semantics(self) -> None:
+        """Integral floats are integers, booleans are not numbers."""
+        validate = compile_schema({"type": "integer", "multipleOf": 2})
+        assert validate(4.0) is None
+        assert validate(False) == "$: expected integer"  # noqa: FBT003
+        assert validate(3) == "$: not a multiple of 2"
+        assert compile_schema({"const": 1})(1.0) is None
+        assert compile_schema({"enum": [1]})(True) is not None  # noqa: FBT003
+
+    def test_multiple_of_is_exact(self) -> None:
+        """Large integers and decimal steps are not judged by float division."""
+        thirds = compile_schema({"type": "integer", "multipleOf": 3})
+        assert thirds(3 * 10**30) is None
+        assert thirds(3 * 10**30 + 1) == "$: not a multiple of 3"
+        tenths = compile_schema({"multipleOf": 0.1})
+        assert tenths(0.3) is None
+        assert tenths(0.35) == "$: not a multiple of 0.1"
+
+    def test_multiple_of_huge_numbers_fail_validation(self) -> None:
+        """Numbers a float cannot hold are judged, and nan fails, without raising."""
+        huge = json.loads("1" + "0" * 400)
+        assert compile_schema({"multipleOf": 7})(huge) == "$: not a multiple of 7"
+        assert compile_schema({"multipleOf": 0.5})(huge) is None
+        assert compile_schema({"multipleOf": 7})(math.nan) == "$: not a multiple of 7"
+
+    def test_combinators_and_boolean_schemas(self) -> None:
+        """oneOf needs exactly one match; not and false reject."""
+        one_of = compile_schema({"oneOf": [{"type": "integer"}, {"minimum": 0}]})
+        assert one_of(-1) is None
+        assert one_of(1) == "$: matches 2 of oneOf, not exactly one"
+        assert compile_schema({"not": {"type": "string"}})("x") == "$: matches not"
+        assert compile_schema({"not": {"type": "string"}})(1) is None
+        assert compile_schema({"items": False})([1]) == "$[0]: no value is allowed"
+        assert compile_schema({"contains": {"const": 2}})([1, 2]) is None
+        assert compile_schema({"uniqueItems": True})([1, 1.0]) == "$[1]: duplicate item"
+
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            {"patternProperties": {"^x": {}}},
+            {"$ref": "other.json#/definitions/x"},
+            {"$ref": "#/definitions/missing"},
+            {"type": "decimal"},
+            {"pattern": "("},
+            {"multipleOf": 0},
+            {"required": "id"},
+            {"required": ["id", 1]},
+        ],
+    )
+    def test_rejects_what_it_cannot_compile(self, schema: dict[str, Any]) -> None:
+        """Uncovered keywords and bad references are not silently ignored."""
+        with pytest.raises(UnsupportedSchemaError):
+            compile_schema(schema)
+
+
+@pytest.mark.unit
+class TestCompilingSchemaRegistry:
+    def test_conforms_to_schema_registry_protocol(self) -> None:
+        """The layer satisfies ProtocolSchemaRegistry."""
+        registry = CompilingSchemaRegistry(_Registry())  # type: ignore[arg-type]
+        assert isinstance(registry, ProtocolSchemaRegistry)
+
+    async def test_fetches_and_compiles_each_schema_once(self) -> None:
+        """Events after the first are validated from the cache."""
+        inner = _Registry()
+        await inner.register_schema(SUBJECT, ENVELOPE_SCHEMA)
+        registry = CompilingSchemaRegistry(inner)  # type: ignore[arg-type]
+
+        results = [await registry.validate_event(SUBJECT, _event()) for _ in range(5)]
+        invalid = await registry.validate_event(SUBJECT, _event(retries=-1))
+
+        assert results == [(True, None)] * 5
+        assert invalid == (False, "$.retries: less than 0")
+        assert inner.fetches == {(SUBJECT, "latest"): 1}
+        assert (registry.lookups, registry.hits, registry.compiles) == (6, 5, 1)
+        assert inner.validations == 0
+        assert await registry.get_schema(SUBJECT, "latest") == ENVELOPE_SCHEMA
+
+    async def test_validate_events_returns_one_result_per_event(self) -> None:
+        """A batch shares one lookup and keeps event order."""
+        inner = _Registry()
+        await inner.register_schema(SUBJECT, ENVELOPE_SCHEMA)
+        registry = CompilingSchemaRegistry(inner)  # type: ignore[arg-type]
+
+        results = await registry.validate_events(
+            SUBJECT, [_event(), _event(event_type=None), _event()]
+        )
+
+        assert results == [
+            (True, None),
+            (False, "$.event_type: not one of ['push', 'tag']"),
+            (True, None),
+        ]
+        assert registry.lookups == 1
+
+    async def test_missing_schemas_are_negatively_cached(self) -> None:
+        """Missing subjects are looked up again only after the TTL."""
+        clock = ManualClock()
+        inner = _Registry()
+        registry = CompilingSchemaRegistry(
+            inner,  # type: ignore[arg-type]
+            negative_ttl_seconds=10.0,
+            clock=clock,
+        )
+
+        first = await registry.validate_event(SUBJECT, _event())
+        batch = await registry.validate_events(SUBJECT, [_event(), _event()])
+        assert inner.fetches[SUBJECT, "latest"] == 1
+        clock.now = 11.0
+        await registry.validate_event(SUBJECT, _event())
+
+        assert first == (False, f"no schema for {SUBJECT} version latest")
+        assert batch == [first, first]
+        assert inner.fetches[SUBJECT, "latest"] == 2
+
+    async def test_register_schema_drops_the_subject(self) -> None:
+        """Registering through the layer replaces negative and latest entries."""
+        inner = _Registry()
+        registry = CompilingSchemaRegistry(inner)  # type: ignore[arg-type]
+        assert (await registry.validate_event(SUBJECT, _event()))[0] is False
+
+        assert await registry.register_schema(SUBJECT, ENVELOPE_SCHEMA, "JSON") == 1
+        assert await registry.validate_event(SUBJECT, _event()) == (True, None)
+        await registry.register_schema(SUBJECT, {"type": "string"}, "JSON")
+
+        assert await registry.validate_event(SUBJECT, _event()) == (
+            False,
+            "$: expected string",
+        )
+        assert await registry.get_schema(SUBJECT, "v1") == ENVELOPE_SCHEMA
+
+    async def test_latest_expires_but_pinned_versions_do_not(self) -> None:
+        """Schemas registered elsewhere reach latest after its TTL."""
+        clock = ManualClock()
+        inner = _Registry()
+        await inner.register_schema(SUBJECT, ENVELOPE_SCHEMA)
+        latest = CompilingSchemaRegistry(
+            inner,  # type: ignore[arg-type]
+            latest_ttl_seconds=60.0,
+            clock=clock,
+        )
+        pinned = CompilingSchemaRegistry(
+            inner,  # type: ignore[arg-type]
+            version="v1",
+            latest_ttl_seconds=60.0,
+            clock=clock,
+        )
+        await latest.validate_event(SUBJECT, _event())
+        await pinned.validate_event(SUBJECT, _event())
+        await inner.register_schema(SUBJECT, {"type": "string"})
+
+        clock.now = 61.0
+
+        assert (await latest.validate_event(SUBJECT, _event()))[0] is False
+        assert await pinned.validate_event(SUBJECT, _event()) == (True, None)
+        assert inner.fetches == {(SUBJECT, "latest"): 2, (SUBJECT, "v1"): 1}
+
+    async def test_least_recently_used_schemas_are_evicted(self) -> None:
+        """At most max_schemas subjects stay compiled."""
+        inner = _Registry()
+        for name in "abc":
+            await inner.register_schema(name, {"type": "object"})
+        registry = CompilingSchemaRegistry(
+            inner,  # type: ignore[arg-type]
+            max_schemas=2,
+        )
+
+        for name in "abac":
+            await registry.validate_event(name, {})
+
+        assert len(registry) == 2
+        assert registry.evictions == 1
+        await registry.validate_event("a", {})
+        await registry.validate_event("b", {})
+        assert inner.fetches["a", "latest"] == 1
+        assert inner.fetches["b", "latest"] == 2
+
+    async def test_uncompilable_schemas_fall_back_to_the_registry(self) -> None:
+        """Events of schemas outside the compiled subset are delegated."""
+        inner = _Registry()
+        await inner.register_schema(SUBJECT, {"patternProperties": {"^x": {}}})
+        registry = CompilingSchemaRegistry(inner)  # type: ignore[arg-type]
+
+        single = await registry.validate_event(SUBJECT, {"x": 1})
+        batch = await registry.validate_events(SUBJECT, [{}, {}])
+
+        assert single == (True, None)
+        assert batch == [(True, None)] * 2
+        assert (inner.validations, registry.fallbacks) == (3, 3)
+        assert inner.fetches[SUBJECT, "latest"] == 1
+
+    async def test_concurrent_misses_share_one_fetch(self) -> None:
+        """Cold validations of one subject wait for the same fetch."""
+        inner = _Registry()
+        inner.delay = 0.01
+        await inner.register_schema(SUBJECT, ENVELOPE_SCHEMA)
+        registry = CompilingSchemaRegistry(inner)  # type: ignore[arg-type]
+
+        results = await asyncio.gather(
+            *(registry.validate_event(SUBJECT, _event()) for _ in range(10))
+        )
+
+        assert results == [(True, None)] * 10
+        assert inner.fetches[SUBJECT, "latest"] == 1
+        assert registry.compiles == 1
+
+    async def test_close_closes_the_wrapped_registry(self) -> None:
+        """close() clears the cache and closes the wrapped registry."""
+        inner = _Registry()
+        await inner.register_schema(SUBJECT, ENVELOPE_SCHEMA)
+        registry = CompilingSchemaRegistry(inner)  # type: ignore[arg-type]
+        await registry.validate_event(SUBJECT, _event())
+
+        await registry.close()
+
+        assert inner.closed
+        assert len(registry) == 0
+
+    def test_rejects_invalid_configuration(self) -> None:
+        """Sizes and TTLs must be positive."""
+        for option in ("max_schemas", "latest_ttl_seconds", "negative_ttl_seconds"):
+            with pytest.raises(ValueError, match=option):
+                CompilingSchemaRegistry(
+                    _Registry(),  # type: ignore[arg-type]
+                    **{option: 0},  # type: ignore[arg-type]
+                )
@@ -0,0 +1,270 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the dependency-aware priority work queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from examples.reference.dependency_work_queue import DependencyWorkQueue
+from omnibase_spi.exceptions import InvalidProtocolStateError
+from omnibase_spi.protocols.types.protocol_workflow_orchestration_types import (
+    ProtocolWorkTicket,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_work_queue import (
+    ProtocolWorkQueue,
+)
+
+from .conftest import ManualClock
+
+
+def _ids(tickets: list[ProtocolWorkTicket]) -> list[str]:
+    return [t.ticket_id for t in tickets]
+
+
+@pytest.mark.unit
+class TestDependencyWorkQueue:
+    def test_conforms_to_work_queue_protocol(self) -> None:
+        """The queue and its tickets satisfy the work queue protocols."""
+        queue = DependencyWorkQueue()
+        ticket = queue.add_ticket("a", "build")
+        assert isinstance(queue, ProtocolWorkQueue)
+        assert isinstance(ticket, ProtocolWorkTicket)
+
+    async def test_completion_unblocks_dependents(self) -> None:
+        """A ticket is ready once all of its dependencies completed."""
+        queue = DependencyWorkQueue()
+        for name in ("build", "lint", "test", "release"):
+            queue.add_ticket(name, "ci")
+        assert await queue.add_ticket_dependency("test", "build")
+        assert await queue.add_ticket_dependency("release", "test")
+        assert await queue.add_ticket_dependency("release", "lint")
+
+        assert _ids(await queue.get_ready_tickets()) == ["build", "lint"]
+        assert _ids(await queue.get_blocked_tickets()) == ["test", "release"]
+        assert await queue.complete_ticket("build", {"ok": True})
+        assert _ids(await queue.get_ready_tickets()) == ["lint", "test"]
+        assert await queue.complete_ticket("test", {})
+        assert _ids(await queue.get_ready_tickets()) == ["lint"]
+        assert await queue.complete_ticket("lint", {})
+
+        assert _ids(await queue.get_ready_tickets()) == ["release"]
+        assert await queue.get_blocked_tickets() == []
+        assert await queue.get_ticket_dependencies("release") == ["test", "lint"]
+        assert not await queue.complete_ticket("build", {})
+
+    async def test_cycles_are_rejected(self) -> None:
+        """Dependencies that would close a cycle are refused."""
+        queue = DependencyWorkQueue()
+        for name in "abcd":
+            queue.add_ticket(name, "job")
+        assert await queue.add_ticket_dependency("b", "a")
+        assert await queue.add_ticket_dependency("c", "b")
+        assert await queue.add_ticket_dependency("d", "c")
+
+        assert not await queue.add_ticket_dependency("a", "d")
+        assert not await queue.add_ticket_dependency("a", "a")
+        assert not await queue.add_ticket_dependency("a", "missing")
+        assert await queue.add_ticket_dependency("d", "a")
+
+        assert queue.cycles_rejected == 2
+        assert await queue.get_ticket_dependencies("a") == []
+        assert _ids(await queue.get_ready_tickets()) == ["a"]
+
+    async def test_strategies_order_ready_tickets(self) -> None:
+        """Each strategy keeps its own ordering of the same ready tickets."""
+        queue = DependencyWorkQueue(strategy="round_robin")
+        queue.add_ticket("low", "job", priority="low")
+        queue.add_ticket("urgent", "job", priority="urgent")
+        queue.add_ticket("hub", "job")
+        queue.add_ticket("late", "job", priority="high")
+        for dependent in ("x", "y"):
+            queue.add_ticket(dependent, "job", priority="deferred")
+            await queue.add_ticket_dependency(dependent, "hub")
+        fifo = _ids(await queue.get_ready_tickets())
+
+        await queue.set_assignment_strategy("priority_weighted")
+        by_priority = _ids(await queue.get_ready_tickets())
+        await queue.set_assignment_strategy("dependency_optimized")
+        unblocking = _ids(await queue.get_ready_tickets(limit=2))
+
+        assert fifo == ["low", "urgent", "hub", "late"]
+        assert by_priority == ["urgent", "late", "hub", "low"]
+        assert unblocking == ["hub", "urgent"]
+        assert await queue.get_assignment_strategy() == "dependency_optimized"
+
+    async def test_reservations_hide_tickets_until_they_expire(self) -> None:
+        """A lease keeps a ticket from others until released or expired."""
+        clock = ManualClock()
+        queue = DependencyWorkQueue(clock=clock)
+        queue.add_ticket("a", "job")
+        queue.add_ticket("b", "job")
+
+        assert await queue.reserve_ticket("a", "agent-1", 5)
+        assert not await queue.reserve_ticket("a", "agent-2", 5)
+        with pytest.raises(InvalidProtocolStateError, match="reserved by agent-1"):
+            await queue.assign_ticket_to_agent("a", "agent-2")
+        assert _ids(await queue.get_ready_tickets()) == ["b"]
+        assert await queue.reserve_ticket("b", "agent-2", 1)
+        assert await queue.release_ticket_reservation("b", "agent-2")
+        assert _ids(await queue.get_ready_tickets()) == ["b"]
+
+        clock.now = 301.0
+        assert _ids(await queue.get_ready_tickets()) == ["a", "b"]
+        assert queue.leases_expired == 1
+        assert not await queue.release_ticket_reservation("a", "agent-1")
+        with pytest.raises(ValueError, match="duration_minutes"):
+            await queue.reserve_ticket("a", "agent-1", 0)
+
+    async def test_assignment_takes_the_reservation(self) -> None:
+        """The lease holder may assign; blocked tickets cannot be assigned."""
+        queue = DependencyWorkQueue()
+        queue.add_ticket("a", "job")
+        queue.add_ticket("b", "job")
+        await queue.add_ticket_dependency("b", "a")
+        await queue.reserve_ticket("a", "agent-1", 5)
+
+        ticket = await queue.assign_ticket_to_agent("a", "agent-1")
+
+        assert ticket.status == "assigned"
+        assert ticket.assigned_to == "agent-1"
+        assert _ids(await queue.get_tickets_by_agent("agent-1")) == ["a"]
+        with pytest.raises(InvalidProtocolStateError, match="blocked"):
+            await queue.assign_ticket_to_agent("b", "agent-1")
+        with pytest.raises(KeyError):
+            await queue.assign_ticket_to_agent("missing", "agent-1")
+
+    async def test_failure_and_requeue(self) -> None:
+        """Failed tickets keep dependents blocked until requeued and done."""
+        queue = DependencyWorkQueue()
+        queue.add_ticket("a", "job")
+        queue.add_ticket("b", "job")
+        await queue.add_ticket_dependency("b", "a")
+        await queue.assign_ticket_to_agent("a", "agent-1")
+
+        assert await queue.fail_ticket("a", "disk full")
+        assert _ids(await queue.get_blocked_tickets()) == ["b"]
+        assert await queue.requeue_ticket("a", "retry")
+        ticket = await queue.get_ticket_by_id("a")
+
+        assert ticket is not None
+        assert ticket.assigned_to is None
+        assert ticket.metadata["attempts"] == 2
+        assert await queue.get_tickets_by_agent("agent-1") == []
+        assert _ids(await queue.get_ready_tickets()) == ["a"]
+        assert await queue.update_ticket_status("a", "completed", "done")
+        assert _ids(await queue.get_ready_tickets()) == ["b"]
+
+    async def test_removing_a_dependency_unblocks(self) -> None:
+        """A ticket whose last open dependency is removed becomes ready."""
+        queue = DependencyWorkQueue()
+        queue.add_ticket("a", "job")
+        queue.add_ticket("b", "job")
+        await queue.add_ticket_dependency("b", "a")
+
+        assert await queue.remove_ticket_dependency("b", "a")
+        assert not await queue.remove_ticket_dependency("b", "a")
+        assert _ids(await queue.get_ready_tickets()) == ["a", "b"]
+
+    async def test_statistics_track_states(self) -> None:
+        """Statistics are kept up to date without scanning tickets."""
+        queue = DependencyWorkQueue()
+        for name in "abcde":
+            queue.add_ticket(name, "job")
+        await queue.add_ticket_dependency("e", "d")
+        await queue.reserve_ticket("a", "agent-1", 5)
+        await queue.assign_ticket_to_agent("b", "agent-1")
+        await queue.update_ticket_progress("b", 50.0)
+        await queue.complete_ticket("c", {})
+
+        assert await queue.get_queue_statistics() == {
+            "total": 5,
+            "pending": 3,
+            "ready": 1,
+            "blocked": 1,
+            "reserved": 1,
+            "assigned": 0,
+            "in_progress": 1,
+            "completed": 1,
+            "failed": 0,
+        }
+
+    async def test_limited_reads_skip_stale_entries(self) -> None:
+        """Heap reads stay in order while tickets come and go."""
+        queue = DependencyWorkQueue()
+        priorities = ("urgent", "high", "normal", "low")
+        for i in range(3_000):
+            queue.add_ticket(f"t{i}", "job", priority=priorities[i % 4])
+        await queue.get_ready_tickets(limit=1)
+        for i in range(3_000):
+            if i % 4 != 1:
+                await queue.assign_ticket_to_agent(f"t{i}", "agent-1")
+
+        top = _ids(await queue.get_ready_tickets(limit=5))
+
+        assert top == ["t1", "t5", "t9", "t13", "t17"]
+        assert len(await queue.get_ready_tickets()) == 750
+        assert queue.purges >= 1
+
+    async def test_available_tickets_match_the_agent(self) -> None:
+        """Capabilities and the priority cut-off filter ready tickets."""
+        queue = DependencyWorkQueue()
+        queue.add_ticket("gpu", "train", metadata={"required_capabilities": ["gpu"]})
+        queue.add_ticket("cpu", "lint", priority="low")
+        queue.add_ticket("any", "test", priority="high")
+
+        cpu_only = await queue.get_available_tickets(["python"])
+        urgent = await queue.get_available_tickets(None, "normal")
+
+        assert _ids(cpu_only) == ["any", "cpu"]
+        assert _ids(urgent) == ["any", "gpu"]
+        assert _ids(await queue.get_tickets_by_priority("low")) == ["cpu"]
+
+    async def test_subscribers_see_updates(self) -> None:
+        """Changes made after subscribing are streamed to subscribers."""
+        queue = DependencyWorkQueue()
+        queue.add_ticket("a", "job")
+        updates = await queue.subscribe_to_ticket_updates()
+
+        await queue.assign_ticket_to_agent("a", "agent-1")
+        await queue.complete_ticket("a", {})
+        seen = [
+            (t.ticket_id, t.status)
+            for t in [
+                await asyncio.wait_for(anext(updates), 1),
+                await asyncio.wait_for(anext(updates), 1),
+            ]
+        ]
+
+        # The same ticket object is delivered twice, now completed.
+        assert seen == [("a", "completed"), ("a", "completed")]
+        await updates.aclose()  # type: ignore[attr-defined]
+
+    async def test_progress_estimates_and_checkpoints(self) -> None:
+        """Durations of finished tickets drive estimates; checkpoints restore."""
+        clock = ManualClock()
+        queue = DependencyWorkQueue(clock=clock)
+        queue.add_ticket("first", "build")
+        queue.add_ticket("second", "build")
+        await queue.assign_ticket_to_agent("first", "agent-1")
+        clock.now = 40.0
+        await queue.complete_ticket("first", {})
+        await queue.assign_ticket_to_agent("second", "agent-1")
+        await queue.update_ticket_progress("second", 25.0)
+        checkpoint = await queue.create_ticket_checkpoint("second", {"step": 3})
+        await queue.update_ticket_progress("second", 75.0)
+
+        estimate = await queue.estimate_completion_time("second")
+        assert estimate["estimated_seconds"] == pytest.approx(10.0)
+        assert await queue.restore_ticket_checkpoint("second", checkpoint)
+        ticket = await queue.get_ticket_by_id("second")
+        assert ticket is not None
+        assert ticket.metadata["progress_percent"] == 25.0
+        assert ticket.metadata["checkpoint"] == {"step": 3}
+        metrics = await queue.get_ticket_metrics("first")
+        assert metrics["run_seconds"] == pytest.approx(40.0)
+        with pytest.raises(ValueError, match="progress_percent"):
+            await queue.update_ticket_progress("second", 101.0)
@@ -0,0 +1,266 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the rate-controlled parallel DLQ replayer."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from examples.reference.dlq_replayer import ReplayingDLQHandler
+from omnibase_spi.exceptions import InvalidProtocolStateError
+from omnibase_spi.protocols.event_bus.protocol_dlq_handler import ProtocolDLQHandler
+
+DLQ = "onex.evt.git.hook.v1.dlq"
+NOW = 1_735_689_600.0
+
+
+@dataclass
+class _Message:
+    key: bytes | None
+    value: bytes
+    topic: str = DLQ
+    partition: int | None = 0
+    offset: int | None = None
+    timestamp: int | None = None
+    headers: dict[str, bytes] = field(default_factory=dict)
+
+
+def _entry(sequence: int, key: str, *, topic: str = "onex.evt.git.hook.v1") -> _Message:
+    record = {
+        "original_topic": topic,
+        "original_envelope": {"sequence": sequence},
+        "error_message": "TimeoutError: downstream timed out",
+        "error_timestamp": NOW - 3600 * (100 - sequence),
+        "retry_count": 3,
+    }
+    return _Message(key.encode(), json.dumps(record).encode())
+
+
+class _Reader:
+    """DLQ topics held in lists."""
+
+    def __init__(self, entries: list[_Message]) -> None:
+        self.topics = {DLQ: entries}
+
+    async def read(
+        self, dlq_topic: str, position: int, max_entries: int
+    ) -> Sequence[_Message]:
+        """Slice of the topic."""
+        return self.topics[dlq_topic][position : position + max_entries]
+
+    async def end_position(self, dlq_topic: str) -> int:
+        """Topic length."""
+        return len(self.topics.get(dlq_topic, []))
+
+
+class _Producer:
+    """Producer recording sends, optionally slow or failing."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, bytes | None, int]] = []
+        self.flushes = 0
+        self.fail_on: set[int] = set()
+        self.delay = 0.0
+
+    async def send(
+        self, topic: str, value: bytes, key: bytes | None = None, **_: object
+    ) -> None:
+        """Record the send."""
+        sequence = json.loads(value)["sequence"]
+        await asyncio.sleep(self.delay)
+        if sequence in self.fail_on:
+            raise ConnectionError("broker unavailable")
+        self.sent.append((topic, key, sequence))
+
+    async def flush(self, timeout_seconds: float = 30.0) -> None:
+        """Count flushes."""
+        self.flushes += 1
+
+
+def _entries(count: int, keys: int = 4) -> list[_Message]:
+    return [_entry(i, f"repo-{i % keys}") for i in range(count)]
+
+
+def _handler(
+    reader: _Reader, producer: _Producer, **kwargs: object
+) -> ReplayingDLQHandler:
+    options: dict[str, object] = {"page_size": 10, "wall_clock": lambda: NOW}
+    options.update(kwargs)
+    return ReplayingDLQHandler(reader, producer, **options)  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestReplayingDLQHandler:
+    def test_conforms_to_dlq_handler_protocol(self) -> None:
+        """The replayer satisfies ProtocolDLQHandler."""
+        assert isinstance(_handler(_Reader([]), _Producer()), ProtocolDLQHandler)
+
+    async def test_replays_every_entry_in_key_order(self) -> None:
+        """Envelopes go to their original topic, each key in DLQ order."""
+        producer = _Producer()
+        producer.delay = 0.001
+        handler = _handler(_Reader(_entries(50)), producer, concurrency=8)
+
+        results = await handler.reprocess_dlq(DLQ)
+
+        assert results == {
+            "messages_reprocessed": 50,
+            "messages_failed": 0,
+            "errors": [],
+            "checkpoint": 50,
+        }
+        assert sorted(s for _, _, s in producer.sent) == list(range(50))
+        for key in {k for _, k, _ in producer.sent}:
+            sequences = [s for _, k, s in producer.sent if k == key]
+            assert sequences == sorted(sequences)
+        assert {t for t, _, _ in producer.sent} == {"onex.evt.git.hook.v1"}
+        assert producer.flushes >= 5
+
+    async def test_resumes_from_the_checkpoint_file(self, tmp_path: Path) -> None:
+        """A new handler picks up where a limited replay stopped."""
+        path = tmp_path / "checkpoints.json"
+        reader = _Reader(_entries(45))
+        producer = _Producer()
+
+        first = await _handler(reader, producer, checkpoint_path=path).reprocess_dlq(
+            DLQ, limit=30
+        )
+        assert first["checkpoint"] == 30
+        assert json.loads(path.read_text()) == {DLQ: 30}
+
+        resumed = _handler(reader, producer, checkpoint_path=path)
+        second = await resumed.reprocess_dlq(DLQ)
+
+        assert second["messages_reprocessed"] == 15
+        assert sorted(s for _, _, s in producer.sent) == list(range(45))
+        assert resumed.checkpoints == {DLQ: 45}
+
+    async def test_undecodable_entries_are_skipped(self) -> None:
+        """Entries without the DLQ fields count as failed and are passed."""
+        entries = _entries(5)
+        entries[2] = _Message(b"k", b"not json")
+        handler = _handler(_Reader(entries), _Producer())
+
+        results = await handler.reprocess_dlq(DLQ)
+
+        assert isinstance(results, dict)
+        assert (results["messages_reprocessed"], results["messages_failed"]) == (4, 1)
+        assert "undecodable DLQ entry at" in str(results["errors"])
+        assert results["checkpoint"] == 5
+
+    async def test_publish_failure_stops_before_the_entry(self) -> None:
+        """The checkpoint never passes an entry that failed to publish."""
+        producer = _Producer()
+        producer.fail_on = {13}
+        handler = _handler(_Reader(_entries(30)), producer)
+
+        results = await handler.reprocess_dlq(DLQ)
+
+        assert isinstance(results, dict)
+        assert results["messages_failed"] == 1
+        assert results["errors"] == ["broker unavailable"]
+        assert results["checkpoint"] == 13
+
+        producer.fail_on.clear()
+        await handler.reprocess_dlq(DLQ)
+        assert {s for _, _, s in producer.sent} == set(range(30))
+        assert handler.checkpoints == {DLQ: 30}
+
+    async def test_rate_limit_spaces_out_replays(self) -> None:
+        """Beyond the burst, replays are held to rate_per_second."""
+        handler = _handler(
+            _Reader(_entries(60)), _Producer(), rate_per_second=200.0, burst=10
+        )
+
+        start = time.monotonic()
+        await handler.reprocess_dlq(DLQ)
+
+        assert time.monotonic() - start >= 50 / 200.0 * 0.9
+
+    async def test_metrics_and_summary(self) -> None:
+        """Metrics report progress and ETA; the summary alerts on backlog."""
+        reader = _Reader(_entries(40))
+        reader.topics[DLQ].append(
+            _entry(40, "other", topic="onex.evt.linear.snapshot.v1")
+        )
+        handler = _handler(reader, _Producer(), dlq_topics=[DLQ], alert_threshold=5)
+
+        before = await handler.get_dlq_summary()
+        await handler.reprocess_dlq(DLQ, limit=20)
+        metrics = await handler.get_metrics()
+        summary = await handler.get_dlq_summary()
+
+        assert isinstance(before, dict)
+        assert isinstance(metrics, dict)
+        assert isinstance(summary, dict)
+        assert before["alert_status"] == "ALERT"
+        assert metrics["total_dlq_messages"] == 41
+        assert metrics["replay_remaining"] == 21
+        assert metrics["reprocessing_success"] == 20
+        assert metrics["messages_by_error_type"] == {"TimeoutError": 20}
+        rate = metrics["replay_rate_per_second"]
+        assert isinstance(rate, float) and rate > 0
+        assert metrics["replay_eta_seconds"] == pytest.approx(21 / rate)
+        assert summary["alert_status"] == "ALERT"
+        assert summary["alerts_triggered"] == 1
+
+        await handler.reprocess_dlq(DLQ)
+        final = await handler.get_dlq_summary()
+        assert isinstance(final, dict)
+        assert final["alert_status"] == "OK"
+        assert final["top_failing_topics"] == {
+            "onex.evt.git.hook.v1": 40,
+            "onex.evt.linear.snapshot.v1": 1,
+        }
+
+    async def test_oldest_age_covers_unreplayed_entries(self) -> None:
+        """Entries read but not checkpointed set the oldest age."""
+        producer = _Producer()
+        producer.fail_on = {3}
+        handler = _handler(_Reader(_entries(10)), producer)
+
+        await handler.reprocess_dlq(DLQ)
+        stuck = await handler.get_metrics()
+        producer.fail_on.clear()
+        await handler.reprocess_dlq(DLQ)
+        done = await handler.get_metrics()
+
+        assert isinstance(stuck, dict) and isinstance(done, dict)
+        assert stuck["oldest_message_age_hours"] == pytest.approx(100.0)
+        assert done["oldest_message_age_hours"] == 0.0
+
+    async def test_stop_ends_replays_at_a_checkpoint(self) -> None:
+        """stop() lets the current page finish; replays wait for start()."""
+        producer = _Producer()
+        producer.delay = 0.002
+        handler = _handler(_Reader(_entries(200)), producer)
+
+        replay = asyncio.create_task(handler.reprocess_dlq(DLQ))
+        await asyncio.sleep(0.01)
+        await handler.stop()
+        results = await replay
+
+        assert isinstance(results, dict)
+        checkpoint = results["checkpoint"]
+        assert isinstance(checkpoint, int) and 0 < checkpoint < 200
+        assert checkpoint % 10 == 0
+        assert len(producer.sent) == checkpoint
+        with pytest.raises(InvalidProtocolStateError):
+            await handler.reprocess_dlq(DLQ)
+        await handler.start()
+        await handler.reprocess_dlq(DLQ)
+        assert handler.checkpoints == {DLQ: 200}
+
+    def test_rejects_invalid_configuration(self) -> None:
+        """Sizes and rates must be positive."""
+        for option in ("concurrency", "page_size", "rate_per_second", "burst"):
+            with pytest.raises(ValueError, match=option):
+                _handler(_Reader([]), _Producer(), **{option: 0})
@@ -0,0 +1,279 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the zero-copy envelope chunker and streaming reassembler."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import warnings
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from examples.reference.envelope_chunker import (
+    ChunkReassembler,
+    ChunkSeriesFailedError,
+    EnvelopeChunker,
+)
+from omnibase_core.enums.enum_chunk_failure_reason import EnumChunkFailureReason
+from omnibase_core.models.chunking.model_chunk_policy import ModelChunkPolicy
+from omnibase_core.models.chunking.model_chunked_envelope import (
+    ModelChunkedEnvelope,
+)
+from omnibase_spi.protocols.chunking.protocol_envelope_chunker import (
+    ProtocolEnvelopeChunker,
+)
+
+from .conftest import ManualClock
+
+
+class _Envelope:
+    """Chunkable envelope wrapping raw bytes."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def to_bytes(self) -> bytes:
+        return self.data
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> _Envelope:
+        return cls(data)
+
+
+def _tamper(chunk: ModelChunkedEnvelope, **metadata: object) -> ModelChunkedEnvelope:
+    payload = metadata.pop("payload", chunk.chunk_payload)
+    return chunk.model_copy(
+        update={
+            "chunk_metadata": chunk.chunk_metadata.model_copy(update=metadata),
+            "chunk_payload": payload,
+        }
+    )
+
+
+# Reproducible test data and shuffles; not used for anything security related.
+_RNG = random.Random(7)  # noqa: S311
+DATA = _RNG.randbytes(10_000)
+
+
+@pytest.mark.unit
+class TestEnvelopeChunker:
+    def test_conforms_to_chunker_protocol(self) -> None:
+        """EnvelopeChunker satisfies ProtocolEnvelopeChunker."""
+        assert isinstance(EnvelopeChunker(_Envelope), ProtocolEnvelopeChunker)
+
+    def test_chunks_are_views_with_checksums(self) -> None:
+        """Payloads are zero-copy slices and checksums cover chunk and series."""
+        chunks = EnvelopeChunker(_Envelope).chunk(
+            _Envelope(DATA), 3000, headers={"event_type": "demo"}
+        )
+
+        assert [len(c.chunk_payload) for c in chunks] == [3000, 3000, 3000, 1000]
+        assert all(isinstance(c.chunk_payload, memoryview) for c in chunks)
+        assert b"".join(c.chunk_payload for c in chunks) == DATA
+        metadata = chunks[1].chunk_metadata
+        assert metadata.chunk_index == 1
+        assert metadata.chunk_count == 4
+        assert metadata.total_size == len(DATA)
+        assert metadata.reassembly_strategy == "any_order"
+        assert metadata.payload_checksum == f"sha256:{hashlib.sha256(DATA).hexdigest()}"
+        assert (
+            metadata.chunk_checksum
+            == f"sha256:{hashlib.sha256(DATA[3000:6000]).hexdigest()}"
+        )
+        assert chunks[0].envelope_headers == {"event_type": "demo"}
+        assert len({c.chunk_metadata.chunk_series_id for c in chunks}) == 1
+
+    def test_copy_payloads_yields_serializable_bytes(self) -> None:
+        """copy_payloads=True produces bytes that pydantic can serialize."""
+        chunks = EnvelopeChunker(_Envelope, copy_payloads=True).chunk(
+            _Envelope(DATA), 4096
+        )
+
+        assert all(type(c.chunk_payload) is bytes for c in chunks)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert chunks[0].model_dump()["chunk_payload"] == DATA[:4096]
+
+    def test_empty_envelope_is_one_empty_chunk(self) -> None:
+        """An empty payload still produces a reassemblable series."""
+        chunker = EnvelopeChunker(_Envelope)
+        chunks = chunker.chunk(_Envelope(b""), 10)
+
+        assert len(chunks) == 1
+        assert chunker.reassemble(chunks).to_bytes() == b""  # type: ignore[attr-defined]
+
+    def test_enforces_max_chunk_count(self) -> None:
+        """The policy's max_chunk_count bounds the series length."""
+        chunker = EnvelopeChunker.from_policy(
+            _Envelope, ModelChunkPolicy(max_chunk_count=3)
+        )
+        with pytest.raises(ValueError, match="max_chunk_count is 3"):
+            chunker.chunk(_Envelope(DATA), 3000)
+        with pytest.raises(ValueError, match="max_chunk_size"):
+            chunker.chunk(_Envelope(DATA), 0)
+
+    def test_reassemble_accepts_any_order(self) -> None:
+        """Batch reassembly restores the envelope from shuffled chunks."""
+        chunker = EnvelopeChunker(_Envelope)
+        chunks = chunker.chunk(_Envelope(DATA), 777)
+        _RNG.shuffle(chunks)
+
+        assert chunker.reassemble(chunks).to_bytes() == DATA  # type: ignore[attr-defined]
+
+    def test_reassemble_rejects_incomplete_and_mixed_series(self) -> None:
+        """Missing chunks and foreign chunks are ValueErrors."""
+        chunker = EnvelopeChunker(_Envelope)
+        chunks = chunker.chunk(_Envelope(DATA), 3000)
+        other = chunker.chunk(_Envelope(b"other"), 3000)
+
+        with pytest.raises(ValueError, match="incomplete: 3 of 4"):
+            chunker.reassemble(chunks[:3])
+        with pytest.raises(ValueError, match="2 series"):
+            chunker.reassemble(chunks + other)
+
+
+@pytest.mark.unit
+class TestChunkReassembler:
+    def test_interleaved_series_complete_independently(self) -> None:
+        """Chunks of several series may arrive interleaved and shuffled."""
+        chunker = EnvelopeChunker(_Envelope)
+        payloads = [DATA, DATA[::-1], DATA[:4321]]
+        chunks = [c for p in payloads for c in chunker.chunk(_Envelope(p), 1000)]
+        _RNG.shuffle(chunks)
+        reassembler = ChunkReassembler(_Envelope)
+
+        completed = [reassembler.add(chunk) for chunk in chunks]
+
+        rebuilt = [e.to_bytes() for e in completed if e is not None]  # type: ignore[attr-defined]
+        assert sorted(rebuilt) == sorted(payloads)
+        assert reassembler.pending_series == 0
+        assert reassembler.buffered_bytes == 0
+
+    def test_redelivered_chunks_are_ignored(self) -> None:
+        """Duplicates and chunks of completed series do not reopen a series."""
+        chunks = EnvelopeChunker(_Envelope).chunk(_Envelope(DATA), 4000)
+        reassembler = ChunkReassembler(_Envelope)
+
+        assert reassembler.add(chunks[0]) is None
+        assert reassembler.add(chunks[0]) is None
+        assert reassembler.add(chunks[1]) is None
+        assert reassembler.add(chunks[2]) is not None
+        assert reassembler.add(chunks[1]) is None
+        assert reassembler.pending_series == 0
+
+    def test_last_chunk_first_is_placed_correctly(self) -> None:
+        """The final, shorter chunk may open its series."""
+        chunks = EnvelopeChunker(_Envelope).chunk(_Envelope(DATA), 3000)
+        reassembler = ChunkReassembler(_Envelope)
+
+        results = [reassembler.add(c) for c in reversed(chunks)]
+
+        assert results[-1].to_bytes() == DATA  # type: ignore[union-attr]
+
+    def test_corrupt_chunk_fails_the_series(self) -> None:
+        """A payload that does not match its checksum abandons the series."""
+        chunks = EnvelopeChunker(_Envelope).chunk(_Envelope(DATA), 3000)
+        reassembler = ChunkReassembler(_Envelope)
+        reassembler.add(chunks[0])
+        corrupt = _tamper(chunks[1], payload=bytes(3000))
+
+        with pytest.raises(ChunkSeriesFailedError) as excinfo:
+            reassembler.add(corrupt)
+
+        event = excinfo.value.event
+        assert event.reason is EnumChunkFailureReason.CHECKSUM_MISMATCH
+        assert event.received_chunk_count == 1
+        assert event.expected_chunk_count == 4
+        assert reassembler.pending_series == 0
+        assert reassembler.buffered_bytes == 0
+
+    def test_conflicting_duplicate_fails_the_series(self) -> None:
+        """Two different payloads for one index are a duplicate-chunk failure."""
+        chunker = EnvelopeChunker(_Envelope)
+        chunks = chunker.chunk(_Envelope(DATA), 3000)
+        forged = bytes(3000)
+        conflicting = _tamper(
+            chunks[0],
+            payload=forged,
+            chunk_checksum=f"sha256:{hashlib.sha256(forged).hexdigest()}",
+        )
+        reassembler = ChunkReassembler(_Envelope)
+        reassembler.add(chunks[0])
+
+        with pytest.raises(ChunkSeriesFailedError) as excinfo:
+            reassembler.add(conflicting)
+
+        assert excinfo.value.event.reason is EnumChunkFailureReason.DUPLICATE_CHUNK
+
+    def test_series_checksum_mismatch_is_detected(self) -> None:
+        """Valid chunks assembling to the wrong payload fail on completion."""
+        chunks = EnvelopeChunker(_Envelope).chunk(_Envelope(DATA), 5000)
+        wrong = "sha256:" + "0" * 64
+        reassembler = ChunkReassembler(_Envelope)
+        reassembler.add(_tamper(chunks[0], payload_checksum=wrong))
+
+        with pytest.raises(ChunkSeriesFailedError) as excinfo:
+            reassembler.add(_tamper(chunks[1], payload_checksum=wrong))
+
+        assert excinfo.value.event.reason is EnumChunkFailureReason.CHECKSUM_MISMATCH
+        assert excinfo.value.event.received_chunk_count == 2
+
+    def test_strict_order_rejects_out_of_order_chunks(self) -> None:
+        """strict_order series must arrive by index."""
+        chunks = [
+            _tamper(c, reassembly_strategy="strict_order")
+            for c in EnvelopeChunker(_Envelope).chunk(_Envelope(DATA), 3000)
+        ]
+        reassembler = ChunkReassembler(_Envelope)
+        reassembler.add(chunks[0])
+
+        with pytest.raises(ChunkSeriesFailedError, match="strict_order"):
+            reassembler.add(chunks[2])
+
+    def test_memory_budget_rejects_new_series(self) -> None:
+        """Series that would exceed max_buffered_bytes are refused."""
+        chunker = EnvelopeChunker(_Envelope)
+        reassembler = ChunkReassembler(_Envelope, max_buffered_bytes=15_000)
+        reassembler.add(chunker.chunk(_Envelope(DATA), 3000)[0])
+
+        with pytest.raises(ChunkSeriesFailedError) as excinfo:
+            reassembler.add(chunker.chunk(_Envelope(DATA), 3000)[0])
+
+        assert (
+            excinfo.value.event.reason
+            is EnumChunkFailureReason.PARTIAL_PROCESSING_PREVENTED
+        )
+        assert reassembler.buffered_bytes == len(DATA)
+
+    def test_expire_abandons_stale_series(self) -> None:
+        """Series past the timeout or their expiry timestamp time out."""
+        clock = ManualClock()
+        chunker = EnvelopeChunker(_Envelope)
+        reassembler = ChunkReassembler(_Envelope, timeout_seconds=5, clock=clock)
+        stale = chunker.chunk(_Envelope(DATA), 3000)
+        expiring = chunker.chunk(_Envelope(DATA), 3000)
+        past = datetime.now(UTC) - timedelta(seconds=1)
+        reassembler.add(stale[0])
+        reassembler.add(_tamper(expiring[0], expiry_timestamp=past))
+
+        expired = reassembler.expire()
+        assert [e.chunk_series_id for e in expired] == [
+            expiring[0].chunk_metadata.chunk_series_id
+        ]
+        clock.now = 5
+        expired = reassembler.expire()
+
+        assert [e.chunk_series_id for e in expired] == [
+            stale[0].chunk_metadata.chunk_series_id
+        ]
+        assert expired[0].reason is EnumChunkFailureReason.TIMEOUT
+        assert expired[0].received_chunk_count == 1
+        assert reassembler.buffered_bytes == 0
+
+    def test_rejects_non_positive_limits(self) -> None:
+        """Timeout and budgets must be positive."""
+        with pytest.raises(ValueError, match="positive"):
+            ChunkReassembler(_Envelope, timeout_seconds=0)
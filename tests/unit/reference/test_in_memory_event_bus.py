@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the in-memory reference event bus."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from uuid import uuid4
+
+import pytest
+
+from examples.reference.in_memory_event_bus import InMemoryEventBus
+from omnibase_core.models.common import ModelEnvelope
+from omnibase_spi.exceptions import SPIError
+from omnibase_spi.protocols.event_bus.protocol_event_bus_mixin import (
+    ProtocolEventBusBase,
+)
+
+TOPIC = "onex.evt.reference.v1"
+
+
+class _Event:
+    """Minimal ProtocolEventMessage stand-in."""
+
+    __slots__ = ("headers", "key", "offset", "partition", "topic", "value")
+
+    def __init__(self, key: bytes | None, value: bytes, topic: str = TOPIC) -> None:
+        self.topic = topic
+        self.key = key
+        self.value = value
+        self.headers = None
+        self.offset = None
+        self.partition = None
+
+    async def ack(self) -> None:
+        """No-op acknowledgement."""
+
+
+class _Recorder:
+    """Async handler that records every message it receives."""
+
+    def __init__(self) -> None:
+        self.messages: list[object] = []
+
+    async def __call__(self, message: object) -> None:
+        self.messages.append(message)
+
+
+async def _run(bus: InMemoryEventBus, *events: _Event) -> None:
+    """Publish ``events`` and drain the bus."""
+    consumer = asyncio.create_task(bus.start_consuming())
+    await asyncio.sleep(0)  # let the consumer start before stop is requested
+    for event in events:
+        await bus.publish(event)
+    await bus.stop_consuming()
+    await consumer
+
+
+@pytest.mark.unit
+class TestInMemoryEventBus:
+    def test_conforms_to_event_bus_protocol(self) -> None:
+        """The bus satisfies ProtocolEventBusBase."""
+        assert isinstance(InMemoryEventBus(), ProtocolEventBusBase)
+
+    def test_rejects_non_positive_sizes(self) -> None:
+        """Partitions and capacity must be positive."""
+        with pytest.raises(ValueError, match="positive"):
+            InMemoryEventBus(partitions=0)
+        with pytest.raises(ValueError, match="positive"):
+            InMemoryEventBus(partition_capacity=0)
+
+    async def test_subscribe_rejects_empty_topic(self) -> None:
+        """An empty topic is an SPIError."""
+        with pytest.raises(SPIError):
+            await InMemoryEventBus().subscribe("", _Recorder())
+
+    async def test_same_key_is_delivered_in_order(self) -> None:
+        """Messages sharing a key reach each subscriber in publish order."""
+        bus = InMemoryEventBus(partitions=4, partition_capacity=8)
+        recorder = _Recorder()
+        await bus.subscribe(TOPIC, recorder)
+        events = [_Event(f"key-{i % 5}".encode(), str(i).encode()) for i in range(200)]
+
+        await _run(bus, *events)
+
+        by_key: dict[bytes | None, list[bytes]] = defaultdict(list)
+        for message in recorder.messages:
+            assert isinstance(message, _Event)
+            by_key[message.key].append(message.value)
+        for key, values in by_key.items():
+            expected = [e.value for e in events if e.key == key]
+            assert values == expected
+
+    async def test_fan_out_hands_every_group_the_same_object(self) -> None:
+        """Independent subscribers receive the identical message object."""
+        bus = InMemoryEventBus(partitions=2)
+        first, second = _Recorder(), _Recorder()
+        await bus.subscribe(TOPIC, first)
+        await bus.subscribe(TOPIC, second)
+        events = [_Event(None, str(i).encode()) for i in range(10)]
+
+        await _run(bus, *events)
+
+        assert len(first.messages) == len(second.messages) == 10
+        assert {id(m) for m in first.messages} == {id(e) for e in events}
+        assert {id(m) for m in second.messages} == {id(e) for e in events}
+
+    async def test_group_members_split_partitions(self) -> None:
+        """A consumer group sees each message once, each key on one member."""
+        bus = InMemoryEventBus(partitions=4)
+        members = [_Recorder(), _Recorder()]
+        observer = _Recorder()
+        for member in members:
+            await bus.subscribe(TOPIC, member, group="workers")
+        await bus.subscribe(TOPIC, observer)
+        events = [_Event(f"k{i % 16}".encode(), str(i).encode()) for i in range(160)]
+
+        await _run(bus, *events)
+
+        received = members[0].messages + members[1].messages
+        assert sorted(id(m) for m in received) == sorted(id(e) for e in events)
+        assert all(member.messages for member in members)
+        keys = [{m.key for m in member.messages} for member in members]  # type: ignore[attr-defined]
+        assert not keys[0] & keys[1]
+        assert len(observer.messages) == len(events)
+
+    async def test_envelopes_are_partitioned_by_entity_id(self) -> None:
+        """Envelopes for one entity stay in publish order."""
+        bus = InMemoryEventBus(partitions=4)
+        recorder = _Recorder()
+        await bus.subscribe(TOPIC, recorder)
+        envelopes = [
+            ModelEnvelope(correlation_id=uuid4(), entity_id=f"entity-{i % 3}")
+            for i in range(30)
+        ]
+
+        consumer = asyncio.create_task(bus.start_consuming())
+        await asyncio.sleep(0)
+        for envelope in envelopes:
+            await bus.publish_envelope(envelope, TOPIC)
+        await bus.stop_consuming()
+        await consumer
+
+        for entity in ("entity-0", "entity-1", "entity-2"):
+            received = [m for m in recorder.messages if m.entity_id == entity]  # type: ignore[attr-defined]
+            assert received == [e for e in envelopes if e.entity_id == entity]
+
+    async def test_publish_waits_while_partition_is_full(self) -> None:
+        """A full partition applies backpressure until consumers catch up."""
+        bus = InMemoryEventBus(partitions=1, partition_capacity=2)
+        recorder = _Recorder()
+        await bus.subscribe(TOPIC, recorder)
+        await bus.publish(_Event(None, b"1"))
+        await bus.publish(_Event(None, b"2"))
+
+        blocked = asyncio.create_task(bus.publish(_Event(None, b"3")))
+        await asyncio.sleep(0)
+        assert not blocked.done()
+        assert (await bus.health_check())["buffered"] == 2  # type: ignore[index]
+
+        consumer = asyncio.create_task(bus.start_consuming())
+        await blocked
+        await bus.stop_consuming()
+        await consumer
+
+        assert [m.value for m in recorder.messages] == [b"1", b"2", b"3"]  # type: ignore[attr-defined]
+
+    async def test_topic_without_subscribers_drops_messages(self) -> None:
+        """Publishing to an unsubscribed topic never blocks."""
+        bus = InMemoryEventBus(partitions=1, partition_capacity=1)
+
+        for i in range(5):
+            await bus.publish(_Event(None, str(i).encode()))
+
+        assert bus.dropped == 5
+        assert bus.published == 0
+
+    async def test_handler_errors_do_not_stop_delivery(self) -> None:
+        """A raising handler is counted and the partition keeps flowing."""
+        bus = InMemoryEventBus(partitions=1)
+        recorder = _Recorder()
+
+        async def failing(_message: object) -> None:
+            raise RuntimeError("boom")
+
+        await bus.subscribe(TOPIC, failing)
+        await bus.subscribe(TOPIC, recorder)
+
+        await _run(bus, *(_Event(None, b"x") for _ in range(3)))
+
+        assert len(recorder.messages) == 3
+        assert bus.handler_errors == 3
+        assert bus.delivered == 3
+        assert bus.last_error == "RuntimeError: boom"
+
+    async def test_start_consuming_returns_after_timeout(self) -> None:
+        """A bounded consume run drains buffered messages and returns."""
+        bus = InMemoryEventBus(partitions=2)
+        recorder = _Recorder()
+        await bus.subscribe(TOPIC, recorder)
+        for i in range(4):
+            await bus.publish(_Event(None, str(i).encode()))
+
+        await bus.start_consuming(timeout_seconds=0.01)
+
+        assert len(recorder.messages) == 4
+        assert (await bus.health_check())["consuming"] is False  # type: ignore[index]
+
+    async def test_late_subscription_joins_running_bus(self) -> None:
+        """Topics subscribed while consuming get workers immediately."""
+        bus = InMemoryEventBus(partitions=2)
+        recorder = _Recorder()
+        consumer = asyncio.create_task(bus.start_consuming())
+        await asyncio.sleep(0)
+
+        await bus.subscribe(TOPIC, recorder)
+        await bus.publish(_Event(b"k", b"v"))
+        await bus.stop_consuming()
+        await consumer
+
+        assert len(recorder.messages) == 1
+
+    async def test_health_check_reports_counters(self) -> None:
+        """Health reports occupancy and delivery counters."""
+        bus = InMemoryEventBus(partitions=3, partition_capacity=4)
+        await bus.subscribe(TOPIC, _Recorder())
+        await _run(bus, _Event(b"a", b"1"), _Event(b"b", b"2"))
+
+        health = await bus.health_check()
+
+        assert health == {
+            "healthy": True,
+            "consuming": False,
+            "topics": 1,
+            "partitions": 3,
+            "buffered": 0,
+            "capacity": 12,
+            "published": 2,
+            "delivered": 2,
+            "dropped": 0,
+            "handler_errors": 0,
+            "last_error": None,
+        }
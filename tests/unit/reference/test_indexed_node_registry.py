@@ -0,0 +1,348 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the indexed scheduling workflow node registry."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.indexed_node_registry import (
+    IndexedNodeRegistry,
+    NodeSchedulingResult,
+    TaskSchedulingCriteria,
+    WorkflowNodeCapability,
+    WorkflowNodeInfo,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_node_registry import (
+    ProtocolNodeSchedulingResult,
+    ProtocolTaskSchedulingCriteria,
+    ProtocolWorkflowNodeCapability,
+    ProtocolWorkflowNodeInfo,
+    ProtocolWorkflowNodeRegistry,
+)
+
+from .conftest import ManualClock
+
+NAMES = ("gpu", "ssd", "python", "java", "ml")
+TYPES = ("COMPUTE", "EFFECT")
+
+
+@dataclass
+class _Task:
+    task_type: str = "compute"
+    resource_requirements: dict[str, Any] = field(default_factory=dict)
+    task_id: UUID = field(default_factory=uuid4)
+
+
+def _node(
+    node_id: str,
+    *names: str,
+    node_type: str = "COMPUTE",
+    slots: int = 4,
+    **fields: Any,
+) -> WorkflowNodeInfo:
+    return WorkflowNodeInfo(
+        node_id=node_id,
+        node_type=node_type,  # type: ignore[arg-type]
+        workflow_capabilities=[
+            WorkflowNodeCapability(f"{node_id}-{name}", name) for name in names
+        ],
+        max_concurrent_tasks=slots,
+        **fields,
+    )
+
+
+def _criteria(*required: str, **fields: Any) -> TaskSchedulingCriteria:
+    fields.setdefault("node_type", "COMPUTE")
+    return TaskSchedulingCriteria(
+        task_type="compute", required_capabilities=list(required), **fields
+    )
+
+
+def _registry(**options: Any) -> IndexedNodeRegistry:
+    return IndexedNodeRegistry(object(), **options)  # type: ignore[arg-type]
+
+
+def _ids(nodes: list[ProtocolWorkflowNodeInfo]) -> list[str]:
+    return [node.node_id for node in nodes]
+
+
+async def _scored(
+    registry: IndexedNodeRegistry,
+    nodes: list[WorkflowNodeInfo],
+    task: _Task,
+    criteria: TaskSchedulingCriteria,
+) -> list[str]:
+    """Rank nodes by scoring every one of them."""
+    scores = [
+        (await registry.calculate_scheduling_score(node, task, criteria), i, node)  # type: ignore[arg-type]
+        for i, node in enumerate(nodes)
+    ]
+    ranked = sorted((s for s in scores if s[0] > 0), key=lambda s: (-s[0], s[1]))
+    return [node.node_id for _, _, node in ranked[:3]]
+
+
+@pytest.mark.unit
+class TestIndexedNodeRegistry:
+    def test_conforms_to_registry_protocols(self) -> None:
+        """Registry and value objects satisfy their protocols."""
+        result = NodeSchedulingResult([], 0.0, "", [], {}, None, {})
+        assert isinstance(_registry(), ProtocolWorkflowNodeRegistry)
+        assert isinstance(_node("a", "gpu"), ProtocolWorkflowNodeInfo)
+        assert isinstance(
+            WorkflowNodeCapability("c", "gpu"), ProtocolWorkflowNodeCapability
+        )
+        assert isinstance(_criteria(), ProtocolTaskSchedulingCriteria)
+        assert isinstance(result, ProtocolNodeSchedulingResult)
+
+    async def test_matches_scoring_every_node(self) -> None:
+        """Indexed discovery picks what scoring all nodes would pick."""
+        rng = random.Random(7)  # noqa: S311
+        registry = _registry()
+        nodes = [
+            _node(
+                f"n{i}",
+                *rng.sample(NAMES, 2),
+                node_type=rng.choice(TYPES),
+                slots=rng.randint(1, 4),
+            )
+            for i in range(300)
+        ]
+        for node in nodes:
+            registry.add_node(node, capacity={"cpu": 4})
+        for step in range(400):
+            node = rng.choice(nodes)
+            task_id = UUID(int=step)
+            if rng.random() < 0.6:
+                await registry.update_node_workload(node.node_id, task_id, "assigned")
+            await registry.record_task_execution_metrics(
+                node.node_id, task_id, {"success": rng.random() < 0.8}
+            )
+
+        for _ in range(50):
+            task = _Task(resource_requirements={"cpu": rng.choice((1, 3))})
+            criteria = _criteria(
+                *rng.sample(NAMES, rng.randint(0, 2)),
+                node_type=rng.choice(TYPES),
+                preferred_capabilities=rng.sample(NAMES, rng.randint(0, 2)),
+            )
+            result = await registry.discover_nodes_for_task(task, criteria)  # type: ignore[arg-type]
+            picked = _ids(result.selected_nodes + result.fallback_nodes)
+            assert picked == await _scored(registry, nodes, task, criteria)
+        assert registry.nodes_examined < 50 * len(nodes)
+
+    async def test_constraints_exclude_nodes(self) -> None:
+        """Node type, capabilities, task type, health and slots are checked."""
+        registry = _registry()
+        registry.add_node(_node("effect", "gpu", node_type="EFFECT"))
+        registry.add_node(_node("no-gpu", "ssd"))
+        registry.add_node(_node("sick", "gpu", health_status="unhealthy"))
+        registry.add_node(_node("full", "gpu", slots=1))
+        registry.add_node(
+            WorkflowNodeInfo(
+                "reducer-only",
+                "COMPUTE",
+                workflow_capabilities=[
+                    WorkflowNodeCapability("r", "gpu", supported_task_types=["reducer"])
+                ],
+            )
+        )
+        await registry.update_node_workload("full", uuid4(), "assigned")
+
+        result = await registry.discover_nodes_for_task(_Task(), _criteria("gpu"))  # type: ignore[arg-type]
+        assert result.selected_nodes == []
+        assert not any(result.constraints_satisfied.values())
+
+        registry.add_node(_node("fits", "gpu", "ssd"))
+        result = await registry.discover_nodes_for_task(_Task(), _criteria("gpu"))  # type: ignore[arg-type]
+        assert _ids(result.selected_nodes) == ["fits"]
+        assert result.fallback_nodes == []
+        assert result.scheduling_score == pytest.approx(0.5)
+
+    async def test_workload_updates_rescore_nodes(self) -> None:
+        """Busy nodes fall behind idle ones as their workload changes."""
+        registry = _registry(fallback_count=1)
+        registry.add_node(_node("a", "gpu", slots=2))
+        registry.add_node(_node("b", "gpu", slots=2))
+        task = uuid4()
+        criteria = _criteria("gpu")
+
+        await registry.update_node_workload("a", task, "assigned")
+        await registry.update_node_workload("a", task, "started")
+        first = await registry.discover_nodes_for_task(_Task(), criteria)  # type: ignore[arg-type]
+        await registry.update_node_workload("a", task, "completed")
+        second = await registry.discover_nodes_for_task(_Task(), criteria)  # type: ignore[arg-type]
+
+        assert _ids(first.selected_nodes + first.fallback_nodes) == ["b", "a"]
+        assert _ids(second.selected_nodes + second.fallback_nodes) == ["a", "b"]
+        assert await registry.get_node_workload("a") == {
+            "active_tasks": 0,
+            "reserved_tasks": 0,
+            "free_slots": 2,
+        }
+        with pytest.raises(ValueError, match="unknown workload change"):
+            await registry.update_node_workload("a", task, "paused")
+        with pytest.raises(KeyError):
+            await registry.update_node_workload("missing", task, "assigned")
+
+    async def test_execution_metrics_drive_scores_and_history(self) -> None:
+        """Failures lower a node's score; history honours its window."""
+        clock = ManualClock()
+        registry = _registry(clock=clock)
+        registry.add_node(_node("a", "gpu"))
+        registry.add_node(_node("b", "gpu"))
+        await registry.record_task_execution_metrics(
+            "a", uuid4(), {"success": False, "duration_seconds": 4.0}
+        )
+        clock.now = 100.0
+        await registry.record_task_execution_metrics(
+            "b", uuid4(), {"duration_seconds": 2.0, "task_type": "effect"}
+        )
+        await registry.record_task_execution_metrics(
+            "b", uuid4(), {"duration_seconds": 4.0, "task_type": "compute"}
+        )
+
+        result = await registry.discover_nodes_for_task(_Task(), _criteria("gpu"))  # type: ignore[arg-type]
+        assert _ids(result.selected_nodes) == ["b"]
+        assert result.estimated_completion_time == pytest.approx(3.0)
+        history = await registry.get_node_performance_history("b", "compute", 60)
+        assert history == {
+            "executions": 1,
+            "successes": 1,
+            "success_rate": 1.0,
+            "mean_duration_seconds": 4.0,
+        }
+        assert (await registry.get_node_performance_history("a", None, 60))[
+            "executions"
+        ] == 0
+        info = await registry.get_workflow_node_info("a")
+        assert info is not None
+        assert info.task_execution_history["failures"] == 1
+
+    async def test_reservations_are_all_or_nothing(self) -> None:
+        """A reservation takes every amount or none, until it is released."""
+        clock = ManualClock()
+        registry = _registry(clock=clock)
+        registry.add_node(_node("a", "gpu"), capacity={"cpu": 4, "memory": 8})
+        first, second = uuid4(), uuid4()
+
+        assert await registry.reserve_resources("a", first, {"cpu": 3}, 30)
+        assert not await registry.reserve_resources(
+            "a", second, {"memory": 2, "cpu": 2}, 30
+        )
+        assert await registry.get_resource_utilization("a") == {
+            "cpu": 0.75,
+            "memory": 0.0,
+        }
+        assert await registry.reserve_resources("a", first, {"cpu": 4, "tag": "x"}, 30)
+        assert not await registry.reserve_resources("a", second, {"disk": 1}, 30)
+        criteria = _criteria("gpu", resource_requirements={"cpu": 1})
+        result = await registry.discover_nodes_for_task(_Task(), criteria)  # type: ignore[arg-type]
+        assert result.selected_nodes == []
+
+        clock.now = 31.0
+        result = await registry.discover_nodes_for_task(_Task(), criteria)  # type: ignore[arg-type]
+        assert _ids(result.selected_nodes) == ["a"]
+        assert registry.reservations_expired == 1
+        assert not await registry.release_resources("a", first)
+        assert await registry.reserve_resources("a", second, {"cpu": 2}, 30)
+        assert await registry.release_resources("a", second)
+        with pytest.raises(ValueError, match="timeout_seconds"):
+            await registry.reserve_resources("a", second, {"cpu": 1}, 0)
+
+    async def test_capability_changes_update_the_indexes(self) -> None:
+        """Registering and removing capabilities changes discovery."""
+        registry = _registry()
+        registry.add_node(_node("a", "gpu"))
+        registry.add_node(_node("b", "ssd"))
+        await registry.update_node_workload("a", uuid4(), "assigned")
+        gpu_v2 = WorkflowNodeCapability("b-gpu", "gpu", capability_version="2.0.0")
+
+        assert await registry.register_workflow_capability("b", gpu_v2)
+        assert _ids(await registry.discover_nodes_by_capability("gpu", None, None)) == [
+            "b",
+            "a",
+        ]
+        assert _ids(
+            await registry.discover_nodes_by_capability("gpu", "2.0.0", None)
+        ) == ["b"]
+        assert _ids(await registry.discover_nodes_by_capability("gpu", None, 1.0)) == [
+            "b"
+        ]
+        assert await registry.unregister_workflow_capability("b", "b-gpu")
+        assert not await registry.unregister_workflow_capability("b", "b-gpu")
+        assert not await registry.register_workflow_capability("missing", gpu_v2)
+
+        result = await registry.discover_nodes_for_task(_Task(), _criteria("gpu"))  # type: ignore[arg-type]
+        assert _ids(result.selected_nodes) == ["a"]
+        assert [c.capability_id for c in await registry.get_node_capabilities("b")] == [
+            "b-ssd"
+        ]
+
+    async def test_availability_and_cluster_summary(self) -> None:
+        """Health changes take nodes out of scheduling and show in summaries."""
+        registry = _registry()
+        registry.add_node(_node("a", "gpu", supported_workflow_types=["etl"]))
+        registry.add_node(
+            _node("b", "gpu", node_type="EFFECT", supported_workflow_types=["etl"])
+        )
+        registry.add_node(_node("c", "gpu", group="edge"))
+
+        assert await registry.update_node_availability("a", "unhealthy", {"why": "oom"})
+        assert not await registry.update_node_availability("missing", "healthy", None)
+        result = await registry.discover_nodes_for_task(_Task(), _criteria("gpu"))  # type: ignore[arg-type]
+
+        assert _ids(result.selected_nodes) == ["c"]
+        assert _ids(await registry.discover_nodes_for_workflow_type("etl", None)) == [
+            "a",
+            "b",
+        ]
+        assert _ids(
+            await registry.discover_nodes_for_workflow_type("etl", ["EFFECT"])
+        ) == ["b"]
+        assert await registry.get_cluster_health_summary("etl", None) == {
+            "total_nodes": 2,
+            "schedulable_nodes": 1,
+            "active_tasks": 0,
+            "task_slots": 8,
+            "healthy_nodes": 1,
+            "unhealthy_nodes": 1,
+        }
+        assert (await registry.get_cluster_health_summary(None, "edge"))[
+            "total_nodes"
+        ] == 1
+
+    async def test_heaps_are_purged_of_replaced_entries(self) -> None:
+        """Many rescores rebuild the heaps without changing results."""
+        registry = _registry(fallback_count=0)
+        for i in range(20):
+            registry.add_node(_node(f"n{i}", "gpu", slots=1_000))
+        for step in range(3_000):
+            await registry.update_node_workload(
+                f"n{step % 19}", UUID(int=step), "assigned"
+            )
+
+        result = await registry.discover_nodes_for_task(_Task(), _criteria("gpu"))  # type: ignore[arg-type]
+
+        assert _ids(result.selected_nodes) == ["n19"]
+        assert registry.purges >= 2
+        assert registry.rescores == 3_020
+
+    def test_invalid_configuration(self) -> None:
+        """Bad options and duplicate or slotless nodes are rejected."""
+        registry = _registry()
+        registry.add_node(_node("a"))
+        with pytest.raises(ValueError, match="already registered"):
+            registry.add_node(_node("a"))
+        with pytest.raises(ValueError, match="max_concurrent_tasks"):
+            registry.add_node(_node("b", slots=0))
+        with pytest.raises(ValueError, match="fallback_count"):
+            _registry(fallback_count=-1)
+        with pytest.raises(ValueError, match="history_size"):
+            _registry(history_size=0)
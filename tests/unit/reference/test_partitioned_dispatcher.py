@@ -0,0 +1,310 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the partition-key ordered parallel dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+
+import pytest
+
+from examples.reference.partitioned_dispatcher import (
+    PartitionedDispatcher,
+    registry_key,
+)
+from omnibase_spi.exceptions import InvalidProtocolStateError, ProtocolHandlerError
+from omnibase_spi.protocols.event_bus.protocol_event_bus_extended import (
+    ProtocolEventBusMessage,
+)
+from omnibase_spi.registry.compiled_event_registry import compile_event_registry
+
+
+@dataclass
+class _Message:
+    key: bytes | None
+    value: bytes
+    topic: str = "events"
+    partition: int | None = 0
+    offset: int | None = None
+    timestamp: int | None = None
+    headers: dict[str, bytes] = field(default_factory=dict)
+
+
+def _messages(keys: str, partition: int = 0) -> list[_Message]:
+    """One message per character of ``keys``, at consecutive offsets."""
+    return [
+        _Message(k.encode(), f"{k}{i}".encode(), partition=partition, offset=i)
+        for i, k in enumerate(keys)
+    ]
+
+
+class _Consumer:
+    """Consumer serving fixed batches, then empty ones."""
+
+    def __init__(self, *batches: list[_Message]) -> None:
+        self.batches = deque(batches)
+        self.commits: list[object] = []
+        self.drained = asyncio.Event()
+
+    async def consume_messages_stream(self, batch_timeout_ms: int) -> list[_Message]:
+        """Next batch, or an empty one after a short wait."""
+        if self.batches:
+            return self.batches.popleft()
+        self.drained.set()
+        await asyncio.sleep(0.001)
+        return []
+
+    async def commit_offsets(self) -> None:
+        """Record a commit of everything consumed."""
+        self.commits.append("all")
+
+
+class _SelectiveConsumer(_Consumer):
+    """Consumer that can commit chosen offsets."""
+
+    async def commit(self, offsets: dict[str, dict[int, int]]) -> None:
+        """Record the committed offsets."""
+        self.commits.append({t: dict(p) for t, p in offsets.items()})
+
+
+def _committed(consumer: _Consumer) -> dict[int, int]:
+    """Latest committed offset per partition of the ``events`` topic."""
+    latest: dict[int, int] = {}
+    for commit in consumer.commits:
+        assert isinstance(commit, dict)
+        latest.update(commit.get("events", {}))
+    return latest
+
+
+async def _until(condition: object) -> None:
+    for _ in range(1_000):
+        if callable(condition) and condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition not reached")
+
+
+async def _run(dispatcher: PartitionedDispatcher, consumer: _Consumer) -> None:
+    runner = asyncio.create_task(dispatcher.run())
+    await consumer.drained.wait()
+    dispatcher.stop()
+    await runner
+
+
+@pytest.mark.unit
+class TestPartitionedDispatcher:
+    async def test_same_key_in_order_other_keys_in_parallel(self) -> None:
+        """Each key is handled in order while keys overlap each other."""
+        handled: list[bytes] = []
+        running = 0
+        peak = 0
+
+        async def handler(message: ProtocolEventBusMessage) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            handled.append(message.value)
+
+        consumer = _Consumer(_messages("abcd" * 5))
+        dispatcher = PartitionedDispatcher(consumer, handler, lanes=8)
+        await _run(dispatcher, consumer)
+
+        for key in "abcd":
+            assert [v for v in handled if v.startswith(key.encode())] == [
+                f"{key}{i}".encode()
+                for i in range(len("abcd" * 5))
+                if i % 4 == "abcd".index(key)
+            ]
+        assert peak > 1
+        assert dispatcher.completed == dispatcher.dispatched == 20
+
+    async def test_unkeyed_messages_keep_partition_order(self) -> None:
+        """Messages without a key are ordered per topic partition."""
+        handled: list[int | None] = []
+
+        async def handler(message: ProtocolEventBusMessage) -> None:
+            await asyncio.sleep(0.001 * ((message.offset or 0) % 3))
+            handled.append(message.offset)
+
+        batch = [_Message(None, b"", offset=i) for i in range(10)]
+        consumer = _Consumer(batch)
+        await _run(PartitionedDispatcher(consumer, handler, lanes=4), consumer)
+
+        assert handled == list(range(10))
+
+    async def test_commits_stop_at_the_contiguous_watermark(self) -> None:
+        """A slow message holds back its partition's commit, not others."""
+        gate = asyncio.Event()
+
+        async def handler(message: ProtocolEventBusMessage) -> None:
+            if message.partition == 0 and message.offset == 1:
+                await gate.wait()
+
+        consumer = _SelectiveConsumer(_messages("abcd", 0) + _messages("xyz", 1))
+        dispatcher = PartitionedDispatcher(consumer, handler, lanes=8)
+        runner = asyncio.create_task(dispatcher.run())
+
+        await _until(lambda: _committed(consumer) == {0: 1, 1: 3})
+        assert dispatcher.lag == {("events", 0): 3, ("events", 1): 0}
+        assert dispatcher.in_flight == 1
+        gate.set()
+        await consumer.drained.wait()
+        dispatcher.stop()
+        await runner
+
+        assert consumer.commits[-1] == {"events": {0: 4}}
+        assert _committed(consumer) == {0: 4, 1: 3}
+        assert dispatcher.lag == {("events", 0): 0, ("events", 1): 0}
+
+    async def test_plain_consumer_commits_after_each_batch(self) -> None:
+        """Without commit(offsets), a batch finishes before commit_offsets."""
+        done: list[int | None] = []
+
+        async def handler(message: ProtocolEventBusMessage) -> None:
+            await asyncio.sleep(0.001)
+            done.append(message.offset)
+
+        consumer = _Consumer(_messages("ab"), _messages("cd"))
+        original = consumer.commit_offsets
+
+        async def commit_offsets() -> None:
+            assert len(done) % 2 == 0
+            await original()
+
+        consumer.commit_offsets = commit_offsets  # type: ignore[method-assign]
+        dispatcher = PartitionedDispatcher(consumer, handler)
+        await _run(dispatcher, consumer)
+
+        assert consumer.commits == ["all", "all"]
+        assert dispatcher.commits == 2
+
+    async def test_handler_error_stops_and_commits_before_it(self) -> None:
+        """A failing message is never committed past."""
+
+        async def handler(message: ProtocolEventBusMessage) -> None:
+            if message.offset == 2:
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.001)
+
+        consumer = _SelectiveConsumer(_messages("abcdef"))
+        dispatcher = PartitionedDispatcher(consumer, handler, lanes=8)
+
+        with pytest.raises(ProtocolHandlerError, match="offset 2: boom") as error:
+            await dispatcher.run()
+
+        assert error.value.context == {"topic": "events", "partition": 0, "offset": 2}
+        assert consumer.commits[-1] == {"events": {0: 2}}
+        assert dispatcher.failed == 1
+
+    async def test_plain_consumer_is_not_committed_after_an_error(self) -> None:
+        """commit_offsets would cover the failed message, so it is skipped."""
+
+        async def handler(_message: ProtocolEventBusMessage) -> None:
+            raise RuntimeError("boom")
+
+        consumer = _Consumer(_messages("ab"))
+        with pytest.raises(ProtocolHandlerError):
+            await PartitionedDispatcher(consumer, handler).run()
+
+        assert consumer.commits == []
+
+    async def test_on_error_handles_failures(self) -> None:
+        """Messages passed to on_error count as handled."""
+        dead_letters: list[int | None] = []
+
+        async def handler(message: ProtocolEventBusMessage) -> None:
+            if message.offset == 1:
+                raise RuntimeError("boom")
+
+        async def on_error(message: ProtocolEventBusMessage, _error: Exception) -> None:
+            dead_letters.append(message.offset)
+
+        consumer = _SelectiveConsumer(_messages("abc"))
+        dispatcher = PartitionedDispatcher(consumer, handler, on_error=on_error)
+        await _run(dispatcher, consumer)
+
+        assert dead_letters == [1]
+        assert consumer.commits[-1] == {"events": {0: 3}}
+        assert (dispatcher.completed, dispatcher.failed) == (3, 1)
+
+    async def test_in_flight_messages_are_bounded(self) -> None:
+        """Fetching waits while max_in_flight messages are outstanding."""
+        peak = 0
+        dispatcher: PartitionedDispatcher
+
+        async def handler(_message: ProtocolEventBusMessage) -> None:
+            nonlocal peak
+            peak = max(peak, dispatcher.in_flight, sum(dispatcher.lane_depths))
+            await asyncio.sleep(0.001)
+
+        consumer = _SelectiveConsumer(_messages("abcdefgh" * 4))
+        dispatcher = PartitionedDispatcher(consumer, handler, max_in_flight=5)
+        await _run(dispatcher, consumer)
+
+        assert peak == 5
+        assert dispatcher.completed == 32
+
+    async def test_registry_key_uses_partition_key_fields(self) -> None:
+        """Registered topics are keyed by their partition key fields."""
+        key = registry_key(compile_event_registry())
+        hook = _Message(
+            b"ignored",
+            json.dumps({"repo": "spi", "branch": "main"}).encode(),
+            topic="onex.evt.git.hook.v1",
+        )
+        other = _Message(b"k", b"{}")
+
+        assert key(hook) == "spi:main"
+        assert key(other) == b"k"
+
+    def test_lanes_do_not_depend_on_the_hash_seed(self) -> None:
+        """Keys map to the same lanes whatever PYTHONHASHSEED is."""
+        script = (
+            "from examples.reference.partitioned_dispatcher import _lane_hash\n"
+            "print([_lane_hash(k) % 8 for k in"
+            " (b'order-1', 'order-1', ('events', 3), 42)])"
+        )
+
+        def lanes(seed: str) -> str:
+            env = {**os.environ, "PYTHONHASHSEED": seed}
+            env["PYTHONPATH"] = os.pathsep.join(sys.path)
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                timeout=30,
+                env=env,
+                check=True,
+            )
+            return result.stdout
+
+        assert lanes("0") == lanes("1") == lanes("2")
+
+    async def test_rejects_invalid_use(self) -> None:
+        """Sizes are validated and a dispatcher runs once at a time."""
+        consumer = _Consumer()
+
+        async def handler(_message: ProtocolEventBusMessage) -> None:
+            return None
+
+        with pytest.raises(ValueError, match="lanes"):
+            PartitionedDispatcher(consumer, handler, lanes=0)
+        with pytest.raises(ValueError, match="max_in_flight"):
+            PartitionedDispatcher(consumer, handler, max_in_flight=0)
+
+        dispatcher = PartitionedDispatcher(consumer, handler)
+        runner = asyncio.create_task(dispatcher.run())
+        await asyncio.sleep(0)
+        with pytest.raises(InvalidProtocolStateError):
+            await dispatcher.run()
+        dispatcher.stop()
+        await runner
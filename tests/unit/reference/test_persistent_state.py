@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for structurally shared reducer states and batch dispatch."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from examples.reference.persistent_state import (
+    DispatchResult,
+    MapEditor,
+    MapState,
+    MapStateReducer,
+    PersistentMap,
+    dispatch_many,
+)
+from omnibase_spi.protocols.types.protocol_core_types import ProtocolState
+from omnibase_spi.protocols.types.protocol_node_types import ProtocolNodeResult
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_reducer import (
+    ProtocolWorkflowReducer,
+)
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class _Action:
+    type: str
+    payload: dict[str, Any]
+    timestamp: datetime
+
+    async def validate_action(self) -> bool:
+        return True
+
+    def is_executable(self) -> bool:
+        return True
+
+
+STARTED = _Action("task.started", {"task": "task-9"}, START)
+
+
+@dataclass(frozen=True)
+class _Colliding:
+    """Key whose hash is the same for every instance."""
+
+    name: str
+
+    def __hash__(self) -> int:
+        return 7
+
+
+def _actions(count: int) -> list[_Action]:
+    kinds = ("task.started", "task.completed", "task.removed")
+    return [
+        _Action(
+            kinds[i % 3],
+            {"task": f"task-{i % 7}"},
+            START + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def _apply(tasks: MapEditor, action: Any) -> None:
+    task = action.payload["task"]
+    if action.type == "task.removed":
+        tasks.pop(task, None)
+    elif action.type == "fail":
+        tasks["half-done"] = True
+        raise RuntimeError("cannot apply")
+    else:
+        tasks[task] = action.type
+
+
+@pytest.mark.unit
+class TestPersistentMap:
+    def test_changes_return_new_maps(self) -> None:
+        """set and delete leave the original map as it was."""
+        empty = PersistentMap()
+        one = empty.set("a", 1)
+        two = one.set("b", 2)
+        changed = two.set("a", 3)
+        smaller = changed.delete("b")
+
+        assert len(empty) == 0
+        assert dict(one) == {"a": 1}
+        assert dict(two) == {"a": 1, "b": 2}
+        assert dict(changed) == {"a": 3, "b": 2}
+        assert dict(smaller) == {"a": 3}
+        assert two == {"b": 2, "a": 1}
+        assert two.set("a", 1) is two
+        assert "b" in two
+        assert "b" not in smaller
+        with pytest.raises(KeyError):
+            smaller.delete("b")
+        with pytest.raises(KeyError):
+            smaller["b"]
+
+    def test_matches_dict_under_random_changes(self) -> None:
+        """Random sets and deletes agree with a dict, old versions included."""
+        rng = random.Random(42)  # noqa: S311
+        model: dict[int, int] = {}
+        current = PersistentMap()
+        versions: list[tuple[PersistentMap, dict[int, int]]] = []
+        for step in range(20_000):
+            key = rng.randrange(3_000)
+            if key in model and rng.random() < 0.4:
+                del model[key]
+                current = current.delete(key)
+            else:
+                model[key] = step
+                current = current.set(key, step)
+            if step % 1_000 == 0:
+                versions.append((current, dict(model)))
+
+        assert current == model
+        assert len(current) == len(model)
+        for version, expected in versions:
+            assert version == expected
+            assert len(version) == len(expected)
+
+    def test_colliding_hashes(self) -> None:
+        """Keys with equal hashes are kept apart and fold back when deleted."""
+        keys = [_Colliding(name) for name in "abcd"]
+        collided = PersistentMap((key, i) for i, key in enumerate(keys))
+        mixed = collided.set("other", "x")
+
+        assert dict(collided) == {key: i for i, key in enumerate(keys)}
+        assert mixed[keys[2]] == 2
+        assert mixed["other"] == "x"
+        remaining = mixed.delete(keys[0]).delete(keys[1]).delete(keys[2])
+        assert dict(remaining) == {keys[3]: 3, "other": "x"}
+        assert dict(remaining.delete(keys[3])) == {"other": "x"}
+
+    def test_unchanged_structure_is_shared(self) -> None:
+        """A set copies one path and shares every other node."""
+        large = PersistentMap((f"key-{i}", i) for i in range(10_000))
+        changed = large.set("key-5", -5)
+
+        old, new = large._root.array, changed._root.array
+        shared = sum(a is b for a, b in zip(old, new, strict=True))
+        assert shared == len(old) - 1
+        assert large["key-5"] == 5
+
+    def test_editor_never_changes_finished_maps(self) -> None:
+        """An editor changes its own copies only, also after finish."""
+        base = PersistentMap((i, i) for i in range(100))
+        editor = base.mutate()
+        for i in range(50):
+            editor[i] = -i
+        del editor[99]
+        first = editor.finish()
+        editor[0] = "again"
+        second = editor.finish()
+
+        assert base == {i: i for i in range(100)}
+        assert first[0] == 0
+        assert first[10] == -10
+        assert 99 not in first
+        assert second[0] == "again"
+        assert len(first) == len(second) == 99
+        assert editor.touched == set(range(50)) | {99}
+
+
+@pytest.mark.unit
+class TestMapStateReducer:
+    def test_conforms_to_reducer_protocols(self) -> None:
+        """Reducer, state and result satisfy their protocols."""
+        reducer = MapStateReducer(_apply)
+        assert isinstance(reducer, ProtocolWorkflowReducer)
+        assert isinstance(reducer.initial_state(), ProtocolState)
+        assert isinstance(DispatchResult(value=None), ProtocolNodeResult)
+
+    def test_dispatch_many_equals_dispatching_one_by_one(self) -> None:
+        """A batch yields the state that single dispatches build."""
+        reducer = MapStateReducer(_apply, initial={"seed": "ready"})
+        actions = _actions(200)
+
+        state = reducer.initial_state()
+        for action in actions:
+            state = reducer.dispatch(state, action)
+        batched = reducer.dispatch_many(reducer.initial_state(), actions)
+
+        assert batched == state
+        assert batched.version == 200
+        assert batched.last_updated == actions[-1].timestamp
+        assert batched.data["seed"] == "ready"
+        assert reducer.initial_state().data == {"seed": "ready"}
+        assert reducer.dispatch_many(state, []) is state
+
+    def test_failed_apply_keeps_the_state(self) -> None:
+        """A raising apply leaves no partial changes behind."""
+        reducer = MapStateReducer(_apply)
+        state = reducer.dispatch_many(reducer.initial_state(), _actions(3))
+        failing = [*_actions(3), _Action("fail", {"task": "x"}, START)]
+
+        with pytest.raises(RuntimeError):
+            reducer.dispatch_many(state, failing)
+
+        assert "half-done" not in state.data
+        assert state.version == 3
+
+    async def test_dispatch_async_reports_delta_and_errors(self) -> None:
+        """The result carries touched keys, or the error of apply."""
+        reducer = MapStateReducer(_apply)
+        state = reducer.dispatch(reducer.initial_state(), _actions(1)[0])
+
+        done = await reducer.dispatch_async(
+            state, _Action("task.removed", {"task": "task-0"}, START)
+        )
+        failed = await reducer.dispatch_async(
+            state, _Action("fail", {"task": ""}, START)
+        )
+
+        assert done.is_successful()
+        assert done.state_delta == {"task-0": None}
+        assert isinstance(done.value, MapState)
+        assert "task-0" not in done.value.data
+        assert failed.is_failure
+        assert isinstance(failed.error, RuntimeError)
+        assert await reducer.validate_state_transition(
+            state, STARTED, reducer.dispatch(state, STARTED)
+        )
+        assert not await reducer.validate_state_transition(state, STARTED, state)
+
+    def test_dispatch_many_folds_plain_reducers(self) -> None:
+        """Reducers without dispatch_many are folded through dispatch."""
+
+        class _Counter:
+            def dispatch(self, state: int, action: Any) -> int:
+                return state + 1
+
+        counted = dispatch_many(_Counter(), 0, _actions(5))  # type: ignore[arg-type]
+        assert counted == 5
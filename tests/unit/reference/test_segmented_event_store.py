@@ -0,0 +1,339 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the append-only segmented file event store."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.segmented_event_store import (
+    SegmentedEventStore,
+    StoredWorkflowEvent,
+)
+from omnibase_spi.exceptions import InvalidProtocolStateError
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence import (
+    ProtocolEventStore,
+)
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+WORKFLOW = "deploy"
+
+
+def _events(
+    instance: UUID,
+    first: int,
+    count: int,
+    *,
+    workflow_type: str = WORKFLOW,
+    event_type: str = "task.completed",
+) -> list[StoredWorkflowEvent]:
+    return [
+        StoredWorkflowEvent(
+            event_id=uuid4(),
+            event_type=event_type,
+            workflow_type=workflow_type,
+            instance_id=instance,
+            correlation_id=instance,
+            sequence_number=sequence,
+            timestamp=START + timedelta(minutes=sequence),
+            source="workflow-engine",
+            idempotency_key=f"{instance}-{sequence}",
+            payload={"step": sequence},
+            metadata={"node": "effect"},
+        )
+        for sequence in range(first, first + count)
+    ]
+
+
+@dataclass
+class _Query:
+    workflow_type: str | None = None
+    instance_id: UUID | None = None
+    event_types: list[str] | None = None
+    from_sequence: int | None = None
+    to_sequence: int | None = None
+    from_timestamp: datetime | None = None
+    to_timestamp: datetime | None = None
+    limit: int | None = None
+    offset: int | None = None
+    order_by: str | None = None
+
+
+def _sequences(events: list[object]) -> list[int]:
+    return [e.sequence_number for e in events]  # type: ignore[attr-defined]
+
+
+def _store(directory: Path, **kwargs: object) -> SegmentedEventStore:
+    options: dict[str, object] = {"segment_bytes": 4_096, "index_interval": 4}
+    options.update(kwargs)
+    return SegmentedEventStore(directory, **options)  # type: ignore[arg-type]
+
+
+async def _fill(
+    store: SegmentedEventStore, streams: list[UUID], per_stream: int
+) -> None:
+    """Append interleaved single events to every stream."""
+    for sequence in range(1, per_stream + 1):
+        for instance in streams:
+            result = await store.append_events(
+                _events(instance, sequence, 1), sequence - 1, None
+            )
+            assert result.success, result.error_message
+
+
+@pytest.mark.unit
+class TestSegmentedEventStore:
+    def test_conforms_to_event_store_protocol(self, tmp_path: Path) -> None:
+        """The store satisfies ProtocolEventStore."""
+        store = _store(tmp_path)
+        assert isinstance(store, ProtocolEventStore)
+        store.close()
+
+    async def test_round_trips_events(self, tmp_path: Path) -> None:
+        """Events read back equal the events appended."""
+        store = _store(tmp_path)
+        instance = uuid4()
+        events = _events(instance, 1, 5)
+
+        result = await store.append_events(events, 0, None)
+
+        assert result.success
+        assert result.sequence_numbers == [1, 2, 3, 4, 5]
+        assert await store.get_event_stream(WORKFLOW, instance, 1, None) == events
+        assert await store.get_last_sequence_number(WORKFLOW, instance) == 5
+        store.close()
+
+    async def test_range_reads_across_segments(self, tmp_path: Path) -> None:
+        """Range reads of interleaved streams return exactly the range."""
+        store = _store(tmp_path)
+        streams = [uuid4() for _ in range(3)]
+        await _fill(store, streams, 40)
+
+        assert len(list(tmp_path.glob("*.seg"))) > 3
+        for low, high in [(1, 40), (1, 1), (7, 23), (40, 40), (30, None), (41, None)]:
+            events = await store.get_event_stream(WORKFLOW, streams[1], low, high)
+            assert _sequences(events) == list(range(low, (high or 40) + 1))
+            assert {e.instance_id for e in events} <= {streams[1]}
+        store.close()
+
+    async def test_conflicts_and_gaps_are_rejected(self, tmp_path: Path) -> None:
+        """expected_sequence and numbering are enforced without writing."""
+        store = _store(tmp_path)
+        instance = uuid4()
+        await store.append_events(_events(instance, 1, 3), 0, None)
+
+        stale = await store.append_events(_events(instance, 4, 1), 2, None)
+        gap = await store.append_events(_events(instance, 5, 1), None, None)
+        mixed = await store.append_events(
+            _events(instance, 4, 1) + _events(uuid4(), 1, 1), 3, None
+        )
+
+        assert not stale.success
+        assert stale.error_message is not None
+        assert "stream is at 3" in stale.error_message
+        assert not gap.success
+        assert not mixed.success
+        assert await store.get_last_sequence_number(WORKFLOW, instance) == 3
+        store.close()
+
+    async def test_concurrent_appends_share_fsyncs(self, tmp_path: Path) -> None:
+        """Appends in flight together are made durable by one group commit."""
+        store = _store(tmp_path, segment_bytes=1 << 20)
+        streams = [uuid4() for _ in range(20)]
+
+        results = await asyncio.gather(
+            *(store.append_events(_events(s, 1, 2), 0, None) for s in streams)
+        )
+
+        assert all(result.success for result in results)
+        assert store.appends == 20
+        assert store.fsyncs < 20
+        for instance in streams:
+            events = await store.get_event_stream(WORKFLOW, instance, 1, None)
+            assert _sequences(events) == [1, 2]
+        store.close()
+
+    async def test_reopening_recovers_streams(self, tmp_path: Path) -> None:
+        """A reopened store rebuilds its indexes and drops a torn tail."""
+        store = _store(tmp_path)
+        streams = [uuid4() for _ in range(2)]
+        await _fill(store, streams, 30)
+        store.close()
+        last = max(tmp_path.glob("*.seg"))
+        size = last.stat().st_size
+        with last.open("ab") as f:
+            f.write(b"\x40\x00\x00\x00torn")
+
+        reopened = _store(tmp_path)
+
+        assert last.stat().st_size == size
+        for instance in streams:
+            assert await reopened.get_last_sequence_number(WORKFLOW, instance) == 30
+            events = await reopened.get_event_stream(WORKFLOW, instance, 10, 20)
+            assert _sequences(events) == list(range(10, 21))
+        result = await reopened.append_events(_events(streams[0], 31, 1), 30, None)
+        assert result.success
+        reopened.close()
+
+    async def test_corrupt_sealed_segment_is_an_error(self, tmp_path: Path) -> None:
+        """Only the last segment may end in a torn record."""
+        store = _store(tmp_path)
+        await _fill(store, [uuid4()], 60)
+        store.close()
+        first = min(tmp_path.glob("*.seg"))
+        data = bytearray(first.read_bytes())
+        data[100] ^= 0xFF
+        first.write_bytes(bytes(data))
+
+        with pytest.raises(InvalidProtocolStateError, match="corrupt record"):
+            _store(tmp_path)
+
+    async def test_archive_drops_whole_old_segments(self, tmp_path: Path) -> None:
+        """Old sealed segments are moved away; later events stay readable."""
+        archive = tmp_path / "archive"
+        store = _store(tmp_path / "events", archive_directory=archive)
+        instance = uuid4()
+        await _fill(store, [instance], 60)
+        segments = len(list((tmp_path / "events").glob("*.seg")))
+
+        result = await store.archive_old_events(START + timedelta(minutes=30), 1_000)
+
+        assert result.success
+        assert 0 < result.events_processed < 30
+        moved = list(archive.glob("*.seg"))
+        assert 0 < len(moved) < segments
+        assert result.storage_size_bytes == sum(p.stat().st_size for p in moved)
+        events = await store.get_event_stream(WORKFLOW, instance, 1, None)
+        assert _sequences(events) == list(range(result.events_processed + 1, 61))
+        assert await store.get_last_sequence_number(WORKFLOW, instance) == 60
+        store.close()
+
+    async def test_archive_stops_after_batch_size(self, tmp_path: Path) -> None:
+        """At least batch_size events go, one whole segment at a time."""
+        store = _store(tmp_path)
+        await _fill(store, [uuid4()], 60)
+
+        result = await store.archive_old_events(START + timedelta(days=1), 1)
+
+        assert len(list(tmp_path.glob("*.seg"))) > 1
+        assert result.events_processed > 0
+        store.close()
+
+    async def test_archived_streams_keep_their_sequence(self, tmp_path: Path) -> None:
+        """A stream whose segments are all archived continues after reopening."""
+        store = _store(tmp_path)
+        archived, active = uuid4(), uuid4()
+        await _fill(store, [archived], 30)
+        await _fill(store, [active], 30)
+
+        await store.archive_old_events(START + timedelta(days=1), 1_000)
+        assert await store.get_event_stream(WORKFLOW, archived, 1, None) == []
+        store.close()
+        reopened = _store(tmp_path)
+
+        assert await reopened.get_last_sequence_number(WORKFLOW, archived) == 30
+        stale = await reopened.append_events(_events(archived, 1, 1), 0, None)
+        assert not stale.success
+        # Archiving the segment holding the marker carries it forward.
+        for sequence in range(31, 91):
+            await reopened.append_events(_events(active, sequence, 1), None, None)
+        await reopened.archive_old_events(START + timedelta(days=1), 1_000)
+        reopened.close()
+        reopened = _store(tmp_path)
+
+        assert await reopened.get_last_sequence_number(WORKFLOW, archived) == 30
+        result = await reopened.append_events(_events(archived, 31, 1), 30, None)
+        assert result.success
+        events = await reopened.get_event_stream(WORKFLOW, archived, 1, None)
+        assert _sequences(events) == [31]
+        reopened.close()
+
+    async def test_deleted_streams_start_over(self, tmp_path: Path) -> None:
+        """A tombstone hides the stream's old events, also after reopening."""
+        store = _store(tmp_path)
+        instance = uuid4()
+        await _fill(store, [instance], 10)
+
+        deleted = await store.delete_event_stream(WORKFLOW, instance)
+        await store.append_events(_events(instance, 1, 3), 0, None)
+
+        assert deleted.events_processed == 10
+        everything = await store.read_events(_Query(workflow_type=WORKFLOW), None)
+        assert _sequences(everything) == [1, 2, 3]
+        store.close()
+        reopened = _store(tmp_path)
+        events = await reopened.get_event_stream(WORKFLOW, instance, 1, None)
+        assert _sequences(events) == [1, 2, 3]
+        reopened.close()
+
+    async def test_transactions_commit_all_or_nothing(self, tmp_path: Path) -> None:
+        """Buffered appends are written together, or not at all."""
+        store = _store(tmp_path)
+        a, b = uuid4(), uuid4()
+        transaction = await store.begin_transaction()
+        await store.append_events(_events(a, 1, 2), 0, transaction)
+        await store.append_events(_events(b, 1, 2), 0, transaction)
+        assert await store.get_last_sequence_number(WORKFLOW, a) == 0
+        assert await transaction.commit()
+
+        conflicting = await store.begin_transaction()
+        await store.append_events(_events(a, 3, 1), 2, conflicting)
+        await store.append_events(_events(b, 3, 1), 0, conflicting)
+        assert not await conflicting.commit()
+
+        discarded = await store.begin_transaction()
+        await store.append_events(_events(a, 3, 1), 2, discarded)
+        await discarded.rollback()
+
+        assert await store.get_last_sequence_number(WORKFLOW, a) == 2
+        assert await store.get_last_sequence_number(WORKFLOW, b) == 2
+        store.close()
+
+    async def test_read_events_filters_and_orders(self, tmp_path: Path) -> None:
+        """Queries filter by type, sequence and time, then order and page."""
+        store = _store(tmp_path)
+        a, b = uuid4(), uuid4()
+        await store.append_events(_events(a, 1, 6), 0, None)
+        await store.append_events(
+            _events(b, 1, 2, event_type="workflow.failed"), 0, None
+        )
+        await store.append_events(
+            _events(uuid4(), 1, 1, workflow_type="other"), 0, None
+        )
+
+        failed = await store.read_events(_Query(event_types=["workflow.failed"]), None)
+        window = await store.read_events(
+            _Query(
+                workflow_type=WORKFLOW,
+                instance_id=a,
+                from_timestamp=START + timedelta(minutes=2),
+                to_timestamp=START + timedelta(minutes=5),
+                order_by="-sequence_number",
+                offset=1,
+                limit=2,
+            ),
+            None,
+        )
+        deploys = await store.read_events(
+            _Query(workflow_type=WORKFLOW, from_sequence=2, to_sequence=2), None
+        )
+
+        assert [(e.instance_id, e.sequence_number) for e in failed] == [(b, 1), (b, 2)]
+        assert _sequences(window) == [4, 3]
+        assert {(e.instance_id, e.sequence_number) for e in deploys} == {(a, 2), (b, 2)}
+        with pytest.raises(ValueError, match="cannot order"):
+            await store.read_events(_Query(order_by="source"), None)
+        store.close()
+
+    def test_rejects_invalid_configuration(self, tmp_path: Path) -> None:
+        """Sizes must be positive."""
+        for option in ("segment_bytes", "index_interval"):
+            with pytest.raises(ValueError, match=option):
+                _store(tmp_path, **{option: 0})
@@ -0,0 +1,205 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the sharded reference idempotency store."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from uuid import uuid1, uuid4
+
+import pytest
+
+from examples.reference.sharded_idempotency_store import ShardedIdempotencyStore
+from omnibase_spi.protocols.storage.protocol_idempotency_store import (
+    ProtocolIdempotencyStore,
+)
+
+from .conftest import ManualClock
+
+DAY = 24 * 3600
+# 2025-01-01T00:00:00Z
+EPOCH = 1_735_689_600.0
+
+
+def _at(seconds: float) -> datetime:
+    return datetime.fromtimestamp(EPOCH + seconds, UTC)
+
+
+@pytest.mark.unit
+class TestShardedIdempotencyStore:
+    def test_conforms_to_store_protocol(self) -> None:
+        """ShardedIdempotencyStore satisfies ProtocolIdempotencyStore."""
+        assert isinstance(ShardedIdempotencyStore(), ProtocolIdempotencyStore)
+
+    async def test_first_caller_wins_per_domain(self) -> None:
+        """A message is new once per domain."""
+        store = ShardedIdempotencyStore()
+        message_id, correlation_id = uuid4(), uuid4()
+
+        assert await store.check_and_record(message_id, "billing", correlation_id)
+        assert not await store.check_and_record(message_id, "billing")
+        assert await store.check_and_record(message_id)
+        assert await store.check_and_record(message_id, "registration")
+        assert await store.is_processed(message_id, "billing")
+        assert not await store.is_processed(uuid4(), "billing")
+        assert store.correlation_id(message_id, "billing") == correlation_id
+        assert store.correlation_id(message_id) is None
+        assert len(store) == 3
+
+    async def test_exactly_one_concurrent_task_wins(self) -> None:
+        """Concurrent tasks racing on one message see exactly one True."""
+        store = ShardedIdempotencyStore(shards=4)
+        message_ids = [uuid4() for _ in range(100)]
+
+        results = await asyncio.gather(
+            *(
+                store.check_and_record(message_id, "race")
+                for message_id in message_ids
+                for _ in range(8)
+            )
+        )
+
+        assert sum(results) == len(message_ids)
+        for start in range(0, len(results), 8):
+            assert sum(results[start : start + 8]) == 1
+
+    def test_exactly_one_concurrent_thread_wins(self) -> None:
+        """Threads with their own event loops race and exactly one wins each id."""
+        store = ShardedIdempotencyStore(shards=4)
+        message_ids = [uuid4() for _ in range(2_000)]
+        threads = 8
+        barrier = threading.Barrier(threads)
+        wins: list[list[bool]] = [[] for _ in range(threads)]
+
+        async def race(results: list[bool]) -> None:
+            for message_id in message_ids:
+                results.append(await store.check_and_record(message_id, "race"))
+
+        def worker(results: list[bool]) -> None:
+            barrier.wait()
+            asyncio.run(race(results))
+
+        workers = [threading.Thread(target=worker, args=(results,)) for results in wins]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        per_message = [sum(column) for column in zip(*wins, strict=True)]
+        assert per_message == [1] * len(message_ids)
+
+    async def test_check_and_record_many(self) -> None:
+        """Batches report per-id results in order, repeats included."""
+        store = ShardedIdempotencyStore(shards=8)
+        old, new = uuid4(), [uuid4() for _ in range(50)]
+        await store.mark_processed(old, "billing")
+
+        results = await store.check_and_record_many([old, *new, new[0]], "billing")
+
+        assert results == [False] + [True] * 50 + [False]
+        assert await store.check_and_record_many(new, "billing") == [False] * 50
+        assert await store.check_and_record_many([]) == []
+
+    async def test_uuid1_ids_spread_over_every_shard(self) -> None:
+        """Ids from one host share their low bits but not their shard."""
+        store = ShardedIdempotencyStore()
+        ids = [uuid1() for _ in range(10_000)]
+
+        assert all(await store.check_and_record_many(ids, "billing"))
+        assert all(shard.entries for shard in store._shards)
+        assert not any([await store.check_and_record(i, "billing") for i in ids])
+
+    async def test_mark_processed_sets_and_overwrites_timestamp(self) -> None:
+        """mark_processed records explicit or current timestamps."""
+        clock = ManualClock(EPOCH)
+        store = ShardedIdempotencyStore(clock=clock)
+        message_id = uuid4()
+
+        await store.mark_processed(message_id, "billing")
+        assert store.processed_at(message_id, "billing") == _at(0)
+        await store.mark_processed(message_id, "billing", processed_at=_at(-60))
+
+        assert store.processed_at(message_id, "billing") == _at(-60)
+        assert store.processed_at(message_id) is None
+        assert len(store) == 1
+
+    async def test_rejects_naive_processed_at(self) -> None:
+        """Naive datetimes are refused rather than guessed."""
+        store = ShardedIdempotencyStore()
+
+        with pytest.raises(ValueError, match="timezone-aware"):
+            await store.mark_processed(uuid4(), processed_at=datetime(2025, 1, 1))  # noqa: DTZ001
+
+    async def test_cleanup_expired_removes_only_old_records(self) -> None:
+        """Records older than the TTL go; newer ones, in any bucket, stay."""
+        clock = ManualClock(EPOCH)
+        store = ShardedIdempotencyStore(shards=2, clock=clock)
+        ages = [0, 30, 299, 301, 3_600, 5 * DAY, 8 * DAY, 40 * DAY, 400 * DAY]
+        ids = {age: uuid4() for age in ages}
+        for age, message_id in ids.items():
+            await store.mark_processed(message_id, processed_at=_at(-age))
+        clock.now += 1  # let the wheel cascade the aged buckets
+
+        assert await store.cleanup_expired(300) == 6
+        assert [age for age in ages if await store.is_processed(ids[age])] == [
+            0,
+            30,
+            299,
+        ]
+        assert await store.cleanup_expired(300) == 0
+        assert len(store) == 3
+
+    async def test_cleanup_after_the_wheel_has_aged(self) -> None:
+        """Records cascaded into coarse buckets expire at the right time."""
+        clock = ManualClock(EPOCH)
+        store = ShardedIdempotencyStore(clock=clock)
+        ids = []
+        for _ in range(30):
+            ids.append(uuid4())
+            await store.check_and_record(ids[-1], "billing")
+            clock.now += 3_600
+
+        # The oldest record is 30 hours old, the newest one hour.
+        assert await store.cleanup_expired(DAY) == 6
+        assert not await store.is_processed(ids[5], "billing")
+        assert await store.is_processed(ids[6], "billing")
+        clock.now += 2 * DAY
+        assert await store.cleanup_expired(DAY) == 24
+        assert len(store) == 0
+
+    async def test_remarked_record_survives_cleanup_of_its_old_bucket(self) -> None:
+        """Re-marking moves a record out of the bucket that expires."""
+        clock = ManualClock(EPOCH)
+        store = ShardedIdempotencyStore(clock=clock)
+        message_id = uuid4()
+        await store.mark_processed(message_id, processed_at=_at(-10 * DAY))
+        await store.mark_processed(message_id)
+
+        assert await store.cleanup_expired(DAY) == 0
+        clock.now += 2 * DAY
+        assert await store.cleanup_expired(DAY) == 1
+
+    async def test_ttl_expires_records_before_cleanup(self) -> None:
+        """With ttl_seconds, old records are new again for check_and_record."""
+        clock = ManualClock(EPOCH)
+        store = ShardedIdempotencyStore(ttl_seconds=60, clock=clock)
+        message_id = uuid4()
+        await store.check_and_record(message_id, correlation_id=uuid4())
+
+        clock.now += 61
+        assert not await store.is_processed(message_id)
+        assert await store.check_and_record(message_id)
+        assert store.correlation_id(message_id) is None
+        assert not await store.check_and_record(message_id)
+
+    def test_rejects_invalid_configuration(self) -> None:
+        """Shard counts must be powers of two and durations positive."""
+        with pytest.raises(ValueError, match="power of two"):
+            ShardedIdempotencyStore(shards=12)
+        with pytest.raises(ValueError, match="ttl_seconds"):
+            ShardedIdempotencyStore(ttl_seconds=0)
+        with pytest.raises(ValueError, match="resolution_seconds"):
+            ShardedIdempotencyStore(resolution_seconds=0)
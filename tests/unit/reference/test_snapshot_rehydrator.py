@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for snapshot-accelerated workflow state rehydration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from examples.reference.segmented_event_store import StoredWorkflowEvent
+from examples.reference.snapshot_rehydrator import (
+    InMemorySnapshotStore,
+    ReplayedAction,
+    SnapshotPolicy,
+    SnapshotRehydrator,
+    StateSnapshot,
+)
+from omnibase_spi.exceptions import InvalidProtocolStateError
+from omnibase_spi.protocols.types.protocol_workflow_orchestration_types import (
+    ProtocolWorkflowSnapshot,
+)
+from omnibase_spi.protocols.workflow_orchestration.protocol_workflow_persistence import (
+    ProtocolSnapshotStore,
+)
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+WORKFLOW = "deploy"
+
+
+def _event(instance: UUID, sequence: int) -> StoredWorkflowEvent:
+    return StoredWorkflowEvent(
+        event_id=uuid4(),
+        event_type="task.completed",
+        workflow_type=WORKFLOW,
+        instance_id=instance,
+        correlation_id=instance,
+        sequence_number=sequence,
+        timestamp=START + timedelta(minutes=sequence),
+        source="workflow-engine",
+        idempotency_key=f"{instance}-{sequence}",
+        payload={"step": sequence},
+    )
+
+
+@dataclass(frozen=True)
+class _State:
+    steps: int = 0
+    total: int = 0
+
+
+class _Reducer:
+    """Counts steps and sums them, recording every dispatch."""
+
+    def __init__(self) -> None:
+        self.dispatched = 0
+
+    def initial_state(self) -> _State:
+        return _State()
+
+    def dispatch(self, state: _State, action: ReplayedAction) -> _State:
+        self.dispatched += 1
+        return _State(state.steps + 1, state.total + action.payload["step"])
+
+
+class _EventStore:
+    """Event streams held in lists, recording the ranges read."""
+
+    def __init__(self) -> None:
+        self.streams: dict[UUID, list[StoredWorkflowEvent]] = {}
+        self.reads: list[tuple[int, int | None]] = []
+        self.delay = 0.0
+
+    def append(self, instance: UUID, count: int) -> None:
+        stream = self.streams.setdefault(instance, [])
+        stream += [_event(instance, len(stream) + 1 + i) for i in range(count)]
+
+    async def get_event_stream(
+        self,
+        workflow_type: str,
+        instance_id: UUID,
+        from_sequence: int,
+        to_sequence: int | None,
+    ) -> list[StoredWorkflowEvent]:
+        self.reads.append((from_sequence, to_sequence))
+        await asyncio.sleep(self.delay)
+        high = to_sequence if to_sequence is not None else 2**63
+        return [
+            e
+            for e in self.streams.get(instance_id, [])
+            if from_sequence <= e.sequence_number <= high
+        ]
+
+
+def _expected(count: int) -> _State:
+    return _State(count, count * (count + 1) // 2)
+
+
+def _rehydrator(
+    events: _EventStore,
+    snapshots: InMemorySnapshotStore,
+    reducer: _Reducer,
+    **policy: Any,
+) -> SnapshotRehydrator:
+    return SnapshotRehydrator(
+        events,  # type: ignore[arg-type]
+        snapshots,
+        reducer,  # type: ignore[arg-type]
+        policy=SnapshotPolicy(**policy),
+    )
+
+
+@pytest.mark.unit
+class TestSnapshotRehydrator:
+    def test_conforms_to_snapshot_protocols(self) -> None:
+        """The store and its snapshots satisfy the persistence protocols."""
+        snapshot = StateSnapshot.of(WORKFLOW, uuid4(), 3, _State())
+        assert isinstance(InMemorySnapshotStore(), ProtocolSnapshotStore)
+        assert isinstance(snapshot, ProtocolWorkflowSnapshot)
+
+    async def test_replays_whole_stream_without_snapshot(self) -> None:
+        """The first rehydration folds every event into the initial state."""
+        events, snapshots, reducer = _EventStore(), InMemorySnapshotStore(), _Reducer()
+        instance = uuid4()
+        events.append(instance, 50)
+        rehydrator = _rehydrator(events, snapshots, reducer, every_events=100)
+
+        rehydrated = await rehydrator.rehydrate(WORKFLOW, instance)
+
+        assert rehydrated.state == _expected(50)
+        assert rehydrated.sequence_number == 50
+        assert rehydrated.snapshot_sequence == 0
+        assert rehydrated.events_replayed == 50
+        assert not rehydrated.snapshot_saved
+        assert events.reads == [(1, None)]
+        assert len(snapshots) == 0
+
+    async def test_replays_only_the_tail_after_a_snapshot(self) -> None:
+        """A saved snapshot limits later replays to the events after it."""
+        events, snapshots, reducer = _EventStore(), InMemorySnapshotStore(), _Reducer()
+        instance = uuid4()
+        events.append(instance, 120)
+        rehydrator = _rehydrator(events, snapshots, reducer, every_events=100)
+
+        first = await rehydrator.rehydrate(WORKFLOW, instance)
+        events.append(instance, 30)
+        second = await rehydrator.rehydrate(WORKFLOW, instance)
+
+        assert first.snapshot_saved
+        assert second.state == _expected(150)
+        assert second.snapshot_sequence == 120
+        assert second.events_replayed == 30
+        assert not second.snapshot_saved
+        assert events.reads[-1] == (121, None)
+        assert reducer.dispatched == 150
+
+    async def test_rehydrates_to_an_earlier_sequence(self) -> None:
+        """A point-in-time rebuild starts from a snapshot at or before it."""
+        events, snapshots, reducer = _EventStore(), InMemorySnapshotStore(), _Reducer()
+        instance = uuid4()
+        rehydrator = _rehydrator(
+            events, snapshots, reducer, every_events=10, keep_count=5
+        )
+        for _ in range(3):
+            events.append(instance, 10)
+            await rehydrator.rehydrate(WORKFLOW, instance)
+
+        rehydrated = await rehydrator.rehydrate(WORKFLOW, instance, 25)
+
+        assert rehydrated.state == _expected(25)
+        assert rehydrated.snapshot_sequence == 20
+        assert events.reads[-1] == (21, 25)
+
+    async def test_saves_when_replay_is_slow(self) -> None:
+        """max_replay_seconds triggers a snapshot of a short but slow tail."""
+        events, snapshots, reducer = _EventStore(), InMemorySnapshotStore(), _Reducer()
+        instance = uuid4()
+        events.append(instance, 5)
+        events.delay = 0.02
+        rehydrator = _rehydrator(
+            events, snapshots, reducer, every_events=None, max_replay_seconds=0.01
+        )
+
+        slow = await rehydrator.rehydrate(WORKFLOW, instance)
+        again = await rehydrator.rehydrate(WORKFLOW, instance)
+
+        assert slow.snapshot_saved
+        assert slow.replay_seconds >= 0.01
+        assert again.events_replayed == 0
+        assert not again.snapshot_saved
+        assert again.state == _expected(5)
+
+    async def test_retention_keeps_the_newest_snapshots(self) -> None:
+        """Each save prunes the instance down to keep_count snapshots."""
+        events, snapshots, reducer = _EventStore(), InMemorySnapshotStore(), _Reducer()
+        instance = uuid4()
+        rehydrator = _rehydrator(
+            events, snapshots, reducer, every_events=10, keep_count=2
+        )
+        for _ in range(4):
+            events.append(instance, 10)
+            await rehydrator.rehydrate(WORKFLOW, instance)
+
+        listed = await snapshots.list_snapshots(WORKFLOW, instance, 10)
+
+        assert [s["sequence_number"] for s in listed] == [40, 30]
+        assert rehydrator.snapshots_saved == 4
+        assert rehydrator.snapshots_removed == 2
+
+    async def test_gaps_after_the_snapshot_are_an_error(self) -> None:
+        """Events must continue the snapshot without gaps."""
+        events, snapshots, reducer = _EventStore(), InMemorySnapshotStore(), _Reducer()
+        instance = uuid4()
+        events.append(instance, 10)
+        del events.streams[instance][4]
+        rehydrator = _rehydrator(events, snapshots, reducer)
+
+        with pytest.raises(InvalidProtocolStateError, match="continues at 6 after 4"):
+            await rehydrator.rehydrate(WORKFLOW, instance)
+
+    async def test_concurrent_rehydrations_share_one_replay(self) -> None:
+        """Callers rebuilding the same instance wait for one replay."""
+        events, snapshots, reducer = _EventStore(), InMemorySnapshotStore(), _Reducer()
+        instance = uuid4()
+        events.append(instance, 20)
+        events.delay = 0.01
+        rehydrator = _rehydrator(events, snapshots, reducer, every_events=10)
+
+        results = await asyncio.gather(
+            *(rehydrator.rehydrate(WORKFLOW, instance) for _ in range(5))
+        )
+
+        assert {r.state for r in results} == {_expected(20)}
+        assert reducer.dispatched == 20
+        assert rehydrator.rehydrations == 1
+        assert rehydrator.coalesced == 4
+        assert rehydrator.snapshots_saved == 1
+
+    async def test_snapshot_store_orders_by_sequence(self) -> None:
+        """Loads find the newest snapshot at or before a sequence number."""
+        store = InMemorySnapshotStore()
+        instance = uuid4()
+        for sequence in (30, 10, 20):
+            await store.save_snapshot(
+                StateSnapshot.of(WORKFLOW, instance, sequence, _State(sequence)), None
+            )
+        replaced = StateSnapshot.of(WORKFLOW, instance, 20, _State(99))
+        await store.save_snapshot(replaced, None)
+
+        latest = await store.load_snapshot(WORKFLOW, instance, None)
+        at_25 = await store.load_snapshot(WORKFLOW, instance, 25)
+
+        assert latest is not None
+        assert latest.sequence_number == 30
+        assert at_25 == replaced
+        assert await store.load_snapshot(WORKFLOW, instance, 9) is None
+        assert await store.load_snapshot(WORKFLOW, uuid4(), None) is None
+        assert await store.delete_snapshot(WORKFLOW, instance, 20)
+        assert not await store.delete_snapshot(WORKFLOW, instance, 20)
+        assert await store.cleanup_old_snapshots(WORKFLOW, instance, 1) == 1
+        assert len(store) == 1
+
+    def test_rejects_invalid_policy(self) -> None:
+        """Thresholds and retention must be positive."""
+        base = SnapshotPolicy()
+        for option in ("every_events", "max_replay_seconds", "keep_count"):
+            with pytest.raises(ValueError, match=option):
+                replace(base, **{option: 0})
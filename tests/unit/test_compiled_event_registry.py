@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+
+"""Tests for the compiled, indexed view of the SPI Event Registry.
+
+Run with:
+    uv run pytest tests/unit/test_compiled_event_registry.py -m unit
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from omnibase_spi.contracts.events.contract_git_hook_event import ContractGitHookEvent
+from omnibase_spi.exceptions_skill_routing import SkillRoutingError
+from omnibase_spi.protocols.effects.protocol_git_hook_effect import (
+    ProtocolGitHookEffect,
+)
+from omnibase_spi.registry import (
+    EVENT_REGISTRY,
+    CompiledEventRegistry,
+    EventRegistryEntry,
+    PartitionKeyExtractor,
+    compile_event_registry,
+)
+from omnibase_spi.registry.event_registry import TOPIC_SKILL_ROUTING_FAILED
+
+GIT_HOOK = "onex.evt.git.hook.v1"
+PR_STATUS = "onex.evt.github.pr-status.v1"
+
+
+def _naive_key(event_type: str, payload: object) -> str:
+    """Key built the way producers did before the compiled view."""
+    fields = EVENT_REGISTRY[event_type].partition_key_fields
+    return ":".join(str(getattr(payload, f)) for f in fields)
+
+
+@pytest.fixture
+def compiled() -> CompiledEventRegistry:
+    """Compiled view over the canonical registry."""
+    return compile_event_registry()
+
+
+@pytest.mark.unit
+class TestCompiledRegistryMapping:
+    """The view mirrors the registry it was built from."""
+
+    def test_same_entries_as_event_registry(
+        self, compiled: CompiledEventRegistry
+    ) -> None:
+        """The view exposes exactly the registry entries."""
+        assert compiled.entries == EVENT_REGISTRY
+        assert compiled.entries[GIT_HOOK] is EVENT_REGISTRY[GIT_HOOK]
+        assert compiled.extractors.keys() == EVENT_REGISTRY.keys()
+
+    def test_snapshot_is_independent_of_source(self) -> None:
+        """Mutating the source mapping does not affect the compiled view."""
+        source = dict(EVENT_REGISTRY)
+        compiled = compile_event_registry(source)
+        source.clear()
+        assert GIT_HOOK in compiled.entries
+
+    def test_indexes_are_read_only(self, compiled: CompiledEventRegistry) -> None:
+        """The compiled mappings cannot be mutated."""
+        with pytest.raises(TypeError):
+            compiled.entries["x"] = compiled.entries[GIT_HOOK]  # type: ignore[index]
+
+
+@pytest.mark.unit
+class TestProducerProtocolResolution:
+    """Producer protocol dotted paths resolve lazily and are cached."""
+
+    def test_resolves_protocol_class(self, compiled: CompiledEventRegistry) -> None:
+        """Dotted paths resolve to the defining classes."""
+        assert compiled.producer_protocol(GIT_HOOK) is ProtocolGitHookEffect
+        assert (
+            compiled.producer_protocol(TOPIC_SKILL_ROUTING_FAILED) is SkillRoutingError
+        )
+
+    @pytest.mark.parametrize("event_type", sorted(EVENT_REGISTRY))
+    def test_every_entry_resolves(
+        self, compiled: CompiledEventRegistry, event_type: str
+    ) -> None:
+        """Every registered producer protocol is importable."""
+        resolved = compiled.producer_protocol(event_type)
+        dotted = f"{resolved.__module__}.{resolved.__qualname__}"
+        assert dotted == EVENT_REGISTRY[event_type].producer_protocol
+
+    def test_resolution_is_cached(
+        self, compiled: CompiledEventRegistry, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A resolved protocol is not imported again."""
+        compiled.producer_protocol(GIT_HOOK)
+
+        def _fail(_name: str) -> None:
+            raise AssertionError("producer protocol imported twice")
+
+        monkeypatch.setattr(
+            "omnibase_spi.registry.compiled_event_registry.importlib.import_module",
+            _fail,
+        )
+        assert compiled.producer_protocol(GIT_HOOK) is ProtocolGitHookEffect
+
+    @pytest.mark.parametrize(
+        "dotted",
+        ["NoModule", "omnibase_spi.registry.Missing", "omnibase_spi.registry.__all__"],
+    )
+    def test_unresolvable_protocol(self, dotted: str) -> None:
+        """Bad dotted paths raise ImportError."""
+        entry = EventRegistryEntry("t.v1", "1.0", ("id",), dotted)
+        compiled = compile_event_registry({"t.v1": entry})
+        with pytest.raises(ImportError):
+            compiled.producer_protocol("t.v1")
+
+    def test_unknown_event_type(self, compiled: CompiledEventRegistry) -> None:
+        """Unregistered event types raise KeyError."""
+        with pytest.raises(KeyError):
+            compiled.producer_protocol("onex.evt.unknown.v1")
+
+
+@pytest.mark.unit
+class TestReverseIndexes:
+    """Reverse indexes agree with a linear scan of the registry."""
+
+    def test_by_producer_protocol(self, compiled: CompiledEventRegistry) -> None:
+        """Lookup works by dotted name and by class."""
+        for event_type, entry in EVENT_REGISTRY.items():
+            assert event_type in compiled.by_producer_protocol(entry.producer_protocol)
+        assert compiled.by_producer_protocol(ProtocolGitHookEffect) == (GIT_HOOK,)
+        assert compiled.by_producer_protocol("not.a.Protocol") == ()
+
+    def test_by_schema_version(self, compiled: CompiledEventRegistry) -> None:
+        """Lookup preserves registry order."""
+        expected = tuple(
+            k for k, v in EVENT_REGISTRY.items() if v.schema_version == "1.0"
+        )
+        assert compiled.by_schema_version("1.0") == expected
+        assert compiled.by_schema_version("9.9") == ()
+
+    @pytest.mark.parametrize(
+        ("prefix", "expected"),
+        [
+            ("onex.evt.git", (GIT_HOOK,)),
+            ("onex.evt.git.", (GIT_HOOK,)),
+            ("onex.evt.github", (PR_STATUS,)),
+            (GIT_HOOK, (GIT_HOOK,)),
+            ("onex.evt.gi", ()),
+            ("onex.cmd", ()),
+        ],
+    )
+    def test_by_topic_prefix(
+        self,
+        compiled: CompiledEventRegistry,
+        prefix: str,
+        expected: tuple[str, ...],
+    ) -> None:
+        """Prefixes match whole dotted segments only."""
+        assert compiled.by_topic_prefix(prefix) == expected
+
+    def test_root_prefix_covers_registry(self, compiled: CompiledEventRegistry) -> None:
+        """The root segment indexes every event type."""
+        assert set(compiled.by_topic_prefix("onex")) == set(EVENT_REGISTRY)
+
+
+@pytest.mark.unit
+class TestPartitionKeys:
+    """Precompiled extractors match the ``:``-joined field convention."""
+
+    def test_contract_model_payload(self, compiled: CompiledEventRegistry) -> None:
+        """Contract models are read by attribute."""
+        event = ContractGitHookEvent(
+            hook="pre-commit",
+            repo="org/repo",
+            branch="main",
+            author="a",
+            outcome="pass",
+        )
+        assert compiled.partition_key(GIT_HOOK, event) == "org/repo:main"
+        assert compiled.partition_key(GIT_HOOK, event) == _naive_key(GIT_HOOK, event)
+
+    def test_mapping_payload(self, compiled: CompiledEventRegistry) -> None:
+        """Mappings are read by key and values are str()-ed."""
+        payload = {"repo": "org/repo", "pr_number": 42, "title": "x"}
+        assert compiled.partition_key(PR_STATUS, payload) == "org/repo:42"
+
+    def test_single_field_key(self, compiled: CompiledEventRegistry) -> None:
+        """Single-field keys are the bare field value."""
+        payload = SimpleNamespace(skill_name="deploy")
+        assert compiled.partition_key(TOPIC_SKILL_ROUTING_FAILED, payload) == "deploy"
+
+    def test_batch_matches_single(self, compiled: CompiledEventRegistry) -> None:
+        """Batch extraction matches per-payload extraction."""
+        payloads = [SimpleNamespace(repo=f"r{i}", pr_number=i) for i in range(50)]
+        keys = compiled.partition_keys(PR_STATUS, payloads)
+        assert keys == [_naive_key(PR_STATUS, p) for p in payloads]
+        assert compiled.partition_keys(PR_STATUS, iter(payloads)) == keys
+
+    def test_batch_with_mixed_payload_types(
+        self, compiled: CompiledEventRegistry
+    ) -> None:
+        """Mixed objects and mappings fall back per payload."""
+        payloads: list[object] = [
+            SimpleNamespace(repo="a", branch="main"),
+            {"repo": "b", "branch": "dev"},
+        ]
+        assert compiled.partition_keys(GIT_HOOK, payloads) == ["a:main", "b:dev"]
+
+    def test_empty_batch(self, compiled: CompiledEventRegistry) -> None:
+        """An empty batch yields no keys."""
+        assert compiled.partition_keys(GIT_HOOK, []) == []
+
+    def test_missing_field(self, compiled: CompiledEventRegistry) -> None:
+        """Missing fields surface the getter's error."""
+        with pytest.raises(AttributeError):
+            compiled.partition_key(GIT_HOOK, SimpleNamespace(repo="a"))
+        with pytest.raises(KeyError):
+            compiled.partition_key(GIT_HOOK, {"repo": "a"})
+
+    def test_key_extractor_is_shared(self, compiled: CompiledEventRegistry) -> None:
+        """Extractors are compiled once per entry."""
+        extractor = compiled.extractors[GIT_HOOK]
+        compiled.partition_keys(GIT_HOOK, [{"repo": "a", "branch": "b"}])
+        assert extractor is compiled.extractors[GIT_HOOK]
+        assert extractor.fields == ("repo", "branch")
+        assert extractor.getters == {dict: extractor.by_key}
+
+    def test_extractor_requires_fields(self) -> None:
+        """An entry must declare at least one key field."""
+        with pytest.raises(ValueError, match="must not be empty"):
+            PartitionKeyExtractor.compile(())
@@ -14,6 +14,7 @@ SCRIPTS_VALIDATION_ROOT = Path(__file__).resolve().parents[3] / "scripts" / "val
 sys.path.insert(0, str(SCRIPTS_VALIDATION_ROOT))
 
 from spi_validator.autofix import AutoFixEngine
+from spi_validator.cache import CACHE_FILE_NAME, ValidationCache
 from spi_validator.config import ValidationConfig
 from spi_validator.duplicate_analyzer import DuplicateProtocolAnalyzer
 from spi_validator.engine import ComprehensiveSPIValidationEngine
@@ -212,3 +213,140 @@ class ProtocolValid(Protocol):
         assert report.total_files == 1
         assert report.total_protocols == 1
         assert report.error_count == 0
+
+
+_CACHED_PROTOCOL = """
+from typing import Protocol
+
+
+class ProtocolCached(Protocol):
+    def fetch(self, key: str) -> str:
+        return key
+"""
+
+
+def _report_dicts(report: ValidationReport) -> tuple[list[dict], list[dict]]:
+    return (
+        [v.to_dict() for v in report.violations],
+        [p.to_dict() for p in report.protocols],
+    )
+
+
+@pytest.mark.unit
+class TestValidationCache:
+    @pytest.fixture
+    def protocol_dir(self, tmp_path: Path) -> Path:
+        protocol_dir = tmp_path / "src"
+        protocol_dir.mkdir()
+        _write_protocol_file(protocol_dir / "protocol_a.py", _CACHED_PROTOCOL)
+        _write_protocol_file(
+            protocol_dir / "protocol_b.py",
+            _CACHED_PROTOCOL.replace("ProtocolCached", "ProtocolOther"),
+        )
+        return protocol_dir
+
+    def _run(self, protocol_dir: Path, cache_dir: Path, config=None):
+        engine = ComprehensiveSPIValidationEngine(
+            config or ValidationConfig(), cache_dir=cache_dir
+        )
+        return engine, engine.validate_directory(protocol_dir)
+
+    def test_warm_run_reuses_results(self, protocol_dir: Path, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        uncached = ComprehensiveSPIValidationEngine(
+            ValidationConfig()
+        ).validate_directory(protocol_dir)
+
+        cold_engine, cold = self._run(protocol_dir, cache_dir)
+        warm_engine, warm = self._run(protocol_dir, cache_dir)
+
+        assert (cache_dir / CACHE_FILE_NAME).exists()
+        assert (cold_engine.cache.hits, cold_engine.cache.misses) == (0, 2)
+        assert (warm_engine.cache.hits, warm_engine.cache.misses) == (2, 0)
+        assert _report_dicts(warm) == _report_dicts(cold) == _report_dicts(uncached)
+        assert warm.performance_metrics["cache_hits"] == 2
+
+    def test_edited_file_is_revalidated_alone(
+        self, protocol_dir: Path, tmp_path: Path
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        self._run(protocol_dir, cache_dir)
+        _write_protocol_file(
+            protocol_dir / "protocol_a.py",
+            _CACHED_PROTOCOL.replace("return key", "..."),
+        )
+
+        engine, report = self._run(protocol_dir, cache_dir)
+
+        assert (engine.cache.hits, engine.cache.misses) == (1, 1)
+        assert not [
+            v
+            for v in report.violations
+            if v.rule_id == "SPI004" and v.file_path.endswith("protocol_a.py")
+        ]
+
+    def test_duplicate_analysis_runs_on_cached_protocols(self, tmp_path: Path) -> None:
+        protocol_dir = tmp_path / "src"
+        (protocol_dir / "one").mkdir(parents=True)
+        (protocol_dir / "two").mkdir()
+        for sub in ("one", "two"):
+            _write_protocol_file(
+                protocol_dir / sub / "protocol_dup.py", _CACHED_PROTOCOL
+            )
+        cache_dir = tmp_path / "cache"
+
+        _, cold = self._run(protocol_dir, cache_dir)
+        engine, warm = self._run(protocol_dir, cache_dir)
+
+        assert engine.cache.misses == 0
+        assert "SPI010" in {v.rule_id for v in warm.violations}
+        assert _report_dicts(warm) == _report_dicts(cold)
+
+    def test_config_change_invalidates_cache(
+        self, protocol_dir: Path, tmp_path: Path
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        self._run(protocol_dir, cache_dir)
+        config = ValidationConfig()
+        config.rules["SPI004"].enabled = False
+
+        engine, report = self._run(protocol_dir, cache_dir, config)
+
+        assert engine.cache.hits == 0
+        assert "SPI004" not in {v.rule_id for v in report.violations}
+
+    def test_corrupt_cache_file_is_ignored(
+        self, protocol_dir: Path, tmp_path: Path
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / CACHE_FILE_NAME).write_text("{not json", encoding="utf-8")
+
+        engine, report = self._run(protocol_dir, cache_dir)
+
+        assert engine.cache.misses == 2
+        assert report.total_protocols == 2
+
+    def test_disabled_caching_writes_nothing(
+        self, protocol_dir: Path, tmp_path: Path
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        config = ValidationConfig()
+        config.global_settings["enable_caching"] = False
+
+        engine, _ = self._run(protocol_dir, cache_dir, config)
+
+        assert engine.cache is None
+        assert not cache_dir.exists()
+
+    def test_save_drops_entries_for_deleted_files(
+        self, protocol_dir: Path, tmp_path: Path
+    ) -> None:
+        cache_dir = tmp_path / "cache"
+        self._run(protocol_dir, cache_dir)
+        (protocol_dir / "protocol_b.py").unlink()
+
+        self._run(protocol_dir, cache_dir)
+
+        entries = ValidationCache(cache_dir, ValidationConfig()).entries
+        assert [Path(path).name for path in entries] == ["protocol_a.py"]
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: 2025 OmniNode.ai Inc.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the unified validation runner and its shared AST cache."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_VALIDATION_ROOT = Path(__file__).resolve().parents[3] / "scripts" / "validation"
+sys.path.insert(0, str(SCRIPTS_VALIDATION_ROOT))
+
+import ast_cache
+import run_all_validations
+from run_all_validations import (
+    VALIDATORS,
+    ValidatorConfig,
+    find_repo_root,
+    run_all_validators_in_process,
+    run_validator,
+    run_validator_in_process,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    ast_cache.clear()
+    yield
+    ast_cache.clear()
+
+
+def _comparable(result: run_all_validations.ValidatorResult) -> tuple[object, ...]:
+    return (
+        result.name,
+        result.exit_code,
+        result.stdout,
+        result.stderr,
+        result.error,
+    )
+
+
+@pytest.mark.unit
+class TestAstCache:
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path) -> None:
+        """A second parse of an unchanged file returns the cached tree."""
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n", encoding="utf-8")
+
+        assert ast_cache.parse_file(path) is ast_cache.parse_file(path)
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path) -> None:
+        """A change in size or mtime invalidates the cached tree."""
+        path = tmp_path / "module.py"
+        path.write_text("x = 1\n", encoding="utf-8")
+        first = ast_cache.parse_file(path)
+
+        path.write_text("x = 1\ny = 2\n", encoding="utf-8")
+        second = ast_cache.parse_file(path)
+
+        assert second is not first
+        assert len(second.body) == 2
+
+    def test_syntax_errors_are_not_cached(self, tmp_path: Path) -> None:
+        """Each caller sees a SyntaxError carrying its own filename."""
+        path = tmp_path / "broken.py"
+        path.write_text("def broken(:\n", encoding="utf-8")
+
+        with pytest.raises(SyntaxError) as first:
+            ast_cache.parse_file(path, filename=str(path))
+        with pytest.raises(SyntaxError) as second:
+            ast_cache.parse_file(path)
+
+        assert first.value.filename == str(path)
+        assert second.value.filename == "<unknown>"
+
+    def test_preload_skips_unparseable_files(self, tmp_path: Path) -> None:
+        """preload caches valid files and ignores broken or missing ones."""
+        good = tmp_path / "good.py"
+        good.write_text("x = 1\n", encoding="utf-8")
+        bad = tmp_path / "bad.py"
+        bad.write_text("def broken(:\n", encoding="utf-8")
+
+        cached = ast_cache.preload([good, bad, tmp_path / "missing.py"])
+
+        assert cached == 1
+        assert ast_cache.parse_file(good) is ast_cache.parse_file(good)
+
+
+@pytest.mark.unit
+class TestRunValidatorInProcess:
+    @pytest.fixture
+    def fake_repo(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[Path]:
+        validation_dir = tmp_path / "scripts" / "validation"
+        validation_dir.mkdir(parents=True)
+        monkeypatch.syspath_prepend(str(validation_dir))
+        yield tmp_path
+        for name in ("fake_exit_message", "fake_raises", "fake_reports"):
+            sys.modules.pop(name, None)
+
+    def _write_validator(self, repo: Path, name: str, body: str) -> ValidatorConfig:
+        script = repo / "scripts" / "validation" / f"{name}.py"
+        script.write_text(f"import sys\n\n\ndef main():\n{body}\n", encoding="utf-8")
+        return ValidatorConfig(name=name, script_name=script.name, description="fake")
+
+    def test_output_argv_and_exit_code_are_captured(self, fake_repo: Path) -> None:
+        """main()'s return value, stdout, stderr and argv match a subprocess."""
+        config = self._write_validator(
+            fake_repo,
+            "fake_reports",
+            "    print(sys.argv[1:])\n"
+            "    print('warning', file=sys.stderr)\n"
+            "    return 1",
+        )
+        config.extra_args = ["--strict"]
+
+        result = run_validator_in_process(config, fake_repo, verbose=True)
+
+        assert result.exit_code == 1
+        assert result.stdout == "['--strict', '--verbose']\n"
+        assert result.stderr == "warning\n"
+        assert result.error is None
+        assert result.status == "FAIL"
+
+    def test_sys_exit_message_maps_to_exit_code_one(self, fake_repo: Path) -> None:
+        """sys.exit('msg') is reported as the interpreter would report it."""
+        config = self._write_validator(
+            fake_repo, "fake_exit_message", "    sys.exit('bad config')"
+        )
+
+        result = run_validator_in_process(config, fake_repo)
+
+        assert result.exit_code == 1
+        assert result.stderr == "bad config\n"
+
+    def test_uncaught_exception_prints_traceback(self, fake_repo: Path) -> None:
+        """An exception in main() fails the validator without aborting the run."""
+        config = self._write_validator(
+            fake_repo, "fake_raises", "    raise RuntimeError('boom')"
+        )
+
+        result = run_validator_in_process(config, fake_repo)
+
+        assert result.exit_code == 1
+        assert "RuntimeError: boom" in result.stderr
+        assert result.error is None
+
+    def test_missing_script_is_an_error(self, fake_repo: Path) -> None:
+        """A missing script reports the same error as the subprocess runner."""
+        config = ValidatorConfig(
+            name="missing", script_name="missing.py", description="fake"
+        )
+
+        in_process = run_validator_in_process(config, fake_repo)
+        subprocess_result = run_validator(config, fake_repo)
+
+        assert _comparable(in_process) == _comparable(subprocess_result)
+        assert in_process.status == "ERROR"
+
+
+@pytest.mark.unit
+class TestRunAllValidatorsInProcess:
+    @pytest.fixture(scope="class")
+    def subprocess_results(self) -> list[run_all_validations.ValidatorResult]:
+        repo_root = find_repo_root()
+        return [run_validator(config, repo_root) for config in VALIDATORS]
+
+    @pytest.mark.parametrize("jobs", [1, len(VALIDATORS)], ids=["sequential", "pool"])
+    def test_matches_subprocess_mode(
+        self,
+        subprocess_results: list[run_all_validations.ValidatorResult],
+        jobs: int,
+    ) -> None:
+        """In-process results equal the subprocess results, in VALIDATORS order."""
+        summary = run_all_validators_in_process(jobs=jobs)
+
+        assert [_comparable(r) for r in summary.results] == [
+            _comparable(r) for r in subprocess_results
+        ]
+
+    def test_restores_cwd_and_sys_path(self) -> None:
+        """The runner leaves the working directory and sys.path as it found them."""
+        cwd = Path.cwd()
+        path = list(sys.path)
+
+        run_all_validators_in_process(jobs=1)
+
+        assert Path.cwd() == cwd
+        assert sys.path == path
+
+    def test_summary_json_shape_is_unchanged(self) -> None:
+        """The JSON summary has the same keys as the subprocess runner's."""
+        summary = run_all_validators_in_process(jobs=1).to_dict()
+
+        assert [v["name"] for v in summary["validators"]] == [
+            config.name for config in VALIDATORS
+        ]
+        assert set(summary) == {
+            "all_passed",
+            "total_validators",
+            "passed_count",
+            "failed_count",
+            "error_count",
+            "total_duration_seconds",
+            "validators",
+        }
+
+
+@pytest.mark.unit
+def test_default_jobs_is_bounded() -> None:
+    """default_jobs never exceeds the validator or CPU count."""
+    jobs = run_all_validations.default_jobs()
+
+    assert 1 <= jobs <= len(VALIDATORS)
+    assert jobs <= (os.cpu_count() or 1)